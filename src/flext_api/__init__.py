@@ -98,10 +98,26 @@ FLEXT ECOSYSTEM INTEGRATION:
 
 4. Infrastructure:
    - FlextApiClient - HTTP client implementation
+   - FlextApiAsyncClient - Native asyncio HTTP client
    - FlextApiApp - FastAPI application factory
+   - FlextApiJsonResponse - JSONResponse encoded with the fast JSON codec
+   - FlextApiNegotiatingRoute - Routes speaking JSON, MessagePack or CBOR
    - FlextApiLifecycleManager - Resource lifecycle
    - (FlextApiOperations removed - use FlextApi or FlextApiClient directly)
    - FlextApiStorage - Storage abstraction
+   - FlextApiEviction - LRU, LFU and W-TinyLFU eviction for bounded storage
+   - FlextApiStreamingBody - Streamed request bodies (files, iterators, mmap)
+   - FlextApiStreamingResponse - Incrementally read response bodies
+   - FlextApiHttpCache - RFC 9111 HTTP response cache
+   - FlextApiRequestCoalescer - Single-flight request coalescing
+   - FlextApiCompression - Request body compression and Accept-Encoding
+   - FlextApiDnsCache - DNS cache with happy-eyeballs connects
+   - FlextApiRetryPolicy - Jittered retries with Retry-After and a budget
+   - FlextApiCircuitBreaker - Per-origin circuit breaker that fails fast
+   - FlextApiHedging - Hedged requests racing a duplicate of slow calls
+   - FlextApiConcurrencyLimiter - Adaptive per-origin concurrency limit
+   - FlextApiRateLimiter - Token-bucket pacing that follows rate-limit headers
+   - FlextApiPagination - Page, offset, cursor and Link pagination with prefetch
    - FlextApiAdapters - Protocol adapters
 
 5. Type System:
@@ -124,12 +140,27 @@ from __future__ import annotations
 from flext_api.__version__ import __version__, __version_info__
 from flext_api.adapters import FlextApiAdapters
 from flext_api.api import FlextApi
-from flext_api.app import FlextApiApp
+from flext_api.app import (
+    FlextApiApp,
+    FlextApiJsonResponse,
+    FlextApiNegotiatedResponse,
+    FlextApiNegotiatingRoute,
+)
+from flext_api.async_client import FlextApiAsyncClient
+from flext_api.cache import FlextApiHttpCache
+from flext_api.circuit_breaker import FlextApiCircuitBreaker
 from flext_api.client import FlextApiClient
+from flext_api.coalescing import FlextApiRequestCoalescer
+from flext_api.compression import FlextApiCompression
+from flext_api.concurrency import FlextApiConcurrencyLimiter
 from flext_api.constants import FlextApiConstants, c
+from flext_api.dns import FlextApiDnsCache
+from flext_api.eviction import FlextApiEviction
 from flext_api.exceptions import HttpError
+from flext_api.hedging import FlextApiHedging
 from flext_api.lifecycle_manager import FlextApiLifecycleManager
 from flext_api.models import FlextApiModels, FlextApiModels as m
+from flext_api.pagination import FlextApiPagination
 from flext_api.protocol_impls import (
     BaseProtocolImplementation,
     FlextWebClientImplementation,
@@ -152,6 +183,8 @@ from flext_api.protocol_stubs import (
     ProtobufSerializer,
 )
 from flext_api.protocols import FlextApiProtocols, p
+from flext_api.rate_limit import FlextApiRateLimiter
+from flext_api.retry import FlextApiRetryPolicy
 from flext_api.schemas import (
     AsyncAPISchemaValidator,
     JSONSchemaValidator,
@@ -161,6 +194,7 @@ from flext_api.server_factory import FlextApiServerFactory
 from flext_api.settings import FlextApiSettings
 from flext_api.settings_manager import FlextApiSettingsManager
 from flext_api.storage import FlextApiStorage
+from flext_api.streaming import FlextApiStreamingBody, FlextApiStreamingResponse
 from flext_api.typings import FlextApiTypes, t
 from flext_api.utilities import FlextApiUtilities, u
 
@@ -170,15 +204,32 @@ __all__ = [
     "FlextApi",
     "FlextApiAdapters",
     "FlextApiApp",
+    "FlextApiAsyncClient",
+    "FlextApiCircuitBreaker",
     "FlextApiClient",
+    "FlextApiCompression",
+    "FlextApiConcurrencyLimiter",
     "FlextApiConstants",
+    "FlextApiDnsCache",
+    "FlextApiEviction",
+    "FlextApiHedging",
+    "FlextApiHttpCache",
+    "FlextApiJsonResponse",
     "FlextApiLifecycleManager",
     "FlextApiModels",
+    "FlextApiNegotiatedResponse",
+    "FlextApiNegotiatingRoute",
+    "FlextApiPagination",
     "FlextApiProtocols",
+    "FlextApiRateLimiter",
+    "FlextApiRetryPolicy",
+    "FlextApiRequestCoalescer",
     "FlextApiServerFactory",
     "FlextApiSettings",
     "FlextApiSettingsManager",
     "FlextApiStorage",
+    "FlextApiStreamingBody",
+    "FlextApiStreamingResponse",
     "FlextApiTypes",
     "FlextApiUtilities",
     "FlextWebClientImplementation",
@@ -10,7 +10,6 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
-import cbor2
 from flext_core import r
 
 from flext_api.models import FlextApiModels
@@ -149,7 +148,7 @@ class FlextApiAdapters:
         def convert_json_to_cbor(data: t.JsonObject) -> r[bytes]:
             """Convert JSON data to CBOR format."""
             try:
-                packed: bytes = cbor2.dumps(data)
+                packed = FlextApiSerializers.Cbor.dumps(data)
                 return r[bytes].ok(packed)
 
             except Exception as e:
@@ -10,12 +10,17 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
+import asyncio
+import threading
+from collections.abc import AsyncIterator, Iterable, Iterator
+from types import TracebackType
 from typing import ClassVar, Self
 
 from flext_core import FlextLogger, r, s
 from flext_core.runtime import FlextRuntime
 from pydantic import ConfigDict
 
+from flext_api.async_client import FlextApiAsyncClient
 from flext_api.client import FlextApiClient
 from flext_api.constants import FlextApiConstants
 from flext_api.models import FlextApiModels
@@ -92,6 +97,8 @@ class FlextApi(s[FlextApiSettings]):
 
         # Initialize HTTP client with API config
         self._client = FlextApiClient(config=api_config)
+        # Async client is created on first async call (aget/apost/arequest)
+        self._async_client: FlextApiAsyncClient | None = None
 
     def execute(
         self,
@@ -107,6 +114,54 @@ class FlextApi(s[FlextApiSettings]):
         )
         return r[FlextApiSettings].ok(config)
 
+    def metrics(self) -> r[t.Api.MetricsDict]:
+        """Get counters of every enabled client component - pure delegation."""
+        return self._client.metrics()
+
+    def cache_metrics(self) -> r[t.Api.MetricsDict]:
+        """Get HTTP response cache hit/miss/revalidation counters."""
+        cache = self._client.cache
+        if cache is None:
+            return r[t.Api.MetricsDict].fail("HTTP cache is not enabled")
+        return cache.metrics()
+
+    def close(self) -> None:
+        """Close the underlying client connection pool - pure delegation."""
+        self._client.close()
+
+    async def aclose(self) -> None:
+        """Close the sync and async client connection pools - pure delegation."""
+        self._client.close()
+        async_client = self._async_client
+        if async_client is not None:
+            await async_client.aclose()
+
+    def __enter__(self) -> Self:
+        """Enter context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit context manager and close the connection pool."""
+        self.close()
+
+    async def __aenter__(self) -> Self:
+        """Enter async context manager."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit async context manager and close the connection pools."""
+        await self.aclose()
+
     def request(
         self,
         request: FlextApiModels.HttpRequest,
@@ -122,6 +177,88 @@ class FlextApi(s[FlextApiSettings]):
         """
         return self._client.request(request)
 
+    def _get_async_client(self) -> FlextApiAsyncClient:
+        """Get the async client, creating it on first use with the API config."""
+        async_client = self._async_client
+        if async_client is None:
+            config = (
+                self._config
+                if isinstance(self._config, FlextApiSettings)
+                else FlextApiSettings()
+            )
+            # Per-origin state is shared so sync and async calls count together
+            async_client = FlextApiAsyncClient(
+                config=config,
+                cache=self._client.cache,
+                circuit_breaker=self._client.circuit_breaker,
+                coalescer=self._client.coalescer,
+                compression=self._client.compression,
+                concurrency_limiter=self._client.concurrency_limiter,
+                hedging=self._client.hedging,
+                rate_limiter=self._client.rate_limiter,
+                retry_policy=self._client.retry_policy,
+            )
+            self._async_client = async_client
+        return async_client
+
+    async def arequest(
+        self,
+        request: FlextApiModels.HttpRequest,
+    ) -> r[FlextApiModels.HttpResponse]:
+        """Execute HTTP request asynchronously - pure delegation to async client.
+
+        Args:
+        request: HttpRequest model.
+
+        Returns:
+        r[HttpResponse]: Response or error.
+
+        """
+        return await self._get_async_client().arequest(request)
+
+    def request_many(
+        self,
+        requests: Iterable[FlextApiModels.HttpRequest],
+        max_concurrency: int = FlextApiConstants.Api.HTTPBatch.DEFAULT_MAX_CONCURRENCY,
+        *,
+        ordered: bool = False,
+        deadline: float | None = None,
+        cancel_event: threading.Event | None = None,
+    ) -> Iterator[tuple[int, r[FlextApiModels.HttpResponse]]]:
+        """Execute many requests with bounded concurrency - delegation to client.
+
+        Results stream back as (index, r[HttpResponse]) pairs as they complete,
+        or in input order with ``ordered=True``. See FlextApiClient.request_many.
+        """
+        return self._client.request_many(
+            requests,
+            max_concurrency,
+            ordered=ordered,
+            deadline=deadline,
+            cancel_event=cancel_event,
+        )
+
+    def arequest_many(
+        self,
+        requests: Iterable[FlextApiModels.HttpRequest],
+        max_concurrency: int = FlextApiConstants.Api.HTTPBatch.DEFAULT_MAX_CONCURRENCY,
+        *,
+        ordered: bool = False,
+        deadline: float | None = None,
+        cancel_event: asyncio.Event | None = None,
+    ) -> AsyncIterator[tuple[int, r[FlextApiModels.HttpResponse]]]:
+        """Execute many requests concurrently - delegation to async client.
+
+        Async counterpart of request_many. See FlextApiAsyncClient.arequest_many.
+        """
+        return self._get_async_client().arequest_many(
+            requests,
+            max_concurrency,
+            ordered=ordered,
+            deadline=deadline,
+            cancel_event=cancel_event,
+        )
+
     def _extract_query_params(
         self,
         request_kwargs: t.Api.RequestKwargs | None,
@@ -181,7 +318,7 @@ class FlextApi(s[FlextApiSettings]):
             return body_value
         return str(body_value)
 
-    def _http_method(
+    def _build_http_request(
         self,
         method: str,
         url: str,
@@ -189,8 +326,8 @@ class FlextApi(s[FlextApiSettings]):
         headers: dict[str, str] | None = None,
         request_kwargs: t.Api.RequestKwargs | None = None,
         timeout: float | None = None,
-    ) -> r[FlextApiModels.HttpResponse]:
-        """Generic HTTP method executor using monadic patterns - no fallbacks.
+    ) -> r[FlextApiModels.HttpRequest]:
+        """Build validated HttpRequest model using monadic patterns - no fallbacks.
 
         Args:
         method: HTTP method (GET, POST, etc.).
@@ -201,7 +338,7 @@ class FlextApi(s[FlextApiSettings]):
         timeout: Optional timeout override.
 
         Returns:
-        r[HttpResponse]: Response or error.
+        r[HttpRequest]: Request model or error.
 
         """
         # Type narrowing: convert RequestKwargs to dict[str, t.GeneralValueType] | None
@@ -214,7 +351,7 @@ class FlextApi(s[FlextApiSettings]):
             request_kwargs_dict,
         )
         if body_result.is_failure:
-            return r[FlextApiModels.HttpResponse].fail(
+            return r[FlextApiModels.HttpRequest].fail(
                 body_result.error or "Body extraction failed",
             )
 
@@ -224,7 +361,7 @@ class FlextApi(s[FlextApiSettings]):
             request_kwargs_dict,
         )
         if headers_result.is_failure:
-            return r[FlextApiModels.HttpResponse].fail(
+            return r[FlextApiModels.HttpRequest].fail(
                 headers_result.error or "Header extraction failed",
             )
 
@@ -236,14 +373,14 @@ class FlextApi(s[FlextApiSettings]):
             )
         )
         if timeout_result.is_failure:
-            return r[FlextApiModels.HttpResponse].fail(
+            return r[FlextApiModels.HttpRequest].fail(
                 timeout_result.error or "Timeout extraction failed",
             )
 
         # Extract query params
         query_params_result = self._extract_query_params(request_kwargs)
         if query_params_result.is_failure:
-            return r[FlextApiModels.HttpResponse].fail(
+            return r[FlextApiModels.HttpRequest].fail(
                 query_params_result.error or "Query params extraction failed",
             )
 
@@ -260,7 +397,73 @@ class FlextApi(s[FlextApiSettings]):
             query_params=query_params_result.value,
             timeout=timeout_result.value,
         )
-        return self.request(http_request)
+        return r[FlextApiModels.HttpRequest].ok(http_request)
+
+    def _http_method(
+        self,
+        method: str,
+        url: str,
+        data: t.Api.RequestBody | None = None,
+        headers: dict[str, str] | None = None,
+        request_kwargs: t.Api.RequestKwargs | None = None,
+        timeout: float | None = None,
+    ) -> r[FlextApiModels.HttpResponse]:
+        """Generic HTTP method executor using monadic patterns - no fallbacks.
+
+        Args:
+        method: HTTP method (GET, POST, etc.).
+        url: Request URL.
+        data: Optional body.
+        headers: Optional headers.
+        request_kwargs: Additional parameters aligned with FlextApiModels.HttpRequest.
+        timeout: Optional timeout override.
+
+        Returns:
+        r[HttpResponse]: Response or error.
+
+        """
+        request_result = self._build_http_request(
+            method=method,
+            url=url,
+            data=data,
+            headers=headers,
+            request_kwargs=request_kwargs,
+            timeout=timeout,
+        )
+        if request_result.is_failure:
+            return r[FlextApiModels.HttpResponse].fail(
+                request_result.error or "Request build failed",
+            )
+        return self.request(request_result.value)
+
+    async def _ahttp_method(
+        self,
+        method: str,
+        url: str,
+        data: t.Api.RequestBody | None = None,
+        headers: dict[str, str] | None = None,
+        request_kwargs: t.Api.RequestKwargs | None = None,
+        timeout: float | None = None,
+    ) -> r[FlextApiModels.HttpResponse]:
+        """Generic async HTTP method executor - same contract as _http_method.
+
+        Returns:
+        r[HttpResponse]: Response or error.
+
+        """
+        request_result = self._build_http_request(
+            method=method,
+            url=url,
+            data=data,
+            headers=headers,
+            request_kwargs=request_kwargs,
+            timeout=timeout,
+        )
+        if request_result.is_failure:
+            return r[FlextApiModels.HttpResponse].fail(
+                request_result.error or "Request build failed",
+            )
+        return await self.arequest(request_result.value)
 
     def get(
         self,
@@ -338,5 +541,81 @@ class FlextApi(s[FlextApiSettings]):
             request_kwargs=request_kwargs,
         )
 
+    async def aget(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        request_kwargs: t.Api.RequestKwargs | None = None,
+    ) -> r[FlextApiModels.HttpResponse]:
+        """Async HTTP GET - delegates to generic async method."""
+        return await self._ahttp_method(
+            method=FlextApiConstants.Api.Method.GET,
+            url=url,
+            headers=headers,
+            request_kwargs=request_kwargs,
+        )
+
+    async def apost(
+        self,
+        url: str,
+        data: t.Api.RequestBody | None = None,
+        headers: dict[str, str] | None = None,
+        request_kwargs: t.Api.RequestKwargs | None = None,
+    ) -> r[FlextApiModels.HttpResponse]:
+        """Async HTTP POST - delegates to generic async method."""
+        return await self._ahttp_method(
+            method=FlextApiConstants.Api.Method.POST,
+            url=url,
+            data=data,
+            headers=headers,
+            request_kwargs=request_kwargs,
+        )
+
+    async def aput(
+        self,
+        url: str,
+        data: t.Api.RequestBody | None = None,
+        headers: dict[str, str] | None = None,
+        request_kwargs: t.Api.RequestKwargs | None = None,
+    ) -> r[FlextApiModels.HttpResponse]:
+        """Async HTTP PUT - delegates to generic async method."""
+        return await self._ahttp_method(
+            method=FlextApiConstants.Api.Method.PUT,
+            url=url,
+            data=data,
+            headers=headers,
+            request_kwargs=request_kwargs,
+        )
+
+    async def adelete(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        request_kwargs: t.Api.RequestKwargs | None = None,
+    ) -> r[FlextApiModels.HttpResponse]:
+        """Async HTTP DELETE - delegates to generic async method."""
+        return await self._ahttp_method(
+            method=FlextApiConstants.Api.Method.DELETE,
+            url=url,
+            headers=headers,
+            request_kwargs=request_kwargs,
+        )
+
+    async def apatch(
+        self,
+        url: str,
+        data: t.Api.RequestBody | None = None,
+        headers: dict[str, str] | None = None,
+        request_kwargs: t.Api.RequestKwargs | None = None,
+    ) -> r[FlextApiModels.HttpResponse]:
+        """Async HTTP PATCH - delegates to generic async method."""
+        return await self._ahttp_method(
+            method=FlextApiConstants.Api.Method.PATCH,
+            url=url,
+            data=data,
+            headers=headers,
+            request_kwargs=request_kwargs,
+        )
+
 
 __all__ = ["FlextApi"]
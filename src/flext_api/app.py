@@ -10,10 +10,120 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
-from fastapi import FastAPI
+from collections.abc import Callable, Coroutine
+from contextvars import ContextVar
 
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+
+from flext_api.constants import c
+from flext_api.serializers import FlextApiSerializers
 from flext_api.settings import FlextApiSettings
 
+_negotiated_media_type: ContextVar[str] = ContextVar(
+    "flext_api_negotiated_media_type",
+    default=c.Api.ContentType.JSON,
+)
+
+
+class FlextApiJsonResponse(JSONResponse):
+    """JSONResponse rendered with the FlextApiSerializers.Json codec.
+
+    Same compact UTF-8 output as FastAPI's JSONResponse, encoded by orjson
+    or msgspec when installed.
+    """
+
+    def render(self, content: object) -> bytes:
+        """Encode the response content."""
+        return FlextApiSerializers.Json.dumps(content)
+
+
+class FlextApiNegotiatedResponse(FlextApiJsonResponse):
+    """Response encoded as JSON, MessagePack or CBOR per the request's Accept.
+
+    The format is the one FlextApiNegotiatingRoute negotiated for the request
+    being handled; outside such a route it is JSON.
+    """
+
+    def render(self, content: object) -> bytes:
+        """Encode the response content in the negotiated format."""
+        media_type = _negotiated_media_type.get()
+        self.media_type = media_type
+        return FlextApiSerializers.ContentNegotiation.encode(content, media_type)
+
+
+class _BinaryBodyRequest(Request):
+    """Request whose MessagePack/CBOR body FastAPI validates like a JSON one.
+
+    FastAPI only parses bodies labelled JSON, so the route sees a JSON
+    Content-Type while ``json()`` decodes the original wire format.
+    """
+
+    def __init__(self, request: Request, content_type: str) -> None:
+        header = c.Api.HEADER_CONTENT_TYPE.lower().encode("latin-1")
+        scope = dict(request.scope)
+        scope["headers"] = [
+            *(
+                (name, value)
+                for name, value in request.scope["headers"]
+                if name != header
+            ),
+            (header, c.Api.ContentType.JSON.encode("latin-1")),
+        ]
+        super().__init__(scope, request.receive)
+        self._wire_content_type = content_type
+
+    async def json(self) -> object:
+        """Decode the body in its wire format."""
+        return FlextApiSerializers.ContentNegotiation.decode(
+            await self.body(),
+            self._wire_content_type,
+        )
+
+
+class FlextApiNegotiatingRoute(APIRoute):
+    """APIRoute accepting and answering JSON, MessagePack or CBOR bodies.
+
+    Request bodies are decoded by their Content-Type; responses built by the
+    route's response class (FlextApiNegotiatedResponse) are encoded in the
+    format the Accept header ranks highest, JSON by default.
+    """
+
+    def get_route_handler(
+        self,
+    ) -> Callable[[Request], Coroutine[object, object, Response]]:
+        """Wrap the FastAPI handler with content negotiation."""
+        handler = super().get_route_handler()
+        negotiation = FlextApiSerializers.ContentNegotiation
+
+        async def negotiating_handler(request: Request) -> Response:
+            content_type = request.headers.get(c.Api.HEADER_CONTENT_TYPE, "")
+            if (
+                negotiation.supports(content_type)
+                and negotiation.canonical_media_type(content_type)
+                != c.Api.ContentType.JSON
+            ):
+                request = _BinaryBodyRequest(request, content_type)
+            token = _negotiated_media_type.set(
+                negotiation.negotiate(request.headers.get(c.Api.HEADER_ACCEPT)),
+            )
+            try:
+                response = await handler(request)
+            finally:
+                _negotiated_media_type.reset(token)
+            if isinstance(response, FlextApiNegotiatedResponse):
+                vary = c.Api.ContentNegotiation.VARY_HEADER
+                existing = response.headers.get(vary)
+                response.headers[vary] = (
+                    f"{existing}, {c.Api.HEADER_ACCEPT}"
+                    if existing
+                    else c.Api.HEADER_ACCEPT
+                )
+            return response
+
+        return negotiating_handler
+
 
 class FlextApiApp:
     """FastAPI application factory following SOLID principles.
@@ -45,17 +155,26 @@ class FlextApiApp:
         openapi_url: OpenAPI JSON URL
 
         Returns:
-        FastAPI application instance.
+        FastAPI application instance; its routes negotiate JSON, MessagePack
+        or CBOR bodies (FlextApiNegotiatingRoute).
 
         """
-        return FastAPI(
+        app = FastAPI(
             title=title or "FlextAPI",
             version=version or "1.0.0",
             description=description or "FlextAPI Application",
             docs_url=docs_url or "/docs",
             redoc_url=redoc_url or "/redoc",
             openapi_url=openapi_url or "/openapi.json",
+            default_response_class=FlextApiNegotiatedResponse,
         )
+        app.router.route_class = FlextApiNegotiatingRoute
+        return app
 
 
-__all__ = ["FlextApiApp"]
+__all__ = [
+    "FlextApiApp",
+    "FlextApiJsonResponse",
+    "FlextApiNegotiatedResponse",
+    "FlextApiNegotiatingRoute",
+]
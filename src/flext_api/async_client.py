@@ -0,0 +1,620 @@
+"""Generic Async HTTP Client - Domain-agnostic asyncio HTTP operations.
+
+Native asyncio counterpart of FlextApiClient built on httpx.AsyncClient.
+Shares request/response models, URL building and body (de)serialization
+with the synchronous client and keeps the FlextResult contract. Retries
+back off with asyncio.sleep so the event loop is never blocked.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Iterable
+from types import TracebackType
+from typing import ClassVar, Literal, Self
+
+import httpx
+from flext_core import r
+
+from flext_api.cache import FlextApiHttpCache
+from flext_api.circuit_breaker import FlextApiCircuitBreaker
+from flext_api.client import FlextApiClient, SerializedBody
+from flext_api.coalescing import FlextApiRequestCoalescer
+from flext_api.compression import FlextApiCompression
+from flext_api.concurrency import FlextApiConcurrencyLimiter
+from flext_api.constants import FlextApiConstants
+from flext_api.hedging import FlextApiHedging
+from flext_api.models import FlextApiModels
+from flext_api.pagination import FlextApiPagination
+from flext_api.rate_limit import FlextApiRateLimiter
+from flext_api.retry import FlextApiRetryPolicy
+from flext_api.settings import FlextApiSettings
+from flext_api.streaming import FlextApiStreamingBody
+from flext_api.typings import t
+
+
+class FlextApiAsyncClient(FlextApiClient):
+    """Generic asyncio HTTP client using FLEXT patterns.
+
+    Single responsibility: Execute HTTP requests concurrently on one event
+    loop with FlextResult error handling. Configuration, URL building and
+    body handling are inherited from FlextApiClient, so the synchronous
+    request() API stays available on the same instance.
+
+    Owns one long-lived httpx.AsyncClient pool (limits from FlextApiSettings);
+    release it with aclose() or by using the client as an async context manager.
+    Retries follow the same rule as FlextApiClient (retry_policy, or one built
+    from the retry settings when retry_enabled is set) with non-blocking
+    backoff.
+
+    FlextApiSettings.dns_cache_enabled does not apply: async connections use
+    anyio's resolver, so no FlextApiDnsCache is created or reported.
+    """
+
+    _dns_cache_supported: ClassVar[bool] = False
+
+    # Type annotations for dynamically-set fields (using object.__setattr__)
+    _async_http_client: httpx.AsyncClient | None
+    _async_transport: httpx.AsyncBaseTransport | None
+
+    def __init__(
+        self,
+        config: FlextApiSettings | None = None,
+        *,
+        transport: httpx.AsyncBaseTransport | None = None,
+        cache: FlextApiHttpCache | None = None,
+        circuit_breaker: FlextApiCircuitBreaker | None = None,
+        coalescer: FlextApiRequestCoalescer | None = None,
+        compression: FlextApiCompression | None = None,
+        concurrency_limiter: FlextApiConcurrencyLimiter | None = None,
+        hedging: FlextApiHedging | None = None,
+        rate_limiter: FlextApiRateLimiter | None = None,
+        retry_policy: FlextApiRetryPolicy | None = None,
+        **kwargs: t.JsonValue | str | int | bool,
+    ) -> None:
+        """Initialize with optional configuration model and transport.
+
+        Args:
+        config: Optional FlextApiSettings model. If None, uses default configuration.
+        transport: Optional httpx async transport (e.g. httpx.ASGITransport to
+                call an in-process ASGI app). Defaults to the pooled network transport.
+        cache: Optional HTTP response cache (see FlextApiClient).
+        circuit_breaker: Optional per-origin circuit breaker (see FlextApiClient).
+        coalescer: Optional single-flight coalescer (see FlextApiClient).
+        compression: Optional request/response compression (see FlextApiClient).
+        concurrency_limiter: Optional adaptive per-origin in-flight limit;
+                queued requests wait without blocking the loop (see
+                FlextApiClient).
+        hedging: Optional hedging of slow idempotent requests; losing copies
+                are cancelled (see FlextApiClient).
+        rate_limiter: Optional token-bucket pacing; requests await their
+                token without blocking the loop (see FlextApiClient).
+        retry_policy: Optional retry policy (see FlextApiClient).
+        **kwargs: Additional Pydantic model fields (ignored for this service).
+
+        """
+        super().__init__(
+            config,
+            cache=cache,
+            circuit_breaker=circuit_breaker,
+            coalescer=coalescer,
+            compression=compression,
+            concurrency_limiter=concurrency_limiter,
+            dns_cache=None,
+            hedging=hedging,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            **kwargs,
+        )
+        object.__setattr__(self, "_async_transport", transport)
+        object.__setattr__(self, "_async_http_client", None)
+
+    @property
+    def is_async_closed(self) -> bool:
+        """Check whether the async pooled transport is closed (or never opened)."""
+        http_client: httpx.AsyncClient | None = self._async_http_client
+        return http_client is None or http_client.is_closed
+
+    def _get_async_http_client(self) -> httpx.AsyncClient:
+        """Get the pooled httpx async client, creating it on first use."""
+        http_client: httpx.AsyncClient | None = self._async_http_client
+        if http_client is None or http_client.is_closed:
+            http_client = httpx.AsyncClient(
+                timeout=self._get_config().timeout,
+                limits=self._build_pool_limits(),
+                transport=self._async_transport,
+            )
+            object.__setattr__(self, "_async_http_client", http_client)
+        return http_client
+
+    async def aclose(self) -> None:
+        """Close the async and sync pooled transports.
+
+        The client stays usable: the next request opens a new pool.
+        """
+        http_client: httpx.AsyncClient | None = self._async_http_client
+        object.__setattr__(self, "_async_http_client", None)
+        if http_client is not None:
+            await http_client.aclose()
+        self.close()
+
+    async def __aenter__(self) -> Self:
+        """Enter async context manager."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit async context manager and close the connection pools."""
+        await self.aclose()
+
+    async def arequest(
+        self,
+        request: FlextApiModels.HttpRequest,
+    ) -> r[FlextApiModels.HttpResponse]:
+        """Execute HTTP request from model without blocking the event loop.
+
+        Args:
+        request: HttpRequest Value Object with method, url, headers, body.
+
+        Returns:
+        r[HttpResponse]: Success with HttpResponse or error message.
+
+        """
+        url_result = self._build_url(request.url)
+        if url_result.is_failure:
+            return r[FlextApiModels.HttpResponse].fail(
+                url_result.error or "URL validation failed",
+            )
+
+        body_result = self._serialize_body(
+            request.body,
+            content_type=self._request_content_type(request),
+        )
+        if body_result.is_failure:
+            return r[FlextApiModels.HttpResponse].fail(
+                body_result.error or "Body serialization failed",
+            )
+
+        return await self._aexecute_with_retry(
+            request=request,
+            url=url_result.value,
+            serialized_body=body_result.value,
+        )
+
+    def arequest_many(
+        self,
+        requests: Iterable[FlextApiModels.HttpRequest],
+        max_concurrency: int = FlextApiConstants.Api.HTTPBatch.DEFAULT_MAX_CONCURRENCY,
+        *,
+        ordered: bool = False,
+        deadline: float | None = None,
+        cancel_event: asyncio.Event | None = None,
+    ) -> AsyncIterator[tuple[int, r[FlextApiModels.HttpResponse]]]:
+        """Execute many requests concurrently on the event loop.
+
+        Async counterpart of request_many: at most ``max_concurrency`` tasks
+        are in flight, requests are pulled from ``requests`` lazily and results
+        stream back as ``(index, result)`` pairs. A passed deadline, a set
+        ``cancel_event`` or closing the iterator cancels the tasks still
+        running; those requests are reported with a failure result, while
+        finished ones keep their result.
+
+        Args:
+        requests: HttpRequest models to execute.
+        max_concurrency: Maximum number of requests in flight.
+        ordered: Yield results in input order instead of completion order.
+        deadline: Optional time budget for the whole batch, in seconds.
+        cancel_event: Optional event that cancels the batch when set.
+
+        Returns:
+        Async iterator of (index, r[HttpResponse]) pairs.
+
+        """
+        if max_concurrency < 1:
+            msg = f"max_concurrency must be >= 1, got {max_concurrency}"
+            raise ValueError(msg)
+        return self._aiter_request_many(
+            requests,
+            max_concurrency,
+            ordered=ordered,
+            deadline=deadline,
+            cancel_event=cancel_event,
+        )
+
+    def apaginate(
+        self,
+        request: FlextApiModels.HttpRequest,
+        pagination: FlextApiPagination | None = None,
+    ) -> AsyncIterator[t.GeneralValueType]:
+        """Async paginate: yield every page's items, prefetching as tasks.
+
+        Args:
+        request: Request of the collection; pagination parameters are added.
+        pagination: Strategy, page size and prefetch depth (default: page
+                numbers, FlextApiPagination()).
+
+        Returns:
+        Async iterator of items; raises FlextApiPagination.PageError when a
+        page fails.
+
+        """
+        return (pagination or FlextApiPagination()).aiterate(request, self.arequest)
+
+    async def _aiter_request_many(
+        self,
+        requests: Iterable[FlextApiModels.HttpRequest],
+        max_concurrency: int,
+        *,
+        ordered: bool,
+        deadline: float | None,
+        cancel_event: asyncio.Event | None,
+    ) -> AsyncIterator[tuple[int, r[FlextApiModels.HttpResponse]]]:
+        """Drive an arequest_many batch with a bounded window of tasks."""
+        deadline_at = None if deadline is None else time.monotonic() + deadline
+        pending = enumerate(requests)
+        # Insertion-ordered: the first key is always the oldest request in flight
+        in_flight: dict[asyncio.Task[r[FlextApiModels.HttpResponse]], int] = {}
+        cancel_waiter = (
+            asyncio.ensure_future(cancel_event.wait())
+            if cancel_event is not None
+            else None
+        )
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(in_flight) < max_concurrency:
+                    item = next(pending, None)
+                    if item is None:
+                        exhausted = True
+                        break
+                    index, request = item
+                    in_flight[asyncio.ensure_future(self.arequest(request))] = index
+                if not in_flight:
+                    return
+
+                stop_error = self._batch_stop_error(
+                    deadline_at,
+                    cancelled=cancel_event is not None and cancel_event.is_set(),
+                )
+                if stop_error is not None:
+                    for task, index in in_flight.items():
+                        if task.done():
+                            yield index, self._task_result(task)
+                            continue
+                        task.cancel()
+                        yield index, r[FlextApiModels.HttpResponse].fail(stop_error)
+                    return
+
+                waiting: set[
+                    asyncio.Future[r[FlextApiModels.HttpResponse]]
+                    | asyncio.Future[Literal[True]]
+                ] = {next(iter(in_flight))} if ordered else set(in_flight)
+                if cancel_waiter is not None:
+                    waiting.add(cancel_waiter)
+                await asyncio.wait(
+                    waiting,
+                    timeout=self._batch_wait_timeout(deadline_at, cancellable=False),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                ready: list[asyncio.Task[r[FlextApiModels.HttpResponse]]] = []
+                for task in in_flight:
+                    if task.done():
+                        ready.append(task)
+                    elif ordered:
+                        break
+                for task in ready:
+                    yield in_flight.pop(task), self._task_result(task)
+        finally:
+            for task in in_flight:
+                task.cancel()
+            if cancel_waiter is not None:
+                cancel_waiter.cancel()
+
+    @staticmethod
+    def _task_result(
+        task: asyncio.Task[r[FlextApiModels.HttpResponse]],
+    ) -> r[FlextApiModels.HttpResponse]:
+        """Unwrap a finished request task into a result, never raising."""
+        if task.cancelled():
+            return r[FlextApiModels.HttpResponse].fail(
+                FlextApiConstants.Api.HTTPBatch.CANCELLED_ERROR,
+            )
+        exc = task.exception()
+        if exc is not None:
+            return r[FlextApiModels.HttpResponse].fail(str(exc))
+        return task.result()
+
+    async def _aexecute_with_retry(
+        self,
+        request: FlextApiModels.HttpRequest,
+        url: str,
+        serialized_body: SerializedBody,
+    ) -> r[FlextApiModels.HttpResponse]:
+        """Execute HTTP request with retries (cache-aware) as a result."""
+        try:
+            headers = self._build_request_headers(request)
+            serialized_body, headers = self._compress_body(serialized_body, headers)
+
+            async def send(extra_headers: dict[str, str]) -> httpx.Response:
+                return await self._asend_coalesced(
+                    request,
+                    url,
+                    serialized_body,
+                    {**headers, **extra_headers},
+                )
+
+            cache: FlextApiHttpCache | None = self._cache
+            response = (
+                await send({})
+                if cache is None
+                else await cache.afetch(
+                    request.method,
+                    url,
+                    request.query_params,
+                    headers,
+                    send,
+                )
+            )
+            self._record_response(response)
+            return self._build_http_response(
+                response,
+                lazy=self._get_config().lazy_response_body,
+            )
+        except FlextApiCircuitBreaker.OpenError as exc:
+            return r[FlextApiModels.HttpResponse].fail(
+                str(exc),
+                error_code=FlextApiConstants.Api.CircuitBreaker.OPEN_ERROR_CODE,
+            )
+        except FlextApiConcurrencyLimiter.LimitExceededError as exc:
+            return r[FlextApiModels.HttpResponse].fail(
+                str(exc),
+                error_code=FlextApiConstants.Api.Concurrency.LIMITED_ERROR_CODE,
+            )
+        except FlextApiRateLimiter.RateLimitedError as exc:
+            return r[FlextApiModels.HttpResponse].fail(
+                str(exc),
+                error_code=FlextApiConstants.Api.RateLimit.LIMITED_ERROR_CODE,
+            )
+        except Exception as exc:
+            return r[FlextApiModels.HttpResponse].fail(str(exc))
+
+    async def _asend_coalesced(
+        self,
+        request: FlextApiModels.HttpRequest,
+        url: str,
+        serialized_body: SerializedBody,
+        headers: dict[str, str],
+    ) -> httpx.Response:
+        """Send with retries, sharing identical in-flight calls when enabled."""
+        coalescer: FlextApiRequestCoalescer | None = self._coalescer
+        if coalescer is None:
+            return await self._asend_with_retry(
+                request,
+                url,
+                serialized_body,
+                headers,
+            )
+        return await coalescer.aexecute(
+            request.method,
+            url,
+            request.query_params,
+            headers,
+            lambda: self._asend_with_retry(request, url, serialized_body, headers),
+            has_body=bool(serialized_body),
+        )
+
+    async def _asend_with_retry(
+        self,
+        request: FlextApiModels.HttpRequest,
+        url: str,
+        serialized_body: SerializedBody,
+        headers: dict[str, str],
+    ) -> httpx.Response:
+        """Send with the retry policy and asyncio.sleep backoff.
+
+        Returns the last response once it is not retryable or retries stop;
+        re-raises the last transport error if every attempt failed. One-shot
+        streamed bodies are sent once.
+        """
+        policy: FlextApiRetryPolicy | None = self._retry_policy
+        if policy is None:
+            return await self._asend_hedged(
+                request,
+                url,
+                serialized_body,
+                headers,
+                request.timeout,
+            )
+
+        async def send(timeout: float | None) -> httpx.Response:
+            try:
+                return await self._asend_hedged(
+                    request,
+                    url,
+                    serialized_body,
+                    headers,
+                    timeout,
+                )
+            except httpx.TransportError as exc:
+                self.logger.warning(
+                    "Transport error",
+                    extra={"url": url, "method": request.method, "error": str(exc)},
+                )
+                raise
+
+        return await policy.aexecute(
+            request.method,
+            url,
+            send,
+            timeout=request.timeout,
+            replayable=self._is_replayable(serialized_body),
+        )
+
+    async def _asend_hedged(
+        self,
+        request: FlextApiModels.HttpRequest,
+        url: str,
+        serialized_body: SerializedBody,
+        headers: dict[str, str],
+        timeout: float | None,
+    ) -> httpx.Response:
+        """Send one attempt, hedging it when slow if hedging is enabled."""
+        hedging: FlextApiHedging | None = self._hedging
+        if hedging is None:
+            return await self._asend_through_circuit(
+                request,
+                url,
+                serialized_body,
+                headers,
+                timeout,
+            )
+        return await hedging.aexecute(
+            request.method,
+            url,
+            lambda: self._asend_through_circuit(
+                request,
+                url,
+                serialized_body,
+                headers,
+                timeout,
+            ),
+            replayable=self._is_replayable(serialized_body),
+        )
+
+    async def _asend_through_circuit(
+        self,
+        request: FlextApiModels.HttpRequest,
+        url: str,
+        serialized_body: SerializedBody,
+        headers: dict[str, str],
+        timeout: float | None,
+    ) -> httpx.Response:
+        """Send one attempt, guarded by the origin's circuit when enabled."""
+        breaker: FlextApiCircuitBreaker | None = self._circuit_breaker
+        if breaker is None:
+            return await self._asend_paced(
+                request,
+                url,
+                serialized_body,
+                headers,
+                timeout,
+            )
+        return await breaker.acall(
+            url,
+            lambda: self._asend_paced(
+                request,
+                url,
+                serialized_body,
+                headers,
+                timeout,
+            ),
+        )
+
+    async def _asend_paced(
+        self,
+        request: FlextApiModels.HttpRequest,
+        url: str,
+        serialized_body: SerializedBody,
+        headers: dict[str, str],
+        timeout: float | None,
+    ) -> httpx.Response:
+        """Send one copy once the rate limiter hands out a token."""
+        limiter: FlextApiRateLimiter | None = self._rate_limiter
+        if limiter is None:
+            return await self._asend_limited(
+                request,
+                url,
+                serialized_body,
+                headers,
+                timeout,
+            )
+        return await limiter.acall(
+            url,
+            lambda: self._asend_limited(
+                request,
+                url,
+                serialized_body,
+                headers,
+                timeout,
+            ),
+        )
+
+    async def _asend_limited(
+        self,
+        request: FlextApiModels.HttpRequest,
+        url: str,
+        serialized_body: SerializedBody,
+        headers: dict[str, str],
+        timeout: float | None,
+    ) -> httpx.Response:
+        """Send one copy within the origin's adaptive concurrency limit."""
+        limiter: FlextApiConcurrencyLimiter | None = self._concurrency_limiter
+        if limiter is None:
+            return await self._aexecute_http_request(
+                request,
+                url,
+                serialized_body,
+                headers,
+                timeout,
+            )
+        return await limiter.acall(
+            url,
+            lambda: self._aexecute_http_request(
+                request,
+                url,
+                serialized_body,
+                headers,
+                timeout,
+            ),
+        )
+
+    async def _aexecute_http_request(
+        self,
+        request: FlextApiModels.HttpRequest,
+        url: str,
+        serialized_body: SerializedBody,
+        headers: dict[str, str],
+        timeout: float | None,
+    ) -> httpx.Response:
+        """Send one HTTP request over the pooled httpx async client."""
+        client = self._get_async_http_client()
+        request_params: dict[str, str | list[str]] = request.query_params
+
+        if isinstance(serialized_body, FlextApiStreamingBody):
+            return await client.request(
+                method=request.method,
+                url=url,
+                headers={**serialized_body.headers, **headers},
+                params=request_params,
+                content=serialized_body.aiter_chunks(),
+                timeout=timeout,
+            )
+
+        if serialized_body:
+            return await client.request(
+                method=request.method,
+                url=url,
+                headers=headers,
+                params=request_params,
+                content=serialized_body,
+                timeout=timeout,
+            )
+        return await client.request(
+            method=request.method,
+            url=url,
+            headers=headers,
+            params=request_params,
+            timeout=timeout,
+        )
+
+
+__all__ = ["FlextApiAsyncClient"]
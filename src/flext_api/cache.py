@@ -0,0 +1,659 @@
+"""Generic HTTP response cache - RFC 9111 caching in front of the client.
+
+Opt-in cache layer used by FlextApiClient and FlextApiAsyncClient. Stores
+responses in FlextApiStorage (or any StorageBackendProtocol), honours
+Cache-Control (max-age, s-maxage, no-store, no-cache, private,
+must-revalidate, stale-while-revalidate), Expires and heuristic freshness,
+revalidates with ETag/Last-Modified and keeps one variant per Vary value.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import math
+import threading
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from email.utils import parsedate_to_datetime
+
+import httpx
+from flext_core import FlextLogger, r
+
+from flext_api.constants import FlextApiConstants
+from flext_api.protocols import p
+from flext_api.storage import FlextApiStorage
+from flext_api.typings import t
+
+type CacheVariant = dict[str, t.GeneralValueType]
+type SendFn = Callable[[dict[str, str]], httpx.Response]
+type AsyncSendFn = Callable[[dict[str, str]], Awaitable[httpx.Response]]
+
+
+class FlextApiHttpCache:
+    """RFC 9111 HTTP response cache backed by a storage backend.
+
+    Only GET responses are stored. Successful unsafe requests (POST, PUT,
+    PATCH, DELETE) invalidate the cached entry of their target URL.
+
+    Entries are JSON-compatible dicts keyed by the full URL (query included),
+    each holding up to MAX_VARIANTS responses selected by the request headers
+    named in Vary. Fresh entries are served without a round-trip, stale ones
+    are revalidated with If-None-Match/If-Modified-Since, and entries within
+    their stale-while-revalidate window are served immediately while a
+    background revalidation refreshes them.
+
+    A private cache (default) may store ``Cache-Control: private`` responses;
+    a shared cache (``shared=True``) does not, and also honours s-maxage.
+    """
+
+    _COUNTERS = (
+        "hits",
+        "misses",
+        "stale_hits",
+        "revalidations",
+        "stores",
+        "invalidations",
+    )
+
+    def __init__(
+        self,
+        storage: p.Api.Storage.StorageBackendProtocol | FlextApiStorage | None = None,
+        *,
+        shared: bool = False,
+    ) -> None:
+        """Initialize cache with storage backend.
+
+        Args:
+            storage: Storage backend; defaults to an in-memory FlextApiStorage.
+            shared: Behave as a shared cache (RFC 9111 section 3.5).
+
+        """
+        self.logger = FlextLogger(__name__)
+        self._storage: p.Api.Storage.StorageBackendProtocol | FlextApiStorage = (
+            storage
+            if storage is not None
+            else FlextApiStorage(
+                {"namespace": FlextApiConstants.Api.HttpCache.NAMESPACE}
+            )
+        )
+        self._shared = shared
+        self._lock = threading.Lock()
+        self._counters: dict[str, int] = dict.fromkeys(self._COUNTERS, 0)
+        self._revalidating: set[str] = set()
+        self._background_tasks: set[asyncio.Task[None]] = set()
+
+    @property
+    def shared(self) -> bool:
+        """Whether the cache behaves as a shared cache."""
+        return self._shared
+
+    def metrics(self) -> r[t.Api.MetricsDict]:
+        """Get hit/miss/revalidation counters."""
+        with self._lock:
+            return r[t.Api.MetricsDict].ok(dict(self._counters))
+
+    def clear(self) -> r[bool]:
+        """Drop every cached response and reset counters."""
+        with self._lock:
+            self._counters = dict.fromkeys(self._COUNTERS, 0)
+            return self._storage.clear()
+
+    # ------------------------------------------------------------------
+    # Request flow
+    # ------------------------------------------------------------------
+
+    def fetch(
+        self,
+        method: str,
+        url: str,
+        params: Mapping[str, str | list[str]],
+        headers: Mapping[str, str],
+        send: SendFn,
+    ) -> httpx.Response:
+        """Serve a request from cache or through ``send``.
+
+        Args:
+            method: HTTP method.
+            url: Absolute request URL (without query params).
+            params: Query parameters.
+            headers: Request headers that will be sent.
+            send: Sends the request with extra (conditional) headers merged in.
+
+        Returns:
+            Cached or network response. Transport errors from ``send`` propagate.
+
+        """
+        method = method.upper()
+        cache_key = self._cache_key(url, params)
+        if method != FlextApiConstants.Api.Method.GET:
+            response = send({})
+            self._invalidate_after(method, cache_key, response)
+            return response
+
+        request_headers = self._lower_headers(headers)
+        request_cc = self._parse_cache_control(request_headers.get("cache-control"))
+        variant = (
+            None
+            if "no-store" in request_cc
+            else self._lookup(cache_key, request_headers)
+        )
+        if variant is None:
+            self._count("misses")
+            response = send({})
+            self._store(cache_key, request_headers, request_cc, response)
+            return response
+
+        state = self._freshness_state(variant, request_cc)
+        if state == "fresh":
+            self._count("hits")
+            return self._to_response(variant, method, url, params)
+        if state == "stale_while_revalidate":
+            self._count("stale_hits")
+            if self._claim_revalidation(cache_key):
+                threading.Thread(
+                    target=self._revalidate_in_background,
+                    args=(cache_key, request_headers, variant, send),
+                    name="flext-api-cache-revalidate",
+                    daemon=True,
+                ).start()
+            return self._to_response(variant, method, url, params)
+
+        response = send(self._conditional_headers(variant))
+        return self._complete_revalidation(
+            cache_key,
+            request_headers,
+            request_cc,
+            variant,
+            response,
+        )
+
+    async def afetch(
+        self,
+        method: str,
+        url: str,
+        params: Mapping[str, str | list[str]],
+        headers: Mapping[str, str],
+        send: AsyncSendFn,
+    ) -> httpx.Response:
+        """Async counterpart of fetch - background revalidation runs as a task."""
+        method = method.upper()
+        cache_key = self._cache_key(url, params)
+        if method != FlextApiConstants.Api.Method.GET:
+            response = await send({})
+            self._invalidate_after(method, cache_key, response)
+            return response
+
+        request_headers = self._lower_headers(headers)
+        request_cc = self._parse_cache_control(request_headers.get("cache-control"))
+        variant = (
+            None
+            if "no-store" in request_cc
+            else self._lookup(cache_key, request_headers)
+        )
+        if variant is None:
+            self._count("misses")
+            response = await send({})
+            self._store(cache_key, request_headers, request_cc, response)
+            return response
+
+        state = self._freshness_state(variant, request_cc)
+        if state == "fresh":
+            self._count("hits")
+            return self._to_response(variant, method, url, params)
+        if state == "stale_while_revalidate":
+            self._count("stale_hits")
+            if self._claim_revalidation(cache_key):
+                task = asyncio.ensure_future(
+                    self._arevalidate_in_background(
+                        cache_key,
+                        request_headers,
+                        variant,
+                        send,
+                    ),
+                )
+                self._background_tasks.add(task)
+                task.add_done_callback(self._background_tasks.discard)
+            return self._to_response(variant, method, url, params)
+
+        response = await send(self._conditional_headers(variant))
+        return self._complete_revalidation(
+            cache_key,
+            request_headers,
+            request_cc,
+            variant,
+            response,
+        )
+
+    def _claim_revalidation(self, cache_key: str) -> bool:
+        """Mark a key as being revalidated; False if one is already running."""
+        with self._lock:
+            if cache_key in self._revalidating:
+                return False
+            self._revalidating.add(cache_key)
+            return True
+
+    def _revalidate_in_background(
+        self,
+        cache_key: str,
+        request_headers: dict[str, str],
+        variant: CacheVariant,
+        send: SendFn,
+    ) -> None:
+        """Revalidate a stale entry off the request path (thread target)."""
+        try:
+            response = send(self._conditional_headers(variant))
+            self._complete_revalidation(
+                cache_key, request_headers, {}, variant, response
+            )
+        except Exception as exc:
+            self.logger.warning(
+                "Background cache revalidation failed",
+                extra={"key": cache_key, "error": str(exc)},
+            )
+        finally:
+            with self._lock:
+                self._revalidating.discard(cache_key)
+
+    async def _arevalidate_in_background(
+        self,
+        cache_key: str,
+        request_headers: dict[str, str],
+        variant: CacheVariant,
+        send: AsyncSendFn,
+    ) -> None:
+        """Revalidate a stale entry off the request path (asyncio task)."""
+        try:
+            response = await send(self._conditional_headers(variant))
+            self._complete_revalidation(
+                cache_key, request_headers, {}, variant, response
+            )
+        except Exception as exc:
+            self.logger.warning(
+                "Background cache revalidation failed",
+                extra={"key": cache_key, "error": str(exc)},
+            )
+        finally:
+            with self._lock:
+                self._revalidating.discard(cache_key)
+
+    def _complete_revalidation(
+        self,
+        cache_key: str,
+        request_headers: dict[str, str],
+        request_cc: dict[str, str | None],
+        variant: CacheVariant,
+        response: httpx.Response,
+    ) -> httpx.Response:
+        """Apply a revalidation response: refresh on 304, replace otherwise."""
+        if response.status_code != httpx.codes.NOT_MODIFIED:
+            self._count("misses")
+            self._store(cache_key, request_headers, request_cc, response)
+            return response
+
+        self._count("revalidations")
+        stored_headers = self._variant_headers(variant)
+        merged = httpx.Headers(stored_headers)
+        for name, value in response.headers.items():
+            if name.lower() not in FlextApiConstants.Api.HttpCache.UNSTORED_HEADERS:
+                merged[name] = value
+        refreshed = httpx.Response(
+            status_code=self._variant_int(variant, "status"),
+            headers=list(merged.items()),
+            content=self._variant_content(variant),
+            request=response.request,
+        )
+        self._store(cache_key, request_headers, request_cc, refreshed)
+        return refreshed
+
+    def _invalidate_after(
+        self,
+        method: str,
+        cache_key: str,
+        response: httpx.Response,
+    ) -> None:
+        """Invalidate the target URL after a successful unsafe request."""
+        if (
+            method in FlextApiConstants.Api.SAFE_METHODS_SET
+            or response.status_code >= FlextApiConstants.Api.HTTP_REDIRECT_MIN
+        ):
+            return
+        with self._lock:
+            if self._storage.exists(cache_key).value:
+                self._storage.delete(cache_key)
+                self._counters["invalidations"] += 1
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            self._counters[counter] += 1
+
+    def _lookup(
+        self,
+        cache_key: str,
+        request_headers: dict[str, str],
+    ) -> CacheVariant | None:
+        """Find the stored variant matching the request's Vary headers."""
+        with self._lock:
+            entry_result = self._storage.get(cache_key)
+        if entry_result.is_failure or not isinstance(entry_result.value, dict):
+            return None
+        variants = entry_result.value.get("variants")
+        if not isinstance(variants, list):
+            return None
+        for variant in variants:
+            if isinstance(variant, dict) and self._vary_matches(
+                variant, request_headers
+            ):
+                return variant
+        return None
+
+    def _store(
+        self,
+        cache_key: str,
+        request_headers: dict[str, str],
+        request_cc: dict[str, str | None],
+        response: httpx.Response,
+    ) -> None:
+        """Store the response if RFC 9111 allows it."""
+        if not self._is_storable(request_headers, request_cc, response):
+            return
+        variant = self._build_variant(request_headers, response, time.time())
+        retention = self._retention(variant)
+        if retention <= 0:
+            return
+
+        with self._lock:
+            entry_result = self._storage.get(cache_key)
+            existing = (
+                entry_result.value.get("variants")
+                if entry_result.is_success and isinstance(entry_result.value, dict)
+                else None
+            )
+            variants: list[t.GeneralValueType] = [
+                other
+                for other in (existing if isinstance(existing, list) else [])
+                if isinstance(other, dict) and other.get("vary") != variant["vary"]
+            ]
+            variants.append(variant)
+            variants = variants[-FlextApiConstants.Api.HttpCache.MAX_VARIANTS :]
+            longest = max(
+                self._retention(other) for other in variants if isinstance(other, dict)
+            )
+            set_result = self._storage.set(
+                cache_key,
+                {"variants": variants},
+                timeout=max(1, math.ceil(longest)),
+            )
+            if set_result.is_success:
+                self._counters["stores"] += 1
+
+    def _is_storable(
+        self,
+        request_headers: dict[str, str],
+        request_cc: dict[str, str | None],
+        response: httpx.Response,
+    ) -> bool:
+        """Check RFC 9111 section 3 storage rules."""
+        if (
+            response.status_code
+            not in FlextApiConstants.Api.HttpCache.STORABLE_STATUS_CODES
+        ):
+            return False
+        response_cc = self._parse_cache_control(response.headers.get("cache-control"))
+        if "no-store" in request_cc or "no-store" in response_cc:
+            return False
+        if response.headers.get("vary", "").strip() == "*":
+            return False
+        if self._shared:
+            if "private" in response_cc:
+                return False
+            if "authorization" in request_headers and not (
+                {"public", "s-maxage", "must-revalidate"} & response_cc.keys()
+            ):
+                return False
+        return bool(
+            {"max-age", "s-maxage", "public", "no-cache"} & response_cc.keys()
+            or "expires" in response.headers
+            or "etag" in response.headers
+            or "last-modified" in response.headers,
+        )
+
+    def _build_variant(
+        self,
+        request_headers: dict[str, str],
+        response: httpx.Response,
+        response_time: float,
+    ) -> CacheVariant:
+        """Serialize a response and its freshness data to a JSON-compatible dict."""
+        response_cc = self._parse_cache_control(response.headers.get("cache-control"))
+        lifetime = self._freshness_lifetime(response, response_cc, response_time)
+        date_value = self._parse_http_date(response.headers.get("date"))
+        apparent_age = max(0.0, response_time - date_value) if date_value else 0.0
+        age_value = self._parse_seconds(response.headers.get("age")) or 0
+        initial_age = max(apparent_age, float(age_value))
+
+        no_stale = "must-revalidate" in response_cc or (
+            self._shared and "proxy-revalidate" in response_cc
+        )
+        swr = (
+            0
+            if no_stale
+            else self._parse_seconds(response_cc.get("stale-while-revalidate")) or 0
+        )
+        vary_names = [
+            name.strip().lower()
+            for name in response.headers.get("vary", "").split(",")
+            if name.strip()
+        ]
+        stored_headers: list[t.JsonValue] = [
+            [name, value]
+            for name, value in response.headers.items()
+            if name.lower() not in FlextApiConstants.Api.HttpCache.UNSTORED_HEADERS
+        ]
+        return {
+            "vary": {name: request_headers.get(name, "") for name in vary_names},
+            "status": response.status_code,
+            "headers": stored_headers,
+            "content": base64.b64encode(response.content).decode("ascii"),
+            "response_time": response_time,
+            "initial_age": initial_age,
+            "expires_at": response_time + lifetime - initial_age,
+            "stale_while_revalidate": swr,
+            "has_validators": "etag" in response.headers
+            or "last-modified" in response.headers,
+        }
+
+    def _freshness_lifetime(
+        self,
+        response: httpx.Response,
+        response_cc: dict[str, str | None],
+        response_time: float,
+    ) -> float:
+        """Compute freshness lifetime (RFC 9111 4.2.1); 0 forces revalidation."""
+        if "no-cache" in response_cc:
+            return 0.0
+        if self._shared and "s-maxage" in response_cc:
+            return float(self._parse_seconds(response_cc["s-maxage"]) or 0)
+        if "max-age" in response_cc:
+            return float(self._parse_seconds(response_cc["max-age"]) or 0)
+        date_value = (
+            self._parse_http_date(response.headers.get("date")) or response_time
+        )
+        if "expires" in response.headers:
+            expires = self._parse_http_date(response.headers.get("expires"))
+            return max(0.0, expires - date_value) if expires else 0.0
+        last_modified = self._parse_http_date(response.headers.get("last-modified"))
+        if last_modified:
+            return max(
+                0.0,
+                (date_value - last_modified)
+                * FlextApiConstants.Api.HttpCache.HEURISTIC_FRACTION,
+            )
+        return 0.0
+
+    @staticmethod
+    def _retention(variant: CacheVariant) -> float:
+        """Seconds the storage backend should keep a variant."""
+        expires_at = variant.get("expires_at")
+        swr = variant.get("stale_while_revalidate")
+        remaining = (
+            (float(expires_at) if isinstance(expires_at, (int, float)) else 0.0)
+            + (float(swr) if isinstance(swr, (int, float)) else 0.0)
+            - time.time()
+        )
+        if variant.get("has_validators"):
+            remaining = (
+                max(remaining, 0.0) + FlextApiConstants.Api.HttpCache.STALE_RETENTION
+            )
+        return remaining
+
+    # ------------------------------------------------------------------
+    # Freshness and response reconstruction
+    # ------------------------------------------------------------------
+
+    def _freshness_state(
+        self,
+        variant: CacheVariant,
+        request_cc: dict[str, str | None],
+    ) -> str:
+        """Classify a variant as fresh, stale_while_revalidate or stale."""
+        now = time.time()
+        expires_at = float(self._variant_number(variant, "expires_at"))
+        if "no-cache" in request_cc:
+            return "stale"
+        request_max_age = self._parse_seconds(request_cc.get("max-age"))
+        if (
+            request_max_age is not None
+            and self._current_age(variant, now) > request_max_age
+        ):
+            return "stale"
+        if now < expires_at:
+            return "fresh"
+        if now < expires_at + self._variant_number(variant, "stale_while_revalidate"):
+            return "stale_while_revalidate"
+        return "stale"
+
+    def _current_age(self, variant: CacheVariant, now: float) -> float:
+        """Current age of a stored response (RFC 9111 section 4.2.3)."""
+        return self._variant_number(variant, "initial_age") + max(
+            0.0,
+            now - self._variant_number(variant, "response_time"),
+        )
+
+    def _conditional_headers(self, variant: CacheVariant) -> dict[str, str]:
+        """Build If-None-Match/If-Modified-Since from stored validators."""
+        headers = httpx.Headers(self._variant_headers(variant))
+        conditional: dict[str, str] = {}
+        if "etag" in headers:
+            conditional["If-None-Match"] = headers["etag"]
+        if "last-modified" in headers:
+            conditional["If-Modified-Since"] = headers["last-modified"]
+        return conditional
+
+    def _to_response(
+        self,
+        variant: CacheVariant,
+        method: str,
+        url: str,
+        params: Mapping[str, str | list[str]],
+    ) -> httpx.Response:
+        """Rebuild an httpx response from a stored variant, with Age set."""
+        headers = httpx.Headers(self._variant_headers(variant))
+        headers["age"] = str(int(self._current_age(variant, time.time())))
+        return httpx.Response(
+            status_code=self._variant_int(variant, "status"),
+            headers=list(headers.items()),
+            content=self._variant_content(variant),
+            request=httpx.Request(method, url, params=dict(params) or None),
+        )
+
+    @staticmethod
+    def _vary_matches(variant: CacheVariant, request_headers: dict[str, str]) -> bool:
+        vary = variant.get("vary")
+        if not isinstance(vary, dict):
+            return False
+        return all(
+            request_headers.get(name, "") == value for name, value in vary.items()
+        )
+
+    @staticmethod
+    def _variant_headers(variant: CacheVariant) -> list[tuple[str, str]]:
+        stored = variant.get("headers")
+        return [
+            (str(pair[0]), str(pair[1]))
+            for pair in (stored if isinstance(stored, list) else [])
+            if isinstance(pair, list) and len(pair) == 2
+        ]
+
+    @staticmethod
+    def _variant_content(variant: CacheVariant) -> bytes:
+        content = variant.get("content")
+        return base64.b64decode(content) if isinstance(content, str) else b""
+
+    @staticmethod
+    def _variant_number(variant: CacheVariant, field: str) -> float:
+        value = variant.get(field)
+        return float(value) if isinstance(value, (int, float)) else 0.0
+
+    @staticmethod
+    def _variant_int(variant: CacheVariant, field: str) -> int:
+        value = variant.get(field)
+        return value if isinstance(value, int) else 0
+
+    # ------------------------------------------------------------------
+    # Parsing helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _cache_key(url: str, params: Mapping[str, str | list[str]]) -> str:
+        """Cache key: the full request URL including query parameters."""
+        return str(httpx.URL(url, params=dict(params))) if params else url
+
+    @staticmethod
+    def _lower_headers(headers: Mapping[str, str]) -> dict[str, str]:
+        return {name.lower(): value for name, value in headers.items()}
+
+    @staticmethod
+    def _parse_cache_control(value: str | None) -> dict[str, str | None]:
+        """Parse a Cache-Control header into lowercase directives."""
+        directives: dict[str, str | None] = {}
+        if not value:
+            return directives
+        for part in value.split(","):
+            name, sep, argument = part.strip().partition("=")
+            if name:
+                directives[name.strip().lower()] = (
+                    argument.strip().strip('"') if sep else None
+                )
+        return directives
+
+    @staticmethod
+    def _parse_seconds(value: str | None) -> int | None:
+        """Parse a delta-seconds value; None when absent or invalid."""
+        if value is None:
+            return None
+        try:
+            return max(0, int(value))
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _parse_http_date(value: str | None) -> float | None:
+        """Parse an HTTP-date into a POSIX timestamp; None when invalid."""
+        if not value:
+            return None
+        try:
+            return parsedate_to_datetime(value).timestamp()
+        except (TypeError, ValueError, IndexError):
+            return None
+
+
+__all__ = ["FlextApiHttpCache"]
@@ -0,0 +1,489 @@
+"""Per-origin circuit breaker over a sliding window of call outcomes.
+
+Opt-in component of FlextApiClient, FlextApiAsyncClient and
+FlextWebProtocolPlugin. While an origin is failing or slow the circuit
+opens and requests to it fail fast with the CIRCUIT_OPEN error code instead
+of waiting for timeouts; after a cool-down a few probe requests decide
+whether it closes again.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from collections.abc import Awaitable, Callable
+
+import httpx
+from flext_core import r
+
+from flext_api.constants import c
+from flext_api.typings import t
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+class FlextApiCircuitBreaker:
+    """Closed / open / half-open circuit breaker keyed by origin.
+
+    Closed: calls pass; outcomes are counted in a sliding time window. Once
+    the window holds ``minimum_calls``, a failure rate (transport errors and
+    5xx) or slow-call rate at or above its threshold opens the circuit.
+
+    Open: calls are rejected with ``OpenError`` until ``open_duration``
+    has passed, then the circuit turns half-open.
+
+    Half-open: up to ``half_open_max_calls`` probes run at once; that many
+    successes close the circuit, any failure opens it again.
+
+    The breaker never blocks, so one instance serves threads and event loops
+    alike. State changes are delivered to listeners as ``Event`` objects.
+
+    Usage:
+        breaker = FlextApiCircuitBreaker(open_duration=10.0)
+        client = FlextApiClient(settings, circuit_breaker=breaker)
+    """
+
+    State = c.Api.CircuitBreaker.State
+
+    class OpenError(Exception):
+        """Raised for a call rejected because its origin's circuit is open."""
+
+        def __init__(self, origin: str, retry_in: float) -> None:
+            self.origin = origin
+            self.retry_in = retry_in
+            super().__init__(
+                f"Circuit open for {origin}; next probe in {retry_in:.1f}s",
+            )
+
+    class Event:
+        """State transition of one origin's circuit."""
+
+        __slots__ = ("at", "origin", "previous", "reason", "state")
+
+        def __init__(
+            self,
+            origin: str,
+            previous: c.Api.CircuitBreaker.State,
+            state: c.Api.CircuitBreaker.State,
+            reason: str,
+            at: float,
+        ) -> None:
+            self.origin = origin
+            self.previous = previous
+            self.state = state
+            self.reason = reason
+            self.at = at
+
+        def __repr__(self) -> str:
+            """Show the transition and why it happened."""
+            transition = f"{self.previous} -> {self.state}"
+            return f"Event({self.origin}: {transition}, {self.reason})"
+
+    class Permit:
+        """Admission of one call; hand it back to ``record``."""
+
+        __slots__ = ("generation", "origin", "probe", "started")
+
+        def __init__(
+            self,
+            origin: str,
+            generation: int,
+            *,
+            probe: bool,
+            started: float,
+        ) -> None:
+            self.origin = origin
+            self.generation = generation
+            self.probe = probe
+            self.started = started
+
+    class _Circuit:
+        __slots__ = (
+            "buckets",
+            "generation",
+            "opened_at",
+            "probe_successes",
+            "probes_in_flight",
+            "state",
+        )
+
+        def __init__(self, buckets: int, generation: int) -> None:
+            self.state = c.Api.CircuitBreaker.State.CLOSED
+            self.generation = generation
+            self.opened_at = 0.0
+            self.probes_in_flight = 0
+            self.probe_successes = 0
+            # [bucket index, calls, failures, slow calls] per bucket
+            self.buckets = [[-1, 0, 0, 0] for _ in range(buckets)]
+
+    type Listener = Callable[[FlextApiCircuitBreaker.Event], object]
+
+    _COUNTERS = (
+        "calls",
+        "successes",
+        "failures",
+        "slow_calls",
+        "rejected",
+        "opened",
+        "half_opened",
+        "closed",
+    )
+
+    def __init__(
+        self,
+        *,
+        failure_rate_threshold: float = c.Api.CircuitBreaker.FAILURE_RATE_THRESHOLD,
+        slow_call_rate_threshold: float = (
+            c.Api.CircuitBreaker.SLOW_CALL_RATE_THRESHOLD
+        ),
+        slow_call_duration: float = c.Api.CircuitBreaker.SLOW_CALL_DURATION,
+        window: float = c.Api.CircuitBreaker.WINDOW_SECONDS,
+        window_buckets: int = c.Api.CircuitBreaker.WINDOW_BUCKETS,
+        minimum_calls: int = c.Api.CircuitBreaker.MINIMUM_CALLS,
+        open_duration: float = c.Api.CircuitBreaker.OPEN_DURATION,
+        half_open_max_calls: int = c.Api.CircuitBreaker.HALF_OPEN_MAX_CALLS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the circuit breaker.
+
+        Args:
+            failure_rate_threshold: Failed share of calls (0-1] that opens.
+            slow_call_rate_threshold: Slow share of calls (0-1] that opens.
+            slow_call_duration: Seconds after which a call is slow.
+            window: Seconds of history the rates are computed over.
+            window_buckets: Buckets the window slides by.
+            minimum_calls: Calls in the window before it can open.
+            open_duration: Seconds to reject calls before probing.
+            half_open_max_calls: Concurrent probes, and successes needed
+                to close.
+            clock: Monotonic time source, replaceable in tests.
+
+        Raises:
+            ValueError: If a threshold is outside (0, 1] or a duration or
+                count is not positive.
+
+        """
+        if not (0 < failure_rate_threshold <= 1 and 0 < slow_call_rate_threshold <= 1):
+            msg = "Circuit breaker rate thresholds must be in (0, 1]"
+            raise ValueError(msg)
+        durations = (slow_call_duration, window, open_duration)
+        counts = (window_buckets, minimum_calls, half_open_max_calls)
+        if min(durations) <= 0 or min(counts) < 1:
+            msg = "Circuit breaker durations and counts must be positive"
+            raise ValueError(msg)
+        self._failure_rate_threshold = failure_rate_threshold
+        self._slow_call_rate_threshold = slow_call_rate_threshold
+        self._slow_call_duration = slow_call_duration
+        self._bucket_width = window / window_buckets
+        self._window_buckets = window_buckets
+        self._minimum_calls = minimum_calls
+        self._open_duration = open_duration
+        self._half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._circuits: dict[str, FlextApiCircuitBreaker._Circuit] = {}
+        # Breaker-wide, so permits never match a circuit created after reset
+        self._generations = itertools.count()
+        self._listeners: list[FlextApiCircuitBreaker.Listener] = []
+        self._counters: dict[str, int] = dict.fromkeys(self._COUNTERS, 0)
+
+    @staticmethod
+    def origin_of(url: str | httpx.URL) -> str:
+        """Circuit key of ``url``: ``scheme://host:port``."""
+        parsed = httpx.URL(url)
+        port = parsed.port or _DEFAULT_PORTS.get(parsed.scheme)
+        return f"{parsed.scheme}://{parsed.host}:{port}"
+
+    def add_listener(self, listener: FlextApiCircuitBreaker.Listener) -> None:
+        """Call ``listener(event)`` on every state transition."""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def state(self, url: str | httpx.URL) -> c.Api.CircuitBreaker.State:
+        """Current state of the circuit for ``url``'s origin."""
+        with self._lock:
+            circuit = self._circuits.get(self.origin_of(url))
+            return self.State.CLOSED if circuit is None else circuit.state
+
+    def acquire(self, url: str | httpx.URL) -> FlextApiCircuitBreaker.Permit:
+        """Admit a call to ``url``'s origin.
+
+        Raises:
+            OpenError: If the circuit is open, or half-open with all probe
+                slots taken.
+
+        """
+        origin = self.origin_of(url)
+        events: list[FlextApiCircuitBreaker.Event] = []
+        with self._lock:
+            circuit = self._circuits.get(origin)
+            if circuit is None:
+                circuit = self._circuits[origin] = self._Circuit(
+                    self._window_buckets,
+                    next(self._generations),
+                )
+            now = self._clock()
+            if circuit.state is self.State.OPEN:
+                retry_in = circuit.opened_at + self._open_duration - now
+                if retry_in > 0:
+                    self._counters["rejected"] += 1
+                    raise self.OpenError(origin, retry_in)
+                events.append(
+                    self._transition(
+                        origin,
+                        circuit,
+                        self.State.HALF_OPEN,
+                        "open duration elapsed",
+                        now,
+                    ),
+                )
+            probe = circuit.state is self.State.HALF_OPEN
+            if probe:
+                if circuit.probes_in_flight >= self._half_open_max_calls:
+                    self._counters["rejected"] += 1
+                    raise self.OpenError(origin, 0.0)
+                circuit.probes_in_flight += 1
+            self._counters["calls"] += 1
+            permit = self.Permit(origin, circuit.generation, probe=probe, started=now)
+        self._notify(events)
+        return permit
+
+    def record(
+        self,
+        permit: FlextApiCircuitBreaker.Permit,
+        *,
+        failure: bool | None,
+    ) -> None:
+        """Record the outcome of an admitted call.
+
+        Args:
+            permit: Value returned by ``acquire`` for this call.
+            failure: True for a failure, False for a success, None when the
+                outcome says nothing about the origin (e.g. a local error);
+                it then only frees a probe slot.
+
+        """
+        events: list[FlextApiCircuitBreaker.Event] = []
+        with self._lock:
+            circuit = self._circuits.get(permit.origin)
+            if circuit is None or permit.generation != circuit.generation:
+                # Started before the last transition or a reset; stale
+                return
+            now = self._clock()
+            slow = now - permit.started >= self._slow_call_duration
+            if permit.probe:
+                circuit.probes_in_flight -= 1
+            if failure is None:
+                return
+            self._counters["failures" if failure else "successes"] += 1
+            if slow:
+                self._counters["slow_calls"] += 1
+            if circuit.state is self.State.HALF_OPEN:
+                if failure or slow:
+                    events.append(
+                        self._transition(
+                            permit.origin,
+                            circuit,
+                            self.State.OPEN,
+                            "probe failed" if failure else "probe slow",
+                            now,
+                        ),
+                    )
+                else:
+                    circuit.probe_successes += 1
+                    if circuit.probe_successes >= self._half_open_max_calls:
+                        events.append(
+                            self._transition(
+                                permit.origin,
+                                circuit,
+                                self.State.CLOSED,
+                                "probes succeeded",
+                                now,
+                            ),
+                        )
+            else:
+                reason = self._count(circuit, now, failure=failure, slow=slow)
+                if reason is not None:
+                    events.append(
+                        self._transition(
+                            permit.origin,
+                            circuit,
+                            self.State.OPEN,
+                            reason,
+                            now,
+                        ),
+                    )
+        self._notify(events)
+
+    def record_response(
+        self,
+        permit: FlextApiCircuitBreaker.Permit,
+        response: httpx.Response,
+    ) -> None:
+        """Record a response; 5xx statuses count as failures."""
+        self.record(
+            permit,
+            failure=response.status_code >= c.Api.HTTP_SERVER_ERROR_MIN,
+        )
+
+    def call(
+        self,
+        url: str | httpx.URL,
+        send: Callable[[], httpx.Response],
+    ) -> httpx.Response:
+        """Run ``send`` through the circuit for ``url``'s origin.
+
+        Raises:
+            OpenError: If the circuit rejects the call.
+
+        """
+        permit = self.acquire(url)
+        try:
+            response = send()
+        except httpx.TransportError:
+            self.record(permit, failure=True)
+            raise
+        except BaseException:
+            self.record(permit, failure=None)
+            raise
+        self.record_response(permit, response)
+        return response
+
+    async def acall(
+        self,
+        url: str | httpx.URL,
+        send: Callable[[], Awaitable[httpx.Response]],
+    ) -> httpx.Response:
+        """Async ``call``: awaits ``send`` through the circuit."""
+        permit = self.acquire(url)
+        try:
+            response = await send()
+        except httpx.TransportError:
+            self.record(permit, failure=True)
+            raise
+        except BaseException:
+            self.record(permit, failure=None)
+            raise
+        self.record_response(permit, response)
+        return response
+
+    def reset(self, url: str | httpx.URL | None = None) -> None:
+        """Forget the circuit of ``url``'s origin, or of every origin.
+
+        Calls admitted before the reset are not counted when they finish.
+        """
+        with self._lock:
+            if url is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(self.origin_of(url), None)
+
+    def stats(self) -> r[dict[str, dict[str, str | int]]]:
+        """Per-origin state and windowed call counts."""
+        now = self._clock()
+        with self._lock:
+            stats: dict[str, dict[str, str | int]] = {}
+            for origin, circuit in self._circuits.items():
+                calls, failures, slow = self._window(circuit, now)
+                stats[origin] = {
+                    "state": str(circuit.state),
+                    "calls": calls,
+                    "failures": failures,
+                    "slow_calls": slow,
+                }
+        return r[dict[str, dict[str, str | int]]].ok(stats)
+
+    def metrics(self) -> r[t.Api.MetricsDict]:
+        """Get call, rejection and transition counters.
+
+        ``open`` and ``half_open`` count origins currently in that state;
+        ``opened``, ``half_opened`` and ``closed`` count transitions.
+        """
+        with self._lock:
+            metrics: t.Api.MetricsDict = dict(self._counters)
+            states = [circuit.state for circuit in self._circuits.values()]
+        metrics["open"] = states.count(self.State.OPEN)
+        metrics["half_open"] = states.count(self.State.HALF_OPEN)
+        return r[t.Api.MetricsDict].ok(metrics)
+
+    def _count(
+        self,
+        circuit: FlextApiCircuitBreaker._Circuit,
+        now: float,
+        *,
+        failure: bool,
+        slow: bool,
+    ) -> str | None:
+        """Add an outcome to the window (lock held); return why to open."""
+        index = int(now // self._bucket_width)
+        bucket = circuit.buckets[index % self._window_buckets]
+        if bucket[0] != index:
+            bucket[:] = [index, 0, 0, 0]
+        bucket[1] += 1
+        bucket[2] += failure
+        bucket[3] += slow
+        calls, failures, slow_calls = self._window(circuit, now)
+        if calls < self._minimum_calls:
+            return None
+        if failures / calls >= self._failure_rate_threshold:
+            return f"failure rate {failures / calls:.0%}"
+        if slow_calls / calls >= self._slow_call_rate_threshold:
+            return f"slow call rate {slow_calls / calls:.0%}"
+        return None
+
+    def _window(
+        self,
+        circuit: FlextApiCircuitBreaker._Circuit,
+        now: float,
+    ) -> tuple[int, int, int]:
+        """Calls, failures and slow calls in the window (lock held)."""
+        oldest = int(now // self._bucket_width) - self._window_buckets
+        totals = [0, 0, 0]
+        for index, calls, failures, slow in circuit.buckets:
+            if index > oldest:
+                totals[0] += calls
+                totals[1] += failures
+                totals[2] += slow
+        return totals[0], totals[1], totals[2]
+
+    def _transition(
+        self,
+        origin: str,
+        circuit: FlextApiCircuitBreaker._Circuit,
+        state: c.Api.CircuitBreaker.State,
+        reason: str,
+        now: float,
+    ) -> FlextApiCircuitBreaker.Event:
+        """Move ``circuit`` to ``state`` (lock held)."""
+        event = self.Event(origin, circuit.state, state, reason, now)
+        circuit.state = state
+        circuit.generation = next(self._generations)
+        circuit.probes_in_flight = 0
+        circuit.probe_successes = 0
+        if state is self.State.OPEN:
+            circuit.opened_at = now
+            self._counters["opened"] += 1
+        elif state is self.State.HALF_OPEN:
+            self._counters["half_opened"] += 1
+        else:
+            self._counters["closed"] += 1
+            circuit.buckets = [[-1, 0, 0, 0] for _ in range(self._window_buckets)]
+        return event
+
+    def _notify(self, events: list[FlextApiCircuitBreaker.Event]) -> None:
+        """Deliver events to listeners outside the lock."""
+        if not events:
+            return
+        with self._lock:
+            listeners = list(self._listeners)
+        for event in events:
+            for listener in listeners:
+                listener(event)
+
+
+__all__ = ["FlextApiCircuitBreaker"]
@@ -11,18 +11,36 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
-import json
-from typing import Self
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from types import TracebackType
+from typing import ClassVar, Self
 
 import httpx
 from flext_core import FlextRuntime, r, s
 
+from flext_api.cache import FlextApiHttpCache
+from flext_api.circuit_breaker import FlextApiCircuitBreaker
+from flext_api.coalescing import FlextApiRequestCoalescer
+from flext_api.compression import FlextApiCompression
+from flext_api.concurrency import FlextApiConcurrencyLimiter
 from flext_api.constants import FlextApiConstants
+from flext_api.dns import FlextApiDnsCache
+from flext_api.hedging import FlextApiHedging
 from flext_api.models import FlextApiModels
+from flext_api.pagination import FlextApiPagination
+from flext_api.protocols import p
+from flext_api.rate_limit import FlextApiRateLimiter
+from flext_api.retry import FlextApiRetryPolicy
+from flext_api.serializers import FlextApiSerializers
 from flext_api.settings import FlextApiSettings
+from flext_api.streaming import FlextApiStreamingBody
 from flext_api.typings import t
 
-# HTTP status codes
+type SerializedBody = bytes | FlextApiStreamingBody
+"""Request body ready to send: encoded bytes or a stream read while sending."""
 
 
 class FlextApiClient(s[FlextApiSettings]):
@@ -33,13 +51,37 @@ class FlextApiClient(s[FlextApiSettings]):
     Domain-agnostic - works with any HTTP endpoint.
 
     Uses httpx for HTTP operations, delegates to models for data validation.
+    Owns one long-lived connection pool (keep-alive, max connections, idle
+    expiry from FlextApiSettings) shared by every request; release it with
+    close() or by using the client as a context manager.
     """
 
-    def __new__(cls, config: FlextApiSettings | None = None) -> Self:
+    # Whether connections of this client can go through a FlextApiDnsCache
+    _dns_cache_supported: ClassVar[bool] = True
+
+    # Type annotations for dynamically-set fields (using object.__setattr__)
+    _http_client: httpx.Client | None
+    _http_client_lock: threading.Lock
+    _cache: FlextApiHttpCache | None
+    _circuit_breaker: FlextApiCircuitBreaker | None
+    _coalescer: FlextApiRequestCoalescer | None
+    _compression: FlextApiCompression | None
+    _concurrency_limiter: FlextApiConcurrencyLimiter | None
+    _dns_cache: FlextApiDnsCache | None
+    _hedging: FlextApiHedging | None
+    _rate_limiter: FlextApiRateLimiter | None
+    _retry_policy: FlextApiRetryPolicy | None
+
+    def __new__(
+        cls,
+        config: FlextApiSettings | None = None,
+        **_kwargs: object,
+    ) -> Self:
         """Intercept positional config argument and convert to kwargs.
 
         Args:
             config: Optional FlextApiSettings (passed to __init__ via attribute).
+            **_kwargs: Keyword arguments handled by __init__.
 
         """
         instance = super().__new__(cls)
@@ -52,6 +94,16 @@ class FlextApiClient(s[FlextApiSettings]):
     def __init__(
         self,
         config: FlextApiSettings | None = None,
+        *,
+        cache: FlextApiHttpCache | None = None,
+        circuit_breaker: FlextApiCircuitBreaker | None = None,
+        coalescer: FlextApiRequestCoalescer | None = None,
+        compression: FlextApiCompression | None = None,
+        concurrency_limiter: FlextApiConcurrencyLimiter | None = None,
+        dns_cache: FlextApiDnsCache | None = None,
+        hedging: FlextApiHedging | None = None,
+        rate_limiter: FlextApiRateLimiter | None = None,
+        retry_policy: FlextApiRetryPolicy | None = None,
         **kwargs: t.JsonValue | str | int | bool,
     ) -> None:
         """Initialize with optional configuration model.
@@ -59,6 +111,32 @@ class FlextApiClient(s[FlextApiSettings]):
         Args:
         config: Optional FlextApiSettings model with base_url, timeout, headers, etc.
                 If None, uses default configuration.
+        cache: Optional HTTP response cache. When None, a default in-memory
+                cache is created if FlextApiSettings.cache_enabled is set.
+        circuit_breaker: Optional per-origin circuit breaker. When None, one is
+                created from the circuit_* settings if
+                FlextApiSettings.circuit_breaker_enabled is set.
+        coalescer: Optional single-flight coalescer. When None, one is created
+                if FlextApiSettings.coalesce_requests is set.
+        compression: Optional request/response compression. When None, one is
+                created from the compression_* settings if
+                FlextApiSettings.compression_enabled is set.
+        concurrency_limiter: Optional adaptive per-origin in-flight limit.
+                When None, one is created from the concurrency_* settings if
+                FlextApiSettings.adaptive_concurrency_enabled is set.
+        dns_cache: Optional DNS cache used to resolve and connect. When None,
+                one is created from the dns_* settings if
+                FlextApiSettings.dns_cache_enabled is set.
+        hedging: Optional hedging of slow idempotent requests. When None, one
+                is created from the hedge_* settings if
+                FlextApiSettings.hedging_enabled is set.
+        rate_limiter: Optional client-side token buckets per origin or route.
+                When None, one is created from the rate_limit_* settings if
+                FlextApiSettings.rate_limit_enabled is set.
+        retry_policy: Optional retry policy for failed requests. When None,
+                one is built from the retry_* settings (build_retry_policy) if
+                FlextApiSettings.retry_enabled is set; otherwise requests are
+                not retried. FlextApiAsyncClient follows the same rule.
         **kwargs: Additional Pydantic model fields (ignored for this service).
 
         """
@@ -80,6 +158,94 @@ class FlextApiClient(s[FlextApiSettings]):
         # Set _config to FlextApiSettings (standard FlextService pattern)
         object.__setattr__(self, "_config", api_config)
 
+        # Pooled transport is created lazily on first request and reused
+        object.__setattr__(self, "_http_client", None)
+        object.__setattr__(self, "_http_client_lock", threading.Lock())
+
+        # Opt-in RFC 9111 response cache in front of the transport
+        if cache is None and api_config.cache_enabled:
+            cache = FlextApiHttpCache(shared=api_config.cache_shared)
+        object.__setattr__(self, "_cache", cache)
+
+        # Opt-in per-origin circuit breaker that fails fast while open
+        if circuit_breaker is None and api_config.circuit_breaker_enabled:
+            circuit_breaker = FlextApiCircuitBreaker(
+                failure_rate_threshold=api_config.circuit_failure_rate,
+                slow_call_duration=api_config.circuit_slow_call_duration,
+                open_duration=api_config.circuit_open_duration,
+            )
+        object.__setattr__(self, "_circuit_breaker", circuit_breaker)
+
+        # Opt-in single-flight coalescing of identical in-flight GET/HEAD
+        if coalescer is None and api_config.coalesce_requests:
+            coalescer = FlextApiRequestCoalescer()
+        object.__setattr__(self, "_coalescer", coalescer)
+
+        # Opt-in request body compression and Accept-Encoding negotiation
+        if compression is None and api_config.compression_enabled:
+            compression = FlextApiCompression(
+                api_config.compression_encoding,
+                min_size=api_config.compression_min_size,
+                level=api_config.compression_level,
+                accept_encodings=api_config.accept_encoding,
+            )
+        object.__setattr__(self, "_compression", compression)
+
+        # Opt-in adaptive concurrency limit per origin (AIMD or Vegas)
+        if concurrency_limiter is None and api_config.adaptive_concurrency_enabled:
+            concurrency_limiter = FlextApiConcurrencyLimiter(
+                algorithm=api_config.concurrency_algorithm,
+                initial_limit=min(
+                    api_config.concurrency_initial_limit,
+                    api_config.concurrency_max_limit,
+                ),
+                max_limit=api_config.concurrency_max_limit,
+                queue_timeout=api_config.concurrency_queue_timeout,
+            )
+        object.__setattr__(self, "_concurrency_limiter", concurrency_limiter)
+
+        # Opt-in DNS cache with happy-eyeballs connects for new connections
+        if (
+            dns_cache is None
+            and api_config.dns_cache_enabled
+            and self._dns_cache_supported
+        ):
+            dns_cache = FlextApiDnsCache(
+                ttl=api_config.dns_cache_ttl,
+                negative_ttl=api_config.dns_negative_ttl,
+            )
+        object.__setattr__(self, "_dns_cache", dns_cache)
+
+        # Opt-in hedging: race a duplicate of slow idempotent requests
+        if hedging is None and api_config.hedging_enabled:
+            hedging = FlextApiHedging(
+                delay=api_config.hedge_delay,
+                budget_ratio=api_config.hedge_budget_ratio,
+            )
+        object.__setattr__(self, "_hedging", hedging)
+
+        # Opt-in token-bucket pacing that follows rate-limit headers
+        if rate_limiter is None and api_config.rate_limit_enabled:
+            rate_limiter = FlextApiRateLimiter(
+                rate=api_config.rate_limit_rate,
+                burst=api_config.rate_limit_burst,
+                scope=api_config.rate_limit_scope,
+                max_wait=api_config.rate_limit_max_wait,
+                store=(
+                    None
+                    if api_config.rate_limit_shared_memory is None
+                    else FlextApiRateLimiter.SharedBuckets(
+                        api_config.rate_limit_shared_memory,
+                    )
+                ),
+            )
+        object.__setattr__(self, "_rate_limiter", rate_limiter)
+
+        # Opt-in retries with jittered backoff and a per-host budget
+        if retry_policy is None and api_config.retry_enabled:
+            retry_policy = self.build_retry_policy(api_config)
+        object.__setattr__(self, "_retry_policy", retry_policy)
+
     def _get_config(self) -> FlextApiSettings:
         """Get FlextApiSettings with proper type narrowing."""
         return (
@@ -107,6 +273,154 @@ class FlextApiClient(s[FlextApiSettings]):
         """Access timeout from configuration."""
         return self._get_config().timeout
 
+    @property
+    def cache(self) -> FlextApiHttpCache | None:
+        """HTTP response cache used by this client, if enabled."""
+        return self._cache
+
+    @property
+    def circuit_breaker(self) -> FlextApiCircuitBreaker | None:
+        """Per-origin circuit breaker guarding requests, if enabled."""
+        return self._circuit_breaker
+
+    @property
+    def coalescer(self) -> FlextApiRequestCoalescer | None:
+        """Single-flight request coalescer used by this client, if enabled."""
+        return self._coalescer
+
+    @property
+    def compression(self) -> FlextApiCompression | None:
+        """Request/response compression used by this client, if enabled."""
+        return self._compression
+
+    @property
+    def concurrency_limiter(self) -> FlextApiConcurrencyLimiter | None:
+        """Adaptive per-origin concurrency limiter, if enabled."""
+        return self._concurrency_limiter
+
+    @property
+    def dns_cache(self) -> FlextApiDnsCache | None:
+        """DNS cache used by this client's connections, if enabled."""
+        return self._dns_cache
+
+    @property
+    def hedging(self) -> FlextApiHedging | None:
+        """Hedging of slow idempotent requests, if enabled."""
+        return self._hedging
+
+    @property
+    def rate_limiter(self) -> FlextApiRateLimiter | None:
+        """Client-side rate limiter pacing requests, if enabled."""
+        return self._rate_limiter
+
+    @property
+    def retry_policy(self) -> FlextApiRetryPolicy | None:
+        """Retry policy for failed requests, if enabled."""
+        return self._retry_policy
+
+    @staticmethod
+    def build_retry_policy(config: FlextApiSettings) -> FlextApiRetryPolicy:
+        """Build the retry policy described by the retry settings."""
+        return FlextApiRetryPolicy(
+            max_retries=config.max_retries,
+            backoff_factor=config.retry_backoff_factor,
+            max_delay=config.retry_max_delay,
+            jitter=config.retry_jitter,
+            deadline=config.retry_deadline,
+            budget=(
+                None
+                if config.retry_budget_ratio is None
+                else FlextApiRetryPolicy.Budget(config.retry_budget_ratio)
+            ),
+        )
+
+    def metrics(self) -> r[t.Api.MetricsDict]:
+        """Get counters of every enabled client component, prefixed by component."""
+        components: dict[str, p.Api.Metrics.MetricsProviderProtocol | None] = {
+            "cache": self._cache,
+            "circuit": self._circuit_breaker,
+            "coalescing": self._coalescer,
+            "compression": self._compression,
+            "concurrency": self._concurrency_limiter,
+            "dns": self._dns_cache,
+            "hedging": self._hedging,
+            "rate_limit": self._rate_limiter,
+            "retry": self._retry_policy,
+        }
+        metrics: t.Api.MetricsDict = {}
+        for prefix, component in components.items():
+            if component is None:
+                continue
+            component_metrics = component.metrics()
+            if component_metrics.is_failure:
+                return r[t.Api.MetricsDict].fail(
+                    component_metrics.error or f"Failed to read {prefix} metrics",
+                )
+            for name, value in component_metrics.value.items():
+                metrics[f"{prefix}.{name}"] = value
+        return r[t.Api.MetricsDict].ok(metrics)
+
+    @property
+    def is_closed(self) -> bool:
+        """Check whether the pooled transport is closed (or never opened)."""
+        http_client: httpx.Client | None = self._http_client
+        return http_client is None or http_client.is_closed
+
+    def _build_pool_limits(self) -> httpx.Limits:
+        """Build connection pool limits from configuration."""
+        api_config = self._get_config()
+        return httpx.Limits(
+            max_connections=api_config.max_connections,
+            max_keepalive_connections=api_config.max_keepalive_connections,
+            keepalive_expiry=api_config.keepalive_expiry,
+        )
+
+    def _get_http_client(self) -> httpx.Client:
+        """Get the pooled httpx client, creating it on first use (thread-safe)."""
+        http_client: httpx.Client | None = self._http_client
+        if http_client is not None and not http_client.is_closed:
+            return http_client
+        with self._http_client_lock:
+            http_client = self._http_client
+            if http_client is None or http_client.is_closed:
+                transport = httpx.HTTPTransport(limits=self._build_pool_limits())
+                dns_cache: FlextApiDnsCache | None = self._dns_cache
+                if dns_cache is not None:
+                    dns_cache.install(transport)
+                http_client = httpx.Client(
+                    timeout=self._get_config().timeout,
+                    transport=transport,
+                )
+                object.__setattr__(self, "_http_client", http_client)
+            return http_client
+
+    def close(self) -> None:
+        """Close the pooled transport and release all connections.
+
+        The client stays usable: the next request opens a new pool.
+        """
+        with self._http_client_lock:
+            http_client: httpx.Client | None = self._http_client
+            object.__setattr__(self, "_http_client", None)
+        if http_client is not None:
+            http_client.close()
+        hedging: FlextApiHedging | None = self._hedging
+        if hedging is not None:
+            hedging.close()
+
+    def __enter__(self) -> Self:
+        """Enter context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit context manager and close the connection pool."""
+        self.close()
+
     def request(
         self,
         request: FlextApiModels.HttpRequest,
@@ -127,7 +441,10 @@ class FlextApiClient(s[FlextApiSettings]):
                 url_result.error or "URL validation failed",
             )
 
-        body_result = self._serialize_body(request.body)
+        body_result = self._serialize_body(
+            request.body,
+            content_type=self._request_content_type(request),
+        )
         if body_result.is_failure:
             return r[FlextApiModels.HttpResponse].fail(
                 body_result.error or "Body serialization failed",
@@ -140,58 +457,552 @@ class FlextApiClient(s[FlextApiSettings]):
             serialized_body=body_result.value,
         )
 
+    def request_many(
+        self,
+        requests: Iterable[FlextApiModels.HttpRequest],
+        max_concurrency: int = FlextApiConstants.Api.HTTPBatch.DEFAULT_MAX_CONCURRENCY,
+        *,
+        ordered: bool = False,
+        deadline: float | None = None,
+        cancel_event: threading.Event | None = None,
+    ) -> Iterator[tuple[int, r[FlextApiModels.HttpResponse]]]:
+        """Execute many requests over the shared pool with bounded concurrency.
+
+        Requests run on a worker thread pool of ``max_concurrency`` threads and
+        are pulled from ``requests`` lazily, so at most ``max_concurrency`` are
+        in flight at any time. Results stream back as ``(index, result)`` pairs,
+        where ``index`` is the request position in the input.
+
+        When the deadline passes or ``cancel_event`` is set, requests that
+        already finished keep their result, every request still running is
+        reported with a failure result and the remaining requests are not
+        issued. Closing the iterator early cancels the batch as well.
+
+        Args:
+        requests: HttpRequest models to execute.
+        max_concurrency: Maximum number of requests in flight.
+        ordered: Yield results in input order instead of completion order.
+        deadline: Optional time budget for the whole batch, in seconds.
+        cancel_event: Optional event that cancels the batch when set.
+
+        Returns:
+        Iterator of (index, r[HttpResponse]) pairs.
+
+        """
+        if max_concurrency < 1:
+            msg = f"max_concurrency must be >= 1, got {max_concurrency}"
+            raise ValueError(msg)
+        return self._iter_request_many(
+            requests,
+            max_concurrency,
+            ordered=ordered,
+            deadline=deadline,
+            cancel_event=cancel_event,
+        )
+
+    def paginate(
+        self,
+        request: FlextApiModels.HttpRequest,
+        pagination: FlextApiPagination | None = None,
+    ) -> Iterator[t.GeneralValueType]:
+        """Yield the items of every page of a paginated endpoint, lazily.
+
+        Pages are fetched with ``request``, so the client's cache, retries
+        and limits apply to each of them, and the next pages are prefetched
+        while the current one is consumed (see FlextApiPagination).
+
+        Args:
+        request: Request of the collection; pagination parameters are added.
+        pagination: Strategy, page size and prefetch depth (default: page
+                numbers, FlextApiPagination()).
+
+        Returns:
+        Iterator of items; raises FlextApiPagination.PageError when a page
+        fails.
+
+        """
+        return (pagination or FlextApiPagination()).iterate(request, self.request)
+
+    def _iter_request_many(
+        self,
+        requests: Iterable[FlextApiModels.HttpRequest],
+        max_concurrency: int,
+        *,
+        ordered: bool,
+        deadline: float | None,
+        cancel_event: threading.Event | None,
+    ) -> Iterator[tuple[int, r[FlextApiModels.HttpResponse]]]:
+        """Drive a request_many batch on a bounded thread pool."""
+        deadline_at = None if deadline is None else time.monotonic() + deadline
+        pending = enumerate(requests)
+        # Insertion-ordered: the first key is always the oldest request in flight
+        in_flight: dict[Future[r[FlextApiModels.HttpResponse]], int] = {}
+        exhausted = False
+        executor = ThreadPoolExecutor(
+            max_workers=max_concurrency,
+            thread_name_prefix="flext-api-batch",
+        )
+        try:
+            while True:
+                while not exhausted and len(in_flight) < max_concurrency:
+                    item = next(pending, None)
+                    if item is None:
+                        exhausted = True
+                        break
+                    index, request = item
+                    in_flight[executor.submit(self.request, request)] = index
+                if not in_flight:
+                    return
+
+                stop_error = self._batch_stop_error(
+                    deadline_at,
+                    cancelled=cancel_event is not None and cancel_event.is_set(),
+                )
+                if stop_error is not None:
+                    for future, index in in_flight.items():
+                        if future.done():
+                            yield index, self._future_result(future)
+                            continue
+                        future.cancel()
+                        yield index, r[FlextApiModels.HttpResponse].fail(stop_error)
+                    return
+
+                waiting = [next(iter(in_flight))] if ordered else list(in_flight)
+                wait(
+                    waiting,
+                    timeout=self._batch_wait_timeout(
+                        deadline_at,
+                        cancellable=cancel_event is not None,
+                    ),
+                    return_when=FIRST_COMPLETED,
+                )
+                ready = (
+                    self._ordered_ready(in_flight)
+                    if ordered
+                    else [future for future in in_flight if future.done()]
+                )
+                for future in ready:
+                    yield in_flight.pop(future), self._future_result(future)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _ordered_ready(
+        in_flight: dict[Future[r[FlextApiModels.HttpResponse]], int],
+    ) -> list[Future[r[FlextApiModels.HttpResponse]]]:
+        """Collect the leading run of completed futures in submission order."""
+        ready: list[Future[r[FlextApiModels.HttpResponse]]] = []
+        for future in in_flight:
+            if not future.done():
+                break
+            ready.append(future)
+        return ready
+
+    @staticmethod
+    def _future_result(
+        future: Future[r[FlextApiModels.HttpResponse]],
+    ) -> r[FlextApiModels.HttpResponse]:
+        """Unwrap a worker future into a result, never raising."""
+        try:
+            return future.result()
+        except Exception as exc:
+            return r[FlextApiModels.HttpResponse].fail(str(exc))
+
+    @staticmethod
+    def _batch_stop_error(
+        deadline_at: float | None,
+        *,
+        cancelled: bool,
+    ) -> str | None:
+        """Return the error that stops a batch, or None to keep going."""
+        if cancelled:
+            return FlextApiConstants.Api.HTTPBatch.CANCELLED_ERROR
+        if deadline_at is not None and time.monotonic() >= deadline_at:
+            return FlextApiConstants.Api.HTTPBatch.DEADLINE_EXCEEDED_ERROR
+        return None
+
+    @staticmethod
+    def _batch_wait_timeout(
+        deadline_at: float | None,
+        *,
+        cancellable: bool,
+    ) -> float | None:
+        """Time to wait for the next completion before re-checking stop conditions."""
+        timeout = (
+            None if deadline_at is None else max(0.0, deadline_at - time.monotonic())
+        )
+        if cancellable:
+            poll = FlextApiConstants.Api.HTTPBatch.CANCEL_POLL_INTERVAL
+            timeout = poll if timeout is None else min(timeout, poll)
+        return timeout
+
     def _execute_http_request(
         self,
         request: FlextApiModels.HttpRequest,
         url: str,
-        serialized_body: bytes,
+        serialized_body: SerializedBody,
     ) -> r[FlextApiModels.HttpResponse]:
-        """Execute HTTP request using httpx client."""
+        """Execute HTTP request over the pooled httpx client (cache-aware)."""
         try:
-            api_config = self._get_config()
-            headers: dict[str, str] = {
-                **api_config.default_headers,
-                **request.headers,
-            }
+            headers = self._build_request_headers(request)
+            serialized_body, headers = self._compress_body(serialized_body, headers)
 
-            with httpx.Client(timeout=request.timeout) as client:
-                # Build request with correct types for httpx
-                request_method: str = request.method
-                request_url: str = url
-                request_headers: dict[str, str] = headers
-                request_params: dict[str, str | list[str]] = request.query_params
-
-                # Call httpx with explicit typed parameters
-                if serialized_body:
-                    response = client.request(
-                        method=request_method,
-                        url=request_url,
-                        headers=request_headers,
-                        params=request_params,
-                        content=serialized_body,
-                    )
-                else:
-                    response = client.request(
-                        method=request_method,
-                        url=request_url,
-                        headers=request_headers,
-                        params=request_params,
-                    )
+            def send(extra_headers: dict[str, str]) -> httpx.Response:
+                return self._send_coalesced(
+                    request,
+                    url,
+                    serialized_body,
+                    {**headers, **extra_headers},
+                )
 
-            if response.status_code >= FlextApiConstants.Api.HTTP_ERROR_MIN:
-                return r[FlextApiModels.HttpResponse].fail(
-                    f"HTTP {response.status_code}: {response.reason_phrase}",
+            cache: FlextApiHttpCache | None = self._cache
+            response = (
+                send({})
+                if cache is None
+                else cache.fetch(
+                    request.method,
+                    url,
+                    request.query_params,
+                    headers,
+                    send,
                 )
+            )
+            self._record_response(response)
+            return self._build_http_response(
+                response,
+                lazy=self._get_config().lazy_response_body,
+            )
+        except FlextApiCircuitBreaker.OpenError as exc:
+            return r[FlextApiModels.HttpResponse].fail(
+                str(exc),
+                error_code=FlextApiConstants.Api.CircuitBreaker.OPEN_ERROR_CODE,
+            )
+        except FlextApiConcurrencyLimiter.LimitExceededError as exc:
+            return r[FlextApiModels.HttpResponse].fail(
+                str(exc),
+                error_code=FlextApiConstants.Api.Concurrency.LIMITED_ERROR_CODE,
+            )
+        except FlextApiRateLimiter.RateLimitedError as exc:
+            return r[FlextApiModels.HttpResponse].fail(
+                str(exc),
+                error_code=FlextApiConstants.Api.RateLimit.LIMITED_ERROR_CODE,
+            )
+        except Exception as exc:
+            return r[FlextApiModels.HttpResponse].fail(str(exc))
 
-            return self._deserialize_body(response).map(
-                lambda body: FlextApiModels.HttpResponse(
+    def _send_coalesced(
+        self,
+        request: FlextApiModels.HttpRequest,
+        url: str,
+        serialized_body: SerializedBody,
+        headers: dict[str, str],
+    ) -> httpx.Response:
+        """Send the request, sharing identical in-flight calls when enabled."""
+        coalescer: FlextApiRequestCoalescer | None = self._coalescer
+        if coalescer is None:
+            return self._send_with_retry(request, url, serialized_body, headers)
+        return coalescer.execute(
+            request.method,
+            url,
+            request.query_params,
+            headers,
+            lambda: self._send_with_retry(request, url, serialized_body, headers),
+            has_body=bool(serialized_body),
+        )
+
+    def _send_with_retry(
+        self,
+        request: FlextApiModels.HttpRequest,
+        url: str,
+        serialized_body: SerializedBody,
+        headers: dict[str, str],
+    ) -> httpx.Response:
+        """Send the request, retrying failures when a retry policy is set."""
+        policy: FlextApiRetryPolicy | None = self._retry_policy
+        if policy is None:
+            return self._send_hedged(
+                request,
+                url,
+                serialized_body,
+                headers,
+                request.timeout,
+            )
+        return policy.execute(
+            request.method,
+            url,
+            lambda timeout: self._send_hedged(
+                request,
+                url,
+                serialized_body,
+                headers,
+                timeout,
+            ),
+            timeout=request.timeout,
+            replayable=self._is_replayable(serialized_body),
+        )
+
+    def _send_through_circuit(
+        self,
+        request: FlextApiModels.HttpRequest,
+        url: str,
+        serialized_body: SerializedBody,
+        headers: dict[str, str],
+        timeout: float | None,
+    ) -> httpx.Response:
+        """Send one attempt, guarded by the origin's circuit when enabled."""
+        breaker: FlextApiCircuitBreaker | None = self._circuit_breaker
+        if breaker is None:
+            return self._send_paced(
+                request,
+                url,
+                serialized_body,
+                headers,
+                timeout,
+            )
+        return breaker.call(
+            url,
+            lambda: self._send_paced(
+                request,
+                url,
+                serialized_body,
+                headers,
+                timeout,
+            ),
+        )
+
+    def _send_paced(
+        self,
+        request: FlextApiModels.HttpRequest,
+        url: str,
+        serialized_body: SerializedBody,
+        headers: dict[str, str],
+        timeout: float | None,
+    ) -> httpx.Response:
+        """Send one copy once the rate limiter hands out a token."""
+        limiter: FlextApiRateLimiter | None = self._rate_limiter
+        if limiter is None:
+            return self._send_limited(
+                request,
+                url,
+                serialized_body,
+                headers,
+                timeout,
+            )
+        return limiter.call(
+            url,
+            lambda: self._send_limited(
+                request,
+                url,
+                serialized_body,
+                headers,
+                timeout,
+            ),
+        )
+
+    def _send_limited(
+        self,
+        request: FlextApiModels.HttpRequest,
+        url: str,
+        serialized_body: SerializedBody,
+        headers: dict[str, str],
+        timeout: float | None,
+    ) -> httpx.Response:
+        """Send one copy within the origin's adaptive concurrency limit."""
+        limiter: FlextApiConcurrencyLimiter | None = self._concurrency_limiter
+        if limiter is None:
+            return self._send_http_request(
+                request,
+                url,
+                serialized_body,
+                headers,
+                timeout,
+            )
+        return limiter.call(
+            url,
+            lambda: self._send_http_request(
+                request,
+                url,
+                serialized_body,
+                headers,
+                timeout,
+            ),
+        )
+
+    def _send_hedged(
+        self,
+        request: FlextApiModels.HttpRequest,
+        url: str,
+        serialized_body: SerializedBody,
+        headers: dict[str, str],
+        timeout: float | None,
+    ) -> httpx.Response:
+        """Send one attempt, hedging it when slow if hedging is enabled."""
+        hedging: FlextApiHedging | None = self._hedging
+        if hedging is None:
+            return self._send_through_circuit(
+                request,
+                url,
+                serialized_body,
+                headers,
+                timeout,
+            )
+        return hedging.execute(
+            request.method,
+            url,
+            lambda: self._send_through_circuit(
+                request,
+                url,
+                serialized_body,
+                headers,
+                timeout,
+            ),
+            replayable=self._is_replayable(serialized_body),
+        )
+
+    @staticmethod
+    def _is_replayable(serialized_body: SerializedBody) -> bool:
+        """Whether a retry can send the body again (one-shot streams cannot)."""
+        return (
+            not isinstance(serialized_body, FlextApiStreamingBody)
+            or serialized_body.is_replayable
+        )
+
+    def _send_http_request(
+        self,
+        request: FlextApiModels.HttpRequest,
+        url: str,
+        serialized_body: SerializedBody,
+        headers: dict[str, str],
+        timeout: float | None,
+    ) -> httpx.Response:
+        """Send one HTTP request over the pooled httpx client."""
+        client = self._get_http_client()
+        # Build request with correct types for httpx
+        request_params: dict[str, str | list[str]] = request.query_params
+
+        if isinstance(serialized_body, FlextApiStreamingBody):
+            return client.request(
+                method=request.method,
+                url=url,
+                headers={**serialized_body.headers, **headers},
+                params=request_params,
+                content=serialized_body.iter_chunks(),
+                timeout=timeout,
+            )
+
+        # Call httpx with explicit typed parameters
+        if serialized_body:
+            return client.request(
+                method=request.method,
+                url=url,
+                headers=headers,
+                params=request_params,
+                content=serialized_body,
+                timeout=timeout,
+            )
+        return client.request(
+            method=request.method,
+            url=url,
+            headers=headers,
+            params=request_params,
+            timeout=timeout,
+        )
+
+    def _build_request_headers(
+        self,
+        request: FlextApiModels.HttpRequest,
+    ) -> dict[str, str]:
+        """Merge configured default headers with request headers."""
+        compression: FlextApiCompression | None = self._compression
+        negotiated = (
+            {}
+            if compression is None or not compression.accept_encoding
+            else {
+                FlextApiConstants.Api.HEADER_ACCEPT_ENCODING: (
+                    compression.accept_encoding
+                ),
+            }
+        )
+        return {
+            **self._get_config().default_headers,
+            **negotiated,
+            **request.headers,
+        }
+
+    def _compress_body(
+        self,
+        serialized_body: SerializedBody,
+        headers: dict[str, str],
+    ) -> tuple[SerializedBody, dict[str, str]]:
+        """Compress a bytes body once per request when compression is enabled."""
+        compression: FlextApiCompression | None = self._compression
+        if (
+            compression is None
+            or not isinstance(serialized_body, bytes)
+            or not serialized_body
+        ):
+            return serialized_body, headers
+        body, headers, report = compression.encode_request(serialized_body, headers)
+        if report is not None:
+            self.logger.debug(
+                "Request body compressed",
+                extra={
+                    "encoding": report.encoding,
+                    "raw_bytes": report.raw_size,
+                    "sent_bytes": report.compressed_size,
+                    "ratio": round(report.ratio, 3),
+                    "cpu_ms": round(report.cpu_seconds * 1000, 3),
+                },
+            )
+        return body, headers
+
+    def _record_response(self, response: httpx.Response) -> None:
+        """Count compressed response bytes when compression is enabled."""
+        compression: FlextApiCompression | None = self._compression
+        if compression is not None:
+            compression.record_response(response)
+
+    def _request_content_type(self, request: FlextApiModels.HttpRequest) -> str:
+        """Effective Content-Type of a request (request header over defaults)."""
+        content_type = ""
+        header = FlextApiConstants.Api.HEADER_CONTENT_TYPE.lower()
+        for name, value in self._build_request_headers(request).items():
+            if name.lower() == header:
+                content_type = value
+        return content_type
+
+    @staticmethod
+    def _build_http_response(
+        response: httpx.Response,
+        *,
+        lazy: bool = False,
+    ) -> r[FlextApiModels.HttpResponse]:
+        """Convert an httpx response into the HttpResponse result contract.
+
+        With ``lazy`` the body stays raw bytes; HttpResponse.json_body()/.text()
+        decode it on first access.
+        """
+        if response.status_code >= FlextApiConstants.Api.HTTP_ERROR_MIN:
+            return r[FlextApiModels.HttpResponse].fail(
+                f"HTTP {response.status_code}: {response.reason_phrase}",
+            )
+
+        if lazy:
+            return r[FlextApiModels.HttpResponse].ok(
+                FlextApiModels.HttpResponse(
                     status_code=response.status_code,
                     headers=dict(response.headers),
-                    body=body,
+                    body=response.content,
                 ),
             )
-        except Exception as exc:
-            return r[FlextApiModels.HttpResponse].fail(str(exc))
+
+        return FlextApiClient._deserialize_body(response).map(
+            lambda body: FlextApiModels.HttpResponse(
+                status_code=response.status_code,
+                headers=dict(response.headers),
+                body=body,
+            ),
+        )
 
     def _build_url(self, path: str) -> r[str]:
         """Build full URL from base_url and path."""
@@ -203,7 +1014,8 @@ class FlextApiClient(s[FlextApiSettings]):
             return r[str].fail("URL path cannot be empty")
 
         api_config = self._get_config()
-        if not api_config.base_url.strip():
+        # Absolute URLs (e.g. pagination Link targets) bypass the base URL
+        if not api_config.base_url.strip() or httpx.URL(path_stripped).is_absolute_url:
             return r[str].ok(path_stripped)
 
         base = api_config.base_url.strip().rstrip("/")
@@ -213,119 +1025,48 @@ class FlextApiClient(s[FlextApiSettings]):
 
     @staticmethod
     def _serialize_body(
-        body: t.Api.RequestBody,
-    ) -> r[bytes]:
-        """Serialize request body to bytes - no None, empty dict is valid."""
+        body: t.Api.RequestBody | FlextApiStreamingBody,
+        *,
+        content_type: str = "",
+    ) -> r[SerializedBody]:
+        """Serialize request body to bytes - no None, empty dict is valid.
+
+        Dict bodies are encoded as MessagePack or CBOR when ``content_type``
+        names one of them, otherwise as JSON. Streaming bodies pass through
+        unchanged and are read while sending.
+        """
+        if isinstance(body, FlextApiStreamingBody):
+            return r[SerializedBody].ok(body)
         # Empty dict serializes to empty bytes
         if isinstance(body, dict) and len(body) == 0:
-            return r[bytes].ok(b"")
+            return r[SerializedBody].ok(b"")
         if isinstance(body, bytes):
-            return r[bytes].ok(body)
+            return r[SerializedBody].ok(body)
         if isinstance(body, str):
-            return r[bytes].ok(body.encode("utf-8"))
+            return r[SerializedBody].ok(body.encode("utf-8"))
         if isinstance(body, dict):
             try:
-                serialized = json.dumps(body).encode("utf-8")
-                return r[bytes].ok(serialized)
+                negotiation = FlextApiSerializers.ContentNegotiation
+                serialized = negotiation.encode(
+                    body,
+                    content_type
+                    if negotiation.supports(content_type)
+                    else FlextApiConstants.Api.ContentType.JSON,
+                )
+                return r[SerializedBody].ok(serialized)
             except (TypeError, ValueError) as e:
-                return r[bytes].fail(f"Failed to serialize body: {e}")
-        return r[bytes].fail(f"Invalid body type: {type(body)}")
+                return r[SerializedBody].fail(f"Failed to serialize body: {e}")
+        return r[SerializedBody].fail(f"Invalid body type: {type(body)}")
 
     @staticmethod
     def _deserialize_body(
         response: httpx.Response,
     ) -> r[t.Api.ResponseBody]:
-        """Deserialize response body based on content-type."""
-        # Check content-type to prioritize deserialization
-        content_type = response.headers.get("content-type", "").lower()
-
-        # For binary content types, prioritize bytes
-        if "application/octet-stream" in content_type or "binary" in content_type:
-            bytes_result = FlextApiClient._deserialize_bytes(response)
-            if bytes_result.is_success:
-                return bytes_result.map(lambda v: v)
-
-        # Try JSON first for JSON content types
-        if "application/json" in content_type or "application/vnd" in content_type:
-            json_result = FlextApiClient._deserialize_json(response)
-            if json_result.is_success:
-                return json_result.map(lambda v: v)
-
-        # Try JSON for any content (may succeed)
-        json_result = FlextApiClient._deserialize_json(response)
-        if json_result.is_success:
-            return json_result.map(lambda v: v)
-
-        # Try text for text content types
-        if "text/" in content_type:
-            text_result = FlextApiClient._deserialize_text(response)
-            if text_result.is_success:
-                return text_result.map(lambda v: v)
-
-        # Try text as fallback
-        text_result = FlextApiClient._deserialize_text(response)
-        if text_result.is_success:
-            return text_result.map(lambda v: v)
-
-        # Try bytes as last resort
-        bytes_result = FlextApiClient._deserialize_bytes(response)
-        if bytes_result.is_success:
-            return bytes_result.map(lambda v: v)
-
-        return r[t.Api.ResponseBody].fail(
-            "Failed to deserialize response body: no valid format found",
+        """Decode the response body once, dispatched on its content type."""
+        return FlextApiSerializers.BodyDecoder.decode(
+            response.content,
+            response.headers.get("content-type", ""),
         )
 
-    @staticmethod
-    def _deserialize_json(
-        response: httpx.Response,
-    ) -> r[t.Api.ResponseBody]:
-        """Deserialize response as JSON."""
-        try:
-            json_data = response.json()
-            # ResponseBody = JsonObject | str | bytes
-            if isinstance(json_data, dict):
-                return r[t.Api.ResponseBody].ok(json_data)
-            if isinstance(json_data, str):
-                return r[t.Api.ResponseBody].ok(json_data)
-            if isinstance(json_data, bytes):
-                return r[t.Api.ResponseBody].ok(json_data)
-            # Convert other types to dict (JsonObject)
-            return r[t.Api.ResponseBody].ok({"value": json_data})
-        except (AttributeError, ValueError, TypeError, Exception) as e:
-            return r[t.Api.ResponseBody].fail(
-                f"JSON deserialization failed: {e}",
-            )
-
-    @staticmethod
-    def _deserialize_text(
-        response: httpx.Response,
-    ) -> r[t.Api.ResponseBody]:
-        """Deserialize response as text."""
-        if not hasattr(response, "text"):
-            return r[t.Api.ResponseBody].fail(
-                "Response does not have text attribute",
-            )
-        if not isinstance(response.text, str):
-            return r[t.Api.ResponseBody].fail(
-                f"Response text is not a string: {type(response.text)}",
-            )
-        return r[t.Api.ResponseBody].ok(response.text)
-
-    @staticmethod
-    def _deserialize_bytes(
-        response: httpx.Response,
-    ) -> r[t.Api.ResponseBody]:
-        """Deserialize response as bytes."""
-        if not hasattr(response, "content"):
-            return r[t.Api.ResponseBody].fail(
-                "Response does not have content attribute",
-            )
-        if not isinstance(response.content, bytes):
-            return r[t.Api.ResponseBody].fail(
-                f"Response content is not bytes: {type(response.content)}",
-            )
-        return r[t.Api.ResponseBody].ok(response.content)
-
 
 __all__ = ["FlextApiClient"]
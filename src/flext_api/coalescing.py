@@ -0,0 +1,228 @@
+"""Generic request coalescing - single-flight for identical idempotent requests.
+
+Concurrent identical GET/HEAD requests share one upstream call: the first
+caller (leader) sends, later callers wait for and receive the same response.
+Works for threads (sync client) and asyncio tasks (async client).
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+
+import httpx
+from flext_core import r
+
+from flext_api.constants import FlextApiConstants
+from flext_api.typings import t
+
+type CoalescingKey = tuple[str, str, tuple[tuple[str, str], ...]]
+
+
+class FlextApiRequestCoalescer:
+    """Single-flight coalescing of identical in-flight idempotent requests.
+
+    Requests are identical when method, URL (query params included) and the
+    selected key headers match. Conditional headers (If-None-Match,
+    If-Modified-Since) are always part of the key so a 304 is never shared
+    with an unconditional caller. Requests with a body are never coalesced.
+    """
+
+    class _InFlight:
+        """Shared state of one in-flight upstream call (thread callers)."""
+
+        __slots__ = ("done", "error", "response")
+
+        def __init__(self) -> None:
+            self.done = threading.Event()
+            self.response: httpx.Response | None = None
+            self.error: BaseException | None = None
+
+    def __init__(
+        self,
+        key_headers: Iterable[str] = FlextApiConstants.Api.Coalescing.KEY_HEADERS,
+    ) -> None:
+        """Initialize coalescer.
+
+        Args:
+            key_headers: Request headers that distinguish otherwise identical
+                requests (case-insensitive).
+
+        """
+        self._key_headers = frozenset(
+            name.lower()
+            for name in (
+                *key_headers,
+                *FlextApiConstants.Api.Coalescing.CONDITIONAL_HEADERS,
+            )
+        )
+        self._lock = threading.Lock()
+        self._in_flight: dict[CoalescingKey, FlextApiRequestCoalescer._InFlight] = {}
+        self._async_in_flight: dict[
+            tuple[int, CoalescingKey],
+            asyncio.Future[httpx.Response | None],
+        ] = {}
+        self._counters: dict[str, int] = {"leaders": 0, "coalesced": 0}
+
+    def metrics(self) -> r[t.Api.MetricsDict]:
+        """Get upstream call (leaders) and coalesced caller counters."""
+        with self._lock:
+            return r[t.Api.MetricsDict].ok(dict(self._counters))
+
+    def execute(
+        self,
+        method: str,
+        url: str,
+        params: Mapping[str, str | list[str]],
+        headers: Mapping[str, str],
+        send: Callable[[], httpx.Response],
+        *,
+        has_body: bool = False,
+    ) -> httpx.Response:
+        """Send the request, or join an identical one already in flight.
+
+        Exceptions raised by the leader's ``send`` are re-raised in every
+        coalesced caller. A leader interrupted by a BaseException that is not
+        an Exception (KeyboardInterrupt, SystemExit) hands the call off: its
+        followers retry and one of them becomes the new leader.
+        """
+        key = self._coalescing_key(method, url, params, headers, has_body=has_body)
+        if key is None:
+            return send()
+
+        with self._lock:
+            call = self._in_flight.get(key)
+            leader = call is None
+            if call is None:
+                call = self._InFlight()
+                self._in_flight[key] = call
+                self._counters["leaders"] += 1
+            else:
+                self._counters["coalesced"] += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            if call.response is None:
+                # Leader was interrupted without a result: retry the call
+                return self.execute(
+                    method,
+                    url,
+                    params,
+                    headers,
+                    send,
+                    has_body=has_body,
+                )
+            return call.response
+
+        try:
+            call.response = send()
+        except Exception as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            call.done.set()
+        return call.response
+
+    async def aexecute(
+        self,
+        method: str,
+        url: str,
+        params: Mapping[str, str | list[str]],
+        headers: Mapping[str, str],
+        send: Callable[[], Awaitable[httpx.Response]],
+        *,
+        has_body: bool = False,
+    ) -> httpx.Response:
+        """Async counterpart of execute for tasks on the running event loop.
+
+        A cancelled follower does not cancel the shared upstream call, and a
+        cancelled leader does not cancel its followers: they retry and one of
+        them becomes the new leader.
+        """
+        request_key = self._coalescing_key(
+            method,
+            url,
+            params,
+            headers,
+            has_body=has_body,
+        )
+        if request_key is None:
+            return await send()
+
+        loop = asyncio.get_running_loop()
+        key = (id(loop), request_key)
+        with self._lock:
+            future = self._async_in_flight.get(key)
+            leader = future is None
+            if future is None:
+                future = loop.create_future()
+                self._async_in_flight[key] = future
+                self._counters["leaders"] += 1
+            else:
+                self._counters["coalesced"] += 1
+        if not leader:
+            shared = await asyncio.shield(future)
+            if shared is None:
+                # Leader was cancelled without a result: retry the call
+                return await self.aexecute(
+                    method,
+                    url,
+                    params,
+                    headers,
+                    send,
+                    has_body=has_body,
+                )
+            return shared
+
+        try:
+            response = await send()
+        except Exception as exc:
+            future.set_exception(exc)
+            # Mark as retrieved so a future without followers does not warn
+            future.exception()
+            raise
+        except BaseException:
+            # Cancellation belongs to the leader only; hand off to followers
+            future.set_result(None)
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            with self._lock:
+                self._async_in_flight.pop(key, None)
+
+    def _coalescing_key(
+        self,
+        method: str,
+        url: str,
+        params: Mapping[str, str | list[str]],
+        headers: Mapping[str, str],
+        *,
+        has_body: bool,
+    ) -> CoalescingKey | None:
+        """Build the identity of a request, or None if it must not be coalesced."""
+        method = method.upper()
+        if has_body or method not in FlextApiConstants.Api.Coalescing.METHODS:
+            return None
+        full_url = str(httpx.URL(url, params=dict(params))) if params else url
+        selected = tuple(
+            sorted(
+                (name.lower(), value)
+                for name, value in headers.items()
+                if name.lower() in self._key_headers
+            ),
+        )
+        return method, full_url, selected
+
+
+__all__ = ["FlextApiRequestCoalescer"]
@@ -0,0 +1,292 @@
+"""Generic HTTP compression - request bodies and response Content-Encoding.
+
+Opt-in component of FlextApiClient and FlextApiAsyncClient. Compresses
+request bodies above a size threshold with gzip, brotli or zstd, advertises
+Accept-Encoding in a preferred order, and counts compression ratio and CPU
+time so the threshold and level can be tuned.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import gzip
+import importlib
+import threading
+import time
+import zlib
+from collections.abc import Callable, Iterable, Mapping
+from types import ModuleType
+from typing import ClassVar
+
+import httpx
+from flext_core import r
+
+from flext_api.constants import FlextApiConstants
+from flext_api.typings import t
+
+
+def _optional_module(*names: str) -> ModuleType | None:
+    """Import the first installed module of ``names``, or None."""
+    for name in names:
+        try:
+            return importlib.import_module(name)
+        except ImportError:
+            continue
+    return None
+
+
+def _installed(module: ModuleType | None, name: str) -> ModuleType:
+    """Return an optional codec module, which codecs only use when found."""
+    if module is None:
+        msg = f"Compression package {name!r} is not installed"
+        raise RuntimeError(msg)
+    return module
+
+
+# Same packages httpx decodes responses with, so only decodable
+# encodings are ever advertised in Accept-Encoding
+_brotli = _optional_module("brotli", "brotlicffi")
+_zstandard = _optional_module("zstandard")
+
+
+class FlextApiCompression:
+    """Request body compression and Accept-Encoding negotiation.
+
+    gzip is always available; ``br`` and ``zstd`` need the brotli and
+    zstandard packages. Responses are decompressed by httpx chunk by chunk as
+    they arrive, including streamed ones, so memory stays bounded by the
+    chunk size rather than the decoded body.
+
+    Bodies that are smaller than ``min_size``, already carry a
+    Content-Encoding, or do not shrink are sent unchanged.
+    """
+
+    type Codec = tuple[Callable[[bytes, int], bytes], Callable[[bytes], bytes]]
+
+    class Report:
+        """Outcome of compressing one request body."""
+
+        __slots__ = ("compressed_size", "cpu_seconds", "encoding", "raw_size")
+
+        def __init__(
+            self,
+            encoding: str,
+            raw_size: int,
+            compressed_size: int,
+            cpu_seconds: float,
+        ) -> None:
+            self.encoding = encoding
+            self.raw_size = raw_size
+            self.compressed_size = compressed_size
+            self.cpu_seconds = cpu_seconds
+
+        @property
+        def ratio(self) -> float:
+            """Compressed size divided by raw size (lower is better)."""
+            return self.compressed_size / self.raw_size if self.raw_size else 1.0
+
+    _COUNTERS = (
+        "requests_compressed",
+        "requests_uncompressed",
+        "request_bytes_raw",
+        "request_bytes_sent",
+        "compress_cpu_us",
+        "responses_compressed",
+        "response_bytes_received",
+        "response_bytes_decoded",
+    )
+
+    def __init__(
+        self,
+        encoding: str | None = FlextApiConstants.Api.Compression.GZIP,
+        *,
+        min_size: int = FlextApiConstants.Api.Compression.DEFAULT_MIN_SIZE,
+        level: int | None = None,
+        accept_encodings: Iterable[str] = (
+            FlextApiConstants.Api.Compression.PREFERENCE
+        ),
+    ) -> None:
+        """Initialize compression.
+
+        Args:
+            encoding: Content-Encoding for request bodies, or None to only
+                negotiate response encodings.
+            min_size: Smallest request body, in bytes, that is compressed.
+            level: Compression level; defaults to a per-encoding level
+                tuned for request latency (see c.Api.Compression).
+            accept_encodings: Response encodings in order of preference;
+                encodings that cannot be decoded here are left out.
+
+        Raises:
+            ValueError: If ``encoding`` is not available or ``min_size`` is
+                negative.
+
+        """
+        if encoding is not None and encoding not in self._codecs:
+            msg = (
+                f"Compression {encoding!r} is not available; "
+                f"installed: {', '.join(self.available_encodings())}"
+            )
+            raise ValueError(msg)
+        if min_size < 0:
+            msg = "min_size must be >= 0"
+            raise ValueError(msg)
+        self._encoding = encoding
+        self._min_size = min_size
+        self._level = level
+        self._accept_encoding = ", ".join(
+            name for name in accept_encodings if name in self._codecs
+        )
+        self._lock = threading.Lock()
+        self._counters: dict[str, int] = dict.fromkeys(self._COUNTERS, 0)
+
+    @classmethod
+    def available_encodings(cls) -> tuple[str, ...]:
+        """Encodings that can be compressed and decoded, in default preference."""
+        return tuple(
+            name
+            for name in FlextApiConstants.Api.Compression.PREFERENCE
+            if name in cls._codecs
+        )
+
+    @property
+    def encoding(self) -> str | None:
+        """Content-Encoding applied to request bodies (None: disabled)."""
+        return self._encoding
+
+    @property
+    def accept_encoding(self) -> str:
+        """Accept-Encoding header value, most preferred first."""
+        return self._accept_encoding
+
+    def metrics(self) -> r[t.Api.MetricsDict]:
+        """Get byte, request and CPU counters.
+
+        Request compression ratio is ``request_bytes_sent / request_bytes_raw``
+        and response ratio ``response_bytes_received / response_bytes_decoded``.
+        """
+        with self._lock:
+            return r[t.Api.MetricsDict].ok(dict(self._counters))
+
+    def compress(self, data: bytes, encoding: str | None = None) -> r[bytes]:
+        """Compress ``data`` with ``encoding`` (default: this instance's)."""
+        encoding = encoding or self._encoding
+        if encoding is None or encoding not in self._codecs:
+            return r[bytes].fail(f"Compression {encoding!r} is not available")
+        level = self._level
+        if level is None:
+            level = FlextApiConstants.Api.Compression.DEFAULT_LEVELS[encoding]
+        try:
+            return r[bytes].ok(self._codecs[encoding][0](data, level))
+        except (ValueError, zlib.error) as e:
+            return r[bytes].fail(f"{encoding} compression failed: {e}")
+
+    @classmethod
+    def decompress(cls, data: bytes, encoding: str) -> r[bytes]:
+        """Decompress a whole ``encoding``-compressed payload."""
+        codec = cls._codecs.get(encoding)
+        if codec is None:
+            return r[bytes].fail(f"Compression {encoding!r} is not available")
+        try:
+            return r[bytes].ok(codec[1](data))
+        except (OSError, ValueError, EOFError, zlib.error) as e:
+            return r[bytes].fail(f"{encoding} decompression failed: {e}")
+
+    def encode_request(
+        self,
+        body: bytes,
+        headers: Mapping[str, str],
+    ) -> tuple[bytes, dict[str, str], FlextApiCompression.Report | None]:
+        """Compress a request body when worthwhile and label it.
+
+        Returns:
+            The body and headers to send, plus a report when compressed.
+
+        """
+        encoding = self._encoding
+        header = FlextApiConstants.Api.HEADER_CONTENT_ENCODING
+        if (
+            encoding is None
+            or len(body) < self._min_size
+            or any(name.lower() == header.lower() for name in headers)
+        ):
+            return self._uncompressed(body, headers)
+        started = time.thread_time()
+        compressed = self.compress(body)
+        cpu_seconds = time.thread_time() - started
+        if compressed.is_failure or len(compressed.value) >= len(body):
+            return self._uncompressed(body, headers)
+        report = self.Report(encoding, len(body), len(compressed.value), cpu_seconds)
+        with self._lock:
+            self._counters["requests_compressed"] += 1
+            self._counters["request_bytes_raw"] += report.raw_size
+            self._counters["request_bytes_sent"] += report.compressed_size
+            self._counters["compress_cpu_us"] += round(cpu_seconds * 1_000_000)
+        return compressed.value, {**headers, header: encoding}, report
+
+    def record_response(self, response: httpx.Response) -> None:
+        """Count wire and decoded bytes of a compressed, fully read response."""
+        encoding = response.headers.get(
+            FlextApiConstants.Api.HEADER_CONTENT_ENCODING,
+            FlextApiConstants.Api.Compression.IDENTITY,
+        )
+        received = response.num_bytes_downloaded
+        if encoding == FlextApiConstants.Api.Compression.IDENTITY or not received:
+            return
+        with self._lock:
+            self._counters["responses_compressed"] += 1
+            self._counters["response_bytes_received"] += received
+            self._counters["response_bytes_decoded"] += len(response.content)
+
+    def _uncompressed(
+        self,
+        body: bytes,
+        headers: Mapping[str, str],
+    ) -> tuple[bytes, dict[str, str], None]:
+        with self._lock:
+            self._counters["requests_uncompressed"] += 1
+        return body, dict(headers), None
+
+    @staticmethod
+    def _gzip_compress(data: bytes, level: int) -> bytes:
+        return gzip.compress(data, compresslevel=level, mtime=0)
+
+    @staticmethod
+    def _brotli_compress(data: bytes, level: int) -> bytes:
+        compressed: bytes = _installed(_brotli, "brotli").compress(data, quality=level)
+        return compressed
+
+    @staticmethod
+    def _zstd_compress(data: bytes, level: int) -> bytes:
+        zstandard = _installed(_zstandard, "zstandard")
+        compressed: bytes = zstandard.ZstdCompressor(level=level).compress(data)
+        return compressed
+
+    @staticmethod
+    def _zstd_decompress(data: bytes) -> bytes:
+        # decompressobj also handles frames without a content size
+        zstandard = _installed(_zstandard, "zstandard")
+        decompressed: bytes = (
+            zstandard.ZstdDecompressor().decompressobj().decompress(data)
+        )
+        return decompressed
+
+    _codecs: ClassVar[dict[str, Codec]] = {
+        FlextApiConstants.Api.Compression.GZIP: (_gzip_compress, gzip.decompress),
+    }
+    if _brotli is not None:
+        _codecs[FlextApiConstants.Api.Compression.BROTLI] = (
+            _brotli_compress,
+            _brotli.decompress,
+        )
+    if _zstandard is not None:
+        _codecs[FlextApiConstants.Api.Compression.ZSTD] = (
+            _zstd_compress,
+            _zstd_decompress,
+        )
+
+
+__all__ = ["FlextApiCompression"]
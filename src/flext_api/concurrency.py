@@ -0,0 +1,452 @@
+"""Adaptive per-origin concurrency limiting (AIMD or Vegas).
+
+Opt-in component of FlextApiClient and FlextApiAsyncClient. Instead of a
+static pool size per upstream, each origin gets an in-flight limit that
+grows while requests succeed quickly and shrinks when latency builds up or
+the upstream sheds load. Requests above the limit wait in a FIFO queue for
+a bounded time, or are rejected at once when the queue is full, with the
+CONCURRENCY_LIMITED error code.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+
+import httpx
+from flext_core import r
+
+from flext_api.circuit_breaker import FlextApiCircuitBreaker
+from flext_api.constants import c
+from flext_api.typings import t
+
+
+class FlextApiConcurrencyLimiter:
+    """Per-origin in-flight limit adapted from latency and drops.
+
+    Every completed request is a sample: its latency, and whether it was
+    dropped (a transport error or a 429/503/504 answer).
+
+    ``aimd``: a drop multiplies the limit by ``backoff_ratio`` (once per
+    round trip, so a burst of drops counts once); a success while the
+    origin is at least half busy adds ``1 / limit``, about one slot per
+    round trip.
+
+    ``vegas``: compares each latency with the lowest seen (the no-load
+    latency) to estimate how many requests queue upstream,
+    ``limit * (1 - min_rtt / rtt)``; below ``alpha`` the limit grows, above
+    ``beta`` it shrinks, by about one per round trip. Drops back off as in
+    AIMD.
+
+    Sync callers block on an event and async callers await a future, so one
+    limiter can serve threads and event loops together.
+
+    Usage:
+        limiter = FlextApiConcurrencyLimiter(algorithm="vegas")
+        client = FlextApiClient(settings, concurrency_limiter=limiter)
+    """
+
+    Algorithm = c.Api.Concurrency.Algorithm
+
+    class LimitExceededError(Exception):
+        """Raised when a request finds the queue full or waits too long."""
+
+        def __init__(self, origin: str, limit: int, reason: str) -> None:
+            self.origin = origin
+            self.limit = limit
+            self.reason = reason
+            super().__init__(
+                f"Concurrency limit {limit} reached for {origin}: {reason}",
+            )
+
+    class Permit:
+        """In-flight slot of one request; hand it back to ``release``."""
+
+        __slots__ = ("origin", "started")
+
+        def __init__(self, origin: str, started: float) -> None:
+            self.origin = origin
+            self.started = started
+
+    class _Waiter:
+        __slots__ = ("event", "future", "granted", "loop")
+
+        def __init__(
+            self,
+            event: threading.Event | None = None,
+            future: asyncio.Future[None] | None = None,
+            loop: asyncio.AbstractEventLoop | None = None,
+        ) -> None:
+            self.event = event
+            self.future = future
+            self.loop = loop
+            self.granted = False
+
+    class _Origin:
+        __slots__ = (
+            "decreased_at",
+            "in_flight",
+            "limit",
+            "min_rtt",
+            "samples",
+            "waiters",
+        )
+
+        def __init__(self, limit: float) -> None:
+            self.limit = limit
+            self.in_flight = 0
+            self.waiters: deque[FlextApiConcurrencyLimiter._Waiter] = deque()
+            self.min_rtt = 0.0
+            self.samples = 0
+            self.decreased_at = float("-inf")
+
+    _COUNTERS = (
+        "acquired",
+        "queued",
+        "rejected",
+        "timeouts",
+        "dropped",
+        "increases",
+        "decreases",
+    )
+
+    def __init__(
+        self,
+        *,
+        algorithm: c.Api.Concurrency.Algorithm | str = (
+            c.Api.Concurrency.Algorithm.AIMD
+        ),
+        initial_limit: int = c.Api.Concurrency.INITIAL_LIMIT,
+        min_limit: int = c.Api.Concurrency.MIN_LIMIT,
+        max_limit: int = c.Api.Concurrency.MAX_LIMIT,
+        backoff_ratio: float = c.Api.Concurrency.BACKOFF_RATIO,
+        alpha: float = c.Api.Concurrency.VEGAS_ALPHA,
+        beta: float = c.Api.Concurrency.VEGAS_BETA,
+        queue_timeout: float = c.Api.Concurrency.QUEUE_TIMEOUT,
+        max_queue: int = c.Api.Concurrency.MAX_QUEUE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            algorithm: ``aimd`` or ``vegas``.
+            initial_limit: In-flight limit of an origin before feedback.
+            min_limit: Lowest limit.
+            max_limit: Highest limit.
+            backoff_ratio: Factor (0-1) applied to the limit on a drop.
+            alpha: Vegas: estimated upstream queue below which to grow.
+            beta: Vegas: estimated upstream queue above which to shrink.
+            queue_timeout: Seconds to wait for a slot (0: never wait).
+            max_queue: Requests waiting per origin; more are rejected.
+            clock: Monotonic time source for latencies.
+
+        Raises:
+            ValueError: If the limits are not ordered, ``backoff_ratio`` is
+                outside (0, 1), ``alpha`` exceeds ``beta`` or a queue setting
+                is negative.
+
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            msg = "Concurrency limits must satisfy 1 <= min <= initial <= max"
+            raise ValueError(msg)
+        if not 0 < backoff_ratio < 1 or not 0 <= alpha <= beta:
+            msg = "Concurrency backoff_ratio must be in (0, 1) and alpha <= beta"
+            raise ValueError(msg)
+        if queue_timeout < 0 or max_queue < 0:
+            msg = "Concurrency queue_timeout and max_queue must be >= 0"
+            raise ValueError(msg)
+        self.algorithm = c.Api.Concurrency.Algorithm(algorithm)
+        self.initial_limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.alpha = alpha
+        self.beta = beta
+        self.queue_timeout = queue_timeout
+        self.max_queue = max_queue
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._origins: dict[str, FlextApiConcurrencyLimiter._Origin] = {}
+        self._counters: dict[str, int] = dict.fromkeys(self._COUNTERS, 0)
+
+    def limit(self, url: str | httpx.URL) -> int:
+        """Current in-flight limit of ``url``'s origin."""
+        with self._lock:
+            state = self._origins.get(FlextApiCircuitBreaker.origin_of(url))
+            return self.initial_limit if state is None else int(state.limit)
+
+    def acquire(
+        self,
+        url: str | httpx.URL,
+        *,
+        timeout: float | None = None,
+    ) -> FlextApiConcurrencyLimiter.Permit:
+        """Take an in-flight slot, blocking up to the queue timeout.
+
+        Raises:
+            LimitExceededError: If the queue is full or no slot frees up in
+                ``timeout`` (default ``queue_timeout``) seconds.
+
+        """
+        origin = FlextApiCircuitBreaker.origin_of(url)
+        with self._lock:
+            permit = self._try_acquire(origin)
+            if permit is not None:
+                return permit
+            waiter = self._enqueue(origin, self._Waiter(event=threading.Event()))
+        if waiter.event is not None:
+            waiter.event.wait(self.queue_timeout if timeout is None else timeout)
+        return self._granted(origin, waiter)
+
+    async def aacquire(
+        self,
+        url: str | httpx.URL,
+        *,
+        timeout: float | None = None,
+    ) -> FlextApiConcurrencyLimiter.Permit:
+        """Async ``acquire``: waits for a slot without blocking the loop."""
+        origin = FlextApiCircuitBreaker.origin_of(url)
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            permit = self._try_acquire(origin)
+            if permit is not None:
+                return permit
+            future: asyncio.Future[None] = loop.create_future()
+            waiter = self._enqueue(origin, self._Waiter(future=future, loop=loop))
+        try:
+            await asyncio.wait(
+                {future},
+                timeout=self.queue_timeout if timeout is None else timeout,
+            )
+        except BaseException:
+            # Cancelled while queued: leave the queue or pass the slot on
+            with self._lock:
+                state = self._origins[origin]
+                if waiter.granted:
+                    state.in_flight -= 1
+                    self._wake(state)
+                else:
+                    state.waiters.remove(waiter)
+            raise
+        return self._granted(origin, waiter)
+
+    def release(
+        self,
+        permit: FlextApiConcurrencyLimiter.Permit,
+        *,
+        dropped: bool | None,
+    ) -> None:
+        """Free a slot and adapt the limit to the request's outcome.
+
+        Args:
+            permit: Value returned by ``acquire`` for this request.
+            dropped: True when the upstream shed or lost the request, False
+                for a served request, None when the outcome says nothing
+                about upstream load (the limit is left unchanged).
+
+        """
+        rtt = self._clock() - permit.started
+        with self._lock:
+            state = self._origins[permit.origin]
+            if dropped is not None:
+                self._adapt(state, permit, rtt, dropped=dropped)
+            state.in_flight -= 1
+            self._wake(state)
+
+    def release_response(
+        self,
+        permit: FlextApiConcurrencyLimiter.Permit,
+        response: httpx.Response,
+    ) -> None:
+        """Release after a response; 429, 503 and 504 count as drops."""
+        self.release(
+            permit,
+            dropped=response.status_code in c.Api.Concurrency.DROP_STATUS_CODES,
+        )
+
+    def call(
+        self,
+        url: str | httpx.URL,
+        send: Callable[[], httpx.Response],
+    ) -> httpx.Response:
+        """Run ``send`` within an in-flight slot of ``url``'s origin.
+
+        Raises:
+            LimitExceededError: If no slot is available in time.
+
+        """
+        permit = self.acquire(url)
+        try:
+            response = send()
+        except httpx.TransportError:
+            self.release(permit, dropped=True)
+            raise
+        except BaseException:
+            self.release(permit, dropped=None)
+            raise
+        self.release_response(permit, response)
+        return response
+
+    async def acall(
+        self,
+        url: str | httpx.URL,
+        send: Callable[[], Awaitable[httpx.Response]],
+    ) -> httpx.Response:
+        """Async ``call``: awaits a slot, then ``send``."""
+        permit = await self.aacquire(url)
+        try:
+            response = await send()
+        except httpx.TransportError:
+            self.release(permit, dropped=True)
+            raise
+        except BaseException:
+            self.release(permit, dropped=None)
+            raise
+        self.release_response(permit, response)
+        return response
+
+    def stats(self) -> r[dict[str, t.Api.MetricsDict]]:
+        """Per-origin limit, in-flight requests, queue depth and min latency."""
+        with self._lock:
+            stats: dict[str, t.Api.MetricsDict] = {
+                origin: {
+                    "limit": int(state.limit),
+                    "in_flight": state.in_flight,
+                    "queue_depth": len(state.waiters),
+                    "min_rtt_us": round(state.min_rtt * 1_000_000),
+                }
+                for origin, state in self._origins.items()
+            }
+        return r[dict[str, t.Api.MetricsDict]].ok(stats)
+
+    def metrics(self) -> r[t.Api.MetricsDict]:
+        """Get admission and adaptation counters.
+
+        ``limit``, ``in_flight`` and ``queue_depth`` are current values
+        summed over origins (with one upstream, that upstream's values).
+        """
+        with self._lock:
+            metrics: t.Api.MetricsDict = dict(self._counters)
+            states = list(self._origins.values())
+            metrics["limit"] = sum(int(state.limit) for state in states)
+            metrics["in_flight"] = sum(state.in_flight for state in states)
+            metrics["queue_depth"] = sum(len(state.waiters) for state in states)
+        return r[t.Api.MetricsDict].ok(metrics)
+
+    def _try_acquire(self, origin: str) -> FlextApiConcurrencyLimiter.Permit | None:
+        """Take a free slot if nobody is queued ahead (lock held)."""
+        state = self._origins.get(origin)
+        if state is None:
+            state = self._origins[origin] = self._Origin(float(self.initial_limit))
+        if state.waiters or state.in_flight >= int(state.limit):
+            return None
+        state.in_flight += 1
+        self._counters["acquired"] += 1
+        return self.Permit(origin, self._clock())
+
+    def _enqueue(
+        self,
+        origin: str,
+        waiter: FlextApiConcurrencyLimiter._Waiter,
+    ) -> FlextApiConcurrencyLimiter._Waiter:
+        """Queue ``waiter`` or reject when the queue is full (lock held)."""
+        state = self._origins[origin]
+        if self.queue_timeout == 0 or len(state.waiters) >= self.max_queue:
+            self._counters["rejected"] += 1
+            raise self.LimitExceededError(origin, int(state.limit), "queue full")
+        state.waiters.append(waiter)
+        self._counters["queued"] += 1
+        return waiter
+
+    def _granted(
+        self,
+        origin: str,
+        waiter: FlextApiConcurrencyLimiter._Waiter,
+    ) -> FlextApiConcurrencyLimiter.Permit:
+        """Permit of a woken waiter, or leave the queue on timeout."""
+        with self._lock:
+            state = self._origins[origin]
+            if not waiter.granted:
+                state.waiters.remove(waiter)
+                self._counters["timeouts"] += 1
+                raise self.LimitExceededError(
+                    origin,
+                    int(state.limit),
+                    "queue timeout",
+                )
+            return self.Permit(origin, self._clock())
+
+    def _wake(self, state: FlextApiConcurrencyLimiter._Origin) -> None:
+        """Hand free slots to queued requests in FIFO order (lock held)."""
+        while state.waiters and state.in_flight < int(state.limit):
+            waiter = state.waiters.popleft()
+            waiter.granted = True
+            state.in_flight += 1
+            self._counters["acquired"] += 1
+            if waiter.event is not None:
+                waiter.event.set()
+            elif waiter.future is not None and waiter.loop is not None:
+                waiter.loop.call_soon_threadsafe(self._resolve, waiter.future)
+
+    def _adapt(
+        self,
+        state: FlextApiConcurrencyLimiter._Origin,
+        permit: FlextApiConcurrencyLimiter.Permit,
+        rtt: float,
+        *,
+        dropped: bool,
+    ) -> None:
+        """Move the limit after one sample (lock held)."""
+        previous = state.limit
+        if dropped:
+            self._counters["dropped"] += 1
+            # Requests sent before the last cut saw the old load
+            if permit.started >= state.decreased_at:
+                state.limit = max(
+                    float(self.min_limit),
+                    state.limit * self.backoff_ratio,
+                )
+                state.decreased_at = self._clock()
+        elif self.algorithm is self.Algorithm.AIMD:
+            if state.in_flight * 2 >= state.limit:
+                state.limit = min(
+                    float(self.max_limit),
+                    state.limit + 1 / state.limit,
+                )
+        else:
+            state.samples += 1
+            if state.min_rtt == 0 or (
+                state.samples % c.Api.Concurrency.MIN_RTT_RESET_SAMPLES == 0
+            ):
+                state.min_rtt = rtt
+            state.min_rtt = min(state.min_rtt, rtt)
+            queued = state.limit * (1 - state.min_rtt / rtt) if rtt > 0 else 0.0
+            if queued < self.alpha and state.in_flight * 2 >= state.limit:
+                state.limit = min(
+                    float(self.max_limit),
+                    state.limit + 1 / state.limit,
+                )
+            elif queued > self.beta:
+                state.limit = max(
+                    float(self.min_limit),
+                    state.limit - 1 / state.limit,
+                )
+        if int(state.limit) > int(previous):
+            self._counters["increases"] += 1
+        elif int(state.limit) < int(previous):
+            self._counters["decreases"] += 1
+
+    @staticmethod
+    def _resolve(future: asyncio.Future[None]) -> None:
+        if not future.done():
+            future.set_result(None)
+
+
+__all__ = ["FlextApiConcurrencyLimiter"]
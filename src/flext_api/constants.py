@@ -131,6 +131,8 @@ class FlextApiConstants(FlextConstants):
             FORM = "application/x-www-form-urlencoded"
             MULTIPART = "multipart/form-data"
             OCTET_STREAM = "application/octet-stream"
+            MSGPACK = "application/msgpack"
+            CBOR = "application/cbor"
 
         class HttpSerializationFormat(StrEnum):
             """HTTP-specific serialization formats (extends parent SerializationFormat).
@@ -260,6 +262,9 @@ class FlextApiConstants(FlextConstants):
         HTTP_ERROR_MIN: Final[int] = 400
         """Minimum HTTP error status code."""
 
+        HTTP_TOO_MANY_REQUESTS: Final[int] = 429
+        """Too Many Requests status code (rate limited, not processed)."""
+
         # ═══════════════════════════════════════════════════════════════════
         # RESPONSE TEMPLATES: Immutable mappings
         # ═══════════════════════════════════════════════════════════════════
@@ -296,6 +301,15 @@ class FlextApiConstants(FlextConstants):
         HEADER_ACCEPT: Final[str] = "Accept"
         """Accept header name."""
 
+        HEADER_CONTENT_ENCODING: Final[str] = "Content-Encoding"
+        """Content-Encoding header name."""
+
+        HEADER_ACCEPT_ENCODING: Final[str] = "Accept-Encoding"
+        """Accept-Encoding header name."""
+
+        HEADER_RETRY_AFTER: Final[str] = "Retry-After"
+        """Retry-After header name."""
+
         # ═══════════════════════════════════════════════════════════════════
         # DERIVED CONSTANTS: Constants derived from others
         # ═══════════════════════════════════════════════════════════════════
@@ -526,11 +540,399 @@ class FlextApiConstants(FlextConstants):
                 504,
             })
 
+        class Retry:
+            """Retry policy constants (backoff, Retry-After and retry budget)."""
+
+            class Jitter(StrEnum):
+                """Randomization applied to exponential backoff delays."""
+
+                NONE = "none"
+                FULL = "full"
+                DECORRELATED = "decorrelated"
+
+            DEFAULT_MAX_DELAY: Final[float] = 30.0
+            """Upper bound, in seconds, of a single backoff delay."""
+            MAX_RETRY_AFTER: Final[float] = 120.0
+            """Longer Retry-After values give up instead of waiting."""
+            IDEMPOTENT_METHODS: Final[frozenset[str]] = frozenset({
+                "GET",
+                "HEAD",
+                "OPTIONS",
+                "PUT",
+                "DELETE",
+                "TRACE",
+            })
+            """Methods safe to repeat after the server may have seen them."""
+            RETRY_AFTER_STATUS_CODES: Final[frozenset[int]] = frozenset({429, 503})
+            """Statuses whose Retry-After header sets the retry delay."""
+            BUDGET_RATIO: Final[float] = 0.2
+            """Retries allowed per host as a fraction of its requests."""
+            BUDGET_MIN_PER_SECOND: Final[float] = 1.0
+            """Retry tokens per second granted to a host regardless of traffic."""
+            BUDGET_CAPACITY: Final[float] = 10.0
+            """Most retry tokens a host can accumulate."""
+
         class HTTPClient:
             """HTTP client connection constants."""
 
             DEFAULT_MAX_CONNECTIONS: Final[int] = 100
             DEFAULT_MAX_KEEPALIVE_CONNECTIONS: Final[int] = 20
+            DEFAULT_KEEPALIVE_EXPIRY: Final[float] = 5.0
+            """Seconds an idle keep-alive connection stays in the pool."""
+            MAX_KEEPALIVE_EXPIRY: Final[float] = 3600.0
+            """Upper bound accepted for the keep-alive idle expiry."""
+            DEFAULT_MAX_REDIRECTS: Final[int] = 20
+            """Redirects followed before a request fails with TooManyRedirects."""
+            HTTP2_PACKAGE: Final[str] = "h2"
+            """Package httpx needs for HTTP/2; without it requests use HTTP/1.1."""
+            POOL_IDLE_TIMEOUT: Final[float] = 60.0
+            """Seconds an unleased pool stays in the registry before it is closed."""
+
+        class HTTPBatch:
+            """Concurrent batch request constants."""
+
+            DEFAULT_MAX_CONCURRENCY: Final[int] = 10
+            """Default number of requests in flight per batch."""
+            CANCEL_POLL_INTERVAL: Final[float] = 0.05
+            """Seconds between cancellation checks while waiting on a batch."""
+            DEADLINE_EXCEEDED_ERROR: Final[str] = "Batch deadline exceeded"
+            """Error for requests still in flight when the batch deadline passes."""
+            CANCELLED_ERROR: Final[str] = "Batch cancelled"
+            """Error for requests still in flight when the batch is cancelled."""
+
+        class HttpCache:
+            """RFC 9111 HTTP response cache constants."""
+
+            NAMESPACE: Final[str] = "http_cache"
+            """Storage namespace for the default cache backend."""
+            HEURISTIC_FRACTION: Final[float] = 0.1
+            """Fraction of (Date - Last-Modified) used as heuristic freshness."""
+            STALE_RETENTION: Final[int] = 86400
+            """Seconds a stale entry with validators is kept for revalidation."""
+            MAX_VARIANTS: Final[int] = 16
+            """Maximum Vary variants kept per URL (oldest dropped first)."""
+            STORABLE_STATUS_CODES: Final[frozenset[int]] = frozenset({
+                200,
+                203,
+                204,
+                300,
+                301,
+                308,
+                404,
+                405,
+                410,
+                414,
+                501,
+            })
+            """Status codes the cache may store (RFC 9110 heuristically cacheable)."""
+            UNSTORED_HEADERS: Final[frozenset[str]] = frozenset({
+                "content-encoding",
+                "content-length",
+                "transfer-encoding",
+                "connection",
+                "keep-alive",
+            })
+            """Hop-by-hop and encoding headers dropped from stored responses."""
+
+        class Storage:
+            """FlextApiStorage capacity and eviction constants."""
+
+            class Eviction(StrEnum):
+                """Which entry is dropped when a size or memory limit is hit."""
+
+                LRU = "lru"
+                LFU = "lfu"
+                TINY_LFU = "tinylfu"
+
+            DEFAULT_EVICTION: Final[str] = Eviction.LRU
+            """Eviction policy used when only a limit is configured."""
+            TINYLFU_WINDOW_RATIO: Final[float] = 0.01
+            """Share of the capacity given to the W-TinyLFU admission window."""
+            TINYLFU_PROTECTED_RATIO: Final[float] = 0.8
+            """Share of the W-TinyLFU main space kept for re-used entries."""
+            ENTRY_OVERHEAD_BYTES: Final[int] = 64
+            """Estimated bytes of an entry record and its dict slot."""
+            SIZE_HISTOGRAM_BUCKETS: Final[int] = 32
+            """Power-of-two entry size buckets; the last one holds the rest."""
+            EXPIRY_SWEEP_BATCH: Final[int] = 16
+            """Expired entries removed at most per get/set/exists call."""
+            EXPIRY_COMPACT_FACTOR: Final[int] = 2
+            """Expiry heap is rebuilt when it outgrows the live TTLs this much."""
+            SKETCH_DEPTH: Final[int] = 4
+            """Rows (hash functions) of the W-TinyLFU frequency sketch."""
+            SKETCH_WIDTH_FACTOR: Final[int] = 4
+            """Counters per sketch row for each entry of capacity."""
+            SKETCH_MAX_WIDTH: Final[int] = 1 << 22
+            """Upper bound on the counters per sketch row (4 MiB per row)."""
+            SKETCH_MAX_COUNT: Final[int] = 15
+            """Saturation value of a frequency sketch counter."""
+            SKETCH_SAMPLE_FACTOR: Final[int] = 10
+            """Counters are halved every ``capacity * factor`` increments."""
+
+        class Coalescing:
+            """Single-flight request coalescing constants."""
+
+            METHODS: Final[frozenset[str]] = frozenset({"GET", "HEAD"})
+            """Idempotent methods eligible for coalescing."""
+            KEY_HEADERS: Final[tuple[str, ...]] = (
+                "accept",
+                "accept-encoding",
+                "accept-language",
+                "authorization",
+                "cookie",
+            )
+            """Default request headers that are part of the coalescing key."""
+            CONDITIONAL_HEADERS: Final[tuple[str, ...]] = (
+                "if-none-match",
+                "if-modified-since",
+            )
+            """Conditional headers always included in the coalescing key."""
+
+        class Streaming:
+            """Streaming request and response body constants."""
+
+            DEFAULT_CHUNK_SIZE: Final[int] = 65536
+            """Default number of bytes yielded per streamed body chunk."""
+            CLOSED_ERROR: Final[str] = "Stream already consumed or closed"
+            """Error when a streaming response is read twice or after close."""
+            DEFAULT_UPLOAD_CHUNK_SIZE: Final[int] = 65536
+            """Default number of bytes read per chunk of a streamed request body."""
+            BODY_CONSUMED_ERROR: Final[str] = (
+                "Streaming request body is a one-shot iterator and was already sent"
+            )
+            """Error when a non-replayable request body is iterated twice."""
+            ASYNC_ONLY_BODY_ERROR: Final[str] = (
+                "Async iterable request bodies require FlextApiAsyncClient"
+            )
+            """Error when an async-only request body is sent by a sync client."""
+
+        class JsonCodec:
+            """Pluggable JSON codec backend constants."""
+
+            ORJSON: Final[str] = "orjson"
+            MSGSPEC: Final[str] = "msgspec"
+            STDLIB: Final[str] = "json"
+            PREFERENCE: Final[tuple[str, ...]] = (ORJSON, MSGSPEC, STDLIB)
+            """Backends in order of preference; the first importable one is used."""
+
+        class BodyDecoding:
+            """Content-type driven response body decoding constants."""
+
+            JSON: Final[str] = "json"
+            """Decoder name producing a JSON object (non-objects wrapped as value)."""
+            TEXT: Final[str] = "text"
+            """Decoder name producing a str decoded with the response charset."""
+            BINARY: Final[str] = "binary"
+            """Decoder name keeping the raw bytes."""
+            MSGPACK: Final[str] = "msgpack"
+            """Decoder name producing a MessagePack object (non-objects wrapped)."""
+            CBOR: Final[str] = "cbor"
+            """Decoder name producing a CBOR object (non-objects wrapped)."""
+            DEFAULT_CHARSET: Final[str] = "utf-8"
+            """Charset used for text when the content type declares none."""
+            MEDIA_TYPES: Final[Mapping[str, str]] = MappingProxyType({
+                "application/json": "json",
+                "application/octet-stream": "binary",
+                "application/xml": "text",
+                "application/javascript": "text",
+                "application/x-www-form-urlencoded": "text",
+                "application/x-ndjson": "text",
+                "application/pdf": "binary",
+                "application/zip": "binary",
+                "application/gzip": "binary",
+                "application/msgpack": "msgpack",
+                "application/x-msgpack": "msgpack",
+                "application/vnd.msgpack": "msgpack",
+                "application/cbor": "cbor",
+            })
+            """Decoder per exact media type."""
+            SUFFIXES: Final[Mapping[str, str]] = MappingProxyType({
+                "+json": "json",
+                "+xml": "text",
+                "+cbor": "cbor",
+            })
+            """Decoder per structured syntax suffix (RFC 6839), e.g. +json."""
+            TOP_LEVEL_TYPES: Final[Mapping[str, str]] = MappingProxyType({
+                "text": "text",
+                "image": "binary",
+                "audio": "binary",
+                "video": "binary",
+                "font": "binary",
+            })
+            """Decoder per top-level type when no exact or suffix match exists."""
+            JSON_START_BYTES: Final[frozenset[int]] = frozenset(b'{["')
+            """First non-whitespace bytes that make an untyped body JSON-like."""
+
+        class ContentNegotiation:
+            """Structured body formats negotiated via Content-Type and Accept."""
+
+            FORMAT_MEDIA_TYPES: Final[Mapping[str, str]] = MappingProxyType({
+                "json": "application/json",
+                "msgpack": "application/msgpack",
+                "cbor": "application/cbor",
+            })
+            """Canonical media type per HttpSerializationFormat value."""
+            MEDIA_TYPE_ALIASES: Final[Mapping[str, str]] = MappingProxyType({
+                "application/x-msgpack": "application/msgpack",
+                "application/vnd.msgpack": "application/msgpack",
+            })
+            """Non-canonical media types accepted for a supported format."""
+            FALLBACK_QUALITY: Final[str] = "0.9"
+            """Accept q-value of JSON when a binary format is preferred."""
+            VARY_HEADER: Final[str] = "Vary"
+            """Response header listing the request headers that chose the format."""
+
+        class Compression:
+            """Request body compression and Accept-Encoding constants."""
+
+            GZIP: Final[str] = "gzip"
+            BROTLI: Final[str] = "br"
+            ZSTD: Final[str] = "zstd"
+            IDENTITY: Final[str] = "identity"
+            PREFERENCE: Final[tuple[str, ...]] = (ZSTD, BROTLI, GZIP)
+            """Default Accept-Encoding order, most preferred first."""
+            DEFAULT_MIN_SIZE: Final[int] = 1024
+            """Request bodies smaller than this many bytes are sent uncompressed."""
+            DEFAULT_LEVELS: Final[Mapping[str, int]] = MappingProxyType({
+                GZIP: 6,
+                BROTLI: 4,
+                ZSTD: 3,
+            })
+            """Per-encoding level balancing ratio against request CPU time."""
+
+        class Hedging:
+            """Hedged request constants (hedge delay, latency samples, budget)."""
+
+            PERCENTILE: Final[float] = 0.95
+            """Observed latency percentile used as the hedge delay."""
+            MIN_SAMPLES: Final[int] = 20
+            """Latencies an endpoint needs before its percentile is trusted."""
+            LATENCY_SAMPLES: Final[int] = 128
+            """Most recent latencies kept per endpoint."""
+            MAX_ENDPOINTS: Final[int] = 1024
+            """Endpoints with latency history; the oldest is dropped beyond it."""
+            MIN_DELAY: Final[float] = 0.005
+            """Shortest hedge delay, in seconds, derived from observed latency."""
+            MAX_DELAY: Final[float] = 10.0
+            """Longest hedge delay, in seconds, derived from observed latency."""
+            BUDGET_RATIO: Final[float] = 0.1
+            """Hedges allowed per origin as a fraction of its hedgeable requests."""
+            MAX_WORKERS: Final[int] = 32
+            """Threads running concurrent attempts of synchronous requests."""
+
+        class Concurrency:
+            """Adaptive per-origin concurrency limit constants."""
+
+            class Algorithm(StrEnum):
+                """How the concurrency limit reacts to latency and drops."""
+
+                AIMD = "aimd"
+                VEGAS = "vegas"
+
+            LIMITED_ERROR_CODE: Final[str] = "CONCURRENCY_LIMITED"
+            """error_code of results rejected or timed out by the limiter."""
+            INITIAL_LIMIT: Final[int] = 20
+            """In-flight requests allowed per origin before any feedback."""
+            MIN_LIMIT: Final[int] = 1
+            """Lowest in-flight limit an origin can be cut to."""
+            MAX_LIMIT: Final[int] = 200
+            """Highest in-flight limit an origin can grow to."""
+            BACKOFF_RATIO: Final[float] = 0.9
+            """Factor applied to the limit when a request is dropped."""
+            VEGAS_ALPHA: Final[float] = 3.0
+            """Estimated queued requests below which Vegas raises the limit."""
+            VEGAS_BETA: Final[float] = 6.0
+            """Estimated queued requests above which Vegas lowers the limit."""
+            MIN_RTT_RESET_SAMPLES: Final[int] = 1000
+            """Samples after which Vegas re-measures the no-load latency."""
+            QUEUE_TIMEOUT: Final[float] = 1.0
+            """Seconds a request waits for an in-flight slot before failing."""
+            MAX_QUEUE: Final[int] = 1000
+            """Requests that may wait per origin; more are rejected at once."""
+            DROP_STATUS_CODES: Final[frozenset[int]] = frozenset({429, 503, 504})
+            """Statuses signalling an overloaded upstream."""
+
+        class RateLimit:
+            """Client-side token bucket and rate-limit header constants."""
+
+            class Scope(StrEnum):
+                """What one token bucket covers."""
+
+                ORIGIN = "origin"
+                ROUTE = "route"
+
+            LIMITED_ERROR_CODE: Final[str] = "RATE_LIMITED"
+            """error_code of results that waited too long for a token."""
+            DEFAULT_MAX_WAIT: Final[float] = 30.0
+            """Seconds a request may wait for a token before failing."""
+            SHARED_SLOTS: Final[int] = 256
+            """Buckets a shared-memory segment holds."""
+            EPOCH_THRESHOLD: Final[float] = 1_000_000_000.0
+            """Reset header values above this are Unix times, not seconds."""
+            HEADER_RATELIMIT: Final[str] = "RateLimit"
+            """Structured header carrying remaining (r) and reset (t)."""
+            REMAINING_HEADERS: Final[tuple[str, ...]] = (
+                "RateLimit-Remaining",
+                "X-RateLimit-Remaining",
+            )
+            """Headers with the requests left in the current window."""
+            RESET_HEADERS: Final[tuple[str, ...]] = (
+                "RateLimit-Reset",
+                "X-RateLimit-Reset",
+            )
+            """Headers with when the current window resets."""
+
+        class CircuitBreaker:
+            """Per-origin circuit breaker constants."""
+
+            class State(StrEnum):
+                """Circuit state: closed passes calls, open rejects them."""
+
+                CLOSED = "closed"
+                OPEN = "open"
+                HALF_OPEN = "half_open"
+
+            OPEN_ERROR_CODE: Final[str] = "CIRCUIT_OPEN"
+            """error_code of results rejected by an open circuit."""
+            FAILURE_RATE_THRESHOLD: Final[float] = 0.5
+            """Failed share of windowed calls that opens the circuit."""
+            SLOW_CALL_RATE_THRESHOLD: Final[float] = 0.8
+            """Slow share of windowed calls that opens the circuit."""
+            SLOW_CALL_DURATION: Final[float] = 10.0
+            """Seconds after which a call counts as slow."""
+            WINDOW_SECONDS: Final[float] = 30.0
+            """Length of the sliding window rates are computed over."""
+            WINDOW_BUCKETS: Final[int] = 10
+            """Buckets the window slides by (its time resolution)."""
+            MINIMUM_CALLS: Final[int] = 20
+            """Calls in the window before rates can open the circuit."""
+            OPEN_DURATION: Final[float] = 30.0
+            """Seconds the circuit stays open before probing."""
+            HALF_OPEN_MAX_CALLS: Final[int] = 3
+            """Successful probes needed to close; also the concurrent cap."""
+
+        class Dns:
+            """In-process DNS cache and connection racing constants."""
+
+            DEFAULT_TTL: Final[float] = 30.0
+            """Seconds to cache answers whose resolver reports no TTL."""
+            DEFAULT_NEGATIVE_TTL: Final[float] = 5.0
+            """Seconds to cache failed lookups (NXDOMAIN, no addresses)."""
+            MAX_TTL: Final[float] = 300.0
+            """Upper bound on any cached answer, whatever TTL was reported."""
+            REFRESH_AHEAD: Final[float] = 0.2
+            """Fraction of the TTL before expiry in which a hit refreshes in
+            the background."""
+            HAPPY_EYEBALLS_DELAY: Final[float] = 0.25
+            """Seconds before racing the next address (RFC 8305 default)."""
+            DEFAULT_MAX_ENTRIES: Final[int] = 1024
+            """Hosts kept in the cache; the oldest entry is dropped beyond it."""
+            HTTPCORE_VERSIONS: Final[tuple[tuple[int, int], tuple[int, int]]] = (
+                (1, 0),
+                (2, 0),
+            )
+            """httpcore versions [min, max) whose private pool backend and
+            socket stream FlextApiDnsCache.install relies on."""
 
         class PaginationDefaults:
             """Pagination default values."""
@@ -539,6 +941,42 @@ class FlextApiConstants(FlextConstants):
             DEFAULT_PAGE_SIZE_STRING: Final[str] = "20"
             DEFAULT_MAX_PAGE_SIZE_FALLBACK: Final[int] = 1000
 
+        class Pagination:
+            """Client-side pagination (FlextApiClient.paginate) constants."""
+
+            class Strategy(StrEnum):
+                """How the next page is addressed."""
+
+                PAGE = "page"
+                OFFSET = "offset"
+                CURSOR = "cursor"
+                LINK = "link"
+
+            DEFAULT_PREFETCH: Final[int] = 2
+            """Pages fetched ahead of the one being consumed."""
+            PARAMS: Final[Mapping[str, tuple[str | None, str | None]]] = (
+                MappingProxyType({
+                    Strategy.PAGE: ("page", "page_size"),
+                    Strategy.OFFSET: ("offset", "limit"),
+                    Strategy.CURSOR: ("cursor", "limit"),
+                    Strategy.LINK: (None, None),
+                })
+            )
+            """Default (position, size) query parameters of each strategy."""
+            ITEM_KEYS: Final[tuple[str, ...]] = ("data", "items", "results", "value")
+            """Body keys searched for the page items when no path is given."""
+            CURSOR_KEYS: Final[tuple[str, ...]] = (
+                "next_cursor",
+                "nextCursor",
+                "pagination.next_cursor",
+                "meta.next_cursor",
+            )
+            """Body paths searched for the next cursor when no path is given."""
+            HEADER_LINK: Final[str] = "Link"
+            """RFC 8288 header whose rel="next" target is the next page."""
+            REL_NEXT: Final[str] = "next"
+            """Link relation of the next page."""
+
     # ═══════════════════════════════════════════════════════════════════
     # PROTOCOL LITERALS - Defined at class level to reference sibling classes
     # ═══════════════════════════════════════════════════════════════════
@@ -0,0 +1,528 @@
+"""In-process DNS cache with TTLs, negative caching and happy eyeballs.
+
+Opt-in component of FlextApiClient and FlextWebTransport. Answers are cached
+for their TTL, failed lookups for a short negative TTL, and hot entries are
+refreshed in the background shortly before they expire so requests never
+wait on a lookup for a host they already use. New connections race IPv6 and
+IPv4 addresses as described by RFC 8305 (happy eyeballs).
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import errno
+import ipaddress
+import os
+import selectors
+import socket
+import threading
+import time
+from collections.abc import Callable, Iterable, Sequence
+
+import httpcore
+import httpx
+from flext_core import FlextLogger, r
+
+from flext_api.constants import c
+from flext_api.typings import t
+
+# httpcore does not export its socket stream; reusing it keeps TLS, reads
+# and timeouts identical to httpcore's own SyncBackend. It is private, so
+# FlextApiDnsCache.supported() checks it is still there.
+_SyncStream: Callable[[socket.socket], httpcore.NetworkStream] | None
+try:
+    from httpcore._backends.sync import SyncStream as _SyncStream
+except ImportError:  # pragma: no cover - depends on the installed httpcore
+    _SyncStream = None
+
+
+class FlextApiDnsCache:
+    """Thread-safe DNS cache that resolves and connects for httpx clients.
+
+    Resolution goes through a pluggable ``resolver(host, port)`` returning a
+    ``Resolution``. The default uses ``socket.getaddrinfo``, which does not
+    report record TTLs, so its answers are cached for ``ttl`` seconds; custom
+    resolvers may return the record TTL, which is honoured up to ``max_ttl``.
+
+    IP literals are never cached. ``metrics()`` reports hits, misses and
+    resolver latency; the hit rate is ``hits / (hits + misses)``.
+
+    Usage:
+        dns = FlextApiDnsCache()
+        client = FlextApiClient(settings, dns_cache=dns)
+    """
+
+    type Address = tuple[int, str]
+    type Resolver = Callable[[str, int], FlextApiDnsCache.Resolution]
+
+    class Resolution:
+        """Addresses of a host, as ``(family, ip)``, and their TTL in seconds."""
+
+        __slots__ = ("addresses", "ttl")
+
+        def __init__(
+            self,
+            addresses: Sequence[FlextApiDnsCache.Address],
+            ttl: float | None = None,
+        ) -> None:
+            self.addresses = tuple(addresses)
+            self.ttl = ttl
+
+    class _Entry:
+        __slots__ = ("addresses", "error", "expires_at", "refresh_at", "refreshing")
+
+        def __init__(
+            self,
+            addresses: tuple[FlextApiDnsCache.Address, ...],
+            error: str | None,
+            expires_at: float,
+            refresh_at: float,
+        ) -> None:
+            self.addresses = addresses
+            self.error = error
+            self.expires_at = expires_at
+            self.refresh_at = refresh_at
+            self.refreshing = False
+
+    class NetworkBackend(httpcore.SyncBackend):
+        """httpcore network backend connecting through a FlextApiDnsCache."""
+
+        def __init__(self, dns_cache: FlextApiDnsCache) -> None:
+            self._dns_cache = dns_cache
+
+        def connect_tcp(
+            self,
+            host: str,
+            port: int,
+            timeout: float | None = None,
+            local_address: str | None = None,
+            socket_options: Iterable[httpcore.SOCKET_OPTION] | None = None,
+        ) -> httpcore.NetworkStream:
+            """Resolve ``host`` through the cache and race its addresses."""
+            try:
+                sock = self._dns_cache.connect(
+                    host,
+                    port,
+                    timeout,
+                    local_address=local_address,
+                    socket_options=socket_options or (),
+                )
+            except TimeoutError as e:
+                raise httpcore.ConnectTimeout(str(e)) from e
+            except OSError as e:
+                raise httpcore.ConnectError(str(e)) from e
+            if _SyncStream is None:
+                sock.close()
+                msg = "httpcore has no SyncStream; DNS cache is unsupported"
+                raise httpcore.ConnectError(msg)
+            return _SyncStream(sock)
+
+    _COUNTERS = (
+        "hits",
+        "misses",
+        "negative_hits",
+        "refreshes",
+        "failures",
+        "resolutions",
+        "resolve_us_total",
+        "resolve_us_max",
+        "connects",
+        "connect_attempts",
+    )
+
+    def __init__(
+        self,
+        *,
+        ttl: float = c.Api.Dns.DEFAULT_TTL,
+        negative_ttl: float = c.Api.Dns.DEFAULT_NEGATIVE_TTL,
+        max_ttl: float = c.Api.Dns.MAX_TTL,
+        refresh_ahead: float = c.Api.Dns.REFRESH_AHEAD,
+        happy_eyeballs_delay: float = c.Api.Dns.HAPPY_EYEBALLS_DELAY,
+        max_entries: int = c.Api.Dns.DEFAULT_MAX_ENTRIES,
+        resolver: FlextApiDnsCache.Resolver | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the DNS cache.
+
+        Args:
+            ttl: Seconds to cache answers that carry no TTL.
+            negative_ttl: Seconds to cache failed lookups (0 disables).
+            max_ttl: Upper bound on the TTL of any cached answer.
+            refresh_ahead: Fraction of the TTL, before expiry, in which a hit
+                starts a background refresh (0 disables refreshing).
+            happy_eyeballs_delay: Seconds to wait on one connection attempt
+                before starting the next address in parallel.
+            max_entries: Hosts kept before the oldest entry is dropped.
+            resolver: Lookup function; defaults to ``system_resolver``.
+            clock: Monotonic time source, replaceable in tests.
+
+        Raises:
+            ValueError: If a TTL or delay is negative, ``refresh_ahead`` is
+                not in [0, 1) or ``max_entries`` is below 1.
+
+        """
+        if min(ttl, negative_ttl, max_ttl, happy_eyeballs_delay) < 0:
+            msg = "DNS TTLs and happy_eyeballs_delay must be >= 0"
+            raise ValueError(msg)
+        if not 0 <= refresh_ahead < 1:
+            msg = "refresh_ahead must be in [0, 1)"
+            raise ValueError(msg)
+        if max_entries < 1:
+            msg = "max_entries must be at least 1"
+            raise ValueError(msg)
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._max_ttl = max_ttl
+        self._refresh_ahead = refresh_ahead
+        self._happy_eyeballs_delay = happy_eyeballs_delay
+        self._max_entries = max_entries
+        self._resolver = resolver or self.system_resolver
+        self._clock = clock
+        self._entries: dict[tuple[str, int], FlextApiDnsCache._Entry] = {}
+        self._lock = threading.Lock()
+        self._counters: dict[str, int] = dict.fromkeys(self._COUNTERS, 0)
+        self._network_backend = self.NetworkBackend(self)
+        self.logger = FlextLogger(__name__)
+
+    @staticmethod
+    def system_resolver(host: str, port: int) -> FlextApiDnsCache.Resolution:
+        """Resolve with ``socket.getaddrinfo`` (no TTL information).
+
+        Raises:
+            OSError: ``socket.gaierror`` when the host does not resolve.
+
+        """
+        addresses = dict.fromkeys(
+            (family, str(sockaddr[0]))
+            for family, _, _, _, sockaddr in socket.getaddrinfo(
+                host,
+                port,
+                type=socket.SOCK_STREAM,
+            )
+            if family in {socket.AF_INET, socket.AF_INET6}
+        )
+        return FlextApiDnsCache.Resolution(list(addresses))
+
+    @staticmethod
+    def interleave(
+        addresses: Iterable[FlextApiDnsCache.Address],
+    ) -> list[FlextApiDnsCache.Address]:
+        """Order addresses for connecting, alternating address families.
+
+        The family of the first address goes first (RFC 8305 section 4), so
+        a broken IPv6 or IPv4 path costs at most one attempt delay.
+        """
+        ordered = list(addresses)
+        if not ordered:
+            return ordered
+        first_family = ordered[0][0]
+        first = [address for address in ordered if address[0] == first_family]
+        other = [address for address in ordered if address[0] != first_family]
+        result: list[FlextApiDnsCache.Address] = []
+        for index in range(max(len(first), len(other))):
+            result.extend(
+                group[index] for group in (first, other) if index < len(group)
+            )
+        return result
+
+    @property
+    def network_backend(self) -> httpcore.SyncBackend:
+        """httpcore network backend using this cache."""
+        return self._network_backend
+
+    @staticmethod
+    def supported() -> bool:
+        """Whether the installed httpcore has the internals ``install`` uses.
+
+        httpx.HTTPTransport accepts no network backend, so ``install`` sets
+        the private backend of its httpcore pool and builds httpcore's
+        private SyncStream; both are only trusted on the httpcore versions
+        in ``c.Api.Dns.HTTPCORE_VERSIONS``.
+        """
+        minimum, maximum = c.Api.Dns.HTTPCORE_VERSIONS
+        try:
+            version = tuple(int(part) for part in httpcore.__version__.split(".")[:2])
+        except ValueError:
+            return False
+        return _SyncStream is not None and minimum <= version < maximum
+
+    def install(self, transport: httpx.HTTPTransport) -> httpx.HTTPTransport:
+        """Route new connections of an httpx transport through this cache.
+
+        With an unsupported httpcore (see ``supported``) the transport keeps
+        httpcore's own resolver and a warning is logged.
+        """
+        pool = getattr(transport, "_pool", None)
+        if not (
+            self.supported()
+            and isinstance(pool, httpcore.ConnectionPool)
+            and hasattr(pool, "_network_backend")
+        ):
+            self.logger.warning(
+                "DNS cache not installed: unsupported httpcore version",
+                extra={"httpcore_version": httpcore.__version__},
+            )
+            return transport
+        # The pool reads the attribute each time it opens a connection
+        pool._network_backend = self._network_backend  # noqa: SLF001
+        return transport
+
+    def resolve(self, host: str, port: int) -> r[tuple[FlextApiDnsCache.Address, ...]]:
+        """Return the addresses of ``host``, from the cache when fresh."""
+        literal = self._ip_literal(host)
+        if literal is not None:
+            return r[tuple[FlextApiDnsCache.Address, ...]].ok((literal,))
+        key = (host.lower(), port)
+        refresh = False
+        with self._lock:
+            entry = self._entries.get(key)
+            now = self._clock()
+            if entry is not None and now < entry.expires_at:
+                if entry.error is not None:
+                    self._counters["negative_hits"] += 1
+                    return r[tuple[FlextApiDnsCache.Address, ...]].fail(entry.error)
+                self._counters["hits"] += 1
+                if now >= entry.refresh_at and not entry.refreshing:
+                    entry.refreshing = refresh = True
+                addresses = entry.addresses
+            else:
+                self._counters["misses"] += 1
+                addresses = None
+        if addresses is None:
+            return self._lookup(key)
+        if refresh:
+            threading.Thread(
+                target=self._lookup,
+                args=(key,),
+                kwargs={"refresh": True},
+                name=f"flext-api-dns-refresh-{host}",
+                daemon=True,
+            ).start()
+        return r[tuple[FlextApiDnsCache.Address, ...]].ok(addresses)
+
+    def connect(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        *,
+        local_address: str | None = None,
+        socket_options: Iterable[httpcore.SOCKET_OPTION] = (),
+    ) -> socket.socket:
+        """Open a TCP connection to ``host``, racing its addresses.
+
+        Attempts start ``happy_eyeballs_delay`` apart (or as soon as the
+        previous one fails) in interleaved family order; the first to
+        connect wins and the others are closed.
+
+        Raises:
+            TimeoutError: If no attempt connects within ``timeout``.
+            OSError: If the host does not resolve or every attempt fails.
+
+        """
+        resolved = self.resolve(host, port)
+        if resolved.is_failure:
+            raise OSError(resolved.error)
+        sock = self._race(
+            self.interleave(resolved.value),
+            port,
+            timeout,
+            local_address,
+            list(socket_options),
+        )
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with self._lock:
+            self._counters["connects"] += 1
+        return sock
+
+    def invalidate(self, host: str | None = None) -> None:
+        """Drop cached answers for ``host`` (all ports), or every entry."""
+        with self._lock:
+            if host is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0] == host.lower()]:
+                del self._entries[key]
+
+    def metrics(self) -> r[t.Api.MetricsDict]:
+        """Get lookup, latency and connection counters.
+
+        ``resolve_us_total / resolutions`` is the mean resolver latency in
+        microseconds; ``entries`` is the current cache size.
+        """
+        with self._lock:
+            metrics: t.Api.MetricsDict = dict(self._counters)
+            metrics["entries"] = len(self._entries)
+        return r[t.Api.MetricsDict].ok(metrics)
+
+    def _lookup(
+        self,
+        key: tuple[str, int],
+        *,
+        refresh: bool = False,
+    ) -> r[tuple[FlextApiDnsCache.Address, ...]]:
+        """Call the resolver and store the answer (or the failure)."""
+        host, port = key
+        started = time.perf_counter()
+        error: str | None = None
+        addresses: tuple[FlextApiDnsCache.Address, ...] = ()
+        ttl = self._negative_ttl
+        try:
+            resolution = self._resolver(host, port)
+            addresses = resolution.addresses
+            if addresses:
+                ttl = min(
+                    self._ttl if resolution.ttl is None else resolution.ttl,
+                    self._max_ttl,
+                )
+            else:
+                error = f"DNS resolution for {host} returned no addresses"
+        except OSError as e:
+            error = f"DNS resolution failed for {host}: {e}"
+        elapsed_us = round((time.perf_counter() - started) * 1_000_000)
+        now = self._clock()
+        with self._lock:
+            self._counters["resolutions"] += 1
+            self._counters["resolve_us_total"] += elapsed_us
+            self._counters["resolve_us_max"] = max(
+                self._counters["resolve_us_max"],
+                elapsed_us,
+            )
+            if refresh:
+                self._counters["refreshes"] += 1
+            if error is not None:
+                self._counters["failures"] += 1
+                current = self._entries.get(key)
+                if refresh and current is not None:
+                    # Keep serving the answer we have until it expires and
+                    # retry the refresh no sooner than a negative TTL later
+                    current.refreshing = False
+                    current.refresh_at = now + self._negative_ttl
+                elif self._negative_ttl > 0:
+                    self._store(key, (), error, now + self._negative_ttl, now)
+                return r[tuple[FlextApiDnsCache.Address, ...]].fail(error)
+            expires_at = now + ttl
+            refresh_at = expires_at - ttl * self._refresh_ahead
+            if self._refresh_ahead == 0:
+                refresh_at = expires_at
+            self._store(key, addresses, None, expires_at, refresh_at)
+        return r[tuple[FlextApiDnsCache.Address, ...]].ok(addresses)
+
+    def _store(
+        self,
+        key: tuple[str, int],
+        addresses: tuple[FlextApiDnsCache.Address, ...],
+        error: str | None,
+        expires_at: float,
+        refresh_at: float,
+    ) -> None:
+        """Insert an entry (lock held), dropping the oldest beyond max_entries."""
+        self._entries.pop(key, None)
+        self._entries[key] = self._Entry(addresses, error, expires_at, refresh_at)
+        while len(self._entries) > self._max_entries:
+            del self._entries[next(iter(self._entries))]
+
+    def _race(
+        self,
+        addresses: list[FlextApiDnsCache.Address],
+        port: int,
+        timeout: float | None,
+        local_address: str | None,
+        socket_options: list[httpcore.SOCKET_OPTION],
+    ) -> socket.socket:
+        """Connect to the first reachable address (RFC 8305 section 5)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        pending = list(addresses)
+        errors: list[OSError] = []
+        next_attempt_at = 0.0
+        with selectors.DefaultSelector() as selector:
+            try:
+                while pending or selector.get_map():
+                    now = time.monotonic()
+                    if deadline is not None and now >= deadline:
+                        msg = f"Connection to port {port} timed out"
+                        raise TimeoutError(msg)
+                    if pending and (not selector.get_map() or now >= next_attempt_at):
+                        family, ip = pending.pop(0)
+                        sock = self._start_attempt(
+                            family,
+                            ip,
+                            port,
+                            local_address,
+                            socket_options,
+                            errors,
+                        )
+                        if sock is not None:
+                            selector.register(sock, selectors.EVENT_WRITE)
+                            next_attempt_at = now + self._happy_eyeballs_delay
+                        continue
+                    waits = [
+                        limit - now
+                        for limit in (
+                            next_attempt_at if pending else None,
+                            deadline,
+                        )
+                        if limit is not None
+                    ]
+                    for key, _ in selector.select(min(waits) if waits else None):
+                        attempt = key.fileobj
+                        selector.unregister(attempt)
+                        if not isinstance(attempt, socket.socket):
+                            continue
+                        code = attempt.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                        if code == 0:
+                            attempt.settimeout(timeout)
+                            return attempt
+                        errors.append(OSError(code, os.strerror(code)))
+                        attempt.close()
+            finally:
+                for key in list(selector.get_map().values()):
+                    if isinstance(key.fileobj, socket.socket):
+                        key.fileobj.close()
+        if errors:
+            raise errors[-1]
+        msg = f"No addresses to connect to on port {port}"
+        raise OSError(msg)
+
+    def _start_attempt(
+        self,
+        family: int,
+        ip: str,
+        port: int,
+        local_address: str | None,
+        socket_options: list[httpcore.SOCKET_OPTION],
+        errors: list[OSError],
+    ) -> socket.socket | None:
+        """Begin a non-blocking connect; None when it failed immediately."""
+        with self._lock:
+            self._counters["connect_attempts"] += 1
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        try:
+            for option in socket_options:
+                sock.setsockopt(*option)
+            if local_address is not None:
+                sock.bind((local_address, 0))
+            sock.setblocking(False)
+            code = sock.connect_ex((ip, port))
+            if code not in {0, errno.EINPROGRESS, errno.EWOULDBLOCK}:
+                raise OSError(code, os.strerror(code))
+        except OSError as e:
+            errors.append(e)
+            sock.close()
+            return None
+        return sock
+
+    @staticmethod
+    def _ip_literal(host: str) -> FlextApiDnsCache.Address | None:
+        try:
+            address = ipaddress.ip_address(host.strip("[]"))
+        except ValueError:
+            return None
+        family = socket.AF_INET6 if address.version == 6 else socket.AF_INET
+        return family, str(address)
+
+
+__all__ = ["FlextApiDnsCache"]
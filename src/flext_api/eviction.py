@@ -0,0 +1,381 @@
+"""Bounded-capacity eviction policies for FlextApiStorage.
+
+Each policy tracks the keys of a store with a fixed ``max_size`` and names
+the keys to drop when a new one does not fit. Every operation is O(1):
+ordering lives in OrderedDicts (hash table plus linked list), so touching
+or evicting a key never scans the store.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Protocol
+
+from flext_api.constants import c
+
+# Odd multiplier deriving the double-hashing step of the sketch rows
+_SPREAD = 0x9E3779B97F4A7C15
+_HALVE = bytes(count >> 1 for count in range(256))
+
+
+class FlextApiEviction:
+    """LRU, LFU and W-TinyLFU key tracking for a bounded store.
+
+    ``lru``: drops the least recently used key.
+
+    ``lfu``: drops the least frequently used key (the oldest of them on a
+    tie); keys sit in per-count buckets with a pointer to the lowest count.
+
+    ``tinylfu``: W-TinyLFU. New keys enter a small LRU window; a key pushed
+    out of the window only enters the main space (a segmented LRU of
+    probation and protected keys) if a count-min sketch says it is used
+    more often than the key it would replace. One-hit wonders and scans
+    therefore cannot flush the popular keys, while bursts still get a
+    chance in the window. Sketch counters are halved periodically, so the
+    popularity of old keys fades.
+
+    Usage:
+        policy = FlextApiEviction.create("tinylfu", max_size=10_000)
+        for victim in policy.insert(key):
+            del store[victim]
+    """
+
+    Name = c.Api.Storage.Eviction
+
+    class Policy(Protocol):
+        """Key tracking shared by every eviction policy."""
+
+        max_size: int
+
+        def __len__(self) -> int:
+            """Number of keys tracked."""
+            ...
+
+        def access(self, key: str) -> None:
+            """Record a read of a stored ``key``."""
+            ...
+
+        def miss(self, key: str) -> None:
+            """Record a read of a ``key`` that is not stored."""
+            ...
+
+        def insert(self, key: str) -> list[str]:
+            """Record a write of ``key``; return the keys to evict.
+
+            The list may contain ``key`` itself when the policy declines to
+            admit it.
+            """
+            ...
+
+        def remove(self, key: str) -> None:
+            """Forget a deleted or expired ``key``."""
+            ...
+
+        def pop(self) -> str | None:
+            """Forget and return the next key to evict (None when empty).
+
+            Used when the store must shrink for another reason than the key
+            count, such as a memory limit.
+            """
+            ...
+
+        def clear(self) -> None:
+            """Forget every key."""
+            ...
+
+    class Lru:
+        """Least recently used eviction."""
+
+        __slots__ = ("_order", "max_size")
+
+        def __init__(self, max_size: int) -> None:
+            self.max_size = max_size
+            self._order: OrderedDict[str, None] = OrderedDict()
+
+        def __len__(self) -> int:
+            return len(self._order)
+
+        def access(self, key: str) -> None:
+            if key in self._order:
+                self._order.move_to_end(key)
+
+        def miss(self, key: str) -> None:
+            pass
+
+        def insert(self, key: str) -> list[str]:
+            if key in self._order:
+                self._order.move_to_end(key)
+                return []
+            self._order[key] = None
+            if len(self._order) > self.max_size:
+                return [self._order.popitem(last=False)[0]]
+            return []
+
+        def remove(self, key: str) -> None:
+            self._order.pop(key, None)
+
+        def pop(self) -> str | None:
+            if not self._order:
+                return None
+            return self._order.popitem(last=False)[0]
+
+        def clear(self) -> None:
+            self._order.clear()
+
+    class Lfu:
+        """Least frequently used eviction, oldest first among equals."""
+
+        __slots__ = ("_buckets", "_counts", "_lowest", "max_size")
+
+        def __init__(self, max_size: int) -> None:
+            self.max_size = max_size
+            self._counts: dict[str, int] = {}
+            self._buckets: dict[int, OrderedDict[str, None]] = {}
+            self._lowest = 0
+
+        def __len__(self) -> int:
+            return len(self._counts)
+
+        def access(self, key: str) -> None:
+            count = self._counts.get(key)
+            if count is None:
+                return
+            bucket = self._buckets[count]
+            del bucket[key]
+            if not bucket:
+                del self._buckets[count]
+                if self._lowest == count:
+                    self._lowest = count + 1
+            self._counts[key] = count + 1
+            self._bucket(count + 1)[key] = None
+
+        def miss(self, key: str) -> None:
+            pass
+
+        def insert(self, key: str) -> list[str]:
+            if key in self._counts:
+                self.access(key)
+                return []
+            victims: list[str] = []
+            if len(self._counts) >= self.max_size:
+                victim = self.pop()
+                if victim is not None:
+                    victims.append(victim)
+            self._counts[key] = 1
+            self._bucket(1)[key] = None
+            self._lowest = 1
+            return victims
+
+        def remove(self, key: str) -> None:
+            count = self._counts.pop(key, None)
+            if count is None:
+                return
+            bucket = self._buckets[count]
+            del bucket[key]
+            if not bucket:
+                del self._buckets[count]
+
+        def pop(self) -> str | None:
+            if not self._buckets:
+                return None
+            if self._lowest not in self._buckets:
+                # Stale after a remove() or pop() emptied the lowest bucket
+                self._lowest = min(self._buckets)
+            bucket = self._buckets[self._lowest]
+            victim, _ = bucket.popitem(last=False)
+            if not bucket:
+                del self._buckets[self._lowest]
+            del self._counts[victim]
+            return victim
+
+        def clear(self) -> None:
+            self._counts.clear()
+            self._buckets.clear()
+            self._lowest = 0
+
+        def _bucket(self, count: int) -> OrderedDict[str, None]:
+            bucket = self._buckets.get(count)
+            if bucket is None:
+                bucket = self._buckets[count] = OrderedDict()
+            return bucket
+
+    class FrequencySketch:
+        """Count-min sketch of small saturating counters, halved periodically.
+
+        The rows share one flat bytearray; the counter of a key in row ``i``
+        is found by double hashing, ``hash + i * step``.
+        """
+
+        __slots__ = ("_additions", "_mask", "_offsets", "_sample_size", "_table")
+
+        def __init__(self, capacity: int) -> None:
+            counters = min(
+                capacity * c.Api.Storage.SKETCH_WIDTH_FACTOR,
+                c.Api.Storage.SKETCH_MAX_WIDTH,
+            )
+            width = 1 << max(4, (counters - 1).bit_length())
+            self._mask = width - 1
+            self._offsets = tuple(
+                row * width for row in range(c.Api.Storage.SKETCH_DEPTH)
+            )
+            self._table = bytearray(width * c.Api.Storage.SKETCH_DEPTH)
+            self._sample_size = capacity * c.Api.Storage.SKETCH_SAMPLE_FACTOR
+            self._additions = 0
+
+        def increment(self, key: str) -> None:
+            """Count one use of ``key``."""
+            hashed = hash(key)
+            step = ((hashed * _SPREAD) >> 32) | 1
+            table = self._table
+            added = False
+            for offset in self._offsets:
+                index = offset + (hashed & self._mask)
+                if table[index] < c.Api.Storage.SKETCH_MAX_COUNT:
+                    table[index] += 1
+                    added = True
+                hashed += step
+            if added:
+                self._additions += 1
+                if self._additions >= self._sample_size:
+                    self._age()
+
+        def frequency(self, key: str) -> int:
+            """Estimated recent uses of ``key`` (never an underestimate)."""
+            hashed = hash(key)
+            step = ((hashed * _SPREAD) >> 32) | 1
+            lowest = c.Api.Storage.SKETCH_MAX_COUNT
+            for offset in self._offsets:
+                lowest = min(lowest, self._table[offset + (hashed & self._mask)])
+                hashed += step
+            return lowest
+
+        def clear(self) -> None:
+            self._table[:] = bytes(len(self._table))
+            self._additions = 0
+
+        def _age(self) -> None:
+            """Halve every counter so old popularity fades."""
+            self._table[:] = self._table.translate(_HALVE)
+            self._additions //= 2
+
+    class TinyLfu:
+        """W-TinyLFU: LRU window, frequency-gated segmented LRU main space."""
+
+        __slots__ = (
+            "_main_size",
+            "_probation",
+            "_protected",
+            "_protected_size",
+            "_sketch",
+            "_window",
+            "_window_size",
+            "max_size",
+        )
+
+        def __init__(self, max_size: int) -> None:
+            self.max_size = max_size
+            self._window_size = max(
+                1,
+                int(max_size * c.Api.Storage.TINYLFU_WINDOW_RATIO),
+            )
+            self._main_size = max_size - self._window_size
+            self._protected_size = int(
+                self._main_size * c.Api.Storage.TINYLFU_PROTECTED_RATIO,
+            )
+            self._window: OrderedDict[str, None] = OrderedDict()
+            self._probation: OrderedDict[str, None] = OrderedDict()
+            self._protected: OrderedDict[str, None] = OrderedDict()
+            self._sketch = FlextApiEviction.FrequencySketch(max_size)
+
+        def __len__(self) -> int:
+            return len(self._window) + len(self._probation) + len(self._protected)
+
+        def access(self, key: str) -> None:
+            self._sketch.increment(key)
+            if key in self._window:
+                self._window.move_to_end(key)
+            elif key in self._probation:
+                # A second use promotes the key to the protected segment
+                del self._probation[key]
+                self._protected[key] = None
+                if len(self._protected) > self._protected_size:
+                    demoted, _ = self._protected.popitem(last=False)
+                    self._probation[demoted] = None
+            elif key in self._protected:
+                self._protected.move_to_end(key)
+
+        def miss(self, key: str) -> None:
+            self._sketch.increment(key)
+
+        def insert(self, key: str) -> list[str]:
+            if key in self._window or key in self._probation or key in self._protected:
+                self.access(key)
+                return []
+            self._sketch.increment(key)
+            self._window[key] = None
+            if len(self._window) <= self._window_size:
+                return []
+            candidate, _ = self._window.popitem(last=False)
+            if len(self._probation) + len(self._protected) < self._main_size:
+                self._probation[candidate] = None
+                return []
+            main = self._probation or self._protected
+            if not main:
+                return [candidate]
+            victim = next(iter(main))
+            if self._sketch.frequency(candidate) > self._sketch.frequency(victim):
+                del main[victim]
+                self._probation[candidate] = None
+                return [victim]
+            return [candidate]
+
+        def remove(self, key: str) -> None:
+            if key in self._window:
+                del self._window[key]
+            elif key in self._probation:
+                del self._probation[key]
+            else:
+                self._protected.pop(key, None)
+
+        def pop(self) -> str | None:
+            # Probation holds the least valuable keys, the window the newest
+            for segment in (self._probation, self._protected, self._window):
+                if segment:
+                    return segment.popitem(last=False)[0]
+            return None
+
+        def clear(self) -> None:
+            self._window.clear()
+            self._probation.clear()
+            self._protected.clear()
+            self._sketch.clear()
+
+    @classmethod
+    def create(
+        cls,
+        name: c.Api.Storage.Eviction | str,
+        max_size: int,
+    ) -> FlextApiEviction.Policy:
+        """Build the policy called ``name`` for ``max_size`` keys.
+
+        Raises:
+            ValueError: If ``name`` is unknown or ``max_size`` is below 1.
+
+        """
+        if max_size < 1:
+            msg = f"Eviction needs max_size >= 1, got: {max_size}"
+            raise ValueError(msg)
+        policies: dict[str, Callable[[int], FlextApiEviction.Policy]] = {
+            cls.Name.LRU: cls.Lru,
+            cls.Name.LFU: cls.Lfu,
+            cls.Name.TINY_LFU: cls.TinyLfu,
+        }
+        return policies[cls.Name(name)](max_size)
+
+
+__all__ = ["FlextApiEviction"]
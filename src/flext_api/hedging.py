@@ -0,0 +1,337 @@
+"""Hedged requests: race a duplicate of slow idempotent calls.
+
+FlextApiHedging sends a second copy of an idempotent request that has not
+completed within a hedge delay and returns whichever copy answers first,
+cutting the latency tail caused by an occasional slow replica. The delay is
+fixed or follows the observed latency percentile of each endpoint, and a
+per-host budget keeps hedges a bounded share of traffic.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+import httpx
+from flext_core import r
+
+from flext_api.constants import c
+from flext_api.retry import FlextApiRetryPolicy
+from flext_api.typings import t
+
+
+class FlextApiHedging:
+    """Hedge slow idempotent requests with one duplicate.
+
+    A request is hedged when its method is idempotent, its body can be sent
+    twice, and it is still running after the hedge delay: ``delay`` when
+    fixed, else the ``percentile`` of the endpoint's recent latencies once
+    ``min_samples`` are known (until then it is not hedged). Each hedge
+    spends a token from the host's budget, which every hedgeable request
+    refills by ``budget_ratio``.
+
+    The first copy to return a response wins. Async losers are cancelled;
+    sync copies run on a small thread pool and a losing copy is abandoned,
+    its response closed as soon as it arrives. A copy that raises only loses
+    when the other one answers; if both fail the primary's error is raised.
+
+    Usage:
+        hedging = FlextApiHedging(percentile=0.95)
+        client = FlextApiClient(settings, hedging=hedging)
+    """
+
+    class _Latencies:
+        """Recent latencies of one endpoint with a cached percentile."""
+
+        __slots__ = ("_percentile", "samples")
+
+        def __init__(self, size: int) -> None:
+            self.samples: deque[float] = deque(maxlen=size)
+            self._percentile: float | None = None
+
+        def add(self, seconds: float) -> None:
+            self.samples.append(seconds)
+            self._percentile = None
+
+        def percentile(self, quantile: float) -> float:
+            if self._percentile is None:
+                ordered = sorted(self.samples)
+                self._percentile = ordered[
+                    min(len(ordered) - 1, int(quantile * len(ordered)))
+                ]
+            return self._percentile
+
+    _COUNTERS = (
+        "requests",
+        "hedges_sent",
+        "hedges_won",
+        "budget_exhausted",
+        "losers_cancelled",
+    )
+
+    def __init__(
+        self,
+        *,
+        delay: float | None = None,
+        percentile: float = c.Api.Hedging.PERCENTILE,
+        min_samples: int = c.Api.Hedging.MIN_SAMPLES,
+        min_delay: float = c.Api.Hedging.MIN_DELAY,
+        max_delay: float = c.Api.Hedging.MAX_DELAY,
+        samples: int = c.Api.Hedging.LATENCY_SAMPLES,
+        max_endpoints: int = c.Api.Hedging.MAX_ENDPOINTS,
+        budget_ratio: float | None = c.Api.Hedging.BUDGET_RATIO,
+        methods: Iterable[str] = c.Api.Retry.IDEMPOTENT_METHODS,
+        max_workers: int = c.Api.Hedging.MAX_WORKERS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize hedging.
+
+        Args:
+            delay: Fixed hedge delay in seconds; None derives it from the
+                observed ``percentile`` of each endpoint.
+            percentile: Latency quantile (0-1) used as the derived delay.
+            min_samples: Latencies an endpoint needs before it is hedged
+                with a derived delay.
+            min_delay: Lower bound of a derived delay.
+            max_delay: Upper bound of a derived delay.
+            samples: Recent latencies kept per endpoint.
+            max_endpoints: Endpoints with latency history.
+            budget_ratio: Hedges allowed per host as a fraction of its
+                hedgeable requests (None: unlimited).
+            methods: Methods that may be hedged.
+            max_workers: Threads running copies of synchronous requests.
+            clock: Monotonic time source for latencies.
+
+        Raises:
+            ValueError: If ``percentile`` is outside (0, 1) or a delay,
+                count or ratio is negative.
+
+        """
+        if not 0 < percentile < 1:
+            msg = "Hedging percentile must be between 0 and 1"
+            raise ValueError(msg)
+        if (delay is not None and delay < 0) or min(min_delay, max_delay) < 0:
+            msg = "Hedging delays must be >= 0"
+            raise ValueError(msg)
+        if min(min_samples, samples, max_endpoints, max_workers) < 1:
+            msg = "Hedging sample, endpoint and worker counts must be positive"
+            raise ValueError(msg)
+        self.delay = delay
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.methods = frozenset(method.upper() for method in methods)
+        self.budget = (
+            None
+            if budget_ratio is None
+            else FlextApiRetryPolicy.Budget(
+                budget_ratio,
+                min_per_second=0.0,
+                clock=clock,
+            )
+        )
+        self._samples = samples
+        self._max_endpoints = max_endpoints
+        self._max_workers = max_workers
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._latencies: dict[str, FlextApiHedging._Latencies] = {}
+        self._executor: ThreadPoolExecutor | None = None
+        self._counters: dict[str, int] = dict.fromkeys(self._COUNTERS, 0)
+
+    @staticmethod
+    def endpoint_of(method: str, url: str | httpx.URL) -> str:
+        """Latency key of a request: method and URL without the query."""
+        return f"{method.upper()} {httpx.URL(url).copy_with(query=None)}"
+
+    def hedgeable(self, method: str, *, replayable: bool = True) -> bool:
+        """Whether requests with this method (and body) may be hedged."""
+        return replayable and method.upper() in self.methods
+
+    def delay_for(self, method: str, url: str | httpx.URL) -> float | None:
+        """Seconds to wait before hedging a request, or None to not hedge it."""
+        if self.delay is not None:
+            return self.delay
+        with self._lock:
+            latencies = self._latencies.get(self.endpoint_of(method, url))
+            if latencies is None or len(latencies.samples) < self.min_samples:
+                return None
+            observed = latencies.percentile(self.percentile)
+        return min(self.max_delay, max(self.min_delay, observed))
+
+    def observe(self, method: str, url: str | httpx.URL, seconds: float) -> None:
+        """Add a completed request's latency to its endpoint's history."""
+        endpoint = self.endpoint_of(method, url)
+        with self._lock:
+            latencies = self._latencies.get(endpoint)
+            if latencies is None:
+                if len(self._latencies) >= self._max_endpoints:
+                    del self._latencies[next(iter(self._latencies))]
+                latencies = self._latencies[endpoint] = self._Latencies(
+                    self._samples,
+                )
+            latencies.add(seconds)
+
+    def execute(
+        self,
+        method: str,
+        url: str | httpx.URL,
+        send: Callable[[], httpx.Response],
+        *,
+        replayable: bool = True,
+    ) -> httpx.Response:
+        """Call ``send``, racing a second call if the first is slow.
+
+        Requests that are not hedged call ``send`` on the calling thread.
+        """
+        if not self.hedgeable(method, replayable=replayable):
+            return send()
+        self._count("requests")
+        self._deposit(url)
+        delay = self.delay_for(method, url)
+        if delay is None:
+            return self._timed(method, url, send)
+        executor = self._get_executor()
+        primary = executor.submit(self._timed, method, url, send)
+        if wait([primary], timeout=delay).done or not self._withdraw(url):
+            return primary.result()
+        hedge = executor.submit(self._timed, method, url, send)
+        self._count("hedges_sent")
+        pending = {primary, hedge}
+        while True:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            winner = next((f for f in done if f.exception() is None), None)
+            if winner is not None:
+                break
+            if not pending:
+                return primary.result()
+        if winner is hedge:
+            self._count("hedges_won")
+        for loser in pending:
+            self._count("losers_cancelled")
+            if not loser.cancel():
+                loser.add_done_callback(self._discard)
+        return winner.result()
+
+    async def aexecute(
+        self,
+        method: str,
+        url: str | httpx.URL,
+        send: Callable[[], Awaitable[httpx.Response]],
+        *,
+        replayable: bool = True,
+    ) -> httpx.Response:
+        """Async ``execute``: the losing copy's task is cancelled."""
+        if not self.hedgeable(method, replayable=replayable):
+            return await send()
+        self._count("requests")
+        self._deposit(url)
+        delay = self.delay_for(method, url)
+        if delay is None:
+            return await self._atimed(method, url, send)
+        primary = asyncio.ensure_future(self._atimed(method, url, send))
+        tasks = [primary]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done or not self._withdraw(url):
+                return await primary
+            hedge = asyncio.ensure_future(self._atimed(method, url, send))
+            tasks.append(hedge)
+            self._count("hedges_sent")
+            pending = set(tasks)
+            while True:
+                done, pending = await asyncio.wait(
+                    pending,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                winner = next((task for task in done if task.exception() is None), None)
+                if winner is not None:
+                    break
+                if not pending:
+                    return await primary
+            if winner is hedge:
+                self._count("hedges_won")
+            self._count("losers_cancelled", len(pending))
+            return winner.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def close(self) -> None:
+        """Stop the thread pool of synchronous copies (running ones finish)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def metrics(self) -> r[t.Api.MetricsDict]:
+        """Get hedgeable request, hedge sent/won and cancellation counters."""
+        with self._lock:
+            metrics: t.Api.MetricsDict = dict(self._counters)
+            metrics["endpoints"] = len(self._latencies)
+        return r[t.Api.MetricsDict].ok(metrics)
+
+    def _timed(
+        self,
+        method: str,
+        url: str | httpx.URL,
+        send: Callable[[], httpx.Response],
+    ) -> httpx.Response:
+        started = self._clock()
+        response = send()
+        self.observe(method, url, self._clock() - started)
+        return response
+
+    async def _atimed(
+        self,
+        method: str,
+        url: str | httpx.URL,
+        send: Callable[[], Awaitable[httpx.Response]],
+    ) -> httpx.Response:
+        started = self._clock()
+        response = await send()
+        self.observe(method, url, self._clock() - started)
+        return response
+
+    def _deposit(self, url: str | httpx.URL) -> None:
+        """Credit a hedgeable request to its host's hedge budget."""
+        if self.budget is not None:
+            self.budget.deposit(httpx.URL(url).host)
+
+    def _withdraw(self, url: str | httpx.URL) -> bool:
+        """Spend a hedge token of the host; False when exhausted."""
+        if self.budget is None or self.budget.withdraw(httpx.URL(url).host):
+            return True
+        self._count("budget_exhausted")
+        return False
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="flext-api-hedge",
+                )
+            return self._executor
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._counters[name] += amount
+
+    @staticmethod
+    def _discard(future: Future[httpx.Response]) -> None:
+        """Close the response of an abandoned copy once it arrives."""
+        if not future.cancelled() and future.exception() is None:
+            future.result().close()
+
+
+__all__ = ["FlextApiHedging"]
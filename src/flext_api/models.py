@@ -11,14 +11,20 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
+import io
+import mmap
 import time
+from collections.abc import AsyncIterator, Iterator
+from pathlib import PurePath
 from typing import Self
 from urllib.parse import ParseResult, urlparse
 
-from flext_core import FlextModels
-from pydantic import Field, computed_field, field_validator
+from flext_core import FlextModels, r
+from pydantic import Field, PrivateAttr, computed_field, field_validator
 
 from flext_api.constants import c
+from flext_api.serializers import FlextApiSerializers
+from flext_api.streaming import FlextApiStreamingBody
 from flext_api.typings import t
 from flext_api.utilities import u
 
@@ -69,17 +75,31 @@ class FlextApiModels(FlextModels):
             default_factory=dict,
             description="HTTP request headers",
         )
-        body: t.Api.RequestBody = Field(
+        body: t.Api.RequestBody | FlextApiStreamingBody = Field(
             default_factory=dict,
-            description="Request body",
+            description="Request body (JSON, text, bytes, or streamed upload)",
         )
 
         @field_validator("body", mode="before")
         @classmethod
-        def normalize_body(cls, v: t.GeneralValueType) -> t.Api.RequestBody:
-            """Normalize body - empty dict is valid."""
+        def normalize_body(
+            cls,
+            v: t.GeneralValueType | FlextApiStreamingBody.Source,
+        ) -> t.Api.RequestBody | FlextApiStreamingBody:
+            """Normalize body - empty dict is valid, stream sources are wrapped.
+
+            Paths, binary file objects, memory maps and byte iterators become
+            a FlextApiStreamingBody so they are uploaded without buffering.
+            """
             if v is None:
                 return {}
+            if isinstance(v, FlextApiStreamingBody):
+                return v
+            if isinstance(
+                v,
+                (PurePath, mmap.mmap, Iterator, AsyncIterator, io.IOBase),
+            ):
+                return FlextApiStreamingBody(v)
             if isinstance(v, dict):
                 # Safe transformation to JsonObject with narrowed value types
                 result: t.Api.JsonObject = {}
@@ -166,6 +186,62 @@ class FlextApiModels(FlextModels):
             description="Associated request ID for tracking",
         )
 
+        _decoded: dict[str, t.GeneralValueType] = PrivateAttr(default_factory=dict)
+
+        def text(self) -> str:
+            """Body as text; raw bytes are decoded once with the response charset."""
+            if isinstance(self.body, str):
+                return self.body
+            if "text" not in self._decoded:
+                if isinstance(self.body, bytes):
+                    _, charset = FlextApiSerializers.BodyDecoder.parse_media_type(
+                        self._header(c.Api.HEADER_CONTENT_TYPE),
+                    )
+                    text = FlextApiSerializers.BodyDecoder.decode_text(
+                        self.body,
+                        charset,
+                    )
+                else:
+                    text = (
+                        ""
+                        if self.body is None
+                        else FlextApiSerializers.Json.dumps_str(self.body)
+                    )
+                self._decoded["text"] = text
+            return str(self._decoded["text"])
+
+        def json_body(self) -> r[t.GeneralValueType]:
+            """Body parsed as structured data; raw bytes are parsed once.
+
+            Raw MessagePack and CBOR bodies are decoded according to the
+            Content-Type header; everything else is parsed as JSON.
+            """
+            if u.Guards.is_configuration_dict(self.body):
+                return r[t.GeneralValueType].ok(self.body)
+            if "json" not in self._decoded:
+                negotiation = FlextApiSerializers.ContentNegotiation
+                content_type = self._header(c.Api.HEADER_CONTENT_TYPE)
+                try:
+                    if isinstance(self.body, bytes) and negotiation.supports(
+                        content_type,
+                    ):
+                        data = negotiation.decode(self.body, content_type)
+                    else:
+                        raw = self.body if isinstance(self.body, bytes) else self.text()
+                        data = FlextApiSerializers.Json.loads(raw)
+                    self._decoded["json"] = data
+                except ValueError as e:
+                    return r[t.GeneralValueType].fail(f"Failed to decode body: {e}")
+            return r[t.GeneralValueType].ok(self._decoded["json"])
+
+        def _header(self, name: str) -> str:
+            """Get a header value case-insensitively (empty when missing)."""
+            lowered = name.lower()
+            for key, value in self.headers.items():
+                if key.lower() == lowered:
+                    return value
+            return ""
+
         @computed_field
         def is_success(self) -> bool:
             """Check if response indicates success (2xx status code)."""
@@ -579,6 +655,7 @@ class FlextApiModels(FlextModels):
             hit_ratio: float = 0.0
             storage_size: int = 0
             memory_usage: int = 0
+            evictions: int = 0
             namespace: str = "flext"
 
 
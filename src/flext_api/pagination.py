@@ -0,0 +1,404 @@
+"""Client-side pagination with page prefetch.
+
+Backs FlextApiClient.paginate and FlextApiAsyncClient.apaginate: walks a
+paginated endpoint and yields its items one by one. Page-number and
+offset pagination know every next request up front, so the next
+``prefetch`` pages are fetched concurrently while the caller consumes the
+current one; cursor and Link-header pagination learn the next request from
+each response, so they fetch one page ahead. At most ``prefetch + 1``
+pages are held at a time, whatever the size of the collection.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import httpx
+from flext_core import r
+
+from flext_api.constants import c
+from flext_api.models import FlextApiModels
+from flext_api.typings import t
+
+_LINK_VALUE = re.compile(r"<([^>]*)>(.*)")
+_LINK_REL = re.compile(r"""rel\s*=\s*"?([^";]+)"?""")
+
+type _Page = tuple[list[t.GeneralValueType], FlextApiModels.HttpResponse, bool]
+
+
+class FlextApiPagination:
+    """How to walk one paginated endpoint, and the walk itself.
+
+    ``page``: ``?page=1&page_size=N``, ``page=2``, ...
+    ``offset``: ``?offset=0&limit=N``, ``offset=N``, ...
+    ``cursor``: the next cursor is read from the body (``cursor_path``) and
+    sent as ``?cursor=...``.
+    ``link``: the next URL is the RFC 8288 ``Link: <...>; rel="next"``.
+
+    Page and offset walks stop at an empty or short page, or when the body
+    reports ``has_next: false`` or its ``total_pages`` (also inside a
+    ``pagination`` object, as built by FlextApiUtilities.PaginationBuilder);
+    cursor and Link walks stop when no next cursor or link is given.
+
+    Usage:
+        pagination = FlextApiPagination("cursor", cursor_path="meta.next")
+        for item in client.paginate(request, pagination):
+            ...
+    """
+
+    Strategy = c.Api.Pagination.Strategy
+
+    class PageError(Exception):
+        """Raised when a page cannot be fetched or read."""
+
+        def __init__(
+            self,
+            index: int,
+            error: str,
+            error_code: str | None = None,
+        ) -> None:
+            self.index = index
+            self.error = error
+            self.error_code = error_code
+            super().__init__(f"Page {index} failed: {error}")
+
+    def __init__(
+        self,
+        strategy: c.Api.Pagination.Strategy | str = c.Api.Pagination.Strategy.PAGE,
+        *,
+        page_size: int = c.Pagination.DEFAULT_PAGE_SIZE,
+        prefetch: int = c.Api.Pagination.DEFAULT_PREFETCH,
+        max_pages: int | None = None,
+        items_path: str | None = None,
+        cursor_path: str | None = None,
+        position_param: str | None = None,
+        size_param: str | None = None,
+        first_page: int = c.Api.PaginationDefaults.DEFAULT_PAGE,
+    ) -> None:
+        """Initialize the pagination.
+
+        Args:
+            strategy: ``page``, ``offset``, ``cursor`` or ``link``.
+            page_size: Items requested per page.
+            prefetch: Pages fetched ahead of the one being consumed.
+            max_pages: Stop after this many pages (None: walk them all).
+            items_path: Dotted body path of the item list (default: the
+                first of ITEM_KEYS present).
+            cursor_path: Dotted body path of the next cursor (default: the
+                first of CURSOR_KEYS present).
+            position_param: Query parameter carrying the page, offset or
+                cursor (default per strategy, see PARAMS).
+            size_param: Query parameter carrying ``page_size`` (default per
+                strategy; the Link strategy sends none).
+            first_page: Number of the first page for ``page``.
+
+        Raises:
+            ValueError: If ``page_size`` or ``max_pages`` is below 1 or
+                ``prefetch`` is negative.
+
+        """
+        if page_size < 1 or prefetch < 0 or (max_pages is not None and max_pages < 1):
+            msg = "Pagination needs page_size >= 1, prefetch >= 0, max_pages >= 1"
+            raise ValueError(msg)
+        self.strategy = c.Api.Pagination.Strategy(strategy)
+        self.page_size = page_size
+        self.prefetch = prefetch
+        self.max_pages = max_pages
+        self.items_path = items_path
+        self.cursor_path = cursor_path
+        default_position, default_size = c.Api.Pagination.PARAMS[self.strategy]
+        self.position_param = position_param or default_position
+        self.size_param = size_param or default_size
+        self.first_page = first_page
+
+    @property
+    def sequential(self) -> bool:
+        """Whether each next request depends on the previous response."""
+        return self.strategy in {self.Strategy.CURSOR, self.Strategy.LINK}
+
+    def iterate(
+        self,
+        request: FlextApiModels.HttpRequest,
+        fetch: Callable[
+            [FlextApiModels.HttpRequest],
+            r[FlextApiModels.HttpResponse],
+        ],
+    ) -> Iterator[t.GeneralValueType]:
+        """Yield the items of every page, fetching pages on worker threads.
+
+        Raises:
+            PageError: When a page fails; items of earlier pages have been
+                yielded already.
+
+        """
+        pending: deque[Future[r[FlextApiModels.HttpResponse]]] = deque()
+        executor = ThreadPoolExecutor(
+            max_workers=self.prefetch + 1,
+            thread_name_prefix="flext-api-pages",
+        )
+        current = self.first_request(request)
+        end = self.max_pages
+        index = ahead = 0
+        try:
+            if self.sequential:
+                pending.append(executor.submit(fetch, current))
+                ahead = 1
+            while True:
+                while (
+                    not self.sequential
+                    and len(pending) <= self.prefetch
+                    and (end is None or ahead < end)
+                ):
+                    pending.append(
+                        executor.submit(fetch, self.page_request(request, ahead)),
+                    )
+                    ahead += 1
+                if not pending:
+                    return
+                items, response, last = self.read_page(
+                    index,
+                    pending.popleft().result(),
+                )
+                index += 1
+                if last:
+                    # Pages prefetched past the end are not needed
+                    end = index
+                    self._drop(pending)
+                elif self.sequential and (end is None or ahead < end):
+                    following = self.next_request(current, response)
+                    if following is not None:
+                        current = following
+                        pending.append(executor.submit(fetch, following))
+                        ahead += 1
+                yield from items
+        finally:
+            # Unstarted pages are dropped; started ones finish before we return
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    async def aiterate(
+        self,
+        request: FlextApiModels.HttpRequest,
+        fetch: Callable[
+            [FlextApiModels.HttpRequest],
+            Awaitable[r[FlextApiModels.HttpResponse]],
+        ],
+    ) -> AsyncIterator[t.GeneralValueType]:
+        """Async ``iterate``: pages are fetched as tasks on the running loop."""
+        pending: deque[asyncio.Future[r[FlextApiModels.HttpResponse]]] = deque()
+        current = self.first_request(request)
+        end = self.max_pages
+        index = ahead = 0
+        try:
+            if self.sequential:
+                pending.append(asyncio.ensure_future(fetch(current)))
+                ahead = 1
+            while True:
+                while (
+                    not self.sequential
+                    and len(pending) <= self.prefetch
+                    and (end is None or ahead < end)
+                ):
+                    pending.append(
+                        asyncio.ensure_future(
+                            fetch(self.page_request(request, ahead)),
+                        ),
+                    )
+                    ahead += 1
+                if not pending:
+                    return
+                items, response, last = self.read_page(
+                    index,
+                    await pending.popleft(),
+                )
+                index += 1
+                if last:
+                    end = index
+                    self._drop(pending)
+                elif self.sequential and (end is None or ahead < end):
+                    following = self.next_request(current, response)
+                    if following is not None:
+                        current = following
+                        pending.append(asyncio.ensure_future(fetch(following)))
+                        ahead += 1
+                for item in items:
+                    yield item
+        finally:
+            self._drop(pending)
+
+    def first_request(
+        self,
+        request: FlextApiModels.HttpRequest,
+    ) -> FlextApiModels.HttpRequest:
+        """Request of the first page."""
+        if not self.sequential:
+            return self.page_request(request, 0)
+        if self.size_param is None:
+            return request
+        return self._with_params(request, {self.size_param: str(self.page_size)})
+
+    def page_request(
+        self,
+        request: FlextApiModels.HttpRequest,
+        index: int,
+    ) -> FlextApiModels.HttpRequest:
+        """Request of page ``index`` (0-based) for ``page`` and ``offset``."""
+        position = (
+            self.first_page + index
+            if self.strategy is self.Strategy.PAGE
+            else index * self.page_size
+        )
+        params = {str(self.position_param): str(position)}
+        if self.size_param is not None:
+            params[self.size_param] = str(self.page_size)
+        return self._with_params(request, params)
+
+    def next_request(
+        self,
+        current: FlextApiModels.HttpRequest,
+        response: FlextApiModels.HttpResponse,
+    ) -> FlextApiModels.HttpRequest | None:
+        """Request of the page after ``response`` for ``cursor`` and ``link``."""
+        if self.strategy is self.Strategy.LINK:
+            target = self.next_link(response.headers)
+            if target is None:
+                return None
+            url = httpx.URL(current.url).join(target)
+            # The client sends query_params as the whole query string
+            params: t.Api.WebParams = {}
+            for name in url.params:
+                values = url.params.get_list(name)
+                params[name] = values[0] if len(values) == 1 else values
+            return current.model_copy(
+                update={"url": str(url.copy_with(query=None)), "query_params": params},
+            )
+        cursor = self._lookup(
+            self._body(response),
+            (self.cursor_path,)
+            if self.cursor_path is not None
+            else c.Api.Pagination.CURSOR_KEYS,
+        )
+        if cursor is None or cursor in {"", False}:
+            return None
+        return self._with_params(current, {str(self.position_param): str(cursor)})
+
+    def read_page(
+        self,
+        index: int,
+        result: r[FlextApiModels.HttpResponse],
+    ) -> _Page:
+        """``(items, response, is_last)`` of a fetched page.
+
+        Raises:
+            PageError: If the request failed or the items are not a list.
+
+        """
+        if result.is_failure:
+            raise self.PageError(
+                index,
+                result.error or "request failed",
+                result.error_code,
+            )
+        response = result.value
+        body = self._body(response)
+        items = self._lookup(
+            body,
+            (self.items_path,)
+            if self.items_path is not None
+            else c.Api.Pagination.ITEM_KEYS,
+        )
+        if items is None:
+            items = []
+        if not isinstance(items, list):
+            raise self.PageError(index, f"items are a {type(items).__name__}")
+        if self.sequential:
+            return items, response, False
+        last = len(items) < self.page_size or self._reports_end(body, index)
+        return items, response, last
+
+    @staticmethod
+    def next_link(headers: dict[str, str]) -> str | None:
+        """Target of the ``rel="next"`` entry of a Link header, if any."""
+        value = next(
+            (
+                header_value
+                for name, header_value in headers.items()
+                if name.lower() == c.Api.Pagination.HEADER_LINK.lower()
+            ),
+            None,
+        )
+        if value is None:
+            return None
+        for entry in re.split(r",\s*(?=<)", value):
+            match = _LINK_VALUE.match(entry.strip())
+            if match is None:
+                continue
+            rel = _LINK_REL.search(match.group(2))
+            if rel is not None and c.Api.Pagination.REL_NEXT in rel.group(1).split():
+                return match.group(1)
+        return None
+
+    def _reports_end(self, body: t.GeneralValueType, index: int) -> bool:
+        """Whether the body says page ``index`` is the last one."""
+        if not isinstance(body, dict):
+            return False
+        for meta in (body, body.get("pagination")):
+            if not isinstance(meta, dict):
+                continue
+            if meta.get("has_next") is False:
+                return True
+            total_pages = meta.get("total_pages")
+            if isinstance(total_pages, int) and index + 1 >= total_pages:
+                return True
+        return False
+
+    @staticmethod
+    def _drop(
+        pending: deque[Future[r[FlextApiModels.HttpResponse]]]
+        | deque[asyncio.Future[r[FlextApiModels.HttpResponse]]],
+    ) -> None:
+        """Cancel and forget prefetched pages (thread futures or tasks)."""
+        for future in pending:
+            future.cancel()
+        pending.clear()
+
+    @staticmethod
+    def _with_params(
+        request: FlextApiModels.HttpRequest,
+        params: dict[str, str],
+    ) -> FlextApiModels.HttpRequest:
+        return request.model_copy(
+            update={"query_params": {**request.query_params, **params}},
+        )
+
+    @staticmethod
+    def _body(response: FlextApiModels.HttpResponse) -> t.GeneralValueType:
+        """Decoded body, or None when it is not structured data."""
+        decoded = response.json_body()
+        return decoded.value if decoded.is_success else None
+
+    @staticmethod
+    def _lookup(
+        body: t.GeneralValueType,
+        paths: tuple[str, ...],
+    ) -> t.GeneralValueType:
+        """Value at the first dotted path present in ``body``."""
+        for path in paths:
+            value = body
+            for key in path.split("."):
+                if not isinstance(value, dict) or key not in value:
+                    break
+                value = value[key]
+            else:
+                return value
+        return None
+
+
+__all__ = ["FlextApiPagination"]
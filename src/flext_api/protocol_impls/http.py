@@ -19,9 +19,13 @@ import time
 import httpx
 from flext_core import r
 
+from flext_api.circuit_breaker import FlextApiCircuitBreaker
 from flext_api.constants import c
+from flext_api.dns import FlextApiDnsCache
 from flext_api.models import FlextApiModels
 from flext_api.protocol_impls.rfc import RFCProtocolImplementation
+from flext_api.retry import FlextApiRetryPolicy
+from flext_api.streaming import FlextApiStreamingBody, FlextApiStreamingResponse
 from flext_api.transports import FlextApiTransports
 from flext_api.typings import t
 
@@ -30,20 +34,21 @@ class FlextWebProtocolPlugin(RFCProtocolImplementation):
     """HTTP protocol implementation with HTTP/1.1, HTTP/2, and HTTP/3 support.
 
     Features:
-    - HTTP/2 multiplexing for improved performance
     - HTTP/3 support via httpx (when available)
-    - Connection pooling with configurable limits
+    - Connection pooling with configurable pool-wide and per-origin limits
     - Automatic retry logic with exponential backoff
     - Streaming support for large requests/responses
     - Keep-alive connections for efficiency
     - Automatic decompression (gzip, deflate, brotli)
     - Custom headers and authentication
     - Timeout management (connect, read, write, pool)
-    - Redirect handling
+    - Redirect handling with a redirect limit
     - Cookie management
 
     Usage:
-    plugin = FlextWebProtocolPlugin(http2=True, max_connections=100)
+    plugin = FlextWebProtocolPlugin(
+        max_connections=100, max_connections_per_origin=20
+    )
     result = plugin.send_request(request)
     if result.is_success:
     response = result.value
@@ -52,22 +57,46 @@ class FlextWebProtocolPlugin(RFCProtocolImplementation):
     def __init__(
         self,
         *,
-        http2: bool = True,
+        http2: bool = False,
         http3: bool = False,
-        max_connections: int = 100,
+        max_connections: int = c.Api.HTTPClient.DEFAULT_MAX_CONNECTIONS,
         max_retries: int | None = None,
         retry_backoff_factor: float | None = None,
         follow_redirects: bool = True,
-        max_redirects: int = 20,
+        max_redirects: int = c.Api.HTTPClient.DEFAULT_MAX_REDIRECTS,
+        max_keepalive_connections: int = (
+            c.Api.HTTPClient.DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+        ),
+        max_connections_per_origin: int | None = None,
+        http2_prior_knowledge: bool = False,
+        dns_cache: FlextApiDnsCache | None = None,
+        retry_policy: FlextApiRetryPolicy | None = None,
+        circuit_breaker: FlextApiCircuitBreaker | None = None,
     ) -> None:
-        """Initialize HTTP protocol plugin."""
+        """Initialize HTTP protocol plugin.
+
+        Each request leases the pooled client for its origin from the
+        process-wide FlextApiTransports.PoolRegistry and returns it when the
+        response is read (or the stream closed), so plugins with the same
+        settings share sockets. Requests are sent on sync connections, which
+        speak HTTP/1.1, so ``http2`` and ``http2_prior_knowledge`` are
+        ignored with a warning; HTTP/2 multiplexing is available from
+        FlextApiTransports.FlextWebTransport.connect_async. ``dns_cache``
+        resolves new connections through a FlextApiDnsCache with
+        happy-eyeballs connects.
+
+        Failures are retried by ``retry_policy``; by default one with full
+        jitter, ``max_retries``, ``retry_backoff_factor`` and a per-host
+        retry budget. With a ``circuit_breaker``, every attempt is admitted
+        by its origin's circuit and requests fail fast with the CIRCUIT_OPEN
+        error code while it is open.
+        """
         super().__init__(
             name="http",
             version="1.0.0",
             description="HTTP/1.1, HTTP/2, HTTP/3 protocol implementation",
         )
 
-        self._http2 = http2
         self._http3 = http3
         self._max_retries = (
             max_retries if max_retries is not None else int(c.Api.DEFAULT_MAX_RETRIES)
@@ -77,11 +106,34 @@ class FlextWebProtocolPlugin(RFCProtocolImplementation):
             if retry_backoff_factor is not None
             else c.Api.BACKOFF_FACTOR
         )
+        self._retry_policy = retry_policy or FlextApiRetryPolicy(
+            max_retries=self._max_retries,
+            backoff_factor=self._retry_backoff_factor,
+            budget=FlextApiRetryPolicy.Budget(),
+        )
+        self._max_retries = self._retry_policy.max_retries
+        self._retry_backoff_factor = self._retry_policy.backoff_factor
+        self._circuit_breaker = circuit_breaker
         self._follow_redirects = follow_redirects
         self._max_redirects = max_redirects
 
-        # Create HTTP transport with configuration
-        self._transport = FlextApiTransports.FlextWebTransport()
+        self._max_connections = max_connections
+        self._max_connections_per_origin = max_connections_per_origin
+
+        # Leases pooled clients from the shared registry per request
+        self._transport = FlextApiTransports.FlextWebTransport(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            max_connections_per_origin=max_connections_per_origin,
+            follow_redirects=follow_redirects,
+            max_redirects=max_redirects,
+            dns_cache=dns_cache,
+        )
+        if http2 or http2_prior_knowledge:
+            self.logger.warning(
+                "HTTP/2 requested but the plugin sends on sync HTTP/1.1 "
+                "connections; use FlextWebTransport.connect_async for HTTP/2",
+            )
 
         # Initialize protocol
         init_result = self.initialize()
@@ -93,9 +145,10 @@ class FlextWebProtocolPlugin(RFCProtocolImplementation):
         self.logger.info(
             "HTTP protocol initialized",
             extra={
-                "http2": http2,
                 "http3": http3,
                 "max_connections": max_connections,
+                "max_connections_per_origin": max_connections_per_origin,
+                "max_redirects": max_redirects,
                 "max_retries": self._max_retries,
             },
         )
@@ -178,13 +231,13 @@ class FlextWebProtocolPlugin(RFCProtocolImplementation):
         headers_dict = headers_result.value
         timeout = http_request.timeout
         body = http_request.body
+        if isinstance(body, FlextApiStreamingBody):
+            return r[dict[str, t.GeneralValueType]].fail(
+                "Streaming request bodies are sent with FlextApiClient",
+            )
 
         # Connect to endpoint (sync)
-        conn_result = self._transport.connect(
-            url=url,
-            follow_redirects=self._follow_redirects,
-            **kwargs,
-        )
+        conn_result = self._transport.connect(url=url, **kwargs)
 
         if conn_result.is_failure:
             return r[dict[str, t.GeneralValueType]].fail(
@@ -193,8 +246,11 @@ class FlextWebProtocolPlugin(RFCProtocolImplementation):
 
         connection = conn_result.value
 
-        # Execute request with retry logic
-        if isinstance(connection, httpx.Client):
+        # Execute request with retry logic, then return the pool lease
+        if not isinstance(connection, httpx.Client):
+            self._transport.disconnect(connection)
+            return r[dict[str, t.GeneralValueType]].fail("Invalid connection type")
+        try:
             result = self._execute_with_retry(
                 connection,
                 method,
@@ -204,8 +260,8 @@ class FlextWebProtocolPlugin(RFCProtocolImplementation):
                 timeout,
                 body,
             )
-        else:
-            return r[dict[str, t.GeneralValueType]].fail("Invalid connection type")
+        finally:
+            self._transport.disconnect(connection)
 
         if result.is_success:
             response = result.value
@@ -216,7 +272,8 @@ class FlextWebProtocolPlugin(RFCProtocolImplementation):
             })
 
         return r[dict[str, t.GeneralValueType]].fail(
-            result.error or "Request execution failed"
+            result.error or "Request execution failed",
+            error_code=result.error_code,
         )
 
     def _build_request_kwargs(
@@ -296,10 +353,11 @@ class FlextWebProtocolPlugin(RFCProtocolImplementation):
         timeout: float | None,
         body: t.Api.RequestBody | None,
     ) -> r[FlextApiModels.HttpResponse]:
-        """Execute HTTP request with retry logic."""
-        last_error = "Unknown error"
-
-        for attempt in range(self._max_retries + 1):
+        """Execute HTTP request, retrying failures the retry policy allows."""
+        attempts = self._retry_policy.start(method, url)
+        while True:
+            attempt = attempts.count
+            permit: FlextApiCircuitBreaker.Permit | None = None
             try:
                 request_kwargs = self._build_request_kwargs(
                     method,
@@ -342,9 +400,10 @@ class FlextWebProtocolPlugin(RFCProtocolImplementation):
                 )
                 timeout_raw = request_kwargs.get("timeout")
                 # httpx.request accepts float | tuple | None, but method expects float | None
-                request_timeout: float | None = (
-                    timeout_raw if isinstance(timeout_raw, float) else None
+                request_timeout: float | None = attempts.begin(
+                    timeout_raw if isinstance(timeout_raw, float) else None,
                 )
+                permit = self._admit(url_str)
                 # Call httpx.request with explicit typed parameters
                 response = connection.request(
                     method=method_str,
@@ -355,20 +414,25 @@ class FlextWebProtocolPlugin(RFCProtocolImplementation):
                     content=content,
                     timeout=request_timeout,
                 )
+                self._record_outcome(permit, response=response)
 
                 if self._is_success_status(response.status_code):
                     return self._build_response(response, method)
 
-                if not self._should_retry(
-                    response.status_code,
-                    attempt,
-                    self._max_retries,
-                ):
+                delay = attempts.next_delay(response)
+                if delay is None:
                     return r[FlextApiModels.HttpResponse].fail(
                         f"HTTP {response.status_code}: {response.text}",
                     )
+                response.close()
 
+            except FlextApiCircuitBreaker.OpenError as e:
+                return r[FlextApiModels.HttpResponse].fail(
+                    str(e),
+                    error_code=c.Api.CircuitBreaker.OPEN_ERROR_CODE,
+                )
             except Exception as e:
+                self._record_outcome(permit, error=e)
                 last_error = self._handle_request_exception(
                     e,
                     url,
@@ -376,14 +440,13 @@ class FlextWebProtocolPlugin(RFCProtocolImplementation):
                     attempt,
                     self._max_retries,
                 )
+                delay = attempts.next_delay(error=e)
+                if delay is None:
+                    return r[FlextApiModels.HttpResponse].fail(
+                        f"Request failed after {attempts.count} attempts: {last_error}",
+                    )
 
-            if attempt < self._max_retries:
-                backoff_time = self._retry_backoff_factor * (2**attempt)
-                time.sleep(backoff_time)
-
-        return r[FlextApiModels.HttpResponse].fail(
-            f"Request failed after {self._max_retries + 1} attempts: {last_error}",
-        )
+            time.sleep(delay)
 
     def _extract_headers_from_model(
         self,
@@ -441,19 +504,187 @@ class FlextWebProtocolPlugin(RFCProtocolImplementation):
     def stream_request(
         self,
         request: FlextApiModels.HttpRequest,
-        chunk_size: int = 8192,
-    ) -> r[object]:
-        """Send streaming HTTP request."""
+        chunk_size: int = c.Api.Streaming.DEFAULT_CHUNK_SIZE,
+    ) -> r[FlextApiStreamingResponse]:
+        """Send HTTP request and return its body as a stream.
+
+        Only the status line and headers are read before returning; the body
+        is pulled from the connection as the caller iterates, so memory stays
+        bounded by ``chunk_size`` regardless of the response size. Retryable
+        statuses are retried before any body is consumed.
+
+        Usage:
+            result = plugin.stream_request(request, chunk_size=1 << 20)
+            with result.value as response:
+                response.write_to(file_descriptor)
+        """
+        if chunk_size < 1:
+            return r[FlextApiStreamingResponse].fail("chunk_size must be at least 1")
+
+        url = str(request.url)
+        method = request.method.upper()
         self.logger.info(
             "Streaming request",
-            extra={
-                "url": str(request.url),
-                "method": request.method,
-                "chunk_size": chunk_size,
-            },
+            extra={"url": url, "method": method, "chunk_size": chunk_size},
+        )
+
+        headers_result = self._extract_headers_from_model(request)
+        if headers_result.is_failure:
+            return r[FlextApiStreamingResponse].fail(
+                headers_result.error or "Headers extraction failed",
+            )
+
+        conn_result = self._transport.connect(url=url)
+        if conn_result.is_failure:
+            return r[FlextApiStreamingResponse].fail(
+                f"Failed to establish connection: {conn_result.error}",
+            )
+        connection = conn_result.value
+        if not isinstance(connection, httpx.Client):
+            self._transport.disconnect(connection)
+            return r[FlextApiStreamingResponse].fail("Invalid connection type")
+
+        body = request.body
+        httpx_request = connection.build_request(
+            method,
+            url,
+            headers=headers_result.value,
+            json=body if isinstance(body, dict) and body else None,
+            content=body if isinstance(body, (str, bytes)) else None,
+            timeout=request.timeout,
         )
 
-        return r[object].fail("Streaming not yet implemented (Phase 2 enhancement)")
+        # Closing the stream returns its connection and the pool lease
+        result = self._send_streaming_with_retry(connection, httpx_request)
+        if result.is_failure:
+            self._transport.disconnect(connection)
+            return r[FlextApiStreamingResponse].fail(
+                result.error or "Streaming request failed",
+            )
+        return r[FlextApiStreamingResponse].ok(
+            FlextApiStreamingResponse(
+                result.value,
+                chunk_size,
+                on_close=lambda: self._transport.disconnect(connection),
+            ),
+        )
+
+    def _send_streaming_with_retry(
+        self,
+        connection: httpx.Client,
+        request: httpx.Request,
+    ) -> r[httpx.Response]:
+        """Send request with ``stream=True``, retrying before reading the body."""
+        method = request.method
+        url = str(request.url)
+        attempts = self._retry_policy.start(method, url)
+        read_timeout = request.extensions.get("timeout", {}).get("read")
+
+        while True:
+            attempt = attempts.count
+            timeout = attempts.begin(read_timeout)
+            if timeout is not None:
+                request.extensions["timeout"] = httpx.Timeout(timeout).as_dict()
+            permit: FlextApiCircuitBreaker.Permit | None = None
+            try:
+                permit = self._admit(url)
+                response = connection.send(
+                    request,
+                    stream=True,
+                    follow_redirects=self._follow_redirects,
+                )
+                self._record_outcome(permit, response=response)
+                if self._is_success_status(response.status_code):
+                    return r[httpx.Response].ok(response)
+
+                delay = attempts.next_delay(response)
+                if delay is None:
+                    # Error bodies are small; read them for the message
+                    response.read()
+                    response.close()
+                    return r[httpx.Response].fail(
+                        f"HTTP {response.status_code}: {response.text}",
+                    )
+                response.close()
+
+            except FlextApiCircuitBreaker.OpenError as e:
+                return r[httpx.Response].fail(
+                    str(e),
+                    error_code=c.Api.CircuitBreaker.OPEN_ERROR_CODE,
+                )
+            except Exception as e:
+                self._record_outcome(permit, error=e)
+                last_error = self._handle_request_exception(
+                    e,
+                    url,
+                    method,
+                    attempt,
+                    self._max_retries,
+                )
+                delay = attempts.next_delay(error=e)
+                if delay is None:
+                    return r[httpx.Response].fail(
+                        f"Request failed after {attempts.count} attempts: {last_error}",
+                    )
+
+            time.sleep(delay)
+
+    def _admit(self, url: str) -> FlextApiCircuitBreaker.Permit | None:
+        """Admit one attempt through the origin's circuit, if enabled."""
+        if self._circuit_breaker is None:
+            return None
+        return self._circuit_breaker.acquire(url)
+
+    def _record_outcome(
+        self,
+        permit: FlextApiCircuitBreaker.Permit | None,
+        *,
+        response: httpx.Response | None = None,
+        error: Exception | None = None,
+    ) -> None:
+        """Report an attempt's response or error to the origin's circuit."""
+        if permit is None or self._circuit_breaker is None:
+            return
+        if response is not None:
+            self._circuit_breaker.record_response(permit, response)
+        else:
+            self._circuit_breaker.record(
+                permit,
+                failure=True if isinstance(error, httpx.TransportError) else None,
+            )
+
+    @property
+    def retry_policy(self) -> FlextApiRetryPolicy:
+        """Retry policy applied to every request of this plugin."""
+        return self._retry_policy
+
+    @property
+    def circuit_breaker(self) -> FlextApiCircuitBreaker | None:
+        """Per-origin circuit breaker guarding requests, if enabled."""
+        return self._circuit_breaker
+
+    def metrics(self) -> r[t.Api.MetricsDict]:
+        """Get pool counters plus ``retry.`` and ``circuit.`` prefixed counters."""
+        transport_metrics = self._transport.metrics()
+        if transport_metrics.is_failure:
+            return transport_metrics
+        metrics: t.Api.MetricsDict = {
+            **transport_metrics.value,
+            **{
+                f"retry.{name}": value
+                for name, value in self._retry_policy.metrics().value.items()
+            },
+        }
+        if self._circuit_breaker is not None:
+            metrics.update({
+                f"circuit.{name}": value
+                for name, value in self._circuit_breaker.metrics().value.items()
+            })
+        return r[t.Api.MetricsDict].ok(metrics)
+
+    def close(self) -> None:
+        """Return any pool lease still held (e.g. by an unclosed stream)."""
+        self._transport.close()
 
     def get_protocol_info(self) -> t.JsonObject:
         """Get protocol configuration information."""
@@ -461,12 +692,14 @@ class FlextWebProtocolPlugin(RFCProtocolImplementation):
         # Type narrowing: base_info is JsonObject, update with compatible values
         updated_info: t.JsonObject = {
             **base_info,
-            "http2_enabled": self._http2,
+            "http2_enabled": False,
             "http3_enabled": self._http3,
             "max_retries": self._max_retries,
             "retry_backoff_factor": self._retry_backoff_factor,
             "follow_redirects": self._follow_redirects,
             "max_redirects": self._max_redirects,
+            "max_connections": self._max_connections,
+            "max_connections_per_origin": self._max_connections_per_origin,
         }
         return updated_info
 
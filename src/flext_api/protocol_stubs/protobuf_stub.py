@@ -22,11 +22,10 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
-import json
-
 from flext_core import FlextLogger, FlextTypes as t, r
 
 from flext_api.protocols import p
+from flext_api.serializers import FlextApiSerializers
 
 
 class ProtobufMessage:
@@ -114,7 +113,7 @@ class ProtobufMessage:
 
         """
         try:
-            json_str = json.dumps(self._data)
+            json_str = FlextApiSerializers.Json.dumps_str(self._data)
             return r[str].ok(json_str)
         except Exception as e:
             return r[str].fail(f"JSON conversion failed: {e}")
@@ -131,7 +130,9 @@ class ProtobufMessage:
 
         """
         try:
-            data = json.loads(json_str)
+            data = FlextApiSerializers.Json.loads(json_str)
+            if not isinstance(data, dict):
+                return r[ProtobufMessage].fail("JSON message must be an object")
             return r[ProtobufMessage].ok(cls(data))
         except Exception as e:
             return r[ProtobufMessage].fail(f"JSON parsing failed: {e}")
@@ -133,6 +133,17 @@ class FlextApiProtocols(FlextProtocols):
                     """Get all keys."""
                     ...
 
+        class Metrics:
+            """Metrics provider protocols."""
+
+            @runtime_checkable
+            class MetricsProviderProtocol(Protocol):
+                """Protocol for client components exposing integer counters."""
+
+                def metrics(self) -> r[t.Api.MetricsDict]:
+                    """Get component counters."""
+                    ...
+
         class Logger:
             """Logger protocols for API operations."""
 
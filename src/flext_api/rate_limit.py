@@ -0,0 +1,548 @@
+"""Client-side token-bucket rate limiting per origin or per route.
+
+Opt-in component of FlextApiClient and FlextApiAsyncClient. Each origin
+(or each route, origin plus path) gets a token bucket; a request takes one
+token, waiting (blocking, or awaiting in async code) until one is
+available. Rate-limit headers on responses (``RateLimit``,
+``RateLimit-Remaining``/``-Reset``, ``X-RateLimit-Remaining``/``-Reset``)
+and 429/503 ``Retry-After`` answers tighten the bucket so the client paces
+itself to what the server says is left. Requests that would wait longer
+than ``max_wait`` fail with the RATE_LIMITED error code.
+
+Buckets live in process memory, or in a named shared-memory segment so
+several worker processes on one host share one budget.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import importlib
+import math
+import re
+import struct
+import tempfile
+import threading
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from multiprocessing import shared_memory
+from pathlib import Path
+from types import ModuleType
+from typing import Protocol
+
+import httpx
+from flext_core import r
+
+from flext_api.circuit_breaker import FlextApiCircuitBreaker
+from flext_api.constants import c
+from flext_api.retry import FlextApiRetryPolicy
+from flext_api.typings import t
+
+
+def _optional_module(name: str) -> ModuleType | None:
+    """Import ``name`` when available (fcntl is POSIX-only)."""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+_fcntl = _optional_module("fcntl")
+
+# Float slack so a refill landing a hair below one token still counts
+_EPSILON = 1e-9
+
+_PARAMETER = re.compile(r"([A-Za-z-]+)\s*=\s*\"?(-?\d+(?:\.\d+)?)\"?")
+
+
+class FlextApiRateLimiter:
+    """Token buckets that pace requests and follow rate-limit headers.
+
+    A bucket holds up to ``burst`` tokens and refills at ``rate`` tokens per
+    second; ``rate=None`` means no client-side limit until a response
+    reports one. When a response says ``remaining`` requests are left until
+    a reset ``reset`` seconds away, the bucket keeps at most ``remaining``
+    tokens and spreads the rest evenly over the window; ``remaining=0`` or a
+    429/503 ``Retry-After`` blocks the bucket until the reset.
+
+    Usage:
+        limiter = FlextApiRateLimiter(rate=10, burst=20, scope="route")
+        client = FlextApiClient(settings, rate_limiter=limiter)
+    """
+
+    Scope = c.Api.RateLimit.Scope
+
+    class RateLimitedError(Exception):
+        """Raised when a request would wait longer than ``max_wait``."""
+
+        def __init__(self, key: str, wait: float) -> None:
+            self.key = key
+            self.wait = wait
+            super().__init__(f"Rate limit for {key} needs a {wait:.2f}s wait")
+
+    class Bucket:
+        """Token state of one origin or route."""
+
+        __slots__ = (
+            "blocked_until",
+            "capped_rate",
+            "capped_until",
+            "tokens",
+            "updated",
+        )
+
+        def __init__(
+            self,
+            tokens: float,
+            updated: float,
+            capped_rate: float = 0.0,
+            capped_until: float = 0.0,
+            blocked_until: float = 0.0,
+        ) -> None:
+            self.tokens = tokens
+            self.updated = updated
+            self.capped_rate = capped_rate
+            self.capped_until = capped_until
+            self.blocked_until = blocked_until
+
+    class Store(Protocol):
+        """Where buckets live; ``update`` runs ``change`` atomically."""
+
+        def update(
+            self,
+            key: str,
+            create: Callable[[], FlextApiRateLimiter.Bucket],
+            change: Callable[[FlextApiRateLimiter.Bucket], float],
+        ) -> float:
+            """Apply ``change`` to ``key``'s bucket and return its result."""
+            ...
+
+    class LocalBuckets:
+        """Buckets of this process, guarded by a lock."""
+
+        def __init__(self) -> None:
+            self._lock = threading.Lock()
+            self._buckets: dict[str, FlextApiRateLimiter.Bucket] = {}
+
+        def update(
+            self,
+            key: str,
+            create: Callable[[], FlextApiRateLimiter.Bucket],
+            change: Callable[[FlextApiRateLimiter.Bucket], float],
+        ) -> float:
+            """Apply ``change`` to ``key``'s bucket and return its result."""
+            with self._lock:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    bucket = self._buckets[key] = create()
+                return change(bucket)
+
+    class SharedBuckets:
+        """Buckets in a named shared-memory segment, shared by processes.
+
+        Every process that opens the same ``name`` sees the same buckets;
+        the first one creates the segment. Slots are keyed by a 64-bit hash
+        of the bucket key with linear probing; when the table is full a key
+        takes over its home slot. Updates hold a thread lock and an
+        exclusive ``flock`` on a lock file in the system temp dir, and
+        times come from the limiter clock, so it must be host-wide (the
+        default ``time.monotonic`` is).
+        """
+
+        _SLOT = struct.Struct("<Q5d")
+
+        def __init__(
+            self,
+            name: str,
+            *,
+            slots: int = c.Api.RateLimit.SHARED_SLOTS,
+        ) -> None:
+            """Create or attach to the segment ``name``.
+
+            Raises:
+                ValueError: If ``slots`` is below 1 or the platform has no
+                    ``fcntl`` file locking.
+
+            """
+            if slots < 1:
+                msg = "Shared rate-limit buckets need at least one slot"
+                raise ValueError(msg)
+            if _fcntl is None:
+                msg = "Shared rate-limit buckets need fcntl file locking"
+                raise ValueError(msg)
+            self.name = name
+            self.slots = slots
+            self._lock = threading.Lock()
+            lock_path = Path(tempfile.gettempdir()) / f"{name.lstrip('/')}.lock"
+            self._lock_file = lock_path.open("a+b")
+            size = slots * self._SLOT.size
+            with self._locked():
+                try:
+                    self._memory = shared_memory.SharedMemory(
+                        name,
+                        create=True,
+                        size=size,
+                        track=False,
+                    )
+                except FileExistsError:
+                    self._memory = shared_memory.SharedMemory(name, track=False)
+            buffer = self._memory.buf
+            if buffer is None or self._memory.size < size:
+                self.close()
+                msg = f"Shared memory {name!r} is smaller than {slots} slots"
+                raise ValueError(msg)
+            self._buffer = buffer
+
+        def update(
+            self,
+            key: str,
+            create: Callable[[], FlextApiRateLimiter.Bucket],
+            change: Callable[[FlextApiRateLimiter.Bucket], float],
+        ) -> float:
+            """Apply ``change`` to ``key``'s bucket and return its result."""
+            digest = int.from_bytes(
+                hashlib.blake2b(key.encode(), digest_size=8).digest(),
+                "little",
+            )
+            digest = digest or 1
+            with self._locked():
+                buffer = self._buffer
+                home = digest % self.slots
+                offset = home * self._SLOT.size
+                for probe in range(self.slots):
+                    at = ((home + probe) % self.slots) * self._SLOT.size
+                    stored, *values = self._SLOT.unpack_from(buffer, at)
+                    if stored in {digest, 0}:
+                        offset = at
+                        break
+                else:
+                    stored = 0
+                bucket = (
+                    FlextApiRateLimiter.Bucket(*values)
+                    if stored == digest
+                    else create()
+                )
+                result = change(bucket)
+                self._SLOT.pack_into(
+                    buffer,
+                    offset,
+                    digest,
+                    bucket.tokens,
+                    bucket.updated,
+                    bucket.capped_rate,
+                    bucket.capped_until,
+                    bucket.blocked_until,
+                )
+                return result
+
+        def close(self) -> None:
+            """Detach this process; the segment stays for the others."""
+            self._memory.close()
+            self._lock_file.close()
+
+        def unlink(self) -> None:
+            """Remove the segment once no process needs it any more."""
+            self._memory.unlink()
+
+        def _locked(self) -> _FileLock:
+            return _FileLock(self._lock, self._lock_file.fileno())
+
+    _COUNTERS = (
+        "acquired",
+        "waited",
+        "wait_ms_total",
+        "rejected",
+        "header_updates",
+        "blocked",
+    )
+
+    def __init__(
+        self,
+        *,
+        rate: float | None = None,
+        burst: float | None = None,
+        scope: c.Api.RateLimit.Scope | str = c.Api.RateLimit.Scope.ORIGIN,
+        limits: Mapping[str, tuple[float, float]] | None = None,
+        max_wait: float = c.Api.RateLimit.DEFAULT_MAX_WAIT,
+        store: FlextApiRateLimiter.Store | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+            rate: Tokens per second of every bucket (None: unlimited until
+                headers report a limit).
+            burst: Bucket capacity (default: one second of ``rate``, at
+                least 1).
+            scope: ``origin`` for one bucket per origin, ``route`` for one
+                per origin and path.
+            limits: ``(rate, burst)`` of specific buckets, keyed like
+                ``key_of`` (e.g. ``https://api.example.com:443/search``).
+            max_wait: Longest wait for a token before RateLimitedError.
+            store: Bucket store (default: this process only); pass
+                SharedBuckets to share buckets between processes.
+            clock: Monotonic time source.
+            sleep: Blocking sleep used by ``acquire``.
+
+        Raises:
+            ValueError: If a rate is not positive, a burst is below 1 or
+                ``max_wait`` is negative.
+
+        """
+        self._default = self._validated(rate, burst)
+        self.scope = c.Api.RateLimit.Scope(scope)
+        self._limits = {
+            key: self._validated(*limit) for key, limit in (limits or {}).items()
+        }
+        if max_wait < 0:
+            msg = "Rate limit max_wait must be >= 0"
+            raise ValueError(msg)
+        self.max_wait = max_wait
+        self.store = store or self.LocalBuckets()
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._counters: dict[str, int] = dict.fromkeys(self._COUNTERS, 0)
+
+    def key_of(self, url: str | httpx.URL) -> str:
+        """Bucket key of ``url``: its origin, plus the path in route scope."""
+        origin = FlextApiCircuitBreaker.origin_of(url)
+        if self.scope is self.Scope.ORIGIN:
+            return origin
+        return origin + (httpx.URL(url).path or "/")
+
+    def acquire(self, url: str | httpx.URL) -> float:
+        """Take a token for ``url``, sleeping until one is available.
+
+        Returns:
+            Seconds spent waiting.
+
+        Raises:
+            RateLimitedError: If the token is more than ``max_wait`` away.
+
+        """
+        key = self.key_of(url)
+        waited = 0.0
+        while (wait := self._take(key, waited)) > 0:
+            self._sleep(wait)
+            waited += wait
+        return waited
+
+    async def aacquire(self, url: str | httpx.URL) -> float:
+        """Async ``acquire``: awaits the token without blocking the loop."""
+        key = self.key_of(url)
+        waited = 0.0
+        while (wait := self._take(key, waited)) > 0:
+            await asyncio.sleep(wait)
+            waited += wait
+        return waited
+
+    def observe(self, url: str | httpx.URL, response: httpx.Response) -> None:
+        """Tighten ``url``'s bucket to the limits a response reports."""
+        retry_after = (
+            FlextApiRetryPolicy.parse_retry_after(response)
+            if response.status_code in c.Api.Retry.RETRY_AFTER_STATUS_CODES
+            else None
+        )
+        remaining, reset = self.parse_headers(response.headers)
+        if retry_after is not None:
+            remaining, reset = 0.0, retry_after
+        if remaining is None or reset is None:
+            return
+        key = self.key_of(url)
+        rate, burst = self._limits.get(key, self._default)
+        now = self._clock()
+
+        def tighten(bucket: FlextApiRateLimiter.Bucket) -> float:
+            self._refill(bucket, now, rate, burst)
+            if remaining < 1:
+                # One request may go the moment the window resets
+                bucket.tokens = 1.0
+                bucket.blocked_until = max(bucket.blocked_until, now + reset)
+                return 1.0
+            bucket.tokens = min(bucket.tokens, remaining)
+            bucket.capped_rate = (remaining - bucket.tokens) / reset if reset else 0.0
+            bucket.capped_until = now + reset
+            return 0.0
+
+        blocked = self.store.update(
+            key,
+            lambda: self.Bucket(burst, now),
+            tighten,
+        )
+        with self._lock:
+            self._counters["header_updates"] += 1
+            self._counters["blocked"] += int(blocked)
+
+    @staticmethod
+    def parse_headers(
+        headers: httpx.Headers,
+    ) -> tuple[float | None, float | None]:
+        """``(remaining, reset seconds)`` from rate-limit headers, if present.
+
+        The structured ``RateLimit`` header (``r=``/``t=`` or
+        ``remaining=``/``reset=``) wins over ``RateLimit-*``, which wins over
+        ``X-RateLimit-*``. Reset values above EPOCH_THRESHOLD are Unix times.
+        """
+        remaining: float | None = None
+        reset: float | None = None
+        structured = headers.get(c.Api.RateLimit.HEADER_RATELIMIT)
+        if structured is not None:
+            for name, value in _PARAMETER.findall(structured):
+                number = float(value)
+                if name.lower() in {"r", "remaining"}:
+                    remaining = number if remaining is None else min(remaining, number)
+                elif name.lower() in {"t", "reset"}:
+                    reset = number if reset is None else max(reset, number)
+        if remaining is None or reset is None:
+            for remaining_header, reset_header in zip(
+                c.Api.RateLimit.REMAINING_HEADERS,
+                c.Api.RateLimit.RESET_HEADERS,
+                strict=True,
+            ):
+                try:
+                    remaining = float(headers[remaining_header])
+                    reset = float(headers[reset_header])
+                    break
+                except (KeyError, ValueError):
+                    remaining = reset = None
+        if remaining is None or reset is None:
+            return None, None
+        if reset > c.Api.RateLimit.EPOCH_THRESHOLD:
+            reset -= time.time()
+        return max(0.0, remaining), max(0.0, reset)
+
+    def call(
+        self,
+        url: str | httpx.URL,
+        send: Callable[[], httpx.Response],
+    ) -> httpx.Response:
+        """Take a token, run ``send`` and learn from its response.
+
+        Raises:
+            RateLimitedError: If the token is more than ``max_wait`` away.
+
+        """
+        self.acquire(url)
+        response = send()
+        self.observe(url, response)
+        return response
+
+    async def acall(
+        self,
+        url: str | httpx.URL,
+        send: Callable[[], Awaitable[httpx.Response]],
+    ) -> httpx.Response:
+        """Async ``call``: awaits a token, then ``send``."""
+        await self.aacquire(url)
+        response = await send()
+        self.observe(url, response)
+        return response
+
+    def metrics(self) -> r[t.Api.MetricsDict]:
+        """Get token, wait and header adaptation counters."""
+        with self._lock:
+            metrics: t.Api.MetricsDict = dict(self._counters)
+        return r[t.Api.MetricsDict].ok(metrics)
+
+    def _take(self, key: str, waited: float) -> float:
+        """Take a token (0.0) or return the seconds until one is due."""
+        rate, burst = self._limits.get(key, self._default)
+        now = self._clock()
+
+        def take(bucket: FlextApiRateLimiter.Bucket) -> float:
+            self._refill(bucket, now, rate, burst)
+            if bucket.blocked_until > now:
+                return bucket.blocked_until - now
+            refill = self._rate_at(bucket, now, rate)
+            if bucket.tokens >= 1 - _EPSILON or math.isinf(refill):
+                bucket.tokens = max(bucket.tokens - 1, 0.0)
+                return 0.0
+            if refill <= 0:
+                # Header said the window is spent: wait for its reset
+                return bucket.capped_until - now
+            return (1 - bucket.tokens) / refill
+
+        wait = self.store.update(key, lambda: self.Bucket(burst, now), take)
+        with self._lock:
+            if wait == 0:
+                self._counters["acquired"] += 1
+                if waited:
+                    self._counters["waited"] += 1
+                    self._counters["wait_ms_total"] += round(waited * 1000)
+            elif waited + wait > self.max_wait:
+                self._counters["rejected"] += 1
+        if wait and waited + wait > self.max_wait:
+            raise self.RateLimitedError(key, wait)
+        return wait
+
+    @staticmethod
+    def _rate_at(bucket: FlextApiRateLimiter.Bucket, now: float, rate: float) -> float:
+        """Refill rate at ``now``: header cap while its window lasts."""
+        if bucket.capped_until > now:
+            return min(rate, bucket.capped_rate)
+        return rate
+
+    @classmethod
+    def _refill(
+        cls,
+        bucket: FlextApiRateLimiter.Bucket,
+        now: float,
+        rate: float,
+        burst: float,
+    ) -> None:
+        """Add the tokens earned since the last update."""
+        start = max(bucket.updated, bucket.blocked_until)
+        if bucket.capped_until > start:
+            # Capped part of the window, then the configured rate after it
+            capped_end = min(now, bucket.capped_until)
+            bucket.tokens += max(capped_end - start, 0.0) * min(
+                rate,
+                bucket.capped_rate,
+            )
+            start = max(start, capped_end)
+        if now > start:
+            earned = (now - start) * rate
+            bucket.tokens = burst if math.isinf(earned) else bucket.tokens + earned
+        bucket.tokens = min(bucket.tokens, burst)
+        bucket.updated = max(bucket.updated, now)
+
+    @staticmethod
+    def _validated(
+        rate: float | None,
+        burst: float | None,
+    ) -> tuple[float, float]:
+        """``(rate, burst)`` with defaults applied (infinite rate: no limit)."""
+        if (rate is not None and rate <= 0) or (burst is not None and burst < 1):
+            msg = "Rate limit rate must be > 0 and burst >= 1"
+            raise ValueError(msg)
+        refill = math.inf if rate is None else float(rate)
+        if burst is None:
+            burst = 1.0 if rate is None else max(1.0, rate)
+        return refill, float(burst)
+
+
+class _FileLock:
+    """Thread lock plus exclusive ``flock`` held for a ``with`` block."""
+
+    def __init__(self, lock: threading.Lock, fileno: int) -> None:
+        self._lock = lock
+        self._fileno = fileno
+
+    def __enter__(self) -> None:
+        self._lock.acquire()
+        if _fcntl is not None:
+            _fcntl.flock(self._fileno, _fcntl.LOCK_EX)
+
+    def __exit__(self, *_exc: object) -> None:
+        if _fcntl is not None:
+            _fcntl.flock(self._fileno, _fcntl.LOCK_UN)
+        self._lock.release()
+
+
+__all__ = ["FlextApiRateLimiter"]
@@ -0,0 +1,451 @@
+"""Retry policy with jittered backoff, Retry-After and a per-host retry budget.
+
+FlextApiRetryPolicy decides whether and when a failed HTTP attempt is
+retried. It is shared by FlextWebProtocolPlugin, FlextApiAsyncClient and,
+when given one, FlextApiClient, so all callers back off the same way and a
+per-host token bucket keeps retries a bounded share of traffic when a
+dependency fails.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from email.utils import parsedate_to_datetime
+
+import httpx
+from flext_core import r
+
+from flext_api.constants import c
+from flext_api.typings import t
+
+
+class FlextApiRetryPolicy:
+    """When and how long to wait before retrying an HTTP request.
+
+    A failure is retried when it is a transport error or a retryable status,
+    the method is idempotent (any method for 429 and for connect errors,
+    where the request never reached the server), attempts remain, the
+    overall deadline leaves time for the delay, and the host's retry budget
+    has a token. The delay is the response's Retry-After for 429/503, else
+    exponential backoff with full or decorrelated jitter.
+
+    Usage:
+        policy = FlextApiRetryPolicy(max_retries=3, deadline=10.0)
+        response = policy.execute("GET", url, lambda timeout: client.get(url))
+    """
+
+    class Budget:
+        """Per-host token bucket capping retries to a share of requests.
+
+        Every request deposits ``ratio`` tokens and every retry spends one,
+        so sustained retries stay below ``ratio`` of traffic; hosts also gain
+        ``min_per_second`` tokens per second so low-traffic hosts can retry.
+        """
+
+        def __init__(
+            self,
+            ratio: float = c.Api.Retry.BUDGET_RATIO,
+            *,
+            min_per_second: float = c.Api.Retry.BUDGET_MIN_PER_SECOND,
+            capacity: float = c.Api.Retry.BUDGET_CAPACITY,
+            clock: Callable[[], float] = time.monotonic,
+        ) -> None:
+            """Initialize the budget; every host starts with a full bucket.
+
+            Raises:
+                ValueError: If a rate is negative or ``capacity`` below 1.
+
+            """
+            if ratio < 0 or min_per_second < 0:
+                msg = "Retry budget ratio and min_per_second must be >= 0"
+                raise ValueError(msg)
+            if capacity < 1:
+                msg = "Retry budget capacity must be at least 1"
+                raise ValueError(msg)
+            self._ratio = ratio
+            self._min_per_second = min_per_second
+            self._capacity = capacity
+            self._clock = clock
+            self._lock = threading.Lock()
+            # host -> [tokens, last refill time]
+            self._buckets: dict[str, list[float]] = {}
+
+        def deposit(self, host: str) -> None:
+            """Credit one request to ``host``."""
+            with self._lock:
+                bucket = self._refill(host)
+                bucket[0] = min(self._capacity, bucket[0] + self._ratio)
+
+        def withdraw(self, host: str) -> bool:
+            """Spend a token for one retry to ``host``; False when exhausted."""
+            with self._lock:
+                bucket = self._refill(host)
+                if bucket[0] < 1:
+                    return False
+                bucket[0] -= 1
+                return True
+
+        def tokens(self, host: str) -> float:
+            """Retry tokens currently available to ``host``."""
+            with self._lock:
+                return self._refill(host)[0]
+
+        def _refill(self, host: str) -> list[float]:
+            now = self._clock()
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = [self._capacity, now]
+            elif now > bucket[1]:
+                elapsed = now - bucket[1]
+                bucket[0] = min(
+                    self._capacity,
+                    bucket[0] + elapsed * self._min_per_second,
+                )
+                bucket[1] = now
+            return bucket
+
+    class Attempts:
+        """Retry state of one logical request across its attempts."""
+
+        __slots__ = (
+            "_deadline_at",
+            "_delay",
+            "_policy",
+            "count",
+            "host",
+            "method",
+            "replayable",
+            "retries",
+        )
+
+        def __init__(
+            self,
+            policy: FlextApiRetryPolicy,
+            method: str,
+            host: str,
+            *,
+            replayable: bool,
+        ) -> None:
+            self._policy = policy
+            self.method = method.upper()
+            self.host = host
+            self.replayable = replayable
+            self.count = 0
+            self.retries = 0
+            self._delay = policy.backoff_factor
+            deadline = policy.deadline
+            self._deadline_at = None if deadline is None else policy.clock() + deadline
+
+        def remaining(self) -> float | None:
+            """Seconds left before the overall deadline (None: no deadline)."""
+            if self._deadline_at is None:
+                return None
+            return max(0.0, self._deadline_at - self._policy.clock())
+
+        def begin(self, timeout: float | None = None) -> float | None:
+            """Count an attempt; return ``timeout`` capped to the deadline."""
+            self.count += 1
+            self._policy.count("attempts")
+            remaining = self.remaining()
+            if remaining is None:
+                return timeout
+            return remaining if timeout is None else min(timeout, remaining)
+
+        def next_delay(
+            self,
+            response: httpx.Response | None = None,
+            error: BaseException | None = None,
+        ) -> float | None:
+            """Seconds to wait before retrying, or None to stop.
+
+            Pass the response of a completed attempt, or the exception of a
+            failed one. None is returned for successes and non-retryable
+            outcomes as well as when a limit stops a retryable failure.
+            """
+            policy = self._policy
+            status = None if response is None else response.status_code
+            if not policy.is_retryable_outcome(status, error):
+                return None
+            if not self.replayable:
+                policy.give_up("not_replayable")
+                return None
+            if not policy.is_retryable_method(self.method, status, error):
+                policy.give_up("not_idempotent")
+                return None
+            if self.retries >= policy.max_retries:
+                policy.give_up("retries_exhausted")
+                return None
+            retry_after = (
+                policy.retry_after(response)
+                if response is not None
+                and status in c.Api.Retry.RETRY_AFTER_STATUS_CODES
+                else None
+            )
+            if retry_after is not None and retry_after > policy.max_retry_after:
+                policy.give_up("retry_after_too_long")
+                return None
+            if retry_after is None:
+                self._delay = policy.backoff(self.retries, self._delay)
+                delay = self._delay
+            else:
+                delay = retry_after
+                policy.count("retry_after_honored")
+            remaining = self.remaining()
+            if remaining is not None and delay >= remaining:
+                policy.give_up("deadline_exceeded")
+                return None
+            budget = policy.budget
+            if budget is not None and not budget.withdraw(self.host):
+                policy.give_up("budget_exhausted")
+                return None
+            self.retries += 1
+            policy.count("retries")
+            policy.count("backoff_ms_total", round(delay * 1000))
+            return delay
+
+    _COUNTERS = (
+        "requests",
+        "attempts",
+        "retries",
+        "gave_up",
+        "retries_exhausted",
+        "not_idempotent",
+        "not_replayable",
+        "retry_after_honored",
+        "retry_after_too_long",
+        "deadline_exceeded",
+        "budget_exhausted",
+        "backoff_ms_total",
+    )
+
+    # The request was never sent, so retrying cannot duplicate side effects
+    _UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+    def __init__(
+        self,
+        *,
+        max_retries: int = c.Api.DEFAULT_MAX_RETRIES,
+        backoff_factor: float = c.Api.BACKOFF_FACTOR,
+        max_delay: float = c.Api.Retry.DEFAULT_MAX_DELAY,
+        jitter: c.Api.Retry.Jitter | str = c.Api.Retry.Jitter.FULL,
+        deadline: float | None = None,
+        retry_statuses: Iterable[int] = c.Api.HTTPRetry.RETRYABLE_STATUS_CODES,
+        retry_methods: Iterable[str] = c.Api.Retry.IDEMPOTENT_METHODS,
+        respect_retry_after: bool = True,
+        max_retry_after: float = c.Api.Retry.MAX_RETRY_AFTER,
+        budget: FlextApiRetryPolicy.Budget | None = None,
+        rng: random.Random | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the retry policy.
+
+        Args:
+            max_retries: Retries after the first attempt.
+            backoff_factor: Base delay in seconds; attempt ``n`` backs off
+                up to ``backoff_factor * 2**n``.
+            max_delay: Upper bound of a single backoff delay.
+            jitter: ``full`` (uniform in [0, backoff]), ``decorrelated``
+                (uniform in [base, 3 * previous delay]) or ``none``.
+            deadline: Seconds a request may take across all attempts and
+                delays; attempt timeouts are capped to what is left.
+            retry_statuses: Response statuses that are retried.
+            retry_methods: Methods retried after the request was sent.
+            respect_retry_after: Wait for Retry-After on 429 and 503.
+            max_retry_after: Give up instead of waiting longer than this.
+            budget: Per-host retry budget (None: unlimited).
+            rng: Random source for jitter, seedable in tests.
+            clock: Monotonic time source for the deadline.
+
+        Raises:
+            ValueError: If a count or delay is negative or ``jitter`` is
+                unknown.
+
+        """
+        if max_retries < 0 or min(backoff_factor, max_delay, max_retry_after) < 0:
+            msg = "max_retries and retry delays must be >= 0"
+            raise ValueError(msg)
+        if deadline is not None and deadline <= 0:
+            msg = "deadline must be > 0"
+            raise ValueError(msg)
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_delay = max_delay
+        self.jitter = c.Api.Retry.Jitter(jitter)
+        self.deadline = deadline
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_methods = frozenset(method.upper() for method in retry_methods)
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.budget = budget
+        self.clock = clock
+        self._rng = rng or random.Random()  # noqa: S311 - jitter, not crypto
+        self._lock = threading.Lock()
+        self._counters: dict[str, int] = dict.fromkeys(self._COUNTERS, 0)
+
+    def start(
+        self,
+        method: str,
+        url: str | httpx.URL,
+        *,
+        replayable: bool = True,
+    ) -> FlextApiRetryPolicy.Attempts:
+        """Begin tracking a request; deposits into the host's retry budget.
+
+        Args:
+            method: HTTP method of the request.
+            url: Request URL; its host selects the retry budget.
+            replayable: False when the body cannot be sent twice.
+
+        """
+        host = httpx.URL(url).host
+        self.count("requests")
+        if self.budget is not None:
+            self.budget.deposit(host)
+        return self.Attempts(self, method, host, replayable=replayable)
+
+    def execute(
+        self,
+        method: str,
+        url: str | httpx.URL,
+        send: Callable[[float | None], httpx.Response],
+        *,
+        timeout: float | None = None,
+        replayable: bool = True,
+    ) -> httpx.Response:
+        """Call ``send(attempt_timeout)`` until it succeeds or retries stop.
+
+        Returns the last response, which may be a retryable error status
+        once retries are exhausted; re-raises the last transport error.
+        Discarded responses are closed before waiting.
+        """
+        attempts = self.start(method, url, replayable=replayable)
+        while True:
+            try:
+                response = send(attempts.begin(timeout))
+            except httpx.TransportError as exc:
+                delay = attempts.next_delay(error=exc)
+                if delay is None:
+                    raise
+            else:
+                delay = attempts.next_delay(response)
+                if delay is None:
+                    return response
+                response.close()
+            time.sleep(delay)
+
+    async def aexecute(
+        self,
+        method: str,
+        url: str | httpx.URL,
+        send: Callable[[float | None], Awaitable[httpx.Response]],
+        *,
+        timeout: float | None = None,
+        replayable: bool = True,
+    ) -> httpx.Response:
+        """Async ``execute``: awaits ``send`` and backs off with asyncio.sleep."""
+        attempts = self.start(method, url, replayable=replayable)
+        while True:
+            try:
+                response = await send(attempts.begin(timeout))
+            except httpx.TransportError as exc:
+                delay = attempts.next_delay(error=exc)
+                if delay is None:
+                    raise
+            else:
+                delay = attempts.next_delay(response)
+                if delay is None:
+                    return response
+                await response.aclose()
+            await asyncio.sleep(delay)
+
+    def is_retryable_outcome(
+        self,
+        status: int | None,
+        error: BaseException | None,
+    ) -> bool:
+        """Whether an attempt failed in a way that retrying may fix."""
+        if error is not None:
+            return isinstance(error, httpx.TransportError)
+        return status in self.retry_statuses
+
+    def is_retryable_method(
+        self,
+        method: str,
+        status: int | None,
+        error: BaseException | None,
+    ) -> bool:
+        """Whether ``method`` may be repeated after this failure.
+
+        Non-idempotent requests are only retried when the server cannot have
+        acted on them: 429 rejects before processing and connect errors
+        never sent the request.
+        """
+        return (
+            method.upper() in self.retry_methods
+            or status == c.Api.HTTP_TOO_MANY_REQUESTS
+            or isinstance(error, self._UNSENT_ERRORS)
+        )
+
+    def backoff(self, retry: int, previous: float) -> float:
+        """Jittered delay before retry number ``retry + 1``."""
+        if self.jitter is c.Api.Retry.Jitter.DECORRELATED:
+            upper = max(self.backoff_factor, previous * 3)
+            return min(self.max_delay, self._rng.uniform(self.backoff_factor, upper))
+        ceiling = min(self.max_delay, self.backoff_factor * 2.0**retry)
+        if self.jitter is c.Api.Retry.Jitter.FULL:
+            return self._rng.uniform(0, ceiling)
+        return ceiling
+
+    def retry_after(self, response: httpx.Response | None) -> float | None:
+        """Seconds requested by a Retry-After header (delta or HTTP date)."""
+        if response is None or not self.respect_retry_after:
+            return None
+        return self.parse_retry_after(response)
+
+    @staticmethod
+    def parse_retry_after(response: httpx.Response) -> float | None:
+        """Seconds in ``response``'s Retry-After header, or None."""
+        value = response.headers.get(c.Api.HEADER_RETRY_AFTER)
+        if value is None:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            return None
+        return max(0.0, when.timestamp() - time.time())
+
+    def give_up(self, reason: str) -> None:
+        """Count a retryable failure that is not retried, and why."""
+        with self._lock:
+            self._counters["gave_up"] += 1
+            self._counters[reason] += 1
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Add ``amount`` to counter ``name``."""
+        with self._lock:
+            self._counters[name] += amount
+
+    def metrics(self) -> r[t.Api.MetricsDict]:
+        """Get request, attempt, retry and give-up counters.
+
+        ``gave_up`` totals the failures left unretried; the other give-up
+        counters break it down by reason.
+        """
+        with self._lock:
+            return r[t.Api.MetricsDict].ok(dict(self._counters))
+
+
+__all__ = ["FlextApiRetryPolicy"]
@@ -1,14 +1,45 @@
 """Serialization utilities for flext-api.
 
-Provides type-safe wrappers for untyped serialization libraries like msgpack.
+Provides type-safe wrappers for untyped serialization libraries like msgpack
+and cbor2, the pluggable JSON codec (orjson, msgspec or stdlib json, whichever
+is fastest and importable), JSON/MessagePack/CBOR content negotiation and the
+content-type driven decoder for HTTP response bodies.
 """
 
 from __future__ import annotations
 
-from collections.abc import Mapping, Sequence
+import importlib
+import json
+from collections.abc import Callable, Mapping, Sequence
+from types import ModuleType
+from typing import ClassVar
 
+import cbor2 as _cbor2
 import msgpack as _msgpack
-from flext_core.typings import t
+from flext_core import r
+
+from flext_api.constants import c
+from flext_api.typings import t
+
+
+def _optional_module(name: str) -> ModuleType | None:
+    """Import an optional codec backend, or None if it is not installed."""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+def _installed(module: ModuleType | None, name: str) -> ModuleType:
+    """Return an optional backend, which codecs only use when it was found."""
+    if module is None:
+        msg = f"JSON backend {name!r} is not installed"
+        raise RuntimeError(msg)
+    return module
+
+
+_orjson = _optional_module(c.Api.JsonCodec.ORJSON)
+_msgspec = _optional_module(c.Api.JsonCodec.MSGSPEC)
 
 
 class FlextApiSerializers:
@@ -64,3 +95,511 @@ class FlextApiSerializers:
                 return None
             # Return the raw result; caller must narrow to GeneralValueType if needed
             return unpackb_fn(data)
+
+    class Cbor:
+        """Type-safe wrappers for the cbor2 library."""
+
+        @staticmethod
+        def dumps(obj: object) -> bytes:
+            """Encode ``obj`` as CBOR (RFC 8949).
+
+            Raises:
+                TypeError: If a value cannot be encoded.
+
+            """
+            try:
+                return _cbor2.dumps(obj)
+            except _cbor2.CBOREncodeError as e:
+                raise TypeError(str(e)) from e
+
+        @staticmethod
+        def loads(data: bytes) -> t.GeneralValueType:
+            """Decode CBOR bytes.
+
+            Raises:
+                ValueError: If ``data`` is not valid CBOR.
+
+            """
+            try:
+                decoded: t.GeneralValueType = _cbor2.loads(data)
+            except _cbor2.CBORDecodeError as e:
+                raise ValueError(str(e)) from e
+            return decoded
+
+    class Json:
+        """Pluggable JSON codec using the fastest available backend.
+
+        Backends are tried in ``c.Api.JsonCodec.PREFERENCE`` order (orjson,
+        msgspec, stdlib json). Encoding always produces compact UTF-8 bytes
+        (two-space indent on request); values a fast backend cannot encode,
+        such as integers beyond 64 bits, are retried with stdlib json. Decode
+        errors are raised as ``ValueError`` whatever the backend.
+
+        Usage:
+            payload = FlextApiSerializers.Json.dumps({"id": 1})
+            data = FlextApiSerializers.Json.loads(payload)
+        """
+
+        type Default = Callable[[object], object]
+        type Encoder = Callable[[object, Default | None, bool], bytes]
+        type Decoder = Callable[[bytes | str], t.JsonValue]
+
+        @classmethod
+        def available_backends(cls) -> tuple[str, ...]:
+            """Importable backends, fastest first."""
+            return tuple(
+                name for name in c.Api.JsonCodec.PREFERENCE if name in cls._backends
+            )
+
+        @classmethod
+        def use(cls, backend: str | None = None) -> r[str]:
+            """Select a backend by name, or the fastest importable one if None.
+
+            Returns:
+                r[str]: Name of the selected backend.
+
+            """
+            if backend is None:
+                backend = cls.available_backends()[0]
+            if backend not in cls._backends:
+                return r[str].fail(
+                    f"JSON backend {backend!r} is not available; "
+                    f"installed: {', '.join(cls.available_backends())}",
+                )
+            cls.backend = backend
+            return r[str].ok(backend)
+
+        @classmethod
+        def dumps(
+            cls,
+            obj: object,
+            *,
+            default: Default | None = None,
+            indent: bool = False,
+        ) -> bytes:
+            """Encode ``obj`` as UTF-8 JSON bytes.
+
+            Args:
+                obj: Value to encode.
+                default: Converts otherwise unsupported objects.
+                indent: Pretty-print with a two-space indent.
+
+            Raises:
+                TypeError: If a value cannot be encoded.
+
+            """
+            encode = cls._backends[cls.backend][0]
+            try:
+                return encode(obj, default, indent)
+            except TypeError:
+                if cls.backend == c.Api.JsonCodec.STDLIB:
+                    raise
+                return cls._stdlib_dumps(obj, default, indent)
+
+        @classmethod
+        def dumps_str(
+            cls,
+            obj: object,
+            *,
+            default: Default | None = None,
+            indent: bool = False,
+        ) -> str:
+            """Encode ``obj`` as a JSON string (see dumps)."""
+            return cls.dumps(obj, default=default, indent=indent).decode("utf-8")
+
+        @classmethod
+        def loads(
+            cls,
+            data: bytes | bytearray | memoryview | str,
+        ) -> t.JsonValue:
+            """Decode JSON from bytes or str.
+
+            Raises:
+                ValueError: If ``data`` is not valid JSON.
+
+            """
+            if not isinstance(data, (bytes, str)):
+                data = bytes(data)
+            return cls._backends[cls.backend][1](data)
+
+        @staticmethod
+        def _stdlib_dumps(
+            obj: object,
+            default: Default | None,
+            indent: bool,
+        ) -> bytes:
+            return json.dumps(
+                obj,
+                default=default,
+                ensure_ascii=False,
+                indent=2 if indent else None,
+                separators=None if indent else (",", ":"),
+            ).encode("utf-8")
+
+        @staticmethod
+        def _stdlib_loads(data: bytes | str) -> t.JsonValue:
+            decoded: t.JsonValue = json.loads(data)
+            return decoded
+
+        @staticmethod
+        def _orjson_dumps(
+            obj: object,
+            default: Default | None,
+            indent: bool,
+        ) -> bytes:
+            orjson = _installed(_orjson, c.Api.JsonCodec.ORJSON)
+            option = orjson.OPT_NON_STR_KEYS
+            if indent:
+                option |= orjson.OPT_INDENT_2
+            encoded: bytes = orjson.dumps(obj, default=default, option=option)
+            return encoded
+
+        @staticmethod
+        def _orjson_loads(data: bytes | str) -> t.JsonValue:
+            orjson = _installed(_orjson, c.Api.JsonCodec.ORJSON)
+            decoded: t.JsonValue = orjson.loads(data)
+            return decoded
+
+        @staticmethod
+        def _msgspec_dumps(
+            obj: object,
+            default: Default | None,
+            indent: bool,
+        ) -> bytes:
+            msgspec = _installed(_msgspec, c.Api.JsonCodec.MSGSPEC)
+            encoded: bytes = msgspec.json.encode(obj, enc_hook=default)
+            if indent:
+                encoded = msgspec.json.format(encoded, indent=2)
+            return encoded
+
+        @staticmethod
+        def _msgspec_loads(data: bytes | str) -> t.JsonValue:
+            msgspec = _installed(_msgspec, c.Api.JsonCodec.MSGSPEC)
+            try:
+                decoded: t.JsonValue = msgspec.json.decode(data)
+            except msgspec.DecodeError as e:
+                raise ValueError(str(e)) from e
+            return decoded
+
+        _backends: ClassVar[dict[str, tuple[Encoder, Decoder]]] = {
+            c.Api.JsonCodec.STDLIB: (_stdlib_dumps, _stdlib_loads),
+        }
+        if _msgspec is not None:
+            _backends[c.Api.JsonCodec.MSGSPEC] = (_msgspec_dumps, _msgspec_loads)
+        if _orjson is not None:
+            _backends[c.Api.JsonCodec.ORJSON] = (_orjson_dumps, _orjson_loads)
+
+        backend: ClassVar[str] = min(_backends, key=c.Api.JsonCodec.PREFERENCE.index)
+        """Name of the backend used by dumps/loads; change it with use()."""
+
+    class ContentNegotiation:
+        """JSON, MessagePack and CBOR bodies selected by Content-Type/Accept.
+
+        Media types are canonicalized (``application/x-msgpack`` is treated as
+        ``application/msgpack``) and JSON is the fallback whenever a peer does
+        not ask for a supported binary format.
+
+        Usage:
+            media_type = FlextApiSerializers.ContentNegotiation.negotiate(accept)
+            body = FlextApiSerializers.ContentNegotiation.encode(data, media_type)
+        """
+
+        type Encoder = Callable[[object], bytes]
+        type Decoder = Callable[[bytes], t.GeneralValueType]
+
+        @classmethod
+        def canonical_media_type(cls, content_type: str) -> str:
+            """Media type of a Content-Type value without parameters or aliases."""
+            media_type, _ = FlextApiSerializers.BodyDecoder.parse_media_type(
+                content_type,
+            )
+            return c.Api.ContentNegotiation.MEDIA_TYPE_ALIASES.get(
+                media_type,
+                media_type,
+            )
+
+        @classmethod
+        def supports(cls, content_type: str) -> bool:
+            """Whether bodies of this content type can be encoded and decoded."""
+            return cls.canonical_media_type(content_type) in cls._codecs
+
+        @staticmethod
+        def media_type_for(serialization_format: str) -> r[str]:
+            """Canonical media type of a format name (``json``/``msgpack``/``cbor``)."""
+            media_type = c.Api.ContentNegotiation.FORMAT_MEDIA_TYPES.get(
+                serialization_format,
+            )
+            if media_type is None:
+                return r[str].fail(
+                    f"Unsupported serialization format: {serialization_format}",
+                )
+            return r[str].ok(media_type)
+
+        @staticmethod
+        def accept_header(media_type: str) -> str:
+            """Accept value preferring ``media_type`` with JSON as fallback."""
+            if media_type == c.Api.ContentType.JSON:
+                return media_type
+            quality = c.Api.ContentNegotiation.FALLBACK_QUALITY
+            return f"{media_type}, {c.Api.ContentType.JSON};q={quality}"
+
+        @classmethod
+        def negotiate(cls, accept: str | None) -> str:
+            """Pick the supported media type an Accept header ranks highest.
+
+            Ties keep the Accept order; wildcards, a missing header or one
+            naming no supported type resolve to JSON.
+            """
+            best = c.Api.ContentType.JSON.value
+            best_quality = 0.0
+            for entry in (accept or "").split(","):
+                media_type, _, params = entry.partition(";")
+                media_type = cls.canonical_media_type(media_type)
+                if media_type not in cls._codecs:
+                    continue
+                quality = 1.0
+                for param in params.split(";"):
+                    key, _, value = param.partition("=")
+                    if key.strip().lower() == "q":
+                        try:
+                            quality = float(value)
+                        except ValueError:
+                            quality = 0.0
+                if quality > best_quality:
+                    best, best_quality = media_type, quality
+            return best
+
+        @classmethod
+        def encode(cls, data: object, content_type: str) -> bytes:
+            """Encode ``data`` in the format of ``content_type``.
+
+            Raises:
+                ValueError: If the content type is not supported.
+                TypeError: If a value cannot be encoded in that format.
+
+            """
+            return cls._codec(content_type)[0](data)
+
+        @classmethod
+        def decode(cls, content: bytes, content_type: str) -> t.GeneralValueType:
+            """Decode ``content`` in the format of ``content_type``.
+
+            Raises:
+                ValueError: If the content type is not supported or the
+                    content is malformed.
+
+            """
+            return cls._codec(content_type)[1](content)
+
+        @classmethod
+        def _codec(cls, content_type: str) -> tuple[Encoder, Decoder]:
+            codec = cls._codecs.get(cls.canonical_media_type(content_type))
+            if codec is None:
+                msg = f"Unsupported content type for negotiation: {content_type}"
+                raise ValueError(msg)
+            return codec
+
+        @staticmethod
+        def _msgpack_dumps(obj: object) -> bytes:
+            return _msgpack.packb(obj)
+
+        @staticmethod
+        def _msgpack_loads(data: bytes) -> t.GeneralValueType:
+            # ExtraData, FormatError and truncated input are ValueErrors
+            try:
+                return _msgpack.unpackb(data)
+            except (_msgpack.UnpackException, ValueError) as e:
+                raise ValueError(str(e) or "invalid MessagePack data") from e
+
+        @staticmethod
+        def _json_dumps(obj: object) -> bytes:
+            return FlextApiSerializers.Json.dumps(obj)
+
+        @staticmethod
+        def _json_loads(data: bytes) -> t.GeneralValueType:
+            return FlextApiSerializers.Json.loads(data)
+
+        @staticmethod
+        def _cbor_dumps(obj: object) -> bytes:
+            return FlextApiSerializers.Cbor.dumps(obj)
+
+        @staticmethod
+        def _cbor_loads(data: bytes) -> t.GeneralValueType:
+            return FlextApiSerializers.Cbor.loads(data)
+
+        _codecs: ClassVar[dict[str, tuple[Encoder, Decoder]]] = {
+            c.Api.ContentType.JSON: (_json_dumps, _json_loads),
+            c.Api.ContentType.MSGPACK: (_msgpack_dumps, _msgpack_loads),
+            c.Api.ContentType.CBOR: (_cbor_dumps, _cbor_loads),
+        }
+
+    class BodyDecoder:
+        """Single-pass HTTP body decoding dispatched on the parsed media type.
+
+        The media type picks exactly one decoder: exact match, then structured
+        suffix (``+json``), then top-level type (``text/*``). Bodies without a
+        content type, or with an unknown one, are sniffed once. Only a JSON
+        body that fails to parse falls back, once, to text.
+        """
+
+        type Decoder = Callable[[bytes, str], t.Api.ResponseBody]
+        """Decoder signature: ``(content, charset) -> body``; raises ValueError."""
+
+        _media_types: ClassVar[dict[str, str]] = dict(
+            c.Api.BodyDecoding.MEDIA_TYPES,
+        )
+
+        @classmethod
+        def register(
+            cls,
+            name: str,
+            decoder: FlextApiSerializers.BodyDecoder.Decoder,
+            media_types: Sequence[str] = (),
+        ) -> None:
+            """Register a named decoder and map media types to it.
+
+            Args:
+                name: Decoder name, e.g. ``"msgpack"``.
+                decoder: Callable turning ``(content, charset)`` into a body.
+                media_types: Exact media types dispatched to this decoder.
+
+            """
+            cls._decoders[name] = decoder
+            for media_type in media_types:
+                cls._media_types[media_type.lower()] = name
+
+        @staticmethod
+        def parse_media_type(content_type: str) -> tuple[str, str | None]:
+            """Split a Content-Type value into (media type, charset or None)."""
+            media_type, _, params = content_type.partition(";")
+            charset: str | None = None
+            for param in params.split(";"):
+                key, _, value = param.partition("=")
+                if key.strip().lower() == "charset":
+                    charset = value.strip().strip('"') or None
+            return media_type.strip().lower(), charset
+
+        @classmethod
+        def decoder_name(cls, media_type: str) -> str | None:
+            """Resolve the decoder name for a media type (None: sniff the body)."""
+            if not media_type:
+                return None
+            name = cls._media_types.get(media_type)
+            if name is not None:
+                return name
+            _, plus, suffix = media_type.rpartition("+")
+            if plus:
+                name = c.Api.BodyDecoding.SUFFIXES.get(f"+{suffix}")
+                if name is not None:
+                    return name
+            top_level = media_type.partition("/")[0]
+            return c.Api.BodyDecoding.TOP_LEVEL_TYPES.get(top_level)
+
+        @classmethod
+        def decode(
+            cls,
+            content: bytes,
+            content_type: str = "",
+        ) -> r[t.Api.ResponseBody]:
+            """Decode a body once with the decoder selected by its content type."""
+            media_type, charset = cls.parse_media_type(content_type)
+            if not content:
+                binary = cls.decoder_name(media_type) == c.Api.BodyDecoding.BINARY
+                return r[t.Api.ResponseBody].ok(b"" if binary else "")
+            name = cls.decoder_name(media_type) or cls._sniff(content)
+            charset = charset or c.Api.BodyDecoding.DEFAULT_CHARSET
+            try:
+                return r[t.Api.ResponseBody].ok(cls._decoders[name](content, charset))
+            except KeyError:
+                return r[t.Api.ResponseBody].fail(f"No body decoder named {name!r}")
+            except (ValueError, TypeError) as e:
+                if name == c.Api.BodyDecoding.JSON:
+                    # Mislabelled payload: fall back to text once
+                    return r[t.Api.ResponseBody].ok(cls.decode_text(content, charset))
+                return r[t.Api.ResponseBody].fail(
+                    f"Failed to decode {media_type or 'response'} body: {e}",
+                )
+
+        @staticmethod
+        def _sniff(content: bytes) -> str:
+            """Pick a decoder for an untyped body from its first bytes."""
+            head = content[:64].lstrip()
+            if head and head[0] in c.Api.BodyDecoding.JSON_START_BYTES:
+                return c.Api.BodyDecoding.JSON
+            try:
+                content.decode(c.Api.BodyDecoding.DEFAULT_CHARSET)
+            except UnicodeDecodeError:
+                return c.Api.BodyDecoding.BINARY
+            return c.Api.BodyDecoding.TEXT
+
+        @staticmethod
+        def _decode_json(content: bytes, _charset: str) -> t.Api.ResponseBody:
+            """Parse JSON; non-object values are wrapped as ``{"value": ...}``."""
+            return FlextApiSerializers.BodyDecoder._wrap(
+                FlextApiSerializers.Json.loads(content),
+            )
+
+        @staticmethod
+        def _decode_msgpack(content: bytes, _charset: str) -> t.Api.ResponseBody:
+            """Parse MessagePack; non-object values are wrapped as ``{"value": ...}``."""
+            return FlextApiSerializers.BodyDecoder._wrap(
+                FlextApiSerializers.ContentNegotiation.decode(
+                    content,
+                    c.Api.ContentType.MSGPACK,
+                ),
+            )
+
+        @staticmethod
+        def _decode_cbor(content: bytes, _charset: str) -> t.Api.ResponseBody:
+            """Parse CBOR; non-object values are wrapped as ``{"value": ...}``."""
+            return FlextApiSerializers.BodyDecoder._wrap(
+                FlextApiSerializers.Cbor.loads(content),
+            )
+
+        @staticmethod
+        def _wrap(data: t.GeneralValueType) -> t.Api.ResponseBody:
+            """Objects and strings as-is; other values as ``{"value": ...}``.
+
+            Top-level values with no JSON form, such as tagged CBOR
+            datetimes, are converted to strings.
+            """
+            if isinstance(data, str):
+                return data
+            items = data.items() if isinstance(data, dict) else (("value", data),)
+            body: t.JsonObject = {}
+            for key, value in items:
+                if value is None or isinstance(
+                    value,
+                    (str, int, float, bool, Sequence, Mapping),
+                ):
+                    body[key] = value
+                else:
+                    body[key] = str(value)
+            return body
+
+        @staticmethod
+        def decode_text(content: bytes, charset: str | None = None) -> str:
+            """Decode text with the given charset (default UTF-8), never failing."""
+            charset = charset or c.Api.BodyDecoding.DEFAULT_CHARSET
+            try:
+                return content.decode(charset, errors="replace")
+            except LookupError:
+                return content.decode(
+                    c.Api.BodyDecoding.DEFAULT_CHARSET,
+                    errors="replace",
+                )
+
+        @staticmethod
+        def _decode_binary(content: bytes, _charset: str) -> bytes:
+            return content
+
+        _decoders: ClassVar[dict[str, FlextApiSerializers.BodyDecoder.Decoder]] = {
+            c.Api.BodyDecoding.JSON: _decode_json,
+            c.Api.BodyDecoding.TEXT: decode_text,
+            c.Api.BodyDecoding.BINARY: _decode_binary,
+            c.Api.BodyDecoding.MSGPACK: _decode_msgpack,
+            c.Api.BodyDecoding.CBOR: _decode_cbor,
+        }
+
+
+__all__ = ["FlextApiSerializers"]
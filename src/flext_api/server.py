@@ -31,6 +31,7 @@ from flext_core import (
     x,
 )
 
+from flext_api.app import FlextApiNegotiatedResponse, FlextApiNegotiatingRoute
 from flext_api.constants import c
 from flext_api.protocols import p
 from flext_api.typings import t
@@ -253,7 +254,9 @@ class FlextApiServer(FlextService[object], x.Validation):
                     docs_url="/docs",
                     redoc_url="/redoc",
                     openapi_url="/openapi.json",
+                    default_response_class=FlextApiNegotiatedResponse,
                 )
+                app.router.route_class = FlextApiNegotiatingRoute
                 return r[FastAPI].ok(app)
             except Exception as e:
                 return r[FastAPI].fail(f"Failed to create app: {e}")
@@ -10,13 +10,13 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
-import json
-
 from flext_core import FlextSettings
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from flext_api.compression import FlextApiCompression
 from flext_api.constants import c
+from flext_api.serializers import FlextApiSerializers
 
 
 @FlextSettings.auto_register("api")
@@ -49,6 +49,11 @@ class FlextApiSettings(BaseSettings):
         description="HTTP request timeout (seconds)",
     )
 
+    retry_enabled: bool = Field(
+        default=False,
+        description="Retry failed requests with the retry_* policy in both clients",
+    )
+
     max_retries: int = Field(
         default=c.Api.DEFAULT_MAX_RETRIES,
         ge=int(c.Api.VALIDATION_LIMITS["MIN_RETRIES"]),
@@ -56,11 +61,252 @@ class FlextApiSettings(BaseSettings):
         description="Maximum retry attempts",
     )
 
+    retry_backoff_factor: float = Field(
+        default=c.Api.BACKOFF_FACTOR,
+        ge=0,
+        description="Base retry delay (seconds), doubled per attempt",
+    )
+
+    retry_max_delay: float = Field(
+        default=c.Api.Retry.DEFAULT_MAX_DELAY,
+        ge=0,
+        description="Upper bound of a single retry delay (seconds)",
+    )
+
+    retry_jitter: c.Api.Retry.Jitter = Field(
+        default=c.Api.Retry.Jitter.FULL,
+        description="Backoff jitter: full, decorrelated or none",
+    )
+
+    retry_deadline: float | None = Field(
+        default=None,
+        gt=0,
+        description="Overall seconds for a request across all retries",
+    )
+
+    retry_budget_ratio: float | None = Field(
+        default=c.Api.Retry.BUDGET_RATIO,
+        ge=0,
+        description="Per-host retries as a fraction of requests (None: no budget)",
+    )
+
     headers: dict[str, str] = Field(
         default_factory=dict,
         description="Default HTTP headers",
     )
 
+    max_connections: int = Field(
+        default=c.Api.HTTPClient.DEFAULT_MAX_CONNECTIONS,
+        ge=1,
+        description="Maximum concurrent connections in the client pool",
+    )
+
+    max_keepalive_connections: int = Field(
+        default=c.Api.HTTPClient.DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        ge=0,
+        description="Maximum idle keep-alive connections kept in the pool",
+    )
+
+    keepalive_expiry: float = Field(
+        default=c.Api.HTTPClient.DEFAULT_KEEPALIVE_EXPIRY,
+        ge=0.0,
+        le=c.Api.HTTPClient.MAX_KEEPALIVE_EXPIRY,
+        description="Seconds before an idle keep-alive connection is closed",
+    )
+
+    cache_enabled: bool = Field(
+        default=False,
+        description="Enable the RFC 9111 HTTP response cache in the client",
+    )
+
+    cache_shared: bool = Field(
+        default=False,
+        description="Treat the response cache as shared (skip private responses)",
+    )
+
+    coalesce_requests: bool = Field(
+        default=False,
+        description="Share one upstream call among identical in-flight GET/HEAD",
+    )
+
+    lazy_response_body: bool = Field(
+        default=False,
+        description="Keep response bodies as raw bytes until .json_body()/.text()",
+    )
+
+    compression_enabled: bool = Field(
+        default=False,
+        description="Compress request bodies and negotiate response encodings",
+    )
+
+    compression_encoding: str = Field(
+        default=c.Api.Compression.GZIP,
+        description="Content-Encoding for request bodies (gzip, br or zstd)",
+    )
+
+    compression_min_size: int = Field(
+        default=c.Api.Compression.DEFAULT_MIN_SIZE,
+        ge=0,
+        description="Smallest request body (bytes) that is compressed",
+    )
+
+    compression_level: int | None = Field(
+        default=None,
+        description="Compression level (None: per-encoding default)",
+    )
+
+    accept_encoding: list[str] = Field(
+        default_factory=lambda: list(c.Api.Compression.PREFERENCE),
+        description="Accepted response encodings, most preferred first",
+    )
+
+    dns_cache_enabled: bool = Field(
+        default=False,
+        description="Cache DNS and race IPv6/IPv4 on new sync client connections",
+    )
+
+    dns_cache_ttl: float = Field(
+        default=c.Api.Dns.DEFAULT_TTL,
+        ge=0,
+        description="Seconds to cache DNS answers that carry no TTL",
+    )
+
+    dns_negative_ttl: float = Field(
+        default=c.Api.Dns.DEFAULT_NEGATIVE_TTL,
+        ge=0,
+        description="Seconds to cache failed DNS lookups",
+    )
+
+    circuit_breaker_enabled: bool = Field(
+        default=False,
+        description="Fail fast to origins whose circuit breaker is open",
+    )
+
+    circuit_failure_rate: float = Field(
+        default=c.Api.CircuitBreaker.FAILURE_RATE_THRESHOLD,
+        gt=0,
+        le=1,
+        description="Failed share of recent calls that opens an origin's circuit",
+    )
+
+    circuit_slow_call_duration: float = Field(
+        default=c.Api.CircuitBreaker.SLOW_CALL_DURATION,
+        gt=0,
+        description="Seconds after which a call counts as slow",
+    )
+
+    circuit_open_duration: float = Field(
+        default=c.Api.CircuitBreaker.OPEN_DURATION,
+        gt=0,
+        description="Seconds an open circuit rejects calls before probing",
+    )
+
+    hedging_enabled: bool = Field(
+        default=False,
+        description="Race a duplicate of slow idempotent requests",
+    )
+
+    hedge_delay: float | None = Field(
+        default=None,
+        ge=0,
+        description="Seconds before hedging; None uses each endpoint's observed p95",
+    )
+
+    hedge_budget_ratio: float | None = Field(
+        default=c.Api.Hedging.BUDGET_RATIO,
+        ge=0,
+        description="Hedges allowed per host as a share of requests (None: unlimited)",
+    )
+
+    adaptive_concurrency_enabled: bool = Field(
+        default=False,
+        description="Adapt each origin's in-flight request limit to its load",
+    )
+
+    concurrency_algorithm: c.Api.Concurrency.Algorithm = Field(
+        default=c.Api.Concurrency.Algorithm.AIMD,
+        description="Limit algorithm: aimd (drop-driven) or vegas (latency-driven)",
+    )
+
+    concurrency_initial_limit: int = Field(
+        default=c.Api.Concurrency.INITIAL_LIMIT,
+        ge=1,
+        description="In-flight requests allowed per origin before any feedback",
+    )
+
+    concurrency_max_limit: int = Field(
+        default=c.Api.Concurrency.MAX_LIMIT,
+        ge=1,
+        description="Highest in-flight limit an origin can grow to",
+    )
+
+    concurrency_queue_timeout: float = Field(
+        default=c.Api.Concurrency.QUEUE_TIMEOUT,
+        ge=0,
+        description="Seconds to wait for an in-flight slot; 0 rejects at once",
+    )
+
+    rate_limit_enabled: bool = Field(
+        default=False,
+        description="Pace requests with token buckets that follow rate-limit headers",
+    )
+
+    rate_limit_rate: float | None = Field(
+        default=None,
+        gt=0,
+        description="Requests per second per bucket (None: only header-driven)",
+    )
+
+    rate_limit_burst: float | None = Field(
+        default=None,
+        ge=1,
+        description="Bucket capacity (None: one second of rate_limit_rate)",
+    )
+
+    rate_limit_scope: c.Api.RateLimit.Scope = Field(
+        default=c.Api.RateLimit.Scope.ORIGIN,
+        description="One token bucket per origin or per route (origin + path)",
+    )
+
+    rate_limit_max_wait: float = Field(
+        default=c.Api.RateLimit.DEFAULT_MAX_WAIT,
+        ge=0,
+        description="Seconds a request may wait for a token before failing",
+    )
+
+    rate_limit_shared_memory: str | None = Field(
+        default=None,
+        min_length=1,
+        description="Shared-memory segment name to share buckets across processes",
+    )
+
+    serialization_format: c.Api.HttpSerializationFormat = Field(
+        default=c.Api.HttpSerializationFormat.JSON,
+        description="Wire format of dict request bodies, preferred in Accept",
+    )
+
+    @field_validator("compression_encoding")
+    @classmethod
+    def validate_compression_encoding(cls, v: str) -> str:
+        """Validate request bodies can be compressed with this encoding."""
+        if v not in FlextApiCompression.available_encodings():
+            available = ", ".join(FlextApiCompression.available_encodings())
+            msg = f"Compression {v!r} is not available; installed: {available}"
+            raise ValueError(msg)
+        return v
+
+    @field_validator("serialization_format")
+    @classmethod
+    def validate_serialization_format(
+        cls,
+        v: c.Api.HttpSerializationFormat,
+    ) -> c.Api.HttpSerializationFormat:
+        """Validate the format has a negotiable media type."""
+        media_type = FlextApiSerializers.ContentNegotiation.media_type_for(v)
+        if media_type.is_failure:
+            raise ValueError(media_type.error)
+        return v
+
     @field_validator("headers", mode="before")
     @classmethod
     def validate_headers(cls, v: dict[str, str]) -> dict[str, str]:
@@ -77,21 +323,23 @@ class FlextApiSettings(BaseSettings):
 
     @property
     def default_headers(self) -> dict[str, str]:
-        """Default headers with MIME type from Constants."""
+        """Default headers with the MIME type of the serialization format."""
+        negotiation = FlextApiSerializers.ContentNegotiation
+        media_type = negotiation.media_type_for(self.serialization_format).value
         return {
-            c.Api.HEADER_ACCEPT: c.Api.ContentType.JSON,
-            c.Api.HEADER_CONTENT_TYPE: c.Api.ContentType.JSON,
+            c.Api.HEADER_ACCEPT: negotiation.accept_header(media_type),
+            c.Api.HEADER_CONTENT_TYPE: media_type,
             **self.headers,
         }
 
     def to_json(self) -> str:
         """Convert to JSON."""
-        return json.dumps(self.model_dump(), indent=2)
+        return FlextApiSerializers.Json.dumps_str(self.model_dump(), indent=True)
 
     @classmethod
     def from_json(cls, data: str) -> FlextApiSettings:
         """Create from JSON."""
-        return cls.model_validate(json.loads(data))
+        return cls.model_validate(FlextApiSerializers.Json.loads(data))
 
 
 __all__ = ["FlextApiSettings"]
@@ -11,12 +11,12 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
-import json
 from collections.abc import Mapping
 
 from flext_core import r
 
 from flext_api.models import FlextApiModels
+from flext_api.serializers import FlextApiSerializers
 from flext_api.typings import t
 
 
@@ -180,7 +180,7 @@ class FlextApiSettingsManager:
             return r[dict[str, str]].ok(headers_dict)
         if isinstance(headers_value, str):
             try:
-                parsed_headers = json.loads(headers_value)
+                parsed_headers = FlextApiSerializers.Json.loads(headers_value)
                 if isinstance(parsed_headers, dict):
                     # Type narrowing: convert dict values to str
                     headers_dict = {
@@ -191,7 +191,7 @@ class FlextApiSettingsManager:
                 return r.fail(
                     f"Parsed headers must be dict, got: {type(parsed_headers)}",
                 )
-            except (json.JSONDecodeError, TypeError) as e:
+            except (ValueError, TypeError) as e:
                 return r.fail(f"Failed to parse headers JSON: {e}")
         else:
             return r.fail(
@@ -2,12 +2,14 @@
 
 Delegates to:
 - pydantic: data validation and serialization
-- json: JSON handling
+- FlextApiSerializers.Json: JSON handling (orjson when available)
 - flext-core: patterns and utilities
 
 Flexible features:
 - Batch operations
-- TTL/expiration management
+- TTL/expiration management (expiry heap, lazy per-key checks, incremental sweeps)
+- Bounded capacity with LRU, LFU or W-TinyLFU eviction
+- Per-entry size accounting with an optional memory limit
 - Metrics and statistics
 - Health monitoring
 - Event emission
@@ -20,14 +22,19 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
-import json
+import heapq
+import sys
 import time
+from collections.abc import Callable
 from typing import Self
 
 from flext_core import FlextLogger, r, u
 from pydantic import BaseModel, ConfigDict
 
+from flext_api.constants import c
+from flext_api.eviction import FlextApiEviction
 from flext_api.models import FlextApiModels
+from flext_api.serializers import FlextApiSerializers
 from flext_api.typings import t
 
 
@@ -36,12 +43,14 @@ class FlextApiStorage:
 
     Delegates to:
     - pydantic for data models and validation
-    - json for serialization
+    - FlextApiSerializers.Json for serialization
     - flext-core utilities for timestamps
     - Python built-ins for core storage
 
     Flexible features:
     - TTL-based expiration
+    - ``max_size`` and ``max_memory_bytes`` enforced by the
+      ``eviction_policy`` (lru, lfu, tinylfu)
     - Batch operations
     - Metrics collection
     - Health monitoring
@@ -52,12 +61,39 @@ class FlextApiStorage:
     model_config = ConfigDict(frozen=False, arbitrary_types_allowed=True)
 
     # Type annotations for dynamically-set fields
-    _storage: dict[str, t.JsonValue]
-    _expiry_times: dict[str, float]
-    _stats: FlextApiModels.Storage.Stats
-    _operations_count: int
+    _storage: dict[str, FlextApiStorage.Entry]
+    _expiry_heap: list[tuple[float, str]]
+    _clock: Callable[[], float]
+    _eviction: FlextApiEviction.Policy | None
+    _counters: FlextApiStorage.Counters
+    _memory_bytes: int
+    _size_histogram: list[int]
     _created_at: str
 
+    class Counters:
+        """Operation counters updated in place on every call."""
+
+        __slots__ = ("evictions", "hits", "misses", "operations")
+
+        def __init__(self) -> None:
+            self.operations = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    class Entry:
+        """One stored value, its expiry and its approximate size in bytes.
+
+        ``expiry`` is in wall-clock seconds, None when the entry has no TTL.
+        """
+
+        __slots__ = ("expiry", "size", "value")
+
+        def __init__(self, value: t.JsonValue, expiry: float | None, size: int) -> None:
+            self.value = value
+            self.expiry = expiry
+            self.size = size
+
     def __new__(
         cls, config: t.GeneralValueType | None = None, **kwargs: t.GeneralValueType
     ) -> Self:
@@ -75,7 +111,9 @@ class FlextApiStorage:
         """Initialize storage with config using Pydantic."""
         self.logger = FlextLogger(__name__)
         config_obj, storage_kwargs = self._extract_init_params(config, kwargs)
-        max_size_val, default_ttl_val = self._extract_storage_kwargs(storage_kwargs)
+        max_size_val, default_ttl_val, eviction_val, max_memory_val = (
+            self._extract_storage_kwargs(storage_kwargs)
+        )
         # Type narrowing: dict already uses t.GeneralValueType
         storage_kwargs_typed: dict[str, t.GeneralValueType] = {
             k: v
@@ -84,18 +122,52 @@ class FlextApiStorage:
         }
         super().__init__(**storage_kwargs_typed)
         config_dict = self._normalize_config(config_obj)
-        self._apply_config(config_dict, max_size_val, default_ttl_val)
+        self._apply_config(config_dict, max_size_val, default_ttl_val, eviction_val)
+        max_memory_result = self._extract_limit(
+            config_dict,
+            "max_memory_bytes",
+            max_memory_val,
+        )
+        if max_memory_result.is_failure:
+            error_msg = f"Failed to extract max_memory_bytes: {max_memory_result.error}"
+            raise ValueError(error_msg)
+        max_memory_value = max_memory_result.value
+        # Convert sentinel value (-1) to None for optional max_memory_bytes
+        self._max_memory_bytes = None if max_memory_value == -1 else max_memory_value
 
-        # Flexible storage tracking - use JsonValue for type safety
+        # One Entry per key; the namespace belongs to the instance, not the keys
         # Use object.__setattr__ to bypass frozen constraint from FlextService parent
         object.__setattr__(self, "_storage", {})
-        object.__setattr__(self, "_expiry_times", {})
-
-        # Metrics using Pydantic model
+        # Min-heap of (expiry, key); heap items whose expiry no longer matches
+        # the entry are stale (key deleted or re-set) and skipped on pop
+        object.__setattr__(self, "_expiry_heap", [])
+        object.__setattr__(self, "_clock", time.time)
+        # Key tracking for the eviction policy, only when a limit bounds the store.
+        # Under a memory limit alone every entry takes at least the overhead,
+        # which bounds the key count the policy has to plan for.
+        capacity = self._max_size
+        if capacity is None and self._max_memory_bytes is not None:
+            capacity = max(
+                1,
+                self._max_memory_bytes // c.Api.Storage.ENTRY_OVERHEAD_BYTES,
+            )
+        object.__setattr__(
+            self,
+            "_eviction",
+            FlextApiEviction.create(self._eviction_policy, capacity)
+            if capacity is not None
+            else None,
+        )
+        # Approximate bytes held, kept up to date on every set and removal
+        object.__setattr__(self, "_memory_bytes", 0)
         object.__setattr__(
-            self, "_stats", FlextApiModels.Storage.Stats(namespace=self._namespace)
+            self,
+            "_size_histogram",
+            [0] * c.Api.Storage.SIZE_HISTOGRAM_BUCKETS,
         )
-        object.__setattr__(self, "_operations_count", 0)
+
+        # Plain counters; the Stats model is only built by metrics()
+        object.__setattr__(self, "_counters", FlextApiStorage.Counters())
         object.__setattr__(self, "_created_at", u.Generators.generate_iso_timestamp())
 
     def _extract_init_params(
@@ -120,11 +192,18 @@ class FlextApiStorage:
     def _extract_storage_kwargs(
         self,
         storage_kwargs: dict[str, t.GeneralValueType],
-    ) -> tuple[t.GeneralValueType | None, t.GeneralValueType | None]:
+    ) -> tuple[
+        t.GeneralValueType | None,
+        t.GeneralValueType | None,
+        t.GeneralValueType | None,
+        t.GeneralValueType | None,
+    ]:
         """Extract storage-specific kwargs before passing to super."""
         max_size_val = storage_kwargs.pop("max_size", None)
         default_ttl_val = storage_kwargs.pop("default_ttl", None)
-        return max_size_val, default_ttl_val
+        eviction_val = storage_kwargs.pop("eviction_policy", None)
+        max_memory_val = storage_kwargs.pop("max_memory_bytes", None)
+        return max_size_val, default_ttl_val, eviction_val, max_memory_val
 
     def _extract_config_field(
         self,
@@ -183,7 +262,16 @@ class FlextApiStorage:
                 "flext",
             )
             backend_str = self._extract_config_field(config_obj, "backend", "memory")
+            eviction_str = self._extract_config_field(
+                config_obj,
+                "eviction_policy",
+                c.Api.Storage.DEFAULT_EVICTION,
+            )
             max_size_val = self._extract_optional_config_field(config_obj, "max_size")
+            max_memory_val = self._extract_optional_config_field(
+                config_obj,
+                "max_memory_bytes",
+            )
             default_ttl_val = self._extract_optional_config_field(
                 config_obj,
                 "default_ttl",
@@ -194,6 +282,8 @@ class FlextApiStorage:
                 "backend": backend_str,
                 "max_size": self._convert_to_int(max_size_val),
                 "default_ttl": self._convert_to_int(default_ttl_val),
+                "eviction_policy": eviction_str,
+                "max_memory_bytes": self._convert_to_int(max_memory_val),
             }
         return {}
 
@@ -202,6 +292,7 @@ class FlextApiStorage:
         config_dict: t.Api.StorageDict,
         max_size_val: t.GeneralValueType | None,
         default_ttl_val: t.GeneralValueType | None,
+        eviction_val: t.GeneralValueType | None = None,
     ) -> None:
         """Apply normalized config to instance attributes - no fallbacks."""
         namespace_result = self._extract_namespace(config_dict)
@@ -232,6 +323,12 @@ class FlextApiStorage:
             raise ValueError(error_msg)
         self._backend = backend_result.value
 
+        eviction_result = self._extract_eviction_policy(config_dict, eviction_val)
+        if eviction_result.is_failure:
+            error_msg = f"Failed to extract eviction_policy: {eviction_result.error}"
+            raise ValueError(error_msg)
+        self._eviction_policy = eviction_result.value
+
     def _extract_namespace(self, config_dict: t.Api.StorageDict) -> r[str]:
         """Extract namespace from config with validation - uses default if not specified."""
         if "namespace" in config_dict:
@@ -320,27 +417,144 @@ class FlextApiStorage:
         # Use default backend (this is OK - it's a valid default, not a fallback)
         return r[str].ok("memory")
 
+    def _extract_eviction_policy(
+        self,
+        config_dict: t.Api.StorageDict,
+        eviction_val: t.GeneralValueType | None,
+    ) -> r[str]:
+        """Extract eviction policy preferring parameter over config."""
+        policy_val = (
+            eviction_val
+            if eviction_val is not None
+            else config_dict.get("eviction_policy", c.Api.Storage.DEFAULT_EVICTION)
+        )
+        valid = [policy.value for policy in c.Api.Storage.Eviction]
+        if isinstance(policy_val, str) and policy_val in valid:
+            return r[str].ok(policy_val)
+        return r[str].fail(
+            f"Unknown eviction policy: {policy_val!r}, expected one of {valid}",
+        )
+
+    def _extract_limit(
+        self,
+        config_dict: t.Api.StorageDict,
+        field_name: str,
+        value: t.GeneralValueType | None,
+    ) -> r[int]:
+        """Extract an optional positive limit, preferring parameter over config.
+
+        Returns r[int] with a sentinel value (-1) when the limit is not set.
+        """
+        limit_val = value if value is not None else config_dict.get(field_name)
+        if limit_val is None:
+            return r[int].ok(-1)
+        try:
+            limit_int = int(str(limit_val))
+        except (ValueError, TypeError) as e:
+            return r[int].fail(f"Invalid {field_name} value: {e}")
+        if limit_int > 0:
+            return r[int].ok(limit_int)
+        return r[int].fail(f"{field_name} must be positive, got: {limit_int}")
+
     def execute(
         self, *_args: t.GeneralValueType, **_kwargs: t.GeneralValueType
     ) -> r[bool]:
         """Service lifecycle execution."""
         return r[bool].ok(value=True)
 
-    def _key(self, key: str) -> str:
-        """Create namespaced key."""
-        return f"{self._namespace}:{key}"
-
-    def _cleanup_expired(self) -> None:
-        """Remove expired entries (TTL management)."""
-        current_time = time.time()
-        expired_keys = [
-            k for k, expiry in self._expiry_times.items() if expiry < current_time
-        ]
-        for k in expired_keys:
-            if k in self._storage:
-                del self._storage[k]
-            if k in self._expiry_times:
-                del self._expiry_times[k]
+    def _cleanup_expired(self, limit: int | None = None) -> int:
+        """Remove expired entries in expiry order, at most ``limit`` of them.
+
+        Only heap items that are due are popped, so the cost is
+        proportional to what expired, never to the size of the store.
+        """
+        heap = self._expiry_heap
+        now = self._clock()
+        removed = 0
+        while heap and heap[0][0] < now and (limit is None or removed < limit):
+            expiry, key = heapq.heappop(heap)
+            entry = self._storage.get(key)
+            if entry is not None and entry.expiry == expiry:
+                self._remove(key)
+                removed += 1
+        return removed
+
+    def _live_entry(self, key: str) -> FlextApiStorage.Entry | None:
+        """Entry of ``key``, dropping it first if its TTL has run out."""
+        entry = self._storage.get(key)
+        if entry is None:
+            return None
+        if entry.expiry is not None and entry.expiry < self._clock():
+            self._remove(key)
+            return None
+        return entry
+
+    def _remove(self, key: str) -> None:
+        """Drop the entry of ``key`` (deleted or expired)."""
+        self._discard(key)
+        if self._eviction is not None:
+            self._eviction.remove(key)
+
+    def _discard(self, key: str) -> None:
+        """Drop the entry of ``key`` and its size, if it is stored."""
+        entry = self._storage.pop(key, None)
+        if entry is not None:
+            self._account(entry.size, -1)
+
+    def _account(self, size: int, count: int) -> None:
+        """Add (``count`` 1) or remove (-1) an entry of ``size`` bytes."""
+        self._memory_bytes += size * count
+        # Bucket b holds sizes in (2 ** (b - 1), 2 ** b]
+        bucket = min(
+            (size - 1).bit_length(),
+            c.Api.Storage.SIZE_HISTOGRAM_BUCKETS - 1,
+        )
+        self._size_histogram[bucket] += count
+
+    @staticmethod
+    def _approximate_size(value: t.GeneralValueType) -> int:
+        """Approximate bytes of ``value``, containers included."""
+        size = sys.getsizeof(value)
+        if isinstance(value, dict):
+            size += sum(
+                FlextApiStorage._approximate_size(item_key)
+                + FlextApiStorage._approximate_size(item)
+                for item_key, item in value.items()
+            )
+        elif isinstance(value, list):
+            size += sum(FlextApiStorage._approximate_size(item) for item in value)
+        return size
+
+    def _index_expiry(self, key: str, expiry: float) -> None:
+        """Push ``key`` onto the expiry heap, compacting stale items."""
+        heapq.heappush(self._expiry_heap, (expiry, key))
+        if (
+            len(self._expiry_heap)
+            > c.Api.Storage.EXPIRY_COMPACT_FACTOR * len(self._storage)
+            + c.Api.Storage.EXPIRY_SWEEP_BATCH
+        ):
+            # Re-set and deleted keys left too many stale items behind
+            self._expiry_heap[:] = [
+                (entry.expiry, stored_key)
+                for stored_key, entry in self._storage.items()
+                if entry.expiry is not None
+            ]
+            heapq.heapify(self._expiry_heap)
+
+    def _evict(self, key: str) -> None:
+        """Drop an entry the eviction policy chose to make room."""
+        self._discard(key)
+        self._counters.evictions += 1
+
+    def _enforce_memory_limit(self) -> None:
+        """Evict in policy order until the store fits ``max_memory_bytes``."""
+        if self._max_memory_bytes is None or self._eviction is None:
+            return
+        while self._memory_bytes > self._max_memory_bytes:
+            victim = self._eviction.pop()
+            if victim is None:
+                return
+            self._evict(victim)
 
     def set(
         self,
@@ -349,7 +563,7 @@ class FlextApiStorage:
         timeout: int | None = None,
         ttl: int | None = None,
     ) -> r[bool]:
-        """Store value with TTL using Pydantic metadata."""
+        """Store value with optional TTL (``timeout`` wins over ``ttl``)."""
         if not key:
             return r[bool].fail("Key must be non-empty string")
 
@@ -359,17 +573,6 @@ class FlextApiStorage:
             else (ttl if ttl is not None else self._default_ttl)
         )
 
-        # Use Pydantic model for metadata validation
-        try:
-            metadata = FlextApiModels.Storage.Metadata(
-                value=value,
-                timestamp=u.Generators.generate_iso_timestamp(),
-                ttl=ttl_val,
-            )
-        except Exception as e:
-            return r[bool].fail(f"Metadata validation failed: {e}")
-
-        # Store with expiry tracking - direct field access
         # Convert value to JsonValue for type safety
         json_value: t.JsonValue
         if isinstance(value, (str, int, float, bool, type(None), list, dict)):
@@ -378,39 +581,31 @@ class FlextApiStorage:
             # For complex objects, convert to string representation
             json_value = str(value)
 
-        self._storage[key] = json_value
-        # Convert metadata fields to JsonValue with proper type narrowing
-        value_json: t.JsonValue = (
-            metadata.value
-            if isinstance(
-                metadata.value,
-                (str, int, float, bool, type(None), dict, list),
-            )
-            else str(metadata.value)
-        )
-        ttl_json: t.JsonValue = metadata.ttl if metadata.ttl is not None else None
-        metadata_dict: dict[str, t.GeneralValueType] = {
-            "value": value_json,
-            "timestamp": metadata.timestamp,
-            "ttl": ttl_json,
-            "created_at": metadata.created_at,
-        }
-        self._storage[self._key(key)] = metadata_dict
-
-        if ttl_val is not None:
-            self._expiry_times[key] = time.time() + ttl_val
-
-        self._operations_count += 1
-        # Create new Stats instance with updated values (immutable pattern)
-        self._stats = FlextApiModels.Storage.Stats(
-            total_operations=self._operations_count,
-            cache_hits=self._stats.cache_hits,
-            cache_misses=self._stats.cache_misses,
-            hit_ratio=self._stats.hit_ratio,
-            storage_size=self._stats.storage_size,
-            memory_usage=self._stats.memory_usage,
-            namespace=self._stats.namespace,
+        expiry = None if ttl_val is None else self._clock() + ttl_val
+        size = (
+            c.Api.Storage.ENTRY_OVERHEAD_BYTES
+            + sys.getsizeof(key)
+            + self._approximate_size(json_value)
         )
+        entry = self._storage.get(key)
+        if entry is None:
+            self._storage[key] = FlextApiStorage.Entry(json_value, expiry, size)
+        else:
+            self._account(entry.size, -1)
+            entry.value = json_value
+            entry.expiry = expiry
+            entry.size = size
+        self._account(size, 1)
+        if expiry is not None:
+            self._index_expiry(key, expiry)
+        self._cleanup_expired(c.Api.Storage.EXPIRY_SWEEP_BATCH)
+
+        if self._eviction is not None:
+            for victim in self._eviction.insert(key):
+                self._evict(victim)
+            self._enforce_memory_limit()
+
+        self._counters.operations += 1
         return r[bool].ok(value=True)
 
     def get(self, key: str) -> r[t.GeneralValueType]:
@@ -418,137 +613,43 @@ class FlextApiStorage:
         if not key:
             return r[t.GeneralValueType].fail("Key must be non-empty string")
 
-        self._cleanup_expired()
-        self._operations_count += 1
-
-        # Try direct key first
-        if key in self._storage:
-            value = self._storage[key]
-            # Create new Stats instance with updated values (immutable pattern)
-            self._stats = FlextApiModels.Storage.Stats(
-                total_operations=self._stats.total_operations,
-                cache_hits=self._stats.cache_hits + 1,
-                cache_misses=self._stats.cache_misses,
-                hit_ratio=self._stats.hit_ratio,
-                storage_size=self._stats.storage_size,
-                memory_usage=self._stats.memory_usage,
-                namespace=self._stats.namespace,
-            )
-            return r[t.GeneralValueType].ok(value)
-
-        # Try namespaced key
-        namespaced_key = self._key(key)
-        if namespaced_key in self._storage:
-            result = self._process_namespaced_entry(namespaced_key, key)
-            if result.is_success:
-                return result
-
-        # Create new Stats instance with updated values (immutable pattern)
-        self._stats = FlextApiModels.Storage.Stats(
-            total_operations=self._stats.total_operations,
-            cache_hits=self._stats.cache_hits,
-            cache_misses=self._stats.cache_misses + 1,
-            hit_ratio=self._stats.hit_ratio,
-            storage_size=self._stats.storage_size,
-            memory_usage=self._stats.memory_usage,
-            namespace=self._stats.namespace,
-        )
+        self._cleanup_expired(c.Api.Storage.EXPIRY_SWEEP_BATCH)
+        self._counters.operations += 1
+        entry = self._live_entry(key)
+        if entry is not None:
+            if self._eviction is not None:
+                self._eviction.access(key)
+            self._counters.hits += 1
+            return r[t.GeneralValueType].ok(entry.value)
+
+        if self._eviction is not None:
+            self._eviction.miss(key)
+        self._counters.misses += 1
         return r[t.GeneralValueType].fail(f"Key not found: {key}")
 
-    def _process_namespaced_entry(
-        self, namespaced_key: str, key: str
-    ) -> r[t.GeneralValueType]:
-        """Process a namespaced storage entry with metadata validation."""
-        data = self._storage[namespaced_key]
-        try:
-            # Validate using Pydantic model
-            if not isinstance(data, dict):
-                return r[t.GeneralValueType].fail(f"Invalid data format for key: {key}")
-
-            # Cast to expected types for Pydantic model construction
-            # Runtime validation ensures type safety
-            ttl_value = data.get("ttl")
-            ttl_int: int | None = None
-            if ttl_value is not None and isinstance(ttl_value, (int, str, float)):
-                try:
-                    ttl_int = int(ttl_value)
-                except (ValueError, TypeError):
-                    ttl_int = None
-
-            created_at_value = data.get("created_at", 0.0)
-            created_at_float = 0.0
-            if isinstance(created_at_value, (int, float, str)):
-                try:
-                    created_at_float = float(created_at_value)
-                except (ValueError, TypeError):
-                    created_at_float = 0.0
-
-            metadata = FlextApiModels.Storage.Metadata(
-                value=data.get("value"),
-                timestamp=str(data.get("timestamp", "")),
-                ttl=ttl_int,
-                created_at=created_at_float,
-            )
-            if not metadata.is_expired():
-                # Create new Stats instance with updated values (immutable pattern)
-                self._stats = FlextApiModels.Storage.Stats(
-                    total_operations=self._stats.total_operations,
-                    cache_hits=self._stats.cache_hits + 1,
-                    cache_misses=self._stats.cache_misses,
-                    hit_ratio=self._stats.hit_ratio,
-                    storage_size=self._stats.storage_size,
-                    memory_usage=self._stats.memory_usage,
-                    namespace=self._stats.namespace,
-                )
-                return r[t.GeneralValueType].ok(metadata.value)
-
-            # Clean up expired entry
-            if namespaced_key in self._storage:
-                del self._storage[namespaced_key]
-            if key in self._expiry_times:
-                del self._expiry_times[key]
-            return r[t.GeneralValueType].fail(f"Key expired: {key}")
-
-        except Exception as e:
-            # Log cleanup errors but continue - cache functionality is preserved
-            FlextLogger(__name__).warning(
-                "Failed to cleanup expired cache entry",
-                error=str(e),
-            )
-            return r[t.GeneralValueType].fail(f"Error processing key: {key}")
-
     def delete(self, key: str) -> r[bool]:
         """Delete key from storage."""
-        key_deleted = key in self._storage
-        namespaced_key = self._key(key)
-        namespaced_deleted = namespaced_key in self._storage
-
-        if key in self._storage:
-            del self._storage[key]
-        if namespaced_key in self._storage:
-            del self._storage[namespaced_key]
-        if key in self._expiry_times:
-            del self._expiry_times[key]
-        self._operations_count += 1
-
-        if key_deleted or namespaced_deleted:
-            return r[bool].ok(value=True)
-        return r[bool].fail(f"Key not found: {key}")
+        self._counters.operations += 1
+        if key not in self._storage:
+            return r[bool].fail(f"Key not found: {key}")
+        self._remove(key)
+        return r[bool].ok(value=True)
 
     def exists(self, key: str) -> r[bool]:
         """Check if key exists and not expired."""
-        self._cleanup_expired()
-        direct_exists = key in self._storage
-        if direct_exists:
-            return r[bool].ok(value=True)
-        namespaced_exists = self._key(key) in self._storage
-        return r[bool].ok(namespaced_exists)
+        self._cleanup_expired(c.Api.Storage.EXPIRY_SWEEP_BATCH)
+        return r[bool].ok(self._live_entry(key) is not None)
 
     def clear(self) -> r[bool]:
         """Clear all storage."""
         self._storage.clear()
-        self._expiry_times.clear()
-        self._operations_count = 0
+        self._expiry_heap.clear()
+        self._memory_bytes = 0
+        self._size_histogram[:] = [0] * len(self._size_histogram)
+        if self._eviction is not None:
+            self._eviction.clear()
+        self._counters.operations = 0
+        self._counters.evictions = 0
         return r[bool].ok(value=True)
 
     def size(self) -> r[int]:
@@ -557,27 +658,23 @@ class FlextApiStorage:
         return r[int].ok(len(self._storage))
 
     def keys(self) -> r[list[str]]:
-        """Get all non-namespaced keys."""
+        """Get all keys."""
         self._cleanup_expired()
-
-        def key_not_namespaced(k: str) -> bool:
-            return not k.startswith(f"{self._namespace}:")
-
-        filtered_keys = u.Collection.filter(
-            list(self._storage.keys()),
-            key_not_namespaced,
-        )
-        return r[list[str]].ok(list(filtered_keys))
+        return r[list[str]].ok(list(self._storage))
 
     def items(self) -> r[list[tuple[str, t.JsonValue]]]:
         """Get all key-value pairs."""
         self._cleanup_expired()
-        return r[list[tuple[str, t.JsonValue]]].ok(list(self._storage.items()))
+        return r[list[tuple[str, t.JsonValue]]].ok([
+            (key, entry.value) for key, entry in self._storage.items()
+        ])
 
     def values(self) -> r[list[t.JsonValue]]:
         """Get all values."""
         self._cleanup_expired()
-        return r[list[t.JsonValue]].ok(list(self._storage.values()))
+        return r[list[t.JsonValue]].ok([
+            entry.value for entry in self._storage.values()
+        ])
 
     def batch_set(
         self,
@@ -628,26 +725,23 @@ class FlextApiStorage:
             return r[bool].fail(str(e))
 
     def serialize_json(self, data: t.GeneralValueType) -> r[str]:
-        """Serialize to JSON using json library."""
+        """Serialize to JSON using the FlextApiSerializers.Json codec."""
         try:
-            return r[str].ok(json.dumps(data, default=str))
+            return r[str].ok(FlextApiSerializers.Json.dumps_str(data, default=str))
         except Exception as e:
             return r[str].fail(f"JSON serialization failed: {e}")
 
     def deserialize_json(self, json_str: str) -> r[t.JsonValue]:
-        """Deserialize from JSON using json library."""
+        """Deserialize from JSON using the FlextApiSerializers.Json codec."""
         try:
-            return r[t.JsonValue].ok(json.loads(json_str))
+            return r[t.JsonValue].ok(FlextApiSerializers.Json.loads(json_str))
         except Exception as e:
             return r[t.JsonValue].fail(f"JSON deserialization failed: {e}")
 
     def cleanup_expired(self) -> r[int]:
         """Clean up expired entries (TTL management)."""
         try:
-            initial_size = len(self._storage)
-            self._cleanup_expired()
-            removed = initial_size - len(self._storage)
-            return r[int].ok(removed)
+            return r[int].ok(self._cleanup_expired())
         except Exception as e:
             return r[int].fail(f"Cleanup failed: {e}")
 
@@ -661,7 +755,11 @@ class FlextApiStorage:
                 "created_at": self._created_at,
                 "max_size": self._max_size,
                 "default_ttl": self._default_ttl,
-                "operations_count": self._operations_count,
+                "eviction_policy": self._eviction_policy,
+                "max_memory_bytes": self._max_memory_bytes,
+                "memory_usage": self._memory_bytes,
+                "evictions": self._counters.evictions,
+                "operations_count": self._counters.operations,
             })
         except Exception as e:
             return r[dict[str, t.JsonValue]].fail(str(e))
@@ -674,38 +772,42 @@ class FlextApiStorage:
                 "timestamp": u.Generators.generate_iso_timestamp(),
                 "storage_accessible": True,
                 "size": len(self._storage),
-                "operations_count": self._operations_count,
+                "operations_count": self._counters.operations,
             })
         except Exception as e:
             return r[dict[str, t.JsonValue]].fail(str(e))
 
+    def _stats(self) -> FlextApiModels.Storage.Stats:
+        """Snapshot the counters into the Pydantic stats model."""
+        counters = self._counters
+        lookups = counters.hits + counters.misses
+        return FlextApiModels.Storage.Stats(
+            total_operations=counters.operations,
+            cache_hits=counters.hits,
+            cache_misses=counters.misses,
+            hit_ratio=counters.hits / lookups if lookups else 0.0,
+            storage_size=len(self._storage),
+            memory_usage=self._memory_bytes,
+            evictions=counters.evictions,
+            namespace=self._namespace,
+        )
+
     def metrics(self) -> r[dict[str, t.JsonValue]]:
         """Get storage metrics using Pydantic stats model."""
         try:
-            # Update stats using Pydantic model (immutable pattern)
-            hit_ratio = 0.0
-            if self._stats.total_operations > 0:
-                hit_ratio = self._stats.cache_hits / self._stats.total_operations
-
-            self._stats = FlextApiModels.Storage.Stats(
-                total_operations=self._stats.total_operations,
-                cache_hits=self._stats.cache_hits,
-                cache_misses=self._stats.cache_misses,
-                hit_ratio=hit_ratio,
-                storage_size=len(self._storage),
-                memory_usage=len(str(self._storage)),
-                namespace=self._stats.namespace,
-            )
-
+            stats = self._stats()
             # Direct field access instead of model_dump
             stats_dict: dict[str, t.JsonValue] = {
-                "total_operations": self._stats.total_operations,
-                "cache_hits": self._stats.cache_hits,
-                "cache_misses": self._stats.cache_misses,
-                "hit_ratio": self._stats.hit_ratio,
-                "storage_size": self._stats.storage_size,
-                "memory_usage": self._stats.memory_usage,
-                "namespace": self._stats.namespace,
+                "total_operations": stats.total_operations,
+                "cache_hits": stats.cache_hits,
+                "cache_misses": stats.cache_misses,
+                "hit_ratio": stats.hit_ratio,
+                "storage_size": stats.storage_size,
+                "memory_usage": stats.memory_usage,
+                "namespace": stats.namespace,
+                "evictions": stats.evictions,
+                # Copied into a display so its int values widen to JsonValue
+                "size_histogram": {**self.size_histogram()},
             }
             return r[dict[str, t.JsonValue]].ok(stats_dict)
         except Exception as e:
@@ -714,11 +816,12 @@ class FlextApiStorage:
     def get_cache_stats(self) -> r[t.Api.CacheDict]:
         """Get cache statistics using Pydantic validation."""
         try:
+            counters = self._counters
             return r[t.Api.CacheDict].ok({
                 "size": len(self._storage),
                 "backend": self._backend,
-                "hits": self._stats.cache_hits,
-                "misses": self._stats.cache_misses,
+                "hits": counters.hits,
+                "misses": counters.misses,
             })
         except Exception as e:
             return r[t.Api.CacheDict].fail(str(e))
@@ -726,10 +829,12 @@ class FlextApiStorage:
     def get_storage_metrics(self) -> r[t.Api.MetricsDict]:
         """Get complete storage metrics."""
         try:
+            counters = self._counters
             return r[t.Api.MetricsDict].ok({
-                "total_operations": self._operations_count,
-                "cache_hits": self._stats.cache_hits,
-                "cache_misses": self._stats.cache_misses,
+                "total_operations": counters.operations,
+                "cache_hits": counters.hits,
+                "cache_misses": counters.misses,
+                "evictions": counters.evictions,
             })
         except Exception as e:
             return r[t.Api.MetricsDict].fail(str(e))
@@ -737,22 +842,32 @@ class FlextApiStorage:
     def get_storage_statistics(self) -> r[dict[str, float]]:
         """Get storage statistics with hit ratio calculation."""
         try:
-            hit_ratio = (
-                self._stats.cache_hits / self._stats.total_operations
-                if self._stats.total_operations > 0
-                else 0.0
-            )
+            stats = self._stats()
             return r[dict[str, float]].ok({
-                "total_operations": float(self._operations_count),
-                "cache_hits": float(self._stats.cache_hits),
-                "cache_misses": float(self._stats.cache_misses),
-                "hit_ratio": hit_ratio,
-                "storage_size": float(len(self._storage)),
-                "memory_usage": float(len(str(self._storage))),
+                "total_operations": float(stats.total_operations),
+                "cache_hits": float(stats.cache_hits),
+                "cache_misses": float(stats.cache_misses),
+                "hit_ratio": stats.hit_ratio,
+                "storage_size": float(stats.storage_size),
+                "memory_usage": float(stats.memory_usage),
+                "evictions": float(stats.evictions),
             })
         except Exception as e:
             return r[dict[str, float]].fail(str(e))
 
+    def size_histogram(self) -> dict[str, int]:
+        """Entry count per power-of-two size bucket, keyed ``"<=N"`` bytes.
+
+        Empty buckets are left out; the last bucket is open-ended (``">N"``).
+        """
+        last = len(self._size_histogram) - 1
+        histogram: dict[str, int] = {}
+        for bucket, count in enumerate(self._size_histogram):
+            if count:
+                label = f">{1 << (last - 1)}" if bucket == last else f"<={1 << bucket}"
+                histogram[label] = count
+        return histogram
+
     # Properties for namespace and backend access
     # Note: config property inherited from FlextService base class
     @property
@@ -0,0 +1,382 @@
+"""Streaming HTTP request and response bodies without buffering them in memory.
+
+FlextApiStreamingResponse wraps an httpx response opened with ``stream=True``
+so large downloads can be consumed as byte chunks, text lines or NDJSON
+records, or copied straight to a file descriptor. FlextApiStreamingBody feeds
+uploads from files, iterators or memory maps chunk by chunk. Memory stays
+bounded by the chunk size in both directions.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import mmap
+import os
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+)
+from pathlib import Path
+from types import TracebackType
+from typing import BinaryIO, Self, TypeIs
+
+import httpx
+from flext_core import r
+
+from flext_api.constants import c
+from flext_api.serializers import FlextApiSerializers
+from flext_api.typings import t
+
+
+class FlextApiStreamingResponse:
+    """Streamed HTTP response whose body is read incrementally.
+
+    The body can be consumed once, through one of the ``iter_*`` methods or
+    ``write_to``. The underlying connection is released when the body is
+    exhausted or on ``close()``; use the response as a context manager.
+
+    Usage:
+        with plugin.stream_request(request).value as response:
+            for record in response.iter_ndjson():
+                handle(record)
+    """
+
+    def __init__(
+        self,
+        response: httpx.Response,
+        chunk_size: int = c.Api.Streaming.DEFAULT_CHUNK_SIZE,
+        *,
+        on_close: Callable[[], object] | None = None,
+    ) -> None:
+        """Initialize streaming response.
+
+        Args:
+            response: httpx response opened with ``stream=True``.
+            chunk_size: Bytes per chunk yielded by ``iter_bytes``.
+            on_close: Called once after the response is closed, e.g. to
+                release the client that owns the connection.
+
+        """
+        if chunk_size < 1:
+            msg = "chunk_size must be at least 1"
+            raise ValueError(msg)
+        self._response = response
+        self._chunk_size = chunk_size
+        self._on_close = on_close
+        self._closed = False
+
+    @property
+    def status_code(self) -> int:
+        """HTTP status code."""
+        return self._response.status_code
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """HTTP response headers."""
+        return dict(self._response.headers)
+
+    @property
+    def chunk_size(self) -> int:
+        """Bytes per chunk yielded by ``iter_bytes``."""
+        return self._chunk_size
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether the response and its connection were released."""
+        return self._closed
+
+    @property
+    def num_bytes_downloaded(self) -> int:
+        """Bytes received from the network so far (before decompression)."""
+        return self._response.num_bytes_downloaded
+
+    def iter_bytes(self, chunk_size: int | None = None) -> Iterator[bytes]:
+        """Yield decoded body chunks of ``chunk_size`` bytes (last may be short)."""
+        try:
+            yield from self._response.iter_bytes(chunk_size or self._chunk_size)
+        finally:
+            self.close()
+
+    def iter_lines(self) -> Iterator[str]:
+        """Yield decoded text lines without line terminators."""
+        try:
+            yield from self._response.iter_lines()
+        finally:
+            self.close()
+
+    def iter_ndjson(self) -> Iterator[t.GeneralValueType]:
+        """Yield one parsed JSON value per non-blank line (NDJSON / JSON Lines).
+
+        Raises:
+            ValueError: If a line is not valid JSON.
+
+        """
+        for line in self.iter_lines():
+            if line.strip():
+                yield FlextApiSerializers.Json.loads(line)
+
+    def write_to(self, target: int | BinaryIO) -> r[int]:
+        """Copy the body to a file descriptor or binary file object.
+
+        Args:
+            target: Open file descriptor or object with a binary ``write``.
+
+        Returns:
+            r[int]: Number of body bytes written.
+
+        """
+        written = 0
+        try:
+            for chunk in self.iter_bytes():
+                if isinstance(target, int):
+                    # os.write may write less than requested (pipes, sockets)
+                    view = memoryview(chunk)
+                    while view:
+                        view = view[os.write(target, view) :]
+                else:
+                    target.write(chunk)
+                written += len(chunk)
+        except (httpx.HTTPError, httpx.StreamError, OSError) as e:
+            return r[int].fail(f"Failed to stream response body: {e}")
+        return r[int].ok(written)
+
+    def close(self) -> None:
+        """Release the connection without reading the rest of the body."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            self._response.close()
+        finally:
+            if self._on_close is not None:
+                self._on_close()
+
+    def __enter__(self) -> Self:
+        """Enter context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit context manager and release the connection."""
+        self.close()
+
+
+class FlextApiStreamingBody:
+    """Request body sent chunk by chunk instead of as one bytes blob.
+
+    Sources:
+    - ``str``/``os.PathLike``: file path, opened per send
+    - binary file object: read from its current position
+    - ``mmap.mmap``: sliced without copying the whole mapping
+    - sync or async iterable of ``bytes``
+
+    Bodies with a known size are sent with ``Content-Length``, others with
+    ``Transfer-Encoding: chunked``. Path, seekable file and mmap sources are
+    replayable (safe to retry); iterators can be sent only once.
+
+    Usage:
+        body = FlextApiStreamingBody(
+            Path("export.csv"),
+            on_progress=lambda sent, total: print(sent, total),
+        )
+        client.request(FlextApiModels.HttpRequest(method="PUT", url=url, body=body))
+    """
+
+    type Source = (
+        str
+        | os.PathLike[str]
+        | BinaryIO
+        | mmap.mmap
+        | Iterable[bytes]
+        | AsyncIterable[bytes]
+    )
+    type ProgressCallback = Callable[[int, int | None], object]
+
+    def __init__(
+        self,
+        source: FlextApiStreamingBody.Source,
+        *,
+        length: int | None = None,
+        chunk_size: int = c.Api.Streaming.DEFAULT_UPLOAD_CHUNK_SIZE,
+        on_progress: FlextApiStreamingBody.ProgressCallback | None = None,
+    ) -> None:
+        """Initialize streaming body.
+
+        Args:
+            source: Where body bytes come from (see class docstring).
+            length: Body size in bytes when the source cannot report it
+                (iterators, non-seekable files); enables Content-Length.
+            chunk_size: Bytes read per chunk from file and mmap sources.
+            on_progress: Called with ``(bytes_sent, total_or_None)`` after
+                each chunk is handed to the transport.
+
+        """
+        if chunk_size < 1:
+            msg = "chunk_size must be at least 1"
+            raise ValueError(msg)
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            msg = "Use bytes bodies directly; FlextApiStreamingBody is for streams"
+            raise TypeError(msg)
+        self._source = (
+            Path(source) if isinstance(source, (str, os.PathLike)) else source
+        )
+        self._chunk_size = chunk_size
+        self._on_progress = on_progress
+        self._start = self._file_position()
+        self._length = length if length is not None else self._detect_length()
+        self._consumed = False
+
+    @property
+    def content_length(self) -> int | None:
+        """Body size in bytes, or None when it is only known after sending."""
+        return self._length
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """Framing header for this body (Content-Length or chunked)."""
+        if self._length is None:
+            return {"Transfer-Encoding": "chunked"}
+        return {"Content-Length": str(self._length)}
+
+    @property
+    def is_replayable(self) -> bool:
+        """Whether the body can be sent again, e.g. by a retry."""
+        source = self._source
+        return isinstance(source, (Path, mmap.mmap)) or self._start is not None
+
+    @property
+    def is_async_only(self) -> bool:
+        """Whether the body can only be sent by an async client."""
+        return isinstance(self._source, AsyncIterable) and not isinstance(
+            self._source,
+            (Iterable, mmap.mmap),
+        )
+
+    def iter_chunks(self) -> Iterator[bytes]:
+        """Return body chunks for a sync transport, reporting progress.
+
+        Raises:
+            TypeError: If the source is an async iterable.
+
+        """
+        if self.is_async_only:
+            raise TypeError(c.Api.Streaming.ASYNC_ONLY_BODY_ERROR)
+        return self._reported(self._sync_chunks())
+
+    async def aiter_chunks(self) -> AsyncIterator[bytes]:
+        """Yield body chunks for an async transport, reporting progress.
+
+        File reads run in a worker thread so the event loop is not blocked.
+        """
+        sent = 0
+        async for chunk in self._async_chunks():
+            sent += len(chunk)
+            yield chunk
+            self._report(sent)
+
+    def _reported(self, chunks: Iterator[bytes]) -> Iterator[bytes]:
+        sent = 0
+        for chunk in chunks:
+            sent += len(chunk)
+            yield chunk
+            self._report(sent)
+
+    @staticmethod
+    def _is_file(source: object) -> TypeIs[BinaryIO]:
+        """Whether ``source`` is read like a file (mmaps included)."""
+        return hasattr(source, "read")
+
+    def _sync_chunks(self) -> Generator[bytes]:
+        source = self._source
+        if isinstance(source, Path):
+            with source.open("rb") as file:
+                yield from iter(lambda: file.read(self._chunk_size), b"")
+        elif isinstance(source, mmap.mmap):
+            for offset in range(0, len(source), self._chunk_size):
+                yield source[offset : offset + self._chunk_size]
+        elif self._is_file(source):
+            if self._start is None:
+                self._claim()
+            else:
+                source.seek(self._start)
+            yield from iter(lambda: source.read(self._chunk_size), b"")
+        elif isinstance(source, Iterable):
+            self._claim()
+            yield from (bytes(chunk) for chunk in source if chunk)
+        else:
+            raise TypeError(c.Api.Streaming.ASYNC_ONLY_BODY_ERROR)
+
+    async def _async_chunks(self) -> AsyncIterator[bytes]:
+        source = self._source
+        if isinstance(source, mmap.mmap) or (
+            isinstance(source, Iterable) and not self._is_file(source)
+        ):
+            for chunk in self._sync_chunks():
+                yield chunk
+        elif isinstance(source, AsyncIterable) and not self._is_file(source):
+            self._claim()
+            async for chunk in source:
+                if chunk:
+                    yield bytes(chunk)
+        else:
+            chunks = self._sync_chunks()
+            sentinel = b""
+            try:
+                while chunk := await asyncio.to_thread(next, chunks, sentinel):
+                    yield chunk
+            finally:
+                chunks.close()
+
+    def _claim(self) -> None:
+        """Mark a one-shot source as consumed, failing on a second send."""
+        if self._consumed:
+            raise RuntimeError(c.Api.Streaming.BODY_CONSUMED_ERROR)
+        self._consumed = True
+
+    def _file_position(self) -> int | None:
+        """Start offset of a seekable file object source, else None."""
+        source = self._source
+        if (
+            isinstance(source, (Path, mmap.mmap))
+            or not self._is_file(source)
+            or not hasattr(source, "seek")
+        ):
+            return None
+        try:
+            return source.tell() if source.seekable() else None
+        except (OSError, ValueError):
+            return None
+
+    def _detect_length(self) -> int | None:
+        source = self._source
+        if isinstance(source, Path):
+            return source.stat().st_size
+        if isinstance(source, mmap.mmap):
+            return len(source)
+        if self._start is not None and self._is_file(source):
+            try:
+                return os.fstat(source.fileno()).st_size - self._start
+            except (AttributeError, OSError, ValueError):
+                end = source.seek(0, os.SEEK_END)
+                source.seek(self._start)
+                return end - self._start
+        return None
+
+    def _report(self, sent: int) -> None:
+        if self._on_progress is not None:
+            self._on_progress(sent, self._length)
+
+
+__all__ = ["FlextApiStreamingBody", "FlextApiStreamingResponse"]
@@ -11,54 +11,867 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import importlib.util
+import ssl
+import threading
+import time
+from collections.abc import (
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from typing import ClassVar, TypedDict
+
+import httpcore
 import httpx
 from flext_core import r
 
 from flext_api.constants import c
+from flext_api.dns import FlextApiDnsCache
 from flext_api.protocols import p
 from flext_api.typings import t
 
 # Protocol reference for backward compatibility
 TransportPlugin = p.Api.Transport.TransportPlugin
 
+_HTTP2_AVAILABLE = importlib.util.find_spec(c.Api.HTTPClient.HTTP2_PACKAGE) is not None
+
+type Origin = tuple[bytes, bytes, int | None]
+"""Scheme, host and port of a request URL."""
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+class _PoolKwargs(TypedDict, total=False):
+    """Keyword arguments of httpx.HTTPTransport and httpx.AsyncHTTPTransport."""
+
+    verify: ssl.SSLContext | str | bool
+    cert: str | tuple[str, str] | tuple[str, str, str] | None
+    trust_env: bool
+    http1: bool
+    http2: bool
+    limits: httpx.Limits
+
+
+class _ClientKwargs(TypedDict, total=False):
+    """Keyword arguments of httpx.Client and httpx.AsyncClient."""
+
+    headers: httpx.Headers | Mapping[str, str] | Sequence[tuple[str, str]] | None
+    timeout: (
+        httpx.Timeout
+        | float
+        | tuple[float | None, float | None, float | None, float | None]
+        | None
+    )
+    follow_redirects: bool
+    max_redirects: int
+
+
+def _freeze(value: object) -> object:
+    """Hashable stand-in for a connect() option value, used in pool keys."""
+    if isinstance(value, Mapping):
+        return tuple(sorted((str(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+class _ReleasingStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Response body stream calling ``release`` once when closed."""
+
+    def __init__(
+        self,
+        stream: httpx.SyncByteStream | httpx.AsyncByteStream,
+        release: Callable[[], None],
+    ) -> None:
+        self._stream = stream
+        self._release = release
+
+    def __iter__(self) -> Iterator[bytes]:
+        if not isinstance(self._stream, httpx.SyncByteStream):
+            msg = "Attempted to read an async response stream synchronously"
+            raise TypeError(msg)
+        yield from self._stream
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        if not isinstance(self._stream, httpx.AsyncByteStream):
+            msg = "Attempted to read a sync response stream asynchronously"
+            raise TypeError(msg)
+        async for chunk in self._stream:
+            yield chunk
+
+    def close(self) -> None:
+        try:
+            if isinstance(self._stream, httpx.SyncByteStream):
+                self._stream.close()
+        finally:
+            self._release()
+
+    async def aclose(self) -> None:
+        try:
+            if isinstance(self._stream, httpx.AsyncByteStream):
+                await self._stream.aclose()
+        finally:
+            self._release()
+
+
+def _pool_connections(
+    pool: httpx.HTTPTransport | httpx.AsyncHTTPTransport,
+) -> list[tuple[bool, bool]]:
+    """``(idle, http2)`` state of each connection of an httpx transport's pool.
+
+    httpx has no public accessor for the httpcore pool behind a transport, and
+    httpcore reports a connection's protocol only in its ``info()`` text, so
+    this is the one place relying on either. If those internals change, the
+    pool counts as empty instead of raising.
+    """
+    core_pool = getattr(pool, "_pool", None)
+    if not isinstance(
+        core_pool,
+        (httpcore.ConnectionPool, httpcore.AsyncConnectionPool),
+    ):
+        return []
+    return [
+        (connection.is_idle(), ", HTTP/2, " in connection.info())
+        for connection in core_pool.connections
+    ]
+
 
 class FlextApiTransports:
     """FLEXT API transport implementations."""
 
+    class OriginLimitedTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+        """httpx transport capping in-flight requests per origin.
+
+        httpx limits connections for the whole pool only. This wrapper holds
+        a slot per origin (scheme, host, port) from sending a request until
+        its response is closed, so one busy host cannot take every pooled
+        connection. With HTTP/1.1 a slot is a connection; with HTTP/2 it is
+        a stream multiplexed on the origin's connection. Wraps a sync or an
+        async transport; waiting longer than the pool timeout raises
+        ``httpx.PoolTimeout``.
+        """
+
+        def __init__(
+            self,
+            transport: httpx.BaseTransport | httpx.AsyncBaseTransport,
+            max_per_origin: int,
+        ) -> None:
+            """Wrap ``transport`` allowing ``max_per_origin`` requests per origin."""
+            if max_per_origin < 1:
+                msg = "max_per_origin must be at least 1"
+                raise ValueError(msg)
+            self._transport = transport
+            self._max_per_origin = max_per_origin
+            self._lock = threading.Lock()
+            self._slots: dict[Origin, threading.Semaphore] = {}
+            self._async_slots: dict[Origin, asyncio.Semaphore] = {}
+            self._in_flight = 0
+            self._waits = 0
+
+        def handle_request(self, request: httpx.Request) -> httpx.Response:
+            """Send ``request`` once its origin has a free slot."""
+            if not isinstance(self._transport, httpx.BaseTransport):
+                msg = "OriginLimitedTransport wraps an async transport"
+                raise TypeError(msg)
+            url = request.url
+            with self._lock:
+                slot = self._slots.setdefault(
+                    (url.raw_scheme, url.raw_host, url.port),
+                    threading.Semaphore(self._max_per_origin),
+                )
+            if not slot.acquire(blocking=False):
+                self._count_wait()
+                timeout = self._pool_timeout(request)
+                if not slot.acquire(timeout=timeout):
+                    raise self._slot_timeout(request, timeout)
+            release = self._acquired(slot.release)
+            try:
+                response = self._transport.handle_request(request)
+            except BaseException:
+                release()
+                raise
+            response.stream = _ReleasingStream(response.stream, release)
+            return response
+
+        async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+            """Send ``request`` once its origin has a free slot (async)."""
+            if not isinstance(self._transport, httpx.AsyncBaseTransport):
+                msg = "OriginLimitedTransport wraps a sync transport"
+                raise TypeError(msg)
+            url = request.url
+            with self._lock:
+                slot = self._async_slots.setdefault(
+                    (url.raw_scheme, url.raw_host, url.port),
+                    asyncio.Semaphore(self._max_per_origin),
+                )
+            if slot.locked():
+                self._count_wait()
+                timeout = self._pool_timeout(request)
+                try:
+                    await asyncio.wait_for(slot.acquire(), timeout)
+                except TimeoutError:
+                    raise self._slot_timeout(request, timeout) from None
+            else:
+                await slot.acquire()
+            release = self._acquired(slot.release)
+            try:
+                response = await self._transport.handle_async_request(request)
+            except BaseException:
+                release()
+                raise
+            response.stream = _ReleasingStream(response.stream, release)
+            return response
+
+        def metrics(self) -> dict[str, int]:
+            """Count requests holding a slot now and requests that had to wait."""
+            with self._lock:
+                return {"in_flight": self._in_flight, "origin_waits": self._waits}
+
+        def close(self) -> None:
+            """Close the wrapped sync transport."""
+            if isinstance(self._transport, httpx.BaseTransport):
+                self._transport.close()
+
+        async def aclose(self) -> None:
+            """Close the wrapped async transport."""
+            if isinstance(self._transport, httpx.AsyncBaseTransport):
+                await self._transport.aclose()
+
+        @staticmethod
+        def _pool_timeout(request: httpx.Request) -> float | None:
+            timeout = request.extensions.get("timeout", {})
+            return timeout.get("pool") if isinstance(timeout, dict) else None
+
+        @staticmethod
+        def _slot_timeout(
+            request: httpx.Request,
+            timeout: float | None,
+        ) -> httpx.PoolTimeout:
+            return httpx.PoolTimeout(
+                f"No free connection slot for {request.url.host} within {timeout}s",
+                request=request,
+            )
+
+        def _count_wait(self) -> None:
+            with self._lock:
+                self._waits += 1
+
+        def _acquired(self, release_slot: Callable[[], None]) -> Callable[[], None]:
+            """Count a held slot; return a callback releasing it exactly once."""
+            released = False
+            with self._lock:
+                self._in_flight += 1
+
+            def release() -> None:
+                nonlocal released
+                with self._lock:
+                    if released:
+                        return
+                    released = True
+                    self._in_flight -= 1
+                release_slot()
+
+            return release
+
+    class PoolRegistry:
+        """Process-wide registry of pooled httpx clients, shared by lease.
+
+        Clients are keyed by origin (scheme, host, port), TLS settings and
+        pool configuration, so every FlextWebTransport, plugin and thread
+        asking for the same origin with the same settings shares one pool
+        of sockets. ``acquire`` takes a lease and ``release`` returns it;
+        a pool without leases is closed once idle for ``idle_timeout``
+        seconds (checked on every acquire/release and by ``evict_idle``).
+        All pools are closed at interpreter exit.
+
+        Usage:
+            registry = FlextApiTransports.PoolRegistry.get_global()
+            registry.stats().value["https://api.example.com:443"]["in_use"]
+        """
+
+        type Key = tuple[object, ...]
+        type Factory = Callable[
+            [],
+            tuple[
+                httpx.Client,
+                httpx.HTTPTransport,
+                FlextApiTransports.OriginLimitedTransport | None,
+            ],
+        ]
+
+        class Entry:
+            """One pooled client and its leases."""
+
+            __slots__ = (
+                "client",
+                "idle_since",
+                "leases",
+                "origin",
+                "origin_limits",
+                "pool",
+            )
+
+            def __init__(
+                self,
+                origin: str,
+                client: httpx.Client,
+                pool: httpx.HTTPTransport,
+                origin_limits: FlextApiTransports.OriginLimitedTransport | None,
+            ) -> None:
+                """Initialize an unleased entry for ``origin``."""
+                self.origin = origin
+                self.client = client
+                self.pool = pool
+                self.origin_limits = origin_limits
+                self.leases = 0
+                self.idle_since: float | None = None
+
+        _global_instance: ClassVar[FlextApiTransports.PoolRegistry | None] = None
+        _COUNTERS = ("pools_created", "pools_evicted", "leases", "releases")
+
+        def __init__(
+            self,
+            idle_timeout: float = c.Api.HTTPClient.POOL_IDLE_TIMEOUT,
+            clock: Callable[[], float] = time.monotonic,
+        ) -> None:
+            """Initialize registry.
+
+            Args:
+                idle_timeout: Seconds a pool without leases is kept for reuse.
+                clock: Monotonic time source (injectable for tests).
+
+            """
+            if idle_timeout < 0:
+                msg = "idle_timeout must be >= 0"
+                raise ValueError(msg)
+            self._idle_timeout = idle_timeout
+            self._clock = clock
+            self._lock = threading.Lock()
+            self._entries: dict[
+                FlextApiTransports.PoolRegistry.Key,
+                FlextApiTransports.PoolRegistry.Entry,
+            ] = {}
+            self._keys_by_client: dict[int, FlextApiTransports.PoolRegistry.Key] = {}
+            self._counters: dict[str, int] = dict.fromkeys(self._COUNTERS, 0)
+
+        @classmethod
+        def get_global(cls) -> FlextApiTransports.PoolRegistry:
+            """Get the process-wide registry, closed automatically at exit."""
+            if cls._global_instance is None:
+                cls._global_instance = cls()
+                atexit.register(cls._global_instance.close_all)
+            return cls._global_instance
+
+        @classmethod
+        def reset_global(cls) -> None:
+            """Close every pool of the global registry and drop it (for tests)."""
+            instance = cls._global_instance
+            cls._global_instance = None
+            if instance is not None:
+                atexit.unregister(instance.close_all)
+                instance.close_all()
+
+        def acquire(
+            self,
+            key: FlextApiTransports.PoolRegistry.Key,
+            origin: str,
+            factory: FlextApiTransports.PoolRegistry.Factory,
+        ) -> httpx.Client:
+            """Lease the client for ``key``, creating it with ``factory`` if needed."""
+            with self._lock:
+                expired = self._take_expired()
+                entry = self._entries.get(key)
+                if entry is None or entry.client.is_closed:
+                    if entry is not None:
+                        self._keys_by_client.pop(id(entry.client), None)
+                    entry = self.Entry(origin, *factory())
+                    self._entries[key] = entry
+                    self._keys_by_client[id(entry.client)] = key
+                    self._counters["pools_created"] += 1
+                entry.leases += 1
+                entry.idle_since = None
+                self._counters["leases"] += 1
+                client = entry.client
+            self._close(expired)
+            return client
+
+        def release(self, client: object) -> bool:
+            """Return one lease on ``client``; False if the registry does not own it."""
+            with self._lock:
+                key = self._keys_by_client.get(id(client))
+                entry = self._entries.get(key) if key is not None else None
+                if entry is None or entry.client is not client:
+                    return False
+                if entry.leases > 0:
+                    entry.leases -= 1
+                    self._counters["releases"] += 1
+                if entry.leases == 0:
+                    entry.idle_since = self._clock()
+                expired = self._take_expired()
+            self._close(expired)
+            return True
+
+        def owns(self, client: object) -> bool:
+            """Whether ``client`` is a pooled client of this registry."""
+            with self._lock:
+                key = self._keys_by_client.get(id(client))
+                entry = self._entries.get(key) if key is not None else None
+                return entry is not None and entry.client is client
+
+        def entry_for(
+            self,
+            key: FlextApiTransports.PoolRegistry.Key,
+        ) -> FlextApiTransports.PoolRegistry.Entry | None:
+            """Get the registry entry for ``key`` if it is still pooled."""
+            with self._lock:
+                return self._entries.get(key)
+
+        def evict_idle(self, *, force: bool = False) -> int:
+            """Close pools without leases idle past the timeout (all if ``force``)."""
+            with self._lock:
+                expired = self._take_expired(force=force)
+            self._close(expired)
+            return len(expired)
+
+        def close_all(self) -> None:
+            """Close every pool, leased or not."""
+            with self._lock:
+                entries = list(self._entries.values())
+                self._entries.clear()
+                self._keys_by_client.clear()
+            self._close(entries)
+
+        def metrics(self) -> r[t.Api.MetricsDict]:
+            """Get pool counters: ``pools`` and ``pools_leased`` now, plus totals."""
+            with self._lock:
+                metrics: t.Api.MetricsDict = dict(self._counters)
+                metrics["pools"] = len(self._entries)
+                metrics["pools_leased"] = sum(
+                    1 for entry in self._entries.values() if entry.leases
+                )
+            return r[t.Api.MetricsDict].ok(metrics)
+
+        def stats(self) -> r[dict[str, t.Api.MetricsDict]]:
+            """Get per-origin counts.
+
+            For each origin: ``pools``, ``leases``, and connections ``open``,
+            ``idle`` (kept alive for reuse) and ``in_use`` (serving a request).
+            """
+            with self._lock:
+                entries = list(self._entries.values())
+            stats: dict[str, t.Api.MetricsDict] = {}
+            for entry in entries:
+                origin = stats.setdefault(
+                    entry.origin,
+                    dict.fromkeys(("pools", "leases", "open", "idle", "in_use"), 0),
+                )
+                counts = self.connection_counts([entry.pool])
+                origin["pools"] += 1
+                origin["leases"] += entry.leases
+                origin["open"] += counts["connections"]
+                origin["idle"] += counts["connections_idle"]
+                origin["in_use"] += counts["connections"] - counts["connections_idle"]
+            return r[dict[str, t.Api.MetricsDict]].ok(stats)
+
+        @staticmethod
+        def connection_counts(
+            pools: Iterable[httpx.HTTPTransport | httpx.AsyncHTTPTransport],
+        ) -> t.Api.MetricsDict:
+            """Count open, idle and HTTP/2 connections of httpx transports."""
+            connections = [state for pool in pools for state in _pool_connections(pool)]
+            return {
+                "connections": len(connections),
+                "connections_idle": sum(1 for idle, _ in connections if idle),
+                "connections_http2": sum(1 for _, http2 in connections if http2),
+            }
+
+        def _take_expired(
+            self,
+            *,
+            force: bool = False,
+        ) -> list[FlextApiTransports.PoolRegistry.Entry]:
+            """Remove and return unleased idle pools (caller holds the lock)."""
+            now = self._clock()
+            expired = [
+                key
+                for key, entry in self._entries.items()
+                if entry.leases == 0
+                and entry.idle_since is not None
+                and (force or now - entry.idle_since >= self._idle_timeout)
+            ]
+            entries = [self._entries.pop(key) for key in expired]
+            for entry in entries:
+                self._keys_by_client.pop(id(entry.client), None)
+            self._counters["pools_evicted"] += len(entries)
+            return entries
+
+        @staticmethod
+        def _close(entries: Iterable[FlextApiTransports.PoolRegistry.Entry]) -> None:
+            for entry in entries:
+                entry.client.close()
+
     class FlextWebTransport(TransportPlugin):
-        """HTTP transport implementation using httpx."""
+        """HTTP transport leasing pooled httpx clients from a PoolRegistry.
+
+        ``connect(url)`` leases the client for the URL's origin and this
+        transport's TLS and pool settings, and ``disconnect`` returns the
+        lease, so transports, plugins and threads with the same settings
+        share sockets. Requests reuse keep-alive connections.
+        ``connect_async`` returns an ``httpx.AsyncClient`` with the same
+        limits and redirect policy, owned by this transport (async clients
+        are bound to one event loop); with HTTP/2 it multiplexes concurrent
+        requests as streams on a single connection per origin.
 
-        def __init__(self) -> None:
-            """Initialize HTTP transport."""
+        With a ``dns_cache``, new sync connections resolve through it and
+        race IPv6 and IPv4 addresses; async connections use anyio's resolver.
+
+        Sync clients always speak HTTP/1.1: httpcore's sync HTTP/2 can send
+        stream ids out of order when many threads share one connection, which
+        strict servers reject. ``http2`` and ``http2_prior_knowledge`` apply
+        to ``connect_async`` only and need the ``h2`` package; without it
+        the async client uses HTTP/1.1 and ``http2`` reports False.
+        """
+
+        # Options of connect() that select and configure the pooled client
+        _CLIENT_OPTIONS: ClassVar[tuple[str, ...]] = ("headers", "timeout")
+        _POOL_OPTIONS: ClassVar[tuple[str, ...]] = ("cert", "trust_env", "verify")
+
+        def __init__(
+            self,
+            *,
+            http2: bool = False,
+            http2_prior_knowledge: bool = False,
+            max_connections: int = c.Api.HTTPClient.DEFAULT_MAX_CONNECTIONS,
+            max_keepalive_connections: int = (
+                c.Api.HTTPClient.DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+            ),
+            keepalive_expiry: float = c.Api.HTTPClient.DEFAULT_KEEPALIVE_EXPIRY,
+            max_connections_per_origin: int | None = None,
+            follow_redirects: bool = True,
+            max_redirects: int = c.Api.HTTPClient.DEFAULT_MAX_REDIRECTS,
+            registry: FlextApiTransports.PoolRegistry | None = None,
+            dns_cache: FlextApiDnsCache | None = None,
+        ) -> None:
+            """Initialize HTTP transport.
+
+            Args:
+                http2: Negotiate HTTP/2 (ALPN over TLS) on async connections
+                    when ``h2`` is installed.
+                http2_prior_knowledge: Speak HTTP/2 on async connections
+                    without negotiation, also over cleartext (h2c); implies
+                    ``http2``.
+                max_connections: Connections open at once per pool.
+                max_keepalive_connections: Idle connections kept for reuse.
+                keepalive_expiry: Seconds an idle connection stays pooled.
+                max_connections_per_origin: In-flight requests allowed per
+                    origin (None: only ``max_connections`` applies).
+                follow_redirects: Follow 3xx responses by default.
+                max_redirects: Redirects followed before failing.
+                registry: Pool registry to lease from (default: the global one).
+                dns_cache: DNS cache for new sync connections (None: system
+                    resolver on every connect).
+
+            """
+            if (
+                max_connections_per_origin is not None
+                and max_connections_per_origin < 1
+            ):
+                msg = "max_connections_per_origin must be at least 1"
+                raise ValueError(msg)
+            if max_redirects < 0:
+                msg = "max_redirects must be >= 0"
+                raise ValueError(msg)
             self._client: httpx.Client | None = None
+            self._lock = threading.Lock()
+            self._http2 = (http2 or http2_prior_knowledge) and _HTTP2_AVAILABLE
+            self._http1 = not (http2_prior_knowledge and self._http2)
+            self._limits = httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            )
+            self._max_connections_per_origin = max_connections_per_origin
+            self._follow_redirects = follow_redirects
+            self._max_redirects = max_redirects
+            self._registry = registry
+            self._dns_cache = dns_cache
+            # Leases held by this transport, and every pool key it has used
+            self._leases: dict[int, tuple[httpx.Client, int]] = {}
+            self._keys: set[FlextApiTransports.PoolRegistry.Key] = set()
+            self._async_client: httpx.AsyncClient | None = None
+            self._async_pool: httpx.AsyncHTTPTransport | None = None
+            self._async_origin_limits: (
+                FlextApiTransports.OriginLimitedTransport | None
+            ) = None
+
+        @staticmethod
+        def http2_available() -> bool:
+            """Whether the ``h2`` package needed for HTTP/2 is installed."""
+            return _HTTP2_AVAILABLE
+
+        @property
+        def http2(self) -> bool:
+            """Whether async connections may use HTTP/2 (sync ones never do)."""
+            return self._http2
+
+        @property
+        def limits(self) -> httpx.Limits:
+            """Connection limits of each pool."""
+            return self._limits
+
+        @property
+        def registry(self) -> FlextApiTransports.PoolRegistry:
+            """Registry this transport leases pooled clients from."""
+            return self._registry or FlextApiTransports.PoolRegistry.get_global()
 
         def connect(self, url: str, **options: object) -> r[object]:
-            """Connect to HTTP endpoint."""
+            """Lease the pooled client for ``url``'s origin (thread-safe).
+
+            ``verify``, ``cert`` and ``trust_env`` (TLS) and ``headers`` and
+            ``timeout`` options are part of the pool key and configure the
+            client when it is created; other options are ignored. Return the
+            lease with ``disconnect``.
+            """
             try:
-                # Validate URL parameter
                 if not url:
                     return r[object].fail("URL is required for HTTP connection")
+                parsed = httpx.URL(url)
+                port = parsed.port or _DEFAULT_PORTS.get(parsed.scheme)
+                origin = f"{parsed.scheme}://{parsed.host}:{port}"
+                key = (origin, *self._pool_key(options))
+                client = self.registry.acquire(
+                    key,
+                    origin,
+                    lambda: self._create_client(options),
+                )
+                with self._lock:
+                    _, count = self._leases.get(id(client), (client, 0))
+                    self._leases[id(client)] = (client, count + 1)
+                    self._keys.add(key)
+                    self._client = client
+                return r[object].ok(client)
+            except Exception as e:
+                return r[object].fail(f"HTTP connect failed: {e}")
 
-                # Create a basic httpx client - options can be used by subclasses
-                # The url parameter is validated but not directly used in client creation
-                # as httpx.Client doesn't take a base URL in connect()
-                # Options parameter is reserved for future extensibility
-                _ = options  # Reserved for future use
-                self._client = httpx.Client()
-                return r[object].ok(self._client)
+        def connect_async(self, url: str, **options: object) -> r[object]:
+            """Get this transport's ``httpx.AsyncClient``, creating it on first use.
+
+            Takes the same options as ``connect``; close it with ``aclose``.
+            """
+            try:
+                if not url:
+                    return r[object].fail("URL is required for HTTP connection")
+                with self._lock:
+                    client = self._async_client
+                    if client is None or client.is_closed:
+                        client = self._create_async_client(options)
+                        self._async_client = client
+                return r[object].ok(client)
             except Exception as e:
                 return r[object].fail(f"HTTP connect failed: {e}")
 
         def disconnect(self, connection: object) -> r[bool]:
-            """Disconnect HTTP connection."""
+            """Return a leased client to the registry, or close any other client."""
             try:
-                if isinstance(connection, httpx.Client):
+                with self._lock:
+                    if self._client is connection:
+                        self._client = None
+                    lease = self._leases.pop(id(connection), None)
+                    if lease is not None and lease[1] > 1:
+                        self._leases[id(connection)] = (lease[0], lease[1] - 1)
+                if lease is not None:
+                    self.registry.release(connection)
+                elif isinstance(connection, httpx.Client) and not self.registry.owns(
+                    connection,
+                ):
                     connection.close()
+                return r[bool].ok(value=True)
+            except Exception as e:
+                return r[bool].fail(f"HTTP disconnect failed: {e}")
+
+        def close(self) -> r[bool]:
+            """Return every lease this transport still holds."""
+            with self._lock:
+                leases = list(self._leases.values())
+                self._leases.clear()
                 self._client = None
+            try:
+                for client, count in leases:
+                    for _ in range(count):
+                        self.registry.release(client)
                 return r[bool].ok(value=True)
             except Exception as e:
                 return r[bool].fail(f"HTTP disconnect failed: {e}")
 
+        async def aclose(self) -> r[bool]:
+            """Close the async pool if one is open."""
+            client = self._async_client
+            self._async_client = None
+            self._async_pool = None
+            self._async_origin_limits = None
+            try:
+                if client is not None:
+                    await client.aclose()
+                return r[bool].ok(value=True)
+            except Exception as e:
+                return r[bool].fail(f"HTTP disconnect failed: {e}")
+
+        def metrics(self) -> r[t.Api.MetricsDict]:
+            """Get counters of the pools this transport has used.
+
+            ``connections`` counts open connections (``connections_http2`` of
+            them speak HTTP/2), ``connections_idle`` those waiting for reuse.
+            With a per-origin limit, ``in_flight`` counts requests holding a
+            slot and ``origin_waits`` requests that queued for one. Pools are
+            shared through the registry, so other users' requests count too.
+            """
+            with self._lock:
+                keys = list(self._keys)
+            entries = [
+                entry
+                for key in keys
+                if (entry := self.registry.entry_for(key)) is not None
+            ]
+            pools: list[httpx.HTTPTransport | httpx.AsyncHTTPTransport] = [
+                entry.pool for entry in entries
+            ]
+            origin_limits = [entry.origin_limits for entry in entries]
+            if self._async_pool is not None:
+                pools.append(self._async_pool)
+                origin_limits.append(self._async_origin_limits)
+            metrics = FlextApiTransports.PoolRegistry.connection_counts(pools)
+            for limiter in origin_limits:
+                if limiter is not None:
+                    for name, value in limiter.metrics().items():
+                        metrics[name] = metrics.get(name, 0) + value
+            return r[t.Api.MetricsDict].ok(metrics)
+
+        def _pool_key(self, options: dict[str, object]) -> tuple[object, ...]:
+            """TLS, client and pool settings that must match to share a pool."""
+            return (
+                *(_freeze(options.get(name)) for name in self._POOL_OPTIONS),
+                *(_freeze(options.get(name)) for name in self._CLIENT_OPTIONS),
+                self._limits.max_connections,
+                self._limits.max_keepalive_connections,
+                self._limits.keepalive_expiry,
+                self._max_connections_per_origin,
+                self._follow_redirects,
+                self._max_redirects,
+                self._dns_cache,
+            )
+
+        def _split_options(
+            self,
+            options: dict[str, object],
+            *,
+            http2: bool,
+        ) -> tuple[_PoolKwargs, _ClientKwargs]:
+            """Split connect() options into pool and client keyword arguments.
+
+            Without ``http2`` the pool speaks HTTP/1.1 only. Options left out
+            keep httpx's defaults.
+
+            Raises:
+                TypeError: If an option has a type httpx does not accept.
+
+            """
+            pool_options: _PoolKwargs = {
+                "http1": self._http1 or not http2,
+                "http2": self._http2 and http2,
+                "limits": self._limits,
+            }
+            client_options: _ClientKwargs = {
+                "follow_redirects": self._follow_redirects,
+                "max_redirects": self._max_redirects,
+            }
+            if "cert" in options:
+                cert = options["cert"]
+                if cert is not None and not isinstance(cert, (str, tuple)):
+                    raise self._option_error("cert", cert)
+                pool_options["cert"] = cert
+            if "trust_env" in options:
+                trust_env = options["trust_env"]
+                if not isinstance(trust_env, bool):
+                    raise self._option_error("trust_env", trust_env)
+                pool_options["trust_env"] = trust_env
+            if "verify" in options:
+                verify = options["verify"]
+                if not isinstance(verify, (ssl.SSLContext, str, bool)):
+                    raise self._option_error("verify", verify)
+                pool_options["verify"] = verify
+            if "headers" in options:
+                headers = options["headers"]
+                if headers is not None and not isinstance(
+                    headers,
+                    (httpx.Headers, Mapping, list, tuple),
+                ):
+                    raise self._option_error("headers", headers)
+                client_options["headers"] = headers
+            if "timeout" in options:
+                timeout = options["timeout"]
+                if timeout is not None and not isinstance(
+                    timeout,
+                    (httpx.Timeout, int, float, tuple),
+                ):
+                    raise self._option_error("timeout", timeout)
+                client_options["timeout"] = timeout
+            return pool_options, client_options
+
+        @staticmethod
+        def _option_error(name: str, value: object) -> TypeError:
+            """Error for a connect() option of a type httpx does not accept."""
+            return TypeError(
+                f"Invalid connect option {name}: {type(value).__name__}",
+            )
+
+        def _create_client(
+            self,
+            options: dict[str, object],
+        ) -> tuple[
+            httpx.Client,
+            httpx.HTTPTransport,
+            FlextApiTransports.OriginLimitedTransport | None,
+        ]:
+            pool_options, client_options = self._split_options(options, http2=False)
+            pool = httpx.HTTPTransport(**pool_options)
+            if self._dns_cache is not None:
+                self._dns_cache.install(pool)
+            transport: httpx.BaseTransport = pool
+            origin_limits = None
+            if self._max_connections_per_origin is not None:
+                origin_limits = FlextApiTransports.OriginLimitedTransport(
+                    pool,
+                    self._max_connections_per_origin,
+                )
+                transport = origin_limits
+            client = httpx.Client(transport=transport, **client_options)
+            return client, pool, origin_limits
+
+        def _create_async_client(
+            self,
+            options: dict[str, object],
+        ) -> httpx.AsyncClient:
+            pool_options, client_options = self._split_options(options, http2=True)
+            self._async_pool = httpx.AsyncHTTPTransport(**pool_options)
+            transport: httpx.AsyncBaseTransport = self._async_pool
+            if self._max_connections_per_origin is not None:
+                self._async_origin_limits = FlextApiTransports.OriginLimitedTransport(
+                    self._async_pool,
+                    self._max_connections_per_origin,
+                )
+                transport = self._async_origin_limits
+            return httpx.AsyncClient(transport=transport, **client_options)
+
         def _extract_request_params(
             self,
             data: dict[str, t.GeneralValueType],
@@ -19,7 +19,6 @@ from __future__ import annotations
 
 import hashlib
 import hmac
-import json
 import time
 import uuid
 from collections import deque
@@ -34,6 +33,7 @@ from flext_core import (
     r,
 )
 
+from flext_api.serializers import FlextApiSerializers
 from flext_api.typings import t
 
 
@@ -169,12 +169,7 @@ class FlextWebhookHandler(FlextService[object]):
     def _parse_payload(self, payload: bytes | str) -> r[t.JsonObject]:
         """Parse webhook payload."""
         try:
-            if isinstance(payload, bytes):
-                payload_str = payload.decode("utf-8")
-            else:
-                payload_str = payload
-
-            event_data = json.loads(payload_str)
+            event_data = FlextApiSerializers.Json.loads(payload)
             if not isinstance(event_data, dict):
                 return r[t.JsonObject].fail("Payload must be a JSON object")
             # Convert to JsonObject (dict[str, JsonValue])
@@ -1,6 +1,10 @@
+type _Unpacked = (
+    str | int | float | bool | bytes | None | list[_Unpacked] | dict[str, _Unpacked]
+)
+
+class UnpackException(Exception): ...
+
 def packb(obj: object) -> bytes: ...
 
 # unpackb returns a union of possible msgpack types
-def unpackb(
-    data: bytes,
-) -> str | int | float | bool | dict[str, object] | list[object] | None: ...
+def unpackb(data: bytes) -> _Unpacked: ...
@@ -0,0 +1,8 @@
+"""Performance benchmarks for FLEXT API.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
@@ -0,0 +1,121 @@
+"""Adaptive concurrency simulation for FlextApiConcurrencyLimiter.
+
+Closed-loop client threads hammer a local server whose capacity changes
+between phases (shrinks, then grows). Without a limiter every thread keeps
+sending and the overflow is shed with 503; with AIMD or Vegas the per-origin
+limit follows the capacity, so fewer requests are shed and the extra demand
+waits in the client queue instead.
+
+Run explicitly: ``pytest tests/benchmark/adaptive_concurrency.py -s``
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import statistics
+import threading
+import time
+
+import pytest
+
+from flext_api import (
+    FlextApiClient,
+    FlextApiConcurrencyLimiter,
+    FlextApiModels,
+    FlextApiSettings,
+)
+from tests.benchmark.servers import LocalCapacityServer
+
+CLIENTS = 24
+LATENCY = 0.02
+# (server capacity, seconds)
+PHASES = ((8, 1.5), (2, 1.5), (12, 1.5))
+SAMPLE_INTERVAL = 0.05
+
+
+def _simulate(
+    limiter: FlextApiConcurrencyLimiter | None,
+) -> list[tuple[int, int, int, float]]:
+    """Per phase: (capacity, served, shed, mean client limit)."""
+    report: list[tuple[int, int, int, float]] = []
+    with LocalCapacityServer(capacity=PHASES[0][0], latency=LATENCY) as server:
+        config = FlextApiSettings(
+            base_url=server.base_url,
+            max_connections=CLIENTS,
+            max_keepalive_connections=CLIENTS,
+        )
+        stop = threading.Event()
+        with FlextApiClient(config, concurrency_limiter=limiter) as client:
+            request = FlextApiModels.HttpRequest(url="/items")
+
+            def worker() -> None:
+                while not stop.is_set():
+                    client.request(request)
+
+            threads = [threading.Thread(target=worker) for _ in range(CLIENTS)]
+            for thread in threads:
+                thread.start()
+            for capacity, seconds in PHASES:
+                server.capacity = capacity
+                served, shed = server.served, server.shed
+                limits: list[int] = []
+                deadline = time.monotonic() + seconds
+                while time.monotonic() < deadline:
+                    time.sleep(SAMPLE_INTERVAL)
+                    limits.append(
+                        CLIENTS if limiter is None else limiter.limit(server.base_url),
+                    )
+                report.append(
+                    (
+                        capacity,
+                        server.served - served,
+                        server.shed - shed,
+                        statistics.fmean(limits),
+                    )
+                )
+            stop.set()
+            for thread in threads:
+                thread.join()
+    return report
+
+
+@pytest.mark.benchmark
+@pytest.mark.performance
+class TestAdaptiveConcurrencyBenchmark:
+    """Shed requests and limit tracking: static vs AIMD vs Vegas."""
+
+    def test_limit_follows_changing_capacity(self) -> None:
+        """Adaptive limits shed far fewer requests than a static pool."""
+        results = {
+            "static": _simulate(None),
+            "aimd": _simulate(FlextApiConcurrencyLimiter(initial_limit=CLIENTS)),
+            "vegas": _simulate(
+                FlextApiConcurrencyLimiter(algorithm="vegas", initial_limit=CLIENTS),
+            ),
+        }
+
+        lines = ["", "strategy  capacity  served/s   shed/s  mean limit"]
+        for name, phases in results.items():
+            for (capacity, served, shed, limit), (_, seconds) in zip(
+                phases,
+                PHASES,
+                strict=True,
+            ):
+                lines.append(
+                    f"{name:8}  {capacity:8}  {served / seconds:8.0f} "
+                    f"{shed / seconds:8.0f}  {limit:10.1f}",
+                )
+        print("\n".join(lines))  # noqa: T201 - benchmark report
+
+        def shed_share(phases: list[tuple[int, int, int, float]]) -> float:
+            shed = sum(phase[2] for phase in phases)
+            return shed / max(1, shed + sum(phase[1] for phase in phases))
+
+        assert shed_share(results["aimd"]) < shed_share(results["static"]) / 2
+        # The AIMD limit drops while capacity is 2 and recovers once it is 12
+        aimd = results["aimd"]
+        assert aimd[1][3] < aimd[0][3]
+        assert aimd[2][3] > aimd[1][3]
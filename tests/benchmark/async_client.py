@@ -0,0 +1,70 @@
+"""Concurrency benchmark for FlextApiAsyncClient.
+
+Fans out requests to an in-process ASGI app with simulated latency and
+compares one-at-a-time awaiting with ``asyncio.gather`` on a single client,
+all on one thread.
+
+Run explicitly: ``pytest tests/benchmark/async_client.py -s``
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from flext_api import FlextApiAsyncClient, FlextApiModels, FlextApiSettings
+from tests.benchmark.servers import LatencyAsgiApp
+
+REQUESTS = 200
+LATENCY = 0.01
+
+
+@pytest.mark.benchmark
+@pytest.mark.performance
+class TestAsyncClientBenchmark:
+    """Requests/sec for sequential vs concurrent async requests."""
+
+    @pytest.mark.asyncio
+    async def test_sequential_vs_concurrent(self) -> None:
+        """Concurrent requests overlap their latency on a single event loop."""
+        app = LatencyAsgiApp(latency=LATENCY)
+        config = FlextApiSettings(base_url="http://bench")
+        request = FlextApiModels.HttpRequest(url="/items")
+
+        async with FlextApiAsyncClient(
+            config,
+            transport=httpx.ASGITransport(app=app),
+        ) as client:
+            start = time.perf_counter()
+            for _ in range(REQUESTS):
+                assert (await client.arequest(request)).is_success
+            sequential_elapsed = time.perf_counter() - start
+            sequential_peak = app.peak_in_flight
+
+            app.peak_in_flight = 0
+            start = time.perf_counter()
+            results = await asyncio.gather(
+                *(client.arequest(request) for _ in range(REQUESTS)),
+            )
+            concurrent_elapsed = time.perf_counter() - start
+
+        assert all(result.is_success for result in results)
+        sequential_rps = REQUESTS / sequential_elapsed
+        concurrent_rps = REQUESTS / concurrent_elapsed
+        print(  # noqa: T201 - benchmark report
+            f"\nsequential await: {sequential_rps:8.0f} req/s "
+            f"(peak in flight {sequential_peak})"
+            f"\nasyncio.gather:   {concurrent_rps:8.0f} req/s "
+            f"(peak in flight {app.peak_in_flight})",
+        )
+
+        assert sequential_peak == 1
+        assert app.peak_in_flight > 1
+        assert concurrent_rps > sequential_rps * 5
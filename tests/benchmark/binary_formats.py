@@ -0,0 +1,101 @@
+"""JSON vs MessagePack vs CBOR size and CPU benchmark.
+
+Encodes and decodes representative service-to-service payloads with each
+negotiable format of FlextApiSerializers.ContentNegotiation and reports the
+encoded size and the encode/decode time per payload.
+
+Run explicitly: ``pytest tests/benchmark/binary_formats.py -s``
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+
+import pytest
+
+from flext_api.serializers import FlextApiSerializers
+
+FORMATS = ("application/json", "application/msgpack", "application/cbor")
+TARGET_SECONDS = 0.2
+
+PAYLOADS: dict[str, object] = {
+    "records": {
+        "items": [
+            {
+                "id": i,
+                "name": f"resource-{i}",
+                "active": i % 2 == 0,
+                "owner": {"id": i % 50, "email": f"user{i % 50}@example.com"},
+                "tags": ["alpha", "beta"],
+            }
+            for i in range(1000)
+        ],
+        "total": 1000,
+    },
+    "metrics": {
+        "series": [
+            {"ts": 1_700_000_000 + i, "value": i * 0.125, "count": i * 7}
+            for i in range(5000)
+        ],
+    },
+    "small": {"id": 42, "status": "ok", "retry_after": None, "score": 0.5},
+}
+
+
+def _microseconds(operation: Callable[[], object]) -> float:
+    """Mean microseconds per call of ``operation`` over about TARGET_SECONDS."""
+    rounds = 0
+    start = time.perf_counter()
+    while (elapsed := time.perf_counter() - start) < TARGET_SECONDS:
+        operation()
+        rounds += 1
+    return elapsed / rounds * 1e6
+
+
+@pytest.mark.benchmark
+@pytest.mark.performance
+class TestBinaryFormatsBenchmark:
+    """Encoded bytes and encode/decode microseconds per format."""
+
+    def test_size_and_cpu_against_json(self) -> None:
+        """Binary formats are smaller than JSON for numeric payloads."""
+        negotiation = FlextApiSerializers.ContentNegotiation
+        sizes: dict[tuple[str, str], int] = {}
+        report = [
+            "",
+            (
+                f"{'payload':8} {'format':20} {'bytes':>9} {'vs json':>8} "
+                f"{'encode us':>10} {'decode us':>10}"
+            ),
+        ]
+        for name, data in PAYLOADS.items():
+            for media_type in FORMATS:
+                encoded = negotiation.encode(data, media_type)
+                assert negotiation.decode(encoded, media_type) == data
+                sizes[name, media_type] = len(encoded)
+                encode = _microseconds(
+                    lambda data=data, media_type=media_type: negotiation.encode(
+                        data,
+                        media_type,
+                    ),
+                )
+                decode = _microseconds(
+                    lambda encoded=encoded, media_type=media_type: negotiation.decode(
+                        encoded,
+                        media_type,
+                    ),
+                )
+                ratio = len(encoded) / sizes[name, "application/json"]
+                report.append(
+                    f"{name:8} {media_type:20} {len(encoded):9d} {ratio:7.0%} "
+                    f"{encode:10.1f} {decode:10.1f}",
+                )
+        print("\n".join(report))  # noqa: T201 - benchmark report
+
+        for media_type in FORMATS[1:]:
+            assert sizes["metrics", media_type] < sizes["metrics", "application/json"]
@@ -0,0 +1,75 @@
+"""Request body compression ratio and CPU benchmark.
+
+Compresses API-shaped JSON bodies of 1 KB to 1 MB with every available
+encoding and level range of FlextApiCompression, reporting the ratio and the
+CPU milliseconds spent per request so ``compression_min_size`` and
+``compression_level`` can be tuned.
+
+Run explicitly: ``pytest tests/benchmark/compression.py -s``
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import json
+import time
+
+import pytest
+
+from flext_api import FlextApiCompression
+
+SIZES = {"1KB": 1024, "10KB": 10 * 1024, "100KB": 100 * 1024, "1MB": 1024**2}
+LEVELS = {"gzip": (1, 6, 9), "br": (1, 4, 11), "zstd": (1, 3, 19)}
+TARGET_SECONDS = 0.1
+
+
+def _payload(size: int) -> bytes:
+    record = {
+        "id": 0,
+        "name": "resource-name",
+        "status": "active",
+        "owner": {"id": 42, "email": "owner@example.com"},
+        "tags": ["alpha", "beta"],
+    }
+    per_record = len(json.dumps(record))
+    items = [{**record, "id": i} for i in range(max(1, size // per_record))]
+    return json.dumps({"items": items}).encode()
+
+
+def _cpu_ms(compression: FlextApiCompression, body: bytes) -> float:
+    """Mean CPU milliseconds of encode_request over about TARGET_SECONDS."""
+    rounds = 0
+    started = time.thread_time()
+    while (elapsed := time.thread_time() - started) < TARGET_SECONDS:
+        compression.encode_request(body, {})
+        rounds += 1
+    return elapsed / rounds * 1000
+
+
+@pytest.mark.benchmark
+@pytest.mark.performance
+class TestCompressionBenchmark:
+    """Ratio and CPU per request body for each encoding and level."""
+
+    def test_ratio_and_cpu(self) -> None:
+        """Compression shrinks typical JSON bodies to under half their size."""
+        report = [
+            "",
+            f"{'encoding':8} {'level':>5} {'size':>6} {'ratio':>6} {'cpu ms':>8}",
+        ]
+        for encoding in FlextApiCompression.available_encodings():
+            for level in LEVELS[encoding]:
+                compression = FlextApiCompression(encoding, min_size=0, level=level)
+                for label, size in SIZES.items():
+                    body = _payload(size)
+                    _, _, result = compression.encode_request(body, {})
+                    assert result is not None
+                    assert result.ratio < 0.5
+                    report.append(
+                        f"{encoding:8} {level:5d} {label:>6} {result.ratio:6.1%} "
+                        f"{_cpu_ms(compression, body):8.3f}",
+                    )
+        print("\n".join(report))  # noqa: T201 - benchmark report
@@ -0,0 +1,62 @@
+"""Connection pool benchmark for FlextApiClient.
+
+Compares the previous strategy (one ``httpx.Client`` per request, i.e. a new
+TCP connection and pool per call) with the persistent pooled transport owned
+by FlextApiClient, against a local keep-alive server.
+
+Run explicitly: ``pytest tests/benchmark/connection_pool.py -s``
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import time
+
+import httpx
+import pytest
+
+from flext_api import FlextApiClient, FlextApiModels, FlextApiSettings
+from tests.benchmark.servers import LocalHttpServer
+
+REQUESTS = 200
+
+
+@pytest.mark.benchmark
+@pytest.mark.performance
+class TestConnectionPoolBenchmark:
+    """Requests/sec before and after the persistent connection pool."""
+
+    def test_pooled_client_vs_client_per_request(self) -> None:
+        """Pooled client reuses keep-alive sockets and serves more requests/sec."""
+        with LocalHttpServer() as server:
+            url = f"{server.base_url}/items"
+
+            start = time.perf_counter()
+            for _ in range(REQUESTS):
+                with httpx.Client(timeout=10.0) as per_request_client:
+                    assert per_request_client.get(url).status_code == 200
+            per_request_elapsed = time.perf_counter() - start
+            per_request_connections = server.connections
+
+            with FlextApiClient(FlextApiSettings(base_url=server.base_url)) as client:
+                request = FlextApiModels.HttpRequest(url="/items")
+                start = time.perf_counter()
+                for _ in range(REQUESTS):
+                    assert client.request(request).is_success
+                pooled_elapsed = time.perf_counter() - start
+            pooled_connections = server.connections - per_request_connections
+
+        per_request_rps = REQUESTS / per_request_elapsed
+        pooled_rps = REQUESTS / pooled_elapsed
+        print(  # noqa: T201 - benchmark report
+            f"\nclient-per-request: {per_request_rps:8.0f} req/s "
+            f"({per_request_connections} connections)"
+            f"\npooled FlextApiClient: {pooled_rps:8.0f} req/s "
+            f"({pooled_connections} connections)",
+        )
+
+        assert per_request_connections == REQUESTS
+        assert pooled_connections == 1
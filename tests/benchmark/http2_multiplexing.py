@@ -0,0 +1,99 @@
+"""HTTP/2 multiplexing benchmark for FlextWebTransport.
+
+Sends many concurrent requests through the transport's pooled async client,
+once over HTTP/1.1 against a keep-alive server and once over HTTP/2 (h2c,
+prior knowledge) against a local HTTP/2 server, and reports connections
+opened and requests/sec. HTTP/1.1 needs one connection per in-flight
+request; HTTP/2 carries them as streams on a single connection.
+
+Needs the ``h2`` package (``pip install flext-api[http2]``); skipped without.
+
+Run explicitly: ``pytest tests/benchmark/http2_multiplexing.py -s``
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from flext_api.transports import FlextApiTransports
+from tests.benchmark.servers import LocalHttp2Server, LocalHttpServer
+
+CONCURRENCY = 200
+REQUESTS = 2000
+LATENCY = 0.02
+
+
+async def _run(
+    transport: FlextApiTransports.FlextWebTransport,
+    base_url: str,
+) -> tuple[float, int]:
+    """Send REQUESTS GETs, CONCURRENCY at a time; return req/s and pool size."""
+    client = transport.connect_async(base_url).value
+    assert isinstance(client, httpx.AsyncClient)
+    url = f"{base_url}/items"
+    gate = asyncio.Semaphore(CONCURRENCY)
+
+    async def call() -> int:
+        async with gate:
+            return (await client.get(url)).status_code
+
+    # Warm-up so both runs start from an open pool
+    assert await call() == 200
+    start = time.perf_counter()
+    statuses = await asyncio.gather(*(call() for _ in range(REQUESTS)))
+    elapsed = time.perf_counter() - start
+    assert set(statuses) == {200}
+    pooled = transport.metrics().value["connections"]
+    await transport.aclose()
+    return REQUESTS / elapsed, pooled
+
+
+@pytest.mark.benchmark
+@pytest.mark.performance
+class TestHttp2MultiplexingBenchmark:
+    """Connections and throughput of HTTP/1.1 vs HTTP/2 at high concurrency."""
+
+    def test_http2_multiplexes_on_one_connection(self) -> None:
+        """HTTP/2 serves the same load over a single connection."""
+        pytest.importorskip("h2")
+        limits = {
+            "max_connections": CONCURRENCY,
+            "max_keepalive_connections": CONCURRENCY,
+        }
+
+        with LocalHttpServer(latency=LATENCY) as server:
+            http1_rps, http1_pooled = asyncio.run(
+                _run(FlextApiTransports.FlextWebTransport(**limits), server.base_url),
+            )
+            http1_accepted = server.connections
+
+        with LocalHttp2Server(latency=LATENCY) as server:
+            http2_rps, http2_pooled = asyncio.run(
+                _run(
+                    FlextApiTransports.FlextWebTransport(
+                        http2_prior_knowledge=True,
+                        **limits,
+                    ),
+                    server.base_url,
+                ),
+            )
+            http2_accepted = server.connections
+
+        print(  # noqa: T201 - benchmark report
+            f"\n{CONCURRENCY} concurrent, {REQUESTS} requests, "
+            f"{LATENCY * 1000:.0f}ms server latency"
+            f"\nHTTP/1.1: {http1_rps:8.0f} req/s, {http1_accepted:4} connections "
+            f"accepted, {http1_pooled} pooled"
+            f"\nHTTP/2:   {http2_rps:8.0f} req/s, {http2_accepted:4} connections "
+            f"accepted, {http2_pooled} pooled",
+        )
+        assert http2_accepted == http2_pooled == 1
+        assert http1_accepted > http2_accepted
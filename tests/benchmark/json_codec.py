@@ -0,0 +1,87 @@
+"""JSON codec throughput benchmark for FlextApiSerializers.Json.
+
+Encodes and decodes API-shaped payloads of 10 KB to 5 MB with every
+installed backend (orjson, msgspec, stdlib json) and reports MB/s.
+
+Run explicitly: ``pytest tests/benchmark/json_codec.py -s``
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+
+import pytest
+
+from flext_api.serializers import FlextApiSerializers
+
+SIZES = {"10KB": 10 * 1024, "100KB": 100 * 1024, "1MB": 1024**2, "5MB": 5 * 1024**2}
+TARGET_SECONDS = 0.2
+
+
+def _payload(size: int) -> dict[str, object]:
+    """List response with records similar to our typical API resources."""
+    record = {
+        "id": 0,
+        "name": "resource-name",
+        "active": True,
+        "score": 0.75,
+        "tags": ["alpha", "beta"],
+        "owner": {"id": 42, "email": "owner@example.com"},
+        "description": "Résumé of the resource",
+    }
+    per_record = len(FlextApiSerializers.Json.dumps(record))
+    items = [{**record, "id": i} for i in range(max(1, size // per_record))]
+    return {"items": items, "total": len(items), "next": None}
+
+
+def _throughput(operation: Callable[[], object], size: int) -> float:
+    """MB/s of ``operation`` repeated for about TARGET_SECONDS."""
+    rounds = 0
+    start = time.perf_counter()
+    while (elapsed := time.perf_counter() - start) < TARGET_SECONDS:
+        operation()
+        rounds += 1
+    return size * rounds / elapsed / 1024**2
+
+
+@pytest.mark.benchmark
+@pytest.mark.performance
+class TestJsonCodecBenchmark:
+    """Encode/decode MB/s per backend and payload size."""
+
+    def test_backend_throughput(self) -> None:
+        """The default backend is at least as fast as stdlib json."""
+        codec = FlextApiSerializers.Json
+        default = codec.backend
+        results: dict[tuple[str, str], tuple[float, float]] = {}
+        report = [
+            "",
+            f"{'backend':8} {'size':>6} {'encode MB/s':>12} {'decode MB/s':>12}",
+        ]
+        try:
+            for backend in codec.available_backends():
+                codec.use(backend)
+                for label, target in SIZES.items():
+                    data = _payload(target)
+                    encoded = codec.dumps(data)
+                    size = len(encoded)
+                    results[backend, label] = (
+                        _throughput(lambda data=data: codec.dumps(data), size),
+                        _throughput(lambda encoded=encoded: codec.loads(encoded), size),
+                    )
+                    encode, decode = results[backend, label]
+                    report.append(
+                        f"{backend:8} {label:>6} {encode:12.1f} {decode:12.1f}",
+                    )
+        finally:
+            codec.use(default)
+        print("\n".join(report))  # noqa: T201 - benchmark report
+
+        if default != "json":
+            for label in SIZES:
+                assert results[default, label][0] > results["json", label][0]
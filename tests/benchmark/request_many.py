@@ -0,0 +1,64 @@
+"""Batch throughput benchmark for FlextApi.request_many.
+
+Issues the same set of independent GETs one at a time through FlextApi.get
+and through request_many with bounded concurrency, against a local server
+with simulated latency.
+
+Run explicitly: ``pytest tests/benchmark/request_many.py -s``
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from flext_api import FlextApi, FlextApiModels, FlextApiSettings
+from tests.benchmark.servers import LocalHttpServer
+
+REQUESTS = 200
+LATENCY = 0.01
+MAX_CONCURRENCY = 20
+
+
+@pytest.mark.benchmark
+@pytest.mark.performance
+class TestRequestManyBenchmark:
+    """Requests/sec for sequential get() vs request_many()."""
+
+    def test_sequential_vs_request_many(self) -> None:
+        """request_many overlaps server latency across worker threads."""
+        with LocalHttpServer(latency=LATENCY) as server:
+            config = FlextApiSettings(
+                base_url=server.base_url,
+                max_keepalive_connections=MAX_CONCURRENCY,
+            )
+            with FlextApi(config) as api:
+                start = time.perf_counter()
+                for i in range(REQUESTS):
+                    assert api.get(f"/items/{i}").is_success
+                sequential_elapsed = time.perf_counter() - start
+
+                requests = (
+                    FlextApiModels.HttpRequest(url=f"/items/{i}")
+                    for i in range(REQUESTS)
+                )
+                start = time.perf_counter()
+                results = list(
+                    api.request_many(requests, max_concurrency=MAX_CONCURRENCY),
+                )
+                batch_elapsed = time.perf_counter() - start
+
+        assert len(results) == REQUESTS
+        assert all(result.is_success for _, result in results)
+        sequential_rps = REQUESTS / sequential_elapsed
+        batch_rps = REQUESTS / batch_elapsed
+        print(  # noqa: T201 - benchmark report
+            f"\nsequential get():  {sequential_rps:8.0f} req/s"
+            f"\nrequest_many({MAX_CONCURRENCY}): {batch_rps:8.0f} req/s",
+        )
+        assert batch_rps > sequential_rps * 3
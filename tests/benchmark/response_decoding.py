@@ -0,0 +1,95 @@
+"""Response body decoding benchmark for FlextApiClient.
+
+Decodes 1 MB JSON, text and binary payloads with the content-type dispatch
+(one decode per body), the lazy mode (no decode until accessed), and the
+previous try-JSON-then-text strategy for reference.
+
+Run explicitly: ``pytest tests/benchmark/response_decoding.py -s``
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections.abc import Callable
+
+import httpx
+import pytest
+
+from flext_api import FlextApiClient, FlextApiModels, t
+
+SIZE = 1024 * 1024
+ROUNDS = 20
+
+
+def _json_payload() -> bytes:
+    records = [{"id": i, "name": f"item-{i}"} for i in range(SIZE // 32)]
+    return json.dumps(records, separators=(",", ":")).encode()
+
+
+PAYLOADS: dict[str, tuple[str, bytes]] = {
+    "json": ("application/json", _json_payload()),
+    "text": ("text/html; charset=utf-8", b"<p>lorem ipsum</p>\n" * (SIZE // 19)),
+    "binary": ("image/png", os.urandom(SIZE)),
+}
+
+
+def _try_json_then_text(response: httpx.Response) -> FlextApiModels.HttpResponse:
+    """Previous strategy: attempt JSON on every body, then text."""
+    body: t.Api.ResponseBody
+    try:
+        data = response.json()
+        body = data if isinstance(data, (dict, str)) else {"value": data}
+    except ValueError:
+        body = response.text
+    return FlextApiModels.HttpResponse(
+        status_code=response.status_code,
+        headers=dict(response.headers),
+        body=body,
+    )
+
+
+def _time(decode: Callable[[httpx.Response], object], kind: str) -> float:
+    content_type, content = PAYLOADS[kind]
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        response = httpx.Response(
+            200,
+            headers={"content-type": content_type},
+            content=content,
+        )
+        decode(response)
+    return (time.perf_counter() - start) / ROUNDS * 1000
+
+
+@pytest.mark.benchmark
+@pytest.mark.performance
+class TestResponseDecodingBenchmark:
+    """Milliseconds per 1 MB body for each decoding strategy."""
+
+    def test_dispatch_vs_lazy_vs_try_all(self) -> None:
+        """Dispatch decodes once; lazy defers all decoding to access time."""
+        report = ["", f"{'payload':8} {'try-all':>9} {'dispatch':>9} {'lazy':>9}"]
+        for kind in PAYLOADS:
+            try_all = _time(_try_json_then_text, kind)
+            dispatch = _time(FlextApiClient._build_http_response, kind)
+            lazy = _time(
+                lambda response: FlextApiClient._build_http_response(
+                    response,
+                    lazy=True,
+                ),
+                kind,
+            )
+            report.append(
+                f"{kind:8} {try_all:8.2f}ms {dispatch:8.2f}ms {lazy:8.2f}ms",
+            )
+            assert lazy < dispatch
+            if kind == "binary":
+                # Binary bodies skip both the JSON parser and text decoding
+                assert dispatch < try_all
+        print("\n".join(report))  # noqa: T201 - benchmark report
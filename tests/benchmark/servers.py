@@ -0,0 +1,356 @@
+"""Local HTTP servers used by the FLEXT API benchmarks.
+
+Real sockets on 127.0.0.1 - no mocks - so connection reuse and throughput
+numbers reflect what the client actually does on the wire.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Awaitable, Callable, MutableMapping
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import TracebackType
+from typing import TYPE_CHECKING, Self, override
+
+if TYPE_CHECKING:
+    import h2.connection
+
+type AsgiMessage = MutableMapping[str, object]
+type AsgiReceive = Callable[[], Awaitable[AsgiMessage]]
+type AsgiSend = Callable[[AsgiMessage], Awaitable[None]]
+
+
+class LocalHttpServer:
+    """Threaded keep-alive HTTP/1.1 server counting accepted connections."""
+
+    class _Handler(BaseHTTPRequestHandler):
+        """Serve a small JSON document for any GET/POST path."""
+
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+        body: bytes = b'{"status":"ok"}'
+        content_type: str = "application/json"
+        latency: float = 0.0
+
+        def do_GET(self) -> None:
+            """Answer GET with the configured body."""
+            self._reply()
+
+        def do_POST(self) -> None:
+            """Drain the request body and answer with the configured body."""
+            length = int(self.headers.get("Content-Length", "0"))
+            if length:
+                self.rfile.read(length)
+            self._reply()
+
+        def _reply(self) -> None:
+            if self.latency:
+                time.sleep(self.latency)
+            self.send_response(200)
+            self.send_header("Content-Type", self.content_type)
+            self.send_header("Content-Length", str(len(self.body)))
+            self.end_headers()
+            self.wfile.write(self.body)
+
+        @override
+        def log_message(self, format: str, *args: object) -> None:
+            """Silence per-request logging."""
+
+    class _Server(ThreadingHTTPServer):
+        daemon_threads = True
+        # Room for bursts of concurrent connects without SYN retransmits
+        request_queue_size = 1024
+        connections: int = 0
+
+        @override
+        def process_request(self, request: object, client_address: object) -> None:
+            self.connections += 1
+            super().process_request(request, client_address)
+
+    def __init__(
+        self,
+        body: bytes = b'{"status":"ok"}',
+        content_type: str = "application/json",
+        latency: float = 0.0,
+    ) -> None:
+        """Prepare a server answering every request with ``body`` after ``latency``."""
+        handler = type(
+            "Handler",
+            (self._Handler,),
+            {"body": body, "content_type": content_type, "latency": latency},
+        )
+        self._server = self._Server(("127.0.0.1", 0), handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        """Base URL of the running server."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    @property
+    def connections(self) -> int:
+        """Number of TCP connections accepted so far."""
+        return self._server.connections
+
+    def __enter__(self) -> Self:
+        """Start serving in a daemon thread."""
+        self._thread.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Stop serving and close the listening socket."""
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class LocalCapacityServer(LocalHttpServer):
+    """Keep-alive server serving at most ``capacity`` requests at once.
+
+    Requests beyond the capacity are shed with 503 straight away. Change
+    ``capacity`` while serving to simulate an upstream scaling down or up.
+    """
+
+    class _CapacityHandler(LocalHttpServer._Handler):
+        gate: LocalCapacityServer
+
+        @override
+        def _reply(self) -> None:
+            if not self.gate.enter():
+                self.send_response(503)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            try:
+                super()._reply()
+            finally:
+                self.gate.leave()
+
+    def __init__(self, capacity: int, latency: float) -> None:
+        """Prepare a server answering ``capacity`` requests at a time."""
+        super().__init__(latency=latency)
+        self._server.RequestHandlerClass = type(
+            "CapacityHandler",
+            (self._CapacityHandler,),
+            {"gate": self, "latency": latency},
+        )
+        self.capacity = capacity
+        self.served = 0
+        self.shed = 0
+        self._in_service = 0
+        self._lock = threading.Lock()
+
+    def enter(self) -> bool:
+        """Admit a request if below capacity, else count it as shed."""
+        with self._lock:
+            if self._in_service >= self.capacity:
+                self.shed += 1
+                return False
+            self._in_service += 1
+            return True
+
+    def leave(self) -> None:
+        """Finish an admitted request."""
+        with self._lock:
+            self._in_service -= 1
+            self.served += 1
+
+
+class LocalHttp2Server:
+    """Cleartext HTTP/2 server (h2c, prior knowledge) on an asyncio thread.
+
+    Needs the ``h2`` package. Streams are answered concurrently after
+    ``latency`` seconds, so many requests can share one connection.
+    """
+
+    def __init__(
+        self,
+        body: bytes = b'{"status":"ok"}',
+        latency: float = 0.0,
+        max_concurrent_streams: int = 1000,
+    ) -> None:
+        """Prepare a server answering every stream with ``body`` after ``latency``."""
+        self.body = body
+        self.latency = latency
+        self.max_concurrent_streams = max_concurrent_streams
+        self.connections = 0
+        self.streams = 0
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._server: asyncio.Server | None = None
+        self._writers: set[asyncio.StreamWriter] = set()
+        self._port = 0
+
+    @property
+    def base_url(self) -> str:
+        """Base URL of the running server."""
+        return f"http://127.0.0.1:{self._port}"
+
+    async def _serve_connection(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        import h2.config  # noqa: PLC0415 - optional benchmark dependency
+        import h2.connection  # noqa: PLC0415
+        import h2.events  # noqa: PLC0415
+        import h2.exceptions  # noqa: PLC0415
+        import h2.settings  # noqa: PLC0415
+
+        self.connections += 1
+        self._writers.add(writer)
+        conn = h2.connection.H2Connection(
+            config=h2.config.H2Configuration(client_side=False),
+        )
+        conn.local_settings = h2.settings.Settings(
+            client=False,
+            initial_values={
+                h2.settings.SettingCodes.MAX_CONCURRENT_STREAMS: (
+                    self.max_concurrent_streams
+                ),
+            },
+        )
+        conn.initiate_connection()
+        writer.write(conn.data_to_send())
+        pending: set[asyncio.Task[None]] = set()
+        try:
+            while data := await reader.read(65536):
+                for event in conn.receive_data(data):
+                    if isinstance(event, h2.events.RequestReceived):
+                        task = asyncio.ensure_future(
+                            self._respond(conn, writer, event.stream_id),
+                        )
+                        pending.add(task)
+                        task.add_done_callback(pending.discard)
+                    elif isinstance(event, h2.events.DataReceived):
+                        conn.acknowledge_received_data(
+                            event.flow_controlled_length,
+                            event.stream_id,
+                        )
+                writer.write(conn.data_to_send())
+        except (ConnectionError, h2.exceptions.ProtocolError):
+            pass
+        finally:
+            for task in pending:
+                task.cancel()
+            self._writers.discard(writer)
+            writer.close()
+
+    async def _respond(
+        self,
+        conn: h2.connection.H2Connection,
+        writer: asyncio.StreamWriter,
+        stream_id: int,
+    ) -> None:
+        import h2.exceptions  # noqa: PLC0415 - optional benchmark dependency
+
+        self.streams += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        try:
+            conn.send_headers(
+                stream_id,
+                [
+                    (":status", "200"),
+                    ("content-type", "application/json"),
+                    ("content-length", str(len(self.body))),
+                ],
+            )
+            conn.send_data(stream_id, self.body, end_stream=True)
+        except h2.exceptions.StreamClosedError:
+            return
+        writer.write(conn.data_to_send())
+
+    async def _start(self) -> None:
+        self._server = await asyncio.start_server(
+            self._serve_connection,
+            "127.0.0.1",
+            0,
+        )
+        self._port = self._server.sockets[0].getsockname()[1]
+
+    async def _stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            for writer in self._writers:
+                writer.close()
+            await self._server.wait_closed()
+
+    def __enter__(self) -> Self:
+        """Start serving on the event loop thread."""
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._start(), self._loop).result()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Stop serving and the event loop thread."""
+        asyncio.run_coroutine_threadsafe(self._stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+class LatencyAsgiApp:
+    """In-process ASGI app answering after a fixed simulated latency.
+
+    Tracks peak in-flight requests so benchmarks can prove real concurrency.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.01,
+        body: bytes = b'{"status":"ok"}',
+    ) -> None:
+        """Prepare an app that sleeps ``latency`` seconds before replying."""
+        self.latency = latency
+        self.body = body
+        self.calls = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def __call__(
+        self,
+        scope: AsgiMessage,
+        receive: AsgiReceive,
+        send: AsgiSend,
+    ) -> None:
+        """Serve one HTTP request."""
+        self.calls += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [(b"content-type", b"application/json")],
+            }
+        )
+        await send({"type": "http.response.body", "body": self.body})
+
+
+__all__ = [
+    "LatencyAsgiApp",
+    "LocalCapacityServer",
+    "LocalHttp2Server",
+    "LocalHttpServer",
+]
@@ -0,0 +1,94 @@
+"""Memory accounting benchmark for FlextApiStorage.
+
+``metrics()`` used to size the store as ``len(str(storage))``, serializing
+every entry on each call. Sizes are now accounted per entry on set and
+removal, so the total is read in O(1). The benchmark times ``metrics()``
+against the old whole-store string at growing sizes, then fills a
+``max_memory_bytes``-capped store with mixed-size values and reports its
+size histogram.
+
+Run explicitly: ``pytest tests/benchmark/storage_accounting.py -s``
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+import pytest
+
+from flext_api import FlextApiStorage
+
+SIZES = (1_000, 10_000, 100_000)
+CALLS = 50
+MEMORY_LIMIT = 2 * 1024**2
+
+
+def _filled(size: int) -> FlextApiStorage:
+    storage = FlextApiStorage()
+    for i in range(size):
+        storage.set(f"key-{i}", {"id": i, "name": f"resource-{i}", "tags": ["a"]})
+    return storage
+
+
+def _metrics_us(storage: FlextApiStorage) -> float:
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        storage.metrics()
+    return (time.perf_counter() - start) / CALLS * 1e6
+
+
+def _string_size_us(storage: FlextApiStorage) -> float:
+    """Microseconds of the old ``len(str(...))`` over every stored value."""
+    start = time.perf_counter()
+    len(str({key: entry.value for key, entry in storage._storage.items()}))
+    return (time.perf_counter() - start) * 1e6
+
+
+@pytest.mark.benchmark
+@pytest.mark.performance
+class TestStorageAccountingBenchmark:
+    """O(1) memory totals and a memory-capped store."""
+
+    def test_metrics_cost_is_flat_in_store_size(self) -> None:
+        """metrics() costs the same at 1k and 100k entries."""
+        lines = ["", "entries   metrics us   old str() us"]
+        latencies: dict[int, float] = {}
+        for size in SIZES:
+            storage = _filled(size)
+            latencies[size] = _metrics_us(storage)
+            lines.append(
+                f"{size:7}  {latencies[size]:11.1f}  {_string_size_us(storage):13.0f}",
+            )
+        print("\n".join(lines))  # noqa: T201 - benchmark report
+
+        assert latencies[SIZES[-1]] < latencies[SIZES[0]] * 3
+
+    def test_memory_limit_caps_mixed_sizes(self) -> None:
+        """A capped store stays under max_memory_bytes and reports a histogram."""
+        rng = random.Random(3)  # noqa: S311 - reproducible sizes, not crypto
+        storage = FlextApiStorage(max_memory_bytes=MEMORY_LIMIT)
+        for i in range(20_000):
+            storage.set(f"key-{i}", "x" * int(rng.paretovariate(1.2) * 64))
+
+        metrics = storage.metrics().value
+        histogram = storage.size_histogram()
+        lines = [
+            "",
+            (
+                f"entries {storage.size().value}  bytes {metrics['memory_usage']}  "
+                f"limit {MEMORY_LIMIT}  evictions {metrics['evictions']}"
+            ),
+            "size bucket   entries",
+            *(f"{label:>11}  {count:8}" for label, count in histogram.items()),
+        ]
+        print("\n".join(lines))  # noqa: T201 - benchmark report
+
+        memory_usage = metrics["memory_usage"]
+        assert isinstance(memory_usage, int)
+        assert memory_usage <= MEMORY_LIMIT
+        assert sum(histogram.values()) == storage.size().value
@@ -0,0 +1,115 @@
+"""Eviction benchmark for bounded FlextApiStorage.
+
+Replays Zipf-distributed key traces (a few hot keys, a long tail of rare
+ones) through a read-through FlextApiStorage with ``max_size`` set, once
+per eviction policy, and reports the hit ratio and storage ops/sec. The
+bare policies are also timed at two capacities 100x apart: O(1) policies
+keep the same ops/sec whatever the capacity.
+
+Run explicitly: ``pytest tests/benchmark/storage_eviction.py -s``
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import itertools
+import random
+import time
+
+import pytest
+
+from flext_api import FlextApiEviction, FlextApiStorage
+
+KEYS = 20_000
+TRACE_LENGTH = 60_000
+CAPACITY = 1_000
+# (name, Zipf exponent): skewed and flatter popularity
+TRACES = (("zipf-1.0", 1.0), ("zipf-0.8", 0.8))
+
+
+def _zipf_trace(exponent: float, length: int, seed: int = 7) -> list[str]:
+    """``length`` keys drawn with P(rank k) proportional to 1 / k**exponent."""
+    weights = itertools.accumulate(1 / rank**exponent for rank in range(1, KEYS + 1))
+    rng = random.Random(seed)  # noqa: S311 - reproducible trace, not crypto
+    return [
+        f"key-{rank}"
+        for rank in rng.choices(range(KEYS), cum_weights=list(weights), k=length)
+    ]
+
+
+def _replay(policy: str, trace: list[str]) -> tuple[float, float, int]:
+    """(hit ratio, ops/sec, evictions) of a read-through storage over ``trace``."""
+    storage = FlextApiStorage(max_size=CAPACITY, eviction_policy=policy)
+    hits = operations = 0
+    start = time.perf_counter()
+    for key in trace:
+        operations += 1
+        if storage.get(key).is_success:
+            hits += 1
+        else:
+            storage.set(key, key)
+            operations += 1
+    elapsed = time.perf_counter() - start
+    evictions = storage.metrics().value["evictions"]
+    assert len(storage.keys().value) <= CAPACITY
+    return hits / len(trace), operations / elapsed, int(str(evictions))
+
+
+def _policy_ops(policy: str, capacity: int, trace: list[str]) -> float:
+    """Bare policy ops/sec (access on hit, insert on miss)."""
+    tracked = FlextApiEviction.create(policy, capacity)
+    present: set[str] = set()
+    start = time.perf_counter()
+    for key in trace:
+        if key in present:
+            tracked.access(key)
+        else:
+            tracked.miss(key)
+            present.add(key)
+            present.difference_update(tracked.insert(key))
+    return len(trace) / (time.perf_counter() - start)
+
+
+@pytest.mark.benchmark
+@pytest.mark.performance
+class TestStorageEvictionBenchmark:
+    """Hit ratio and throughput of LRU, LFU and W-TinyLFU."""
+
+    def test_hit_ratio_on_zipf_traces(self) -> None:
+        """Frequency-aware policies beat LRU on skewed traces."""
+        lines = ["", "trace     policy    hit ratio    ops/sec   evictions"]
+        ratios: dict[tuple[str, str], float] = {}
+        for trace_name, exponent in TRACES:
+            trace = _zipf_trace(exponent, TRACE_LENGTH)
+            for policy in FlextApiEviction.Name:
+                ratio, ops, evictions = _replay(policy, trace)
+                ratios[trace_name, policy] = ratio
+                lines.append(
+                    f"{trace_name:8}  {policy:8}  {ratio:9.3f}  {ops:9.0f}  "
+                    f"{evictions:10}",
+                )
+        print("\n".join(lines))  # noqa: T201 - benchmark report
+
+        for trace_name, _ in TRACES:
+            assert ratios[trace_name, "tinylfu"] > ratios[trace_name, "lru"]
+
+    def test_policy_cost_is_independent_of_capacity(self) -> None:
+        """Policy ops/sec stays in the same range at small and large capacities."""
+        trace = _zipf_trace(0.8, TRACE_LENGTH * 2)
+        lines = ["", "policy    capacity      ops/sec"]
+        rates: dict[tuple[str, int], float] = {}
+        for policy in FlextApiEviction.Name:
+            for capacity in (CAPACITY // 10, CAPACITY * 10):
+                rates[policy, capacity] = _policy_ops(policy, capacity, trace)
+                lines.append(
+                    f"{policy:8}  {capacity:8}  {rates[policy, capacity]:11.0f}",
+                )
+        print("\n".join(lines))  # noqa: T201 - benchmark report
+
+        for policy in FlextApiEviction.Name:
+            small = rates[policy, CAPACITY // 10]
+            large = rates[policy, CAPACITY * 10]
+            assert large > small / 3
@@ -0,0 +1,76 @@
+"""TTL index benchmark for FlextApiStorage.
+
+Fills storages of growing size with TTL'd entries and times ``get`` on
+random live keys. Expiry is indexed in a heap and only due entries are
+swept, so read latency stays flat as the store grows. For reference the
+report also times one pass over every TTL, the work each read used to do
+before the index.
+
+Run explicitly: ``pytest tests/benchmark/storage_expiry.py -s``
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+import pytest
+
+from flext_api import FlextApiStorage
+
+SIZES = (1_000, 10_000, 100_000, 300_000)
+READS = 20_000
+TTL = 3_600
+
+
+def _filled(size: int) -> FlextApiStorage:
+    storage = FlextApiStorage()
+    for i in range(size):
+        storage.set(f"key-{i}", i, ttl=TTL)
+    return storage
+
+
+def _get_latency_us(storage: FlextApiStorage, size: int) -> float:
+    """Mean microseconds per ``get`` of a random live key."""
+    rng = random.Random(size)  # noqa: S311 - reproducible keys, not crypto
+    keys = [f"key-{rng.randrange(size)}" for _ in range(READS)]
+    start = time.perf_counter()
+    for key in keys:
+        storage.get(key)
+    return (time.perf_counter() - start) / READS * 1e6
+
+
+def _full_scan_us(storage: FlextApiStorage) -> float:
+    """Microseconds of one pass over every TTL (the old per-read cleanup)."""
+    now = time.time()
+    start = time.perf_counter()
+    _ = [
+        key
+        for key, entry in storage._storage.items()
+        if entry.expiry is not None and entry.expiry < now
+    ]
+    return (time.perf_counter() - start) * 1e6
+
+
+@pytest.mark.benchmark
+@pytest.mark.performance
+class TestStorageExpiryBenchmark:
+    """get latency against store size with every entry under a TTL."""
+
+    def test_get_latency_is_flat_in_store_size(self) -> None:
+        """Reads cost the same at 1k and 300k entries."""
+        lines = ["", "entries   get us   old full scan us"]
+        latencies: dict[int, float] = {}
+        for size in SIZES:
+            storage = _filled(size)
+            latencies[size] = _get_latency_us(storage, size)
+            lines.append(
+                f"{size:7}  {latencies[size]:7.2f}  {_full_scan_us(storage):17.1f}",
+            )
+        print("\n".join(lines))  # noqa: T201 - benchmark report
+
+        assert latencies[SIZES[-1]] < latencies[SIZES[0]] * 3
@@ -0,0 +1,93 @@
+"""Memory-per-entry benchmark for FlextApiStorage.
+
+Measures with tracemalloc the bytes each stored key costs: the value is
+kept once in a slotted entry next to its expiry, where the previous layout
+kept the raw value, a ``namespace:key`` metadata dict (value, ISO
+timestamp, ttl, created_at) and a separate expiry dict item. The previous
+layout is rebuilt by hand for comparison.
+
+Run explicitly: ``pytest tests/benchmark/storage_memory.py -s``
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import time
+import tracemalloc
+from collections.abc import Callable
+
+import pytest
+from flext_core import u
+
+from flext_api import FlextApiStorage
+
+ENTRIES = 50_000
+TTL = 3_600
+
+
+def _keys_and_values() -> list[tuple[str, int]]:
+    return [(f"key-{i}", i) for i in range(ENTRIES)]
+
+
+def _fill_storage(items: list[tuple[str, int]], *, ttl: int | None) -> object:
+    storage = FlextApiStorage()
+    for key, value in items:
+        storage.set(key, value, ttl=ttl)
+    return storage
+
+
+def _fill_previous_layout(items: list[tuple[str, int]], *, ttl: int | None) -> object:
+    """Raw value + namespaced metadata dict + expiry dict, as set() used to."""
+    store: dict[str, object] = {}
+    expiry_times: dict[str, float] = {}
+    for key, value in items:
+        store[key] = value
+        store[f"flext_api:{key}"] = {
+            "value": value,
+            "timestamp": u.Generators.generate_iso_timestamp(),
+            "ttl": ttl,
+            "created_at": time.time(),
+        }
+        if ttl is not None:
+            expiry_times[key] = time.time() + ttl
+    return store, expiry_times
+
+
+def _bytes_per_entry(
+    fill: Callable[..., object],
+    *,
+    ttl: int | None,
+) -> float:
+    items = _keys_and_values()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = fill(items, ttl=ttl)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return (after - before) / ENTRIES
+
+
+@pytest.mark.benchmark
+@pytest.mark.performance
+class TestStorageMemoryBenchmark:
+    """tracemalloc bytes per stored key, with and without a TTL."""
+
+    def test_single_copy_entries(self) -> None:
+        """One slotted entry per key takes well under half the old layout."""
+        lines = ["", "layout        ttl     bytes/entry"]
+        results: dict[tuple[str, int | None], float] = {}
+        for ttl in (None, TTL):
+            for name, fill in (
+                ("entry", _fill_storage),
+                ("previous", _fill_previous_layout),
+            ):
+                results[name, ttl] = _bytes_per_entry(fill, ttl=ttl)
+                lines.append(f"{name:10}  {ttl!s:>5}  {results[name, ttl]:14.0f}")
+        print("\n".join(lines))  # noqa: T201 - benchmark report
+
+        for ttl in (None, TTL):
+            assert results["entry", ttl] < results["previous", ttl] / 2
@@ -0,0 +1,84 @@
+"""Bookkeeping cost benchmark for FlextApiStorage.
+
+Every set/get used to rebuild a Pydantic ``Storage.Stats`` model to bump a
+counter, and every set also validated a ``Storage.Metadata`` model with an
+ISO timestamp. Counters are now plain slots and the model is only built by
+``metrics()``. The benchmark times set/get with the current storage, then
+the same loop plus the removed per-call model work, and reports ops/sec.
+
+Run explicitly: ``pytest tests/benchmark/storage_stats.py -s``
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+
+import pytest
+from flext_core import u
+
+from flext_api import FlextApiModels, FlextApiStorage
+
+OPERATIONS = 50_000
+
+
+def _no_bookkeeping(_value: int, *, is_set: bool) -> None:
+    _ = is_set
+
+
+def _model_bookkeeping(value: int, *, is_set: bool) -> None:
+    """The models the storage used to build on each set or get."""
+    if is_set:
+        FlextApiModels.Storage.Metadata(
+            value=value,
+            timestamp=u.Generators.generate_iso_timestamp(),
+            ttl=None,
+        )
+    FlextApiModels.Storage.Stats(
+        total_operations=value,
+        cache_hits=value,
+        cache_misses=0,
+        hit_ratio=0.0,
+        storage_size=0,
+        memory_usage=0,
+        namespace="flext_api",
+    )
+
+
+def _ops_per_second(bookkeeping: Callable[..., None]) -> float:
+    """set/get ops/sec over OPERATIONS keys, half writes and half reads."""
+    storage = FlextApiStorage()
+    keys = [f"key-{i}" for i in range(OPERATIONS // 2)]
+    start = time.perf_counter()
+    for i, key in enumerate(keys):
+        storage.set(key, i)
+        bookkeeping(i, is_set=True)
+    for i, key in enumerate(keys):
+        storage.get(key)
+        bookkeeping(i, is_set=False)
+    return OPERATIONS / (time.perf_counter() - start)
+
+
+@pytest.mark.benchmark
+@pytest.mark.performance
+class TestStorageStatsBenchmark:
+    """set/get throughput with counters vs per-call Pydantic models."""
+
+    def test_counter_bookkeeping_is_cheaper(self) -> None:
+        """Dropping the per-call models raises set/get throughput."""
+        counters = _ops_per_second(_no_bookkeeping)
+        models = _ops_per_second(_model_bookkeeping)
+        lines = [
+            "",
+            "bookkeeping        ops/sec",
+            f"slot counters  {counters:10.0f}",
+            f"pydantic/call  {models:10.0f}",
+            f"gain           {counters / models:9.2f}x",
+        ]
+        print("\n".join(lines))  # noqa: T201 - benchmark report
+
+        assert counters > models
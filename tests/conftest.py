@@ -344,6 +344,32 @@ def temp_dir() -> Generator[Path]:
         yield Path(temp_dir)
 
 
+class FakeClock:
+    """Manually advanced clock; ``sleep`` records the wait and moves time on."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_clock() -> FakeClock:
+    """Provide a FakeClock starting at 0 for components taking a ``clock``.
+
+    Returns:
+        FakeClock: Clock advanced by setting ``now`` or calling ``sleep``.
+
+    """
+    return FakeClock()
+
+
 # Async event loop fixture removed - synchronous implementation only
 
 
@@ -10,12 +10,36 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
+import pytest
 from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
 
-from flext_api.app import FlextApiApp
+from flext_api.app import (
+    FlextApiApp,
+    FlextApiJsonResponse,
+    FlextApiNegotiatedResponse,
+    FlextApiNegotiatingRoute,
+)
+from flext_api.serializers import FlextApiSerializers
 from flext_api.settings import FlextApiSettings
 
 
+class _Item(BaseModel):
+    name: str
+    quantity: int
+
+
+def _negotiating_client() -> TestClient:
+    app = FlextApiApp.create(FlextApiSettings(base_url="http://test.com"))
+
+    @app.post("/items")
+    def create_item(item: _Item) -> dict[str, object]:
+        return {"name": item.name, "quantity": item.quantity * 2}
+
+    return TestClient(app)
+
+
 class TestFlextApiApp:
     """Test FastAPI application factory."""
 
@@ -54,3 +78,81 @@ class TestFlextApiApp:
         assert app.docs_url == "/api-docs"
         assert app.redoc_url == "/api-redoc"
         assert app.openapi_url == "/api-openapi.json"
+
+    def test_default_response_class_uses_json_codec(self) -> None:
+        """Test routes render JSON through FlextApiJsonResponse."""
+        app = FlextApiApp.create(FlextApiSettings(base_url="http://test.com"))
+
+        @app.get("/item")
+        def item() -> dict[str, object]:
+            return {"name": "café", "tags": ["a", "b"]}
+
+        response = TestClient(app).get("/item")
+
+        assert issubclass(app.router.default_response_class, FlextApiJsonResponse)
+        assert response.headers["content-type"] == "application/json"
+        assert response.content == '{"name":"café","tags":["a","b"]}'.encode()
+
+
+class TestFlextApiNegotiatingRoute:
+    """Test routes answering JSON, MessagePack or CBOR."""
+
+    def test_app_routes_negotiate(self) -> None:
+        """Test created apps use the negotiating route and response classes."""
+        app = FlextApiApp.create(FlextApiSettings(base_url="http://test.com"))
+
+        assert app.router.route_class is FlextApiNegotiatingRoute
+        assert app.router.default_response_class is FlextApiNegotiatedResponse
+
+    @pytest.mark.parametrize(
+        ("request_type", "accept"),
+        [
+            ("application/json", "application/msgpack"),
+            ("application/msgpack", "application/cbor"),
+            ("application/cbor", "application/json"),
+            ("application/x-msgpack", None),
+        ],
+    )
+    def test_body_and_response_formats(
+        self,
+        request_type: str,
+        accept: str | None,
+    ) -> None:
+        """Test bodies are decoded by Content-Type and encoded per Accept."""
+        negotiation = FlextApiSerializers.ContentNegotiation
+        headers = {"Content-Type": request_type}
+        if accept is not None:
+            headers["Accept"] = accept
+
+        response = _negotiating_client().post(
+            "/items",
+            content=negotiation.encode({"name": "bolt", "quantity": 2}, request_type),
+            headers=headers,
+        )
+
+        response_type = accept or "application/json"
+        assert response.status_code == 200
+        assert response.headers["content-type"] == response_type
+        assert response.headers["vary"] == "Accept"
+        assert negotiation.decode(response.content, response_type) == {
+            "name": "bolt",
+            "quantity": 4,
+        }
+
+    def test_binary_body_validated(self) -> None:
+        """Test binary bodies go through request validation and parse errors."""
+        client = _negotiating_client()
+
+        invalid = client.post(
+            "/items",
+            content=FlextApiSerializers.Cbor.dumps({"name": "bolt"}),
+            headers={"Content-Type": "application/cbor"},
+        )
+        malformed = client.post(
+            "/items",
+            content=b"\xc1",
+            headers={"Content-Type": "application/msgpack"},
+        )
+
+        assert invalid.status_code == 422
+        assert malformed.status_code == 400
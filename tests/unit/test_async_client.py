@@ -0,0 +1,378 @@
+"""Tests for FlextApiAsyncClient and the FlextApi async facade.
+
+Requests run against an in-process ASGI app through httpx.ASGITransport,
+so the full async request path executes without network access.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Awaitable, Callable, MutableMapping
+
+import httpx
+import pytest
+import pytest_httpx
+
+from flext_api import (
+    FlextApi,
+    FlextApiAsyncClient,
+    FlextApiModels,
+    FlextApiSettings,
+    c,
+)
+
+type AsgiMessage = MutableMapping[str, object]
+type AsgiReceive = Callable[[], Awaitable[AsgiMessage]]
+type AsgiSend = Callable[[AsgiMessage], Awaitable[None]]
+
+
+class _EchoApp:
+    """Minimal ASGI app echoing method, path, query and body as JSON."""
+
+    def __init__(
+        self,
+        statuses: list[int] | None = None,
+        delay: float = 0.0,
+    ) -> None:
+        self.statuses = list(statuses or [])
+        self.delay = delay
+        self.calls = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def __call__(
+        self,
+        scope: AsgiMessage,
+        receive: AsgiReceive,
+        send: AsgiSend,
+    ) -> None:
+        self.calls += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            chunk = message.get("body", b"")
+            body += chunk if isinstance(chunk, bytes) else b""
+            more_body = bool(message.get("more_body"))
+        status = self.statuses.pop(0) if self.statuses else 200
+        raw_query = scope.get("query_string", b"")
+        payload = json.dumps(
+            {
+                "method": scope["method"],
+                "path": scope["path"],
+                "query": raw_query.decode() if isinstance(raw_query, bytes) else "",
+                "body": body.decode(),
+            }
+        ).encode()
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [(b"content-type", b"application/json")],
+            }
+        )
+        await send({"type": "http.response.body", "body": payload})
+
+
+def _client(app: _EchoApp, max_retries: int = 0) -> FlextApiAsyncClient:
+    config = FlextApiSettings(
+        base_url="http://testserver",
+        retry_enabled=True,
+        max_retries=max_retries,
+    )
+    return FlextApiAsyncClient(config, transport=httpx.ASGITransport(app=app))
+
+
+class TestFlextApiAsyncClient:
+    """Test FlextApiAsyncClient request execution."""
+
+    @pytest.mark.asyncio
+    async def test_arequest_get(self) -> None:
+        """Test async GET returns HttpResponse with decoded JSON body."""
+        app = _EchoApp()
+        async with _client(app) as client:
+            result = await client.arequest(
+                FlextApiModels.HttpRequest(
+                    method="GET",
+                    url="/items",
+                    query_params={"page": "2"},
+                ),
+            )
+        assert result.is_success
+        assert result.value.status_code == 200
+        assert isinstance(result.value.body, dict)
+        assert result.value.body["path"] == "/items"
+        assert result.value.body["query"] == "page=2"
+
+    @pytest.mark.asyncio
+    async def test_arequest_post_serializes_body(self) -> None:
+        """Test async POST shares body serialization with the sync client."""
+        app = _EchoApp()
+        async with _client(app) as client:
+            result = await client.arequest(
+                FlextApiModels.HttpRequest(
+                    method="POST",
+                    url="/items",
+                    body={"name": "x"},
+                ),
+            )
+        assert result.is_success
+        assert isinstance(result.value.body, dict)
+        assert json.loads(str(result.value.body["body"])) == {"name": "x"}
+
+    @pytest.mark.asyncio
+    async def test_arequest_http_error(self) -> None:
+        """Test non-retryable error status returns failure result."""
+        app = _EchoApp(statuses=[404])
+        async with _client(app) as client:
+            result = await client.arequest(
+                FlextApiModels.HttpRequest(method="GET", url="/missing"),
+            )
+        assert result.is_failure
+        assert "HTTP 404" in (result.error or "")
+        assert app.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_arequest_retries_retryable_status(self) -> None:
+        """Test retryable status is retried with non-blocking backoff."""
+        app = _EchoApp(statuses=[503])
+        async with _client(app, max_retries=1) as client:
+            result = await client.arequest(
+                FlextApiModels.HttpRequest(method="GET", url="/flaky"),
+            )
+        assert result.is_success
+        assert app.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_arequest_gives_up_after_max_retries(self) -> None:
+        """Test retryable status fails once retries are exhausted."""
+        app = _EchoApp(statuses=[503, 503])
+        async with _client(app, max_retries=0) as client:
+            result = await client.arequest(
+                FlextApiModels.HttpRequest(method="GET", url="/down"),
+            )
+        assert result.is_failure
+        assert "HTTP 503" in (result.error or "")
+        assert app.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_pool(self) -> None:
+        """Test many concurrent requests complete on one client."""
+        app = _EchoApp()
+        async with _client(app) as client:
+            results = await asyncio.gather(
+                *(
+                    client.arequest(
+                        FlextApiModels.HttpRequest(method="GET", url=f"/items/{i}"),
+                    )
+                    for i in range(50)
+                )
+            )
+        assert all(result.is_success for result in results)
+        assert app.calls == 50
+
+    @pytest.mark.asyncio
+    async def test_aclose_and_reopen(self) -> None:
+        """Test aclose releases the pool and the client can be reused."""
+        app = _EchoApp()
+        client = _client(app)
+        assert client.is_async_closed
+        request = FlextApiModels.HttpRequest(method="GET", url="/a")
+        assert (await client.arequest(request)).is_success
+        assert not client.is_async_closed
+        await client.aclose()
+        assert client.is_async_closed
+        assert (await client.arequest(request)).is_success
+        await client.aclose()
+
+
+class TestFlextApiAsyncFacade:
+    """Test FlextApi async facade methods."""
+
+    @pytest.mark.asyncio
+    async def test_aget_and_apost(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
+        """Test aget/apost delegate to the async client."""
+        httpx_mock.add_response(
+            method="GET",
+            url="https://api.example.com/users",
+            json={"users": []},
+        )
+        httpx_mock.add_response(
+            method="POST",
+            url="https://api.example.com/users",
+            json={"id": 1},
+            status_code=201,
+        )
+        async with FlextApi(
+            FlextApiSettings(base_url="https://api.example.com")
+        ) as api:
+            get_result = await api.aget("/users")
+            post_result = await api.apost("/users", data={"name": "x"})
+
+        assert get_result.is_success
+        assert get_result.value.body == {"users": []}
+        assert post_result.is_success
+        assert post_result.value.status_code == 201
+
+    @pytest.mark.asyncio
+    async def test_arequest_with_model(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test arequest accepts the shared HttpRequest model."""
+        httpx_mock.add_response(
+            method="DELETE",
+            url="https://api.example.com/users/1",
+            status_code=204,
+        )
+        api = FlextApi(FlextApiSettings(base_url="https://api.example.com"))
+        result = await api.arequest(
+            FlextApiModels.HttpRequest(method="DELETE", url="/users/1"),
+        )
+        await api.aclose()
+        assert result.is_success
+        assert result.value.status_code == 204
+
+
+class TestFlextApiAsyncClientRequestMany:
+    """Test FlextApiAsyncClient.arequest_many bounded-concurrency batches."""
+
+    @staticmethod
+    def _requests(count: int) -> list[FlextApiModels.HttpRequest]:
+        return [FlextApiModels.HttpRequest(url=f"/items/{i}") for i in range(count)]
+
+    @pytest.mark.asyncio
+    async def test_all_results_within_concurrency_bound(self) -> None:
+        """Test every request yields one pair and the window is respected."""
+        app = _EchoApp(delay=0.01)
+        async with _client(app) as client:
+            results = {
+                index: result
+                async for index, result in client.arequest_many(
+                    self._requests(30),
+                    max_concurrency=4,
+                )
+            }
+        assert sorted(results) == list(range(30))
+        assert all(result.is_success for result in results.values())
+        assert 1 < app.peak_in_flight <= 4
+
+    @pytest.mark.asyncio
+    async def test_ordered_results(self) -> None:
+        """Test ordered=True yields results in input order."""
+        app = _EchoApp(delay=0.005)
+        async with _client(app) as client:
+            indices = [
+                index
+                async for index, _ in client.arequest_many(
+                    self._requests(15),
+                    max_concurrency=6,
+                    ordered=True,
+                )
+            ]
+        assert indices == list(range(15))
+
+    @pytest.mark.asyncio
+    async def test_deadline_cancels_in_flight(self) -> None:
+        """Test requests running at the deadline are cancelled and reported."""
+        app = _EchoApp(delay=1.0)
+        async with _client(app) as client:
+            results = [
+                item
+                async for item in client.arequest_many(
+                    self._requests(10),
+                    max_concurrency=3,
+                    deadline=0.05,
+                )
+            ]
+        assert [index for index, _ in results] == [0, 1, 2]
+        assert all(
+            result.error == c.Api.HTTPBatch.DEADLINE_EXCEEDED_ERROR
+            for _, result in results
+        )
+        assert app.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_deadline_keeps_finished_results(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test results finished behind a slow ordered head are not failed."""
+
+        async def callback(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/items/0":
+                await asyncio.sleep(1.0)
+            return httpx.Response(200, json={"path": request.url.path})
+
+        httpx_mock.add_callback(callback, is_reusable=True)
+        async with FlextApiAsyncClient(
+            FlextApiSettings(base_url="https://api.example.com"),
+        ) as client:
+            results = [
+                item
+                async for item in client.arequest_many(
+                    self._requests(3),
+                    max_concurrency=3,
+                    ordered=True,
+                    deadline=0.1,
+                )
+            ]
+        assert [index for index, _ in results] == [0, 1, 2]
+        assert results[0][1].error == c.Api.HTTPBatch.DEADLINE_EXCEEDED_ERROR
+        assert results[1][1].is_success
+        assert results[2][1].is_success
+
+    @pytest.mark.asyncio
+    async def test_cancel_event_stops_batch(self) -> None:
+        """Test setting the cancel event cancels the batch promptly."""
+        app = _EchoApp(delay=1.0)
+        cancel = asyncio.Event()
+        async with _client(app) as client:
+            asyncio.get_running_loop().call_later(0.05, cancel.set)
+            results = [
+                item
+                async for item in client.arequest_many(
+                    self._requests(10),
+                    max_concurrency=2,
+                    cancel_event=cancel,
+                )
+            ]
+        assert len(results) == 2
+        assert all(
+            result.error == c.Api.HTTPBatch.CANCELLED_ERROR for _, result in results
+        )
+
+    @pytest.mark.asyncio
+    async def test_facade_arequest_many(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test FlextApi.arequest_many delegates to the async client."""
+        httpx_mock.add_response(json={"ok": True}, is_reusable=True)
+        async with FlextApi(
+            FlextApiSettings(base_url="https://api.example.com")
+        ) as api:
+            results = [
+                item
+                async for item in api.arequest_many(self._requests(5), ordered=True)
+            ]
+        assert [index for index, _ in results] == list(range(5))
+        assert all(result.is_success for _, result in results)
+
+
+__all__ = [
+    "TestFlextApiAsyncClient",
+    "TestFlextApiAsyncClientRequestMany",
+    "TestFlextApiAsyncFacade",
+]
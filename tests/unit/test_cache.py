@@ -0,0 +1,376 @@
+"""Tests for FlextApiHttpCache RFC 9111 response caching.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import time
+
+import httpx
+import pytest
+import pytest_httpx
+
+from flext_api import (
+    FlextApi,
+    FlextApiAsyncClient,
+    FlextApiClient,
+    FlextApiHttpCache,
+    FlextApiModels,
+    FlextApiSettings,
+    FlextApiStorage,
+)
+
+BASE_URL = "https://api.example.com"
+URL = f"{BASE_URL}/items"
+
+
+def _client(cache: FlextApiHttpCache | None = None) -> FlextApiClient:
+    return FlextApiClient(
+        FlextApiSettings(base_url=BASE_URL),
+        cache=cache or FlextApiHttpCache(),
+    )
+
+
+def _get(client: FlextApiClient, **headers: str) -> FlextApiModels.HttpResponse:
+    result = client.request(
+        FlextApiModels.HttpRequest(url="/items", headers=dict(headers)),
+    )
+    assert result.is_success, result.error
+    return result.value
+
+
+class TestFlextApiHttpCacheFreshness:
+    """Test freshness rules and storage decisions."""
+
+    def test_max_age_serves_from_cache(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test a fresh response is served without a second round-trip."""
+        httpx_mock.add_response(
+            url=URL,
+            json={"n": 1},
+            headers={"Cache-Control": "max-age=60"},
+        )
+        client = _client()
+
+        first = _get(client)
+        second = _get(client)
+
+        assert first.body == second.body == {"n": 1}
+        assert "age" in second.headers
+        assert len(httpx_mock.get_requests()) == 1
+        assert client.cache is not None
+        metrics = client.cache.metrics().value
+        assert metrics["hits"] == 1
+        assert metrics["misses"] == 1
+        assert metrics["stores"] == 1
+
+    def test_no_store_is_never_cached(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test Cache-Control: no-store responses are not stored."""
+        httpx_mock.add_response(
+            url=URL,
+            json={},
+            headers={"Cache-Control": "no-store, max-age=60"},
+            is_reusable=True,
+        )
+        client = _client()
+
+        _get(client)
+        _get(client)
+
+        assert len(httpx_mock.get_requests()) == 2
+        assert client.cache is not None
+        assert client.cache.metrics().value["stores"] == 0
+
+    def test_request_no_store_bypasses_cache(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test a request with no-store neither reads nor writes the cache."""
+        httpx_mock.add_response(
+            url=URL,
+            json={},
+            headers={"Cache-Control": "max-age=60"},
+            is_reusable=True,
+        )
+        client = _client()
+
+        _get(client, **{"Cache-Control": "no-store"})
+        _get(client)
+
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_private_only_stored_by_private_cache(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test Cache-Control: private is skipped by a shared cache."""
+        httpx_mock.add_response(
+            url=URL,
+            json={},
+            headers={"Cache-Control": "private, max-age=60"},
+            is_reusable=True,
+        )
+        private_client = _client(FlextApiHttpCache())
+        shared_client = _client(FlextApiHttpCache(shared=True))
+
+        _get(private_client)
+        _get(private_client)
+        _get(shared_client)
+        _get(shared_client)
+
+        assert len(httpx_mock.get_requests()) == 3
+
+    def test_response_without_freshness_or_validators_not_stored(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test plain responses without caching headers are not stored."""
+        httpx_mock.add_response(url=URL, json={}, is_reusable=True)
+        client = _client()
+
+        _get(client)
+        _get(client)
+
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_vary_keeps_separate_variants(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test Vary selects the stored variant by request header value."""
+        httpx_mock.add_callback(
+            lambda request: httpx.Response(
+                200,
+                json={"lang": request.headers.get("accept-language", "")},
+                headers={"Cache-Control": "max-age=60", "Vary": "Accept-Language"},
+            ),
+            is_reusable=True,
+        )
+        client = _client()
+
+        en = _get(client, **{"Accept-Language": "en"})
+        fr = _get(client, **{"Accept-Language": "fr"})
+        en_again = _get(client, **{"Accept-Language": "en"})
+
+        assert en.body == en_again.body == {"lang": "en"}
+        assert fr.body == {"lang": "fr"}
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_unsafe_method_invalidates(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test a successful POST invalidates the cached GET of the same URL."""
+        httpx_mock.add_response(
+            method="GET",
+            url=URL,
+            json={},
+            headers={"Cache-Control": "max-age=60"},
+            is_reusable=True,
+        )
+        httpx_mock.add_response(method="POST", url=URL, json={}, status_code=201)
+        client = _client()
+
+        _get(client)
+        post = client.request(
+            FlextApiModels.HttpRequest(method="POST", url="/items", body={"a": 1}),
+        )
+        _get(client)
+
+        assert post.is_success
+        assert len(httpx_mock.get_requests(method="GET")) == 2
+        assert client.cache is not None
+        assert client.cache.metrics().value["invalidations"] == 1
+
+
+class TestFlextApiHttpCacheRevalidation:
+    """Test conditional revalidation and stale-while-revalidate."""
+
+    def test_etag_revalidation_304(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test a stale entry is revalidated with If-None-Match."""
+        httpx_mock.add_response(
+            url=URL,
+            json={"v": 1},
+            headers={"Cache-Control": "max-age=0", "ETag": '"v1"'},
+        )
+        httpx_mock.add_response(
+            url=URL,
+            status_code=304,
+            headers={"ETag": '"v1"', "Cache-Control": "max-age=0"},
+            match_headers={"If-None-Match": '"v1"'},
+        )
+        client = _client()
+
+        _get(client)
+        revalidated = _get(client)
+
+        assert revalidated.status_code == 200
+        assert revalidated.body == {"v": 1}
+        assert client.cache is not None
+        assert client.cache.metrics().value["revalidations"] == 1
+
+    def test_last_modified_revalidation(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test Last-Modified becomes If-Modified-Since."""
+        last_modified = "Wed, 21 Oct 2015 07:28:00 GMT"
+        httpx_mock.add_response(
+            url=URL,
+            json={"v": 1},
+            headers={"Cache-Control": "no-cache", "Last-Modified": last_modified},
+        )
+        httpx_mock.add_response(
+            url=URL,
+            json={"v": 2},
+            headers={"Cache-Control": "no-cache", "Last-Modified": last_modified},
+            match_headers={"If-Modified-Since": last_modified},
+        )
+        client = _client()
+
+        _get(client)
+        changed = _get(client)
+
+        assert changed.body == {"v": 2}
+
+    def test_stale_while_revalidate_serves_stale(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test stale responses are served while revalidating in background."""
+        httpx_mock.add_response(
+            url=URL,
+            json={"v": 1},
+            headers={
+                "Cache-Control": "max-age=0, stale-while-revalidate=60",
+                "ETag": '"v1"',
+            },
+        )
+        httpx_mock.add_response(
+            url=URL,
+            status_code=304,
+            headers={"Cache-Control": "max-age=60", "ETag": '"v1"'},
+        )
+        client = _client()
+        assert client.cache is not None
+
+        _get(client)
+        stale = _get(client)
+
+        assert stale.body == {"v": 1}
+        deadline = time.monotonic() + 5
+        while client.cache.metrics().value["revalidations"] < 1:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        fresh = _get(client)
+
+        assert fresh.body == {"v": 1}
+        metrics = client.cache.metrics().value
+        assert metrics["stale_hits"] == 1
+        assert metrics["hits"] == 1
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_must_revalidate_disables_stale_serving(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test must-revalidate overrides stale-while-revalidate."""
+        headers = {
+            "Cache-Control": "max-age=0, stale-while-revalidate=60, must-revalidate",
+            "ETag": '"v1"',
+        }
+        httpx_mock.add_response(url=URL, json={"v": 1}, headers=headers)
+        httpx_mock.add_response(url=URL, status_code=304, headers=headers)
+        client = _client()
+
+        _get(client)
+        _get(client)
+
+        assert client.cache is not None
+        metrics = client.cache.metrics().value
+        assert metrics["stale_hits"] == 0
+        assert metrics["revalidations"] == 1
+
+
+class TestFlextApiHttpCacheIntegration:
+    """Test cache wiring through settings, facade, storage and async client."""
+
+    def test_cache_enabled_setting(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test FlextApiSettings.cache_enabled turns the cache on in the facade."""
+        httpx_mock.add_response(
+            url=URL,
+            json={},
+            headers={"Cache-Control": "max-age=60"},
+        )
+        api = FlextApi(FlextApiSettings(base_url=BASE_URL, cache_enabled=True))
+
+        assert api.get("/items").is_success
+        assert api.get("/items").is_success
+        assert api.cache_metrics().value["hits"] == 1
+        assert FlextApi().cache_metrics().is_failure
+
+    def test_custom_storage_backend(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test any StorageBackendProtocol can hold the cache entries."""
+        httpx_mock.add_response(
+            url=URL,
+            json={},
+            headers={"Cache-Control": "max-age=60"},
+        )
+        storage = FlextApiStorage({"namespace": "custom"})
+        client = _client(FlextApiHttpCache(storage))
+
+        _get(client)
+
+        assert storage.exists(URL).value is True
+        assert client.cache is not None
+        assert client.cache.clear().is_success
+        assert storage.exists(URL).value is False
+
+    @pytest.mark.asyncio
+    async def test_async_client_uses_cache(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test the async client serves fresh entries from the cache."""
+        httpx_mock.add_response(
+            url=URL,
+            json={"n": 1},
+            headers={"Cache-Control": "max-age=60"},
+        )
+        cache = FlextApiHttpCache()
+        async with FlextApiAsyncClient(
+            FlextApiSettings(base_url=BASE_URL),
+            cache=cache,
+        ) as client:
+            request = FlextApiModels.HttpRequest(url="/items")
+            first = await client.arequest(request)
+            second = await client.arequest(request)
+
+        assert first.is_success
+        assert second.is_success
+        assert second.value.body == {"n": 1}
+        assert cache.metrics().value["hits"] == 1
+
+
+__all__ = [
+    "TestFlextApiHttpCacheFreshness",
+    "TestFlextApiHttpCacheIntegration",
+    "TestFlextApiHttpCacheRevalidation",
+]
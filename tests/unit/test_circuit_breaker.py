@@ -0,0 +1,397 @@
+"""Tests for FlextApiCircuitBreaker states, windows, events and clients.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+import pytest_httpx
+
+from flext_api import (
+    FlextApi,
+    FlextApiAsyncClient,
+    FlextApiCircuitBreaker,
+    FlextApiClient,
+    FlextApiModels,
+    FlextApiSettings,
+    FlextWebProtocolPlugin,
+    c,
+)
+
+if TYPE_CHECKING:
+    from tests.conftest import FakeClock
+
+URL = "https://api.example.com/items"
+State = c.Api.CircuitBreaker.State
+
+
+def _breaker(clock: FakeClock, **options: float) -> FlextApiCircuitBreaker:
+    settings: dict[str, float] = {
+        "minimum_calls": 4,
+        "open_duration": 10.0,
+        "half_open_max_calls": 2,
+        **options,
+    }
+    return FlextApiCircuitBreaker(
+        failure_rate_threshold=settings.pop("failure_rate_threshold", 0.5),
+        slow_call_rate_threshold=settings.pop("slow_call_rate_threshold", 0.8),
+        slow_call_duration=settings.pop("slow_call_duration", 1.0),
+        window=settings.pop("window", 10.0),
+        minimum_calls=int(settings.pop("minimum_calls")),
+        open_duration=settings.pop("open_duration"),
+        half_open_max_calls=int(settings.pop("half_open_max_calls")),
+        clock=clock,
+    )
+
+
+def _calls(
+    breaker: FlextApiCircuitBreaker,
+    *outcomes: bool,
+    url: str = URL,
+) -> None:
+    for failure in outcomes:
+        breaker.record(breaker.acquire(url), failure=failure)
+
+
+def _trip(breaker: FlextApiCircuitBreaker, url: str = URL) -> None:
+    _calls(breaker, True, True, False, True, url=url)
+
+
+class TestFlextApiCircuitBreakerStates:
+    """Test transitions between closed, open and half-open."""
+
+    def test_opens_on_failure_rate_after_minimum_calls(
+        self,
+        fake_clock: FakeClock,
+    ) -> None:
+        """Test the circuit opens once enough calls fail."""
+        breaker = _breaker(fake_clock)
+
+        _calls(breaker, True, True, True)
+        assert breaker.state(URL) is State.CLOSED
+
+        _calls(breaker, False)
+        assert breaker.state(URL) is State.OPEN
+
+    def test_stays_closed_below_threshold(self, fake_clock: FakeClock) -> None:
+        """Test a failure rate under the threshold keeps the circuit closed."""
+        breaker = _breaker(fake_clock)
+
+        _calls(breaker, True, False, False, False, False, True, False)
+
+        assert breaker.state(URL) is State.CLOSED
+
+    def test_opens_on_slow_call_rate(self, fake_clock: FakeClock) -> None:
+        """Test successful but slow calls open the circuit."""
+        breaker = _breaker(fake_clock, slow_call_rate_threshold=0.5)
+
+        for _ in range(4):
+            permit = breaker.acquire(URL)
+            fake_clock.now += 2.0
+            breaker.record(permit, failure=False)
+
+        assert breaker.state(URL) is State.OPEN
+        assert breaker.metrics().value["slow_calls"] == 4
+
+    def test_old_outcomes_slide_out_of_window(self, fake_clock: FakeClock) -> None:
+        """Test failures older than the window no longer count."""
+        breaker = _breaker(fake_clock)
+
+        _calls(breaker, True, True, True)
+        fake_clock.now = 11.0
+        _calls(breaker, False)
+
+        assert breaker.state(URL) is State.CLOSED
+        assert breaker.stats().value[breaker.origin_of(URL)]["calls"] == 1
+
+    def test_open_circuit_fails_fast_until_probe_time(
+        self,
+        fake_clock: FakeClock,
+    ) -> None:
+        """Test calls are rejected while open and probed afterwards."""
+        breaker = _breaker(fake_clock)
+        _trip(breaker)
+
+        fake_clock.now = 4.0
+        with pytest.raises(FlextApiCircuitBreaker.OpenError) as raised:
+            breaker.acquire(URL)
+        assert raised.value.retry_in == pytest.approx(6.0)
+
+        fake_clock.now = 10.0
+        permit = breaker.acquire(URL)
+        assert permit.probe
+        assert breaker.state(URL) is State.HALF_OPEN
+
+    def test_half_open_limits_probes_and_closes(self, fake_clock: FakeClock) -> None:
+        """Test enough successful probes close the circuit."""
+        breaker = _breaker(fake_clock)
+        _trip(breaker)
+        fake_clock.now = 10.0
+
+        first = breaker.acquire(URL)
+        second = breaker.acquire(URL)
+        with pytest.raises(FlextApiCircuitBreaker.OpenError):
+            breaker.acquire(URL)
+        breaker.record(first, failure=False)
+        breaker.record(second, failure=False)
+
+        assert breaker.state(URL) is State.CLOSED
+        assert breaker.stats().value[breaker.origin_of(URL)]["calls"] == 0
+
+    def test_failed_probe_reopens(self, fake_clock: FakeClock) -> None:
+        """Test a failed probe opens the circuit for another period."""
+        breaker = _breaker(fake_clock)
+        _trip(breaker)
+        fake_clock.now = 10.0
+
+        _calls(breaker, True)
+
+        assert breaker.state(URL) is State.OPEN
+        with pytest.raises(FlextApiCircuitBreaker.OpenError):
+            breaker.acquire(URL)
+
+    def test_stale_and_unknown_outcomes_are_ignored(
+        self,
+        fake_clock: FakeClock,
+    ) -> None:
+        """Test pre-transition permits and None outcomes only free slots."""
+        breaker = _breaker(fake_clock, half_open_max_calls=1)
+        stale = breaker.acquire(URL)
+        _trip(breaker)
+        breaker.record(stale, failure=False)
+        fake_clock.now = 10.0
+
+        probe = breaker.acquire(URL)
+        breaker.record(probe, failure=None)
+        assert breaker.state(URL) is State.HALF_OPEN
+        _calls(breaker, False)
+
+        assert breaker.state(URL) is State.CLOSED
+
+    def test_reset_during_call_is_ignored(self, fake_clock: FakeClock) -> None:
+        """Test calls admitted before a reset finish without being counted."""
+        breaker = _breaker(fake_clock)
+        in_flight = [breaker.acquire(URL) for _ in range(4)]
+        breaker.reset()
+
+        breaker.record(in_flight[0], failure=True)
+        _calls(breaker, True, True, False)
+        for permit in in_flight[1:]:
+            breaker.record(permit, failure=True)
+
+        assert breaker.state(URL) is State.CLOSED
+        assert breaker.metrics().value["failures"] == 2
+
+        def send() -> httpx.Response:
+            breaker.reset(URL)
+            return httpx.Response(503)
+
+        assert breaker.call(URL, send).status_code == 503
+        assert breaker.metrics().value["failures"] == 2
+
+    def test_circuits_are_per_origin(self, fake_clock: FakeClock) -> None:
+        """Test one failing origin does not affect another."""
+        breaker = _breaker(fake_clock)
+
+        _trip(breaker, "https://api.example.com:443/a")
+
+        assert breaker.state("https://api.example.com/b") is State.OPEN
+        assert breaker.state("http://api.example.com/b") is State.CLOSED
+
+    def test_rejects_invalid_settings(self) -> None:
+        """Test thresholds and durations are validated."""
+        with pytest.raises(ValueError, match="thresholds"):
+            FlextApiCircuitBreaker(failure_rate_threshold=0)
+        with pytest.raises(ValueError, match="positive"):
+            FlextApiCircuitBreaker(open_duration=0)
+
+
+class TestFlextApiCircuitBreakerObservability:
+    """Test transition events and metrics."""
+
+    def test_listeners_receive_transitions(self, fake_clock: FakeClock) -> None:
+        """Test every transition is reported once with its reason."""
+        breaker = _breaker(fake_clock, half_open_max_calls=1)
+        events: list[FlextApiCircuitBreaker.Event] = []
+        breaker.add_listener(events.append)
+
+        _trip(breaker)
+        fake_clock.now = 10.0
+        _calls(breaker, False)
+
+        assert [(event.previous, event.state) for event in events] == [
+            (State.CLOSED, State.OPEN),
+            (State.OPEN, State.HALF_OPEN),
+            (State.HALF_OPEN, State.CLOSED),
+        ]
+        assert events[0].reason == "failure rate 75%"
+        assert events[0].origin == "https://api.example.com:443"
+
+    def test_metrics_count_calls_rejections_and_states(
+        self,
+        fake_clock: FakeClock,
+    ) -> None:
+        """Test counters and current open-circuit gauge."""
+        breaker = _breaker(fake_clock)
+        _trip(breaker)
+        with pytest.raises(FlextApiCircuitBreaker.OpenError):
+            breaker.acquire(URL)
+
+        metrics = breaker.metrics().value
+
+        assert metrics["calls"] == 4
+        assert metrics["failures"] == 3
+        assert metrics["successes"] == 1
+        assert metrics["rejected"] == 1
+        assert metrics["opened"] == 1
+        assert metrics["open"] == 1
+
+
+class TestFlextApiCircuitBreakerCalls:
+    """Test call helpers and client integration."""
+
+    def test_call_counts_5xx_and_transport_errors(self, fake_clock: FakeClock) -> None:
+        """Test server errors and transport errors count as failures."""
+        breaker = _breaker(fake_clock)
+
+        def fail() -> httpx.Response:
+            msg = "refused"
+            raise httpx.ConnectError(msg)
+
+        for _ in range(2):
+            breaker.call(URL, lambda: httpx.Response(503))
+            with pytest.raises(httpx.ConnectError):
+                breaker.call(URL, fail)
+
+        assert breaker.state(URL) is State.OPEN
+
+    @pytest.mark.asyncio
+    async def test_acall_ignores_local_errors(self, fake_clock: FakeClock) -> None:
+        """Test the async helper only records outcomes from the origin."""
+        breaker = _breaker(fake_clock)
+
+        async def broken() -> httpx.Response:
+            msg = "bad body"
+            raise ValueError(msg)
+
+        for _ in range(5):
+            with pytest.raises(ValueError, match="bad body"):
+                await breaker.acall(URL, broken)
+
+        assert breaker.state(URL) is State.CLOSED
+        assert breaker.metrics().value["failures"] == 0
+
+    def test_sync_client_fails_fast_with_error_code(
+        self,
+        fake_clock: FakeClock,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test FlextApiClient stops calling an origin whose circuit is open."""
+        httpx_mock.add_response(url=URL, status_code=500, is_reusable=True)
+        client = FlextApiClient(
+            FlextApiSettings(base_url="https://api.example.com"),
+            circuit_breaker=_breaker(fake_clock),
+        )
+        request = FlextApiModels.HttpRequest(method="GET", url="/items")
+
+        for _ in range(4):
+            client.request(request)
+        result = client.request(request)
+
+        assert result.is_failure
+        assert result.error_code == c.Api.CircuitBreaker.OPEN_ERROR_CODE
+        assert len(httpx_mock.get_requests()) == 4
+        assert client.metrics().value["circuit.rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_async_client_builds_breaker_from_settings(self) -> None:
+        """Test circuit settings enable the breaker for async requests."""
+        calls = 0
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(502)
+
+        config = FlextApiSettings(
+            base_url="http://testserver",
+            max_retries=0,
+            circuit_breaker_enabled=True,
+            circuit_open_duration=60,
+        )
+        async with FlextApiAsyncClient(
+            config,
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            request = FlextApiModels.HttpRequest(method="GET", url="/items")
+            for _ in range(c.Api.CircuitBreaker.MINIMUM_CALLS):
+                await client.arequest(request)
+            result = await client.arequest(request)
+            breaker = client.circuit_breaker
+
+        assert result.error_code == c.Api.CircuitBreaker.OPEN_ERROR_CODE
+        assert calls == c.Api.CircuitBreaker.MINIMUM_CALLS
+        assert breaker is not None
+        assert breaker.state("http://testserver") is State.OPEN
+
+    @pytest.mark.asyncio
+    async def test_facade_shares_breaker_between_sync_and_async(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test a circuit tripped through get() makes aget() fail fast."""
+        httpx_mock.add_response(url=URL, status_code=502, is_reusable=True)
+        config = FlextApiSettings(
+            base_url="https://api.example.com",
+            circuit_breaker_enabled=True,
+            circuit_open_duration=60,
+        )
+        async with FlextApi(config) as api:
+            for _ in range(c.Api.CircuitBreaker.MINIMUM_CALLS):
+                api.get("/items")
+            result = await api.aget("/items")
+            async_client = api._get_async_client()
+            shared = (
+                async_client.circuit_breaker is api._client.circuit_breaker
+                and async_client.concurrency_limiter is api._client.concurrency_limiter
+                and async_client.hedging is api._client.hedging
+            )
+
+        assert result.error_code == c.Api.CircuitBreaker.OPEN_ERROR_CODE
+        assert len(httpx_mock.get_requests()) == c.Api.CircuitBreaker.MINIMUM_CALLS
+        assert shared
+
+    def test_plugin_stops_retrying_when_circuit_opens(
+        self,
+        fake_clock: FakeClock,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test the plugin's retry loop ends on an open circuit."""
+        httpx_mock.add_response(url=URL, status_code=503, is_reusable=True)
+        plugin = FlextWebProtocolPlugin(
+            max_retries=10,
+            retry_backoff_factor=0,
+            circuit_breaker=_breaker(fake_clock),
+        )
+        try:
+            result = plugin.send_request({"url": URL, "method": "GET"})
+            metrics = plugin.metrics().value
+        finally:
+            plugin.close()
+
+        assert result.error_code == c.Api.CircuitBreaker.OPEN_ERROR_CODE
+        assert len(httpx_mock.get_requests()) == 4
+        assert metrics["circuit.opened"] == 1
+
+
+__all__ = [
+    "TestFlextApiCircuitBreakerCalls",
+    "TestFlextApiCircuitBreakerObservability",
+    "TestFlextApiCircuitBreakerStates",
+]
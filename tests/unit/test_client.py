@@ -12,6 +12,9 @@ SPDX-License-Identifier: MIT
 from __future__ import annotations
 
 import json
+import threading
+import time
+from collections.abc import Callable
 from typing import cast
 
 import httpx
@@ -19,7 +22,14 @@ import pytest
 import pytest_httpx
 from flext_core import FlextResult
 
-from flext_api import FlextApi, FlextApiClient, FlextApiModels, FlextApiSettings
+from flext_api import (
+    FlextApi,
+    FlextApiClient,
+    FlextApiModels,
+    FlextApiSettings,
+    c,
+)
+from flext_api.serializers import FlextApiSerializers
 
 
 class TestFlextApiClientInitialization:
@@ -118,6 +128,14 @@ class TestFlextApiClientUrlBuilding:
         assert url_result.is_success
         assert url_result.value == "https://external.api/endpoint"
 
+    def test_build_url_absolute_bypasses_base_url(self) -> None:
+        """Test absolute URLs are used as-is even with a base URL."""
+        config = FlextApiSettings(base_url="https://api.example.com")
+        client = FlextApiClient(config)
+
+        url_result = client._build_url("https://other.example.com/items?page=2")
+        assert url_result.value == "https://other.example.com/items?page=2"
+
     def test_build_url_strips_trailing_slash(self) -> None:
         """Test URL building strips trailing slash from base URL."""
         config = FlextApiSettings(base_url="https://api.example.com/")
@@ -159,7 +177,7 @@ class TestFlextApiClientBodySerialization:
         body = {"key": "value"}
         result = FlextApiClient._serialize_body(body)
         assert result.is_success
-        assert result.value == json.dumps(body).encode("utf-8")
+        assert json.loads(result.value) == body
 
     def test_deserialize_json_response(self) -> None:
         """Test deserializing JSON response using real httpx.Response."""
@@ -547,16 +565,388 @@ class TestFlextApiSettingsValidation:
             FlextApiSettings(headers={"Key": ""})
 
 
+class TestFlextApiClientConnectionPool:
+    """Test the persistent pooled transport owned by FlextApiClient."""
+
+    def test_pool_limits_from_settings(self) -> None:
+        """Test pool limits are taken from FlextApiSettings."""
+        config = FlextApiSettings(
+            max_connections=7,
+            max_keepalive_connections=3,
+            keepalive_expiry=12.5,
+        )
+        client = FlextApiClient(config)
+
+        limits = client._build_pool_limits()
+        assert limits.max_connections == 7
+        assert limits.max_keepalive_connections == 3
+        assert limits.keepalive_expiry == 12.5
+
+    def test_pool_reused_across_requests(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test every request goes through the same httpx client."""
+        httpx_mock.add_response(url="https://api.example.com/a", json={"n": 1})
+        httpx_mock.add_response(url="https://api.example.com/b", json={"n": 2})
+        client = FlextApiClient(FlextApiSettings(base_url="https://api.example.com"))
+        assert client.is_closed
+
+        first = client.request(FlextApiModels.HttpRequest(url="/a"))
+        pool = client._get_http_client()
+        second = client.request(FlextApiModels.HttpRequest(url="/b"))
+
+        assert first.is_success
+        assert second.is_success
+        assert client._get_http_client() is pool
+        assert not client.is_closed
+
+    def test_close_and_reopen(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test close() releases the pool and the next request opens a new one."""
+        httpx_mock.add_response(url="https://api.example.com/a", json={})
+        client = FlextApiClient(FlextApiSettings(base_url="https://api.example.com"))
+        pool = client._get_http_client()
+
+        client.close()
+        assert client.is_closed
+        assert pool.is_closed
+
+        assert client.request(FlextApiModels.HttpRequest(url="/a")).is_success
+        assert client._get_http_client() is not pool
+
+    def test_context_manager_closes_pool(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test client and facade context managers close the pool on exit."""
+        httpx_mock.add_response(url="https://api.example.com/a", json={})
+        httpx_mock.add_response(url="https://api.example.com/b", json={})
+        config = FlextApiSettings(base_url="https://api.example.com")
+
+        with FlextApiClient(config) as client:
+            assert client.request(FlextApiModels.HttpRequest(url="/a")).is_success
+            assert not client.is_closed
+        assert client.is_closed
+
+        with FlextApi(config) as api:
+            assert api.get("/b").is_success
+        assert api._client.is_closed
+
+
+class TestFlextApiClientRequestMany:
+    """Test FlextApiClient.request_many bounded-concurrency batches."""
+
+    @staticmethod
+    def _slow_callback(
+        delay: float,
+        peak: list[int],
+    ) -> Callable[[httpx.Request], httpx.Response]:
+        in_flight = [0]
+        lock = threading.Lock()
+
+        def callback(request: httpx.Request) -> httpx.Response:
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(delay)
+            with lock:
+                in_flight[0] -= 1
+            return httpx.Response(200, json={"path": request.url.path})
+
+        return callback
+
+    @staticmethod
+    def _requests(count: int) -> list[FlextApiModels.HttpRequest]:
+        return [FlextApiModels.HttpRequest(url=f"/items/{i}") for i in range(count)]
+
+    def test_all_results_with_indices(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test every request yields exactly one (index, result) pair."""
+        httpx_mock.add_callback(self._slow_callback(0.0, [0]), is_reusable=True)
+        client = FlextApiClient(FlextApiSettings(base_url="https://api.example.com"))
+
+        results = dict(client.request_many(self._requests(20), max_concurrency=4))
+
+        assert sorted(results) == list(range(20))
+        assert all(result.is_success for result in results.values())
+        assert results[7].value.body == {"path": "/items/7"}
+
+    def test_ordered_results(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
+        """Test ordered=True yields results in input order."""
+        httpx_mock.add_callback(self._slow_callback(0.01, [0]), is_reusable=True)
+        api = FlextApi(FlextApiSettings(base_url="https://api.example.com"))
+
+        indices = [
+            index
+            for index, _ in api.request_many(
+                self._requests(12),
+                max_concurrency=5,
+                ordered=True,
+            )
+        ]
+
+        assert indices == list(range(12))
+
+    def test_max_concurrency_bound(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
+        """Test no more than max_concurrency requests are in flight."""
+        peak = [0]
+        httpx_mock.add_callback(self._slow_callback(0.02, peak), is_reusable=True)
+        client = FlextApiClient(FlextApiSettings(base_url="https://api.example.com"))
+
+        results = list(client.request_many(self._requests(15), max_concurrency=3))
+
+        assert len(results) == 15
+        assert 1 < peak[0] <= 3
+
+    def test_deadline_fails_in_flight_requests(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test requests still running at the deadline are reported as failures."""
+        httpx_mock.add_callback(
+            self._slow_callback(0.3, [0]),
+            is_reusable=True,
+            is_optional=True,
+        )
+        client = FlextApiClient(FlextApiSettings(base_url="https://api.example.com"))
+
+        results = list(
+            client.request_many(self._requests(10), max_concurrency=2, deadline=0.05),
+        )
+
+        assert [index for index, _ in results] == [0, 1]
+        assert all(result.is_failure for _, result in results)
+        assert all(
+            result.error == c.Api.HTTPBatch.DEADLINE_EXCEEDED_ERROR
+            for _, result in results
+        )
+
+    def test_deadline_keeps_finished_results(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test results finished behind a slow ordered head are not failed."""
+
+        def callback(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/items/0":
+                time.sleep(0.3)
+            return httpx.Response(200, json={"path": request.url.path})
+
+        httpx_mock.add_callback(callback, is_reusable=True)
+        client = FlextApiClient(FlextApiSettings(base_url="https://api.example.com"))
+
+        results = list(
+            client.request_many(
+                self._requests(3),
+                max_concurrency=3,
+                ordered=True,
+                deadline=0.1,
+            ),
+        )
+
+        assert [index for index, _ in results] == [0, 1, 2]
+        assert results[0][1].error == c.Api.HTTPBatch.DEADLINE_EXCEEDED_ERROR
+        assert results[1][1].is_success
+        assert results[2][1].value.body == {"path": "/items/2"}
+
+    def test_cancel_event_stops_batch(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test setting the cancel event stops issuing new requests."""
+        httpx_mock.add_callback(
+            self._slow_callback(0.01, [0]),
+            is_reusable=True,
+            is_optional=True,
+        )
+        client = FlextApiClient(FlextApiSettings(base_url="https://api.example.com"))
+        cancel = threading.Event()
+
+        results: list[tuple[int, FlextResult[FlextApiModels.HttpResponse]]] = []
+        for item in client.request_many(
+            self._requests(50),
+            max_concurrency=2,
+            cancel_event=cancel,
+        ):
+            results.append(item)
+            if len(results) == 3:
+                cancel.set()
+
+        assert len(results) < 50
+        assert any(
+            result.error == c.Api.HTTPBatch.CANCELLED_ERROR for _, result in results
+        )
+
+    def test_invalid_max_concurrency(self) -> None:
+        """Test max_concurrency below 1 is rejected."""
+        client = FlextApiClient()
+        with pytest.raises(ValueError, match="max_concurrency"):
+            client.request_many([], max_concurrency=0)
+
+
+class TestFlextApiClientLazyBody:
+    """Test lazy response bodies decoded on first .json_body()/.text() access."""
+
+    def test_lazy_body_kept_raw_until_accessed(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test lazy_response_body keeps bytes and decodes on demand."""
+        httpx_mock.add_response(json=[{"id": 1}, {"id": 2}])
+        client = FlextApiClient(
+            FlextApiSettings(
+                base_url="https://api.example.com", lazy_response_body=True
+            ),
+        )
+
+        response = client.request(FlextApiModels.HttpRequest(url="/items")).value
+
+        assert response.body == b'[{"id":1},{"id":2}]'
+        assert response.json_body().value == [{"id": 1}, {"id": 2}]
+        assert response.json_body().value is response.json_body().value
+        assert response.text() == '[{"id":1},{"id":2}]'
+
+    def test_lazy_text_uses_response_charset(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test text() decodes raw bytes with the declared charset."""
+        httpx_mock.add_response(
+            content="café".encode("latin-1"),
+            headers={"Content-Type": "text/plain; charset=latin-1"},
+        )
+        client = FlextApiClient(
+            FlextApiSettings(
+                base_url="https://api.example.com", lazy_response_body=True
+            ),
+        )
+
+        response = client.request(FlextApiModels.HttpRequest(url="/page")).value
+
+        assert response.text() == "café"
+        assert response.json_body().is_failure
+
+    def test_eager_body_accessors(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test json_body()/text() also work on eagerly decoded bodies."""
+        httpx_mock.add_response(json={"ok": True})
+        client = FlextApiClient(FlextApiSettings(base_url="https://api.example.com"))
+
+        response = client.request(FlextApiModels.HttpRequest(url="/items")).value
+
+        assert response.body == {"ok": True}
+        assert response.json_body().value == {"ok": True}
+        assert json.loads(response.text()) == {"ok": True}
+
+
+class TestFlextApiClientContentNegotiation:
+    """Test MessagePack/CBOR request and response bodies."""
+
+    @pytest.mark.parametrize(
+        ("serialization_format", "media_type"),
+        [("msgpack", "application/msgpack"), ("cbor", "application/cbor")],
+    )
+    def test_binary_format_round_trip(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+        serialization_format: str,
+        media_type: str,
+    ) -> None:
+        """Test dict bodies are encoded and binary responses decoded."""
+        negotiation = FlextApiSerializers.ContentNegotiation
+        httpx_mock.add_response(
+            content=negotiation.encode({"id": 7, "tags": ["a"]}, media_type),
+            headers={"Content-Type": media_type},
+        )
+        client = FlextApiClient(
+            FlextApiSettings(
+                base_url="https://api.example.com",
+                serialization_format=serialization_format,
+            ),
+        )
+
+        result = client.request(
+            FlextApiModels.HttpRequest(
+                method="POST",
+                url="/items",
+                body={"name": "widget"},
+            ),
+        )
+
+        sent = httpx_mock.get_request()
+        assert sent is not None
+        assert sent.headers["Content-Type"] == media_type
+        assert sent.headers["Accept"] == f"{media_type}, application/json;q=0.9"
+        assert negotiation.decode(sent.content, media_type) == {"name": "widget"}
+        assert result.is_success
+        assert result.value.body == {"id": 7, "tags": ["a"]}
+
+    def test_request_content_type_overrides_format(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test a per-request Content-Type selects the body encoding."""
+        httpx_mock.add_response(json={})
+        client = FlextApiClient(FlextApiSettings(base_url="https://api.example.com"))
+
+        client.request(
+            FlextApiModels.HttpRequest(
+                method="POST",
+                url="/items",
+                headers={"content-type": "application/x-msgpack"},
+                body={"name": "widget"},
+            ),
+        )
+
+        sent = httpx_mock.get_request()
+        assert sent is not None
+        assert FlextApiSerializers.MessagePack.unpackb(sent.content) == {
+            "name": "widget",
+        }
+
+    def test_lazy_binary_body_decoded_by_json(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test HttpResponse.json_body() decodes raw CBOR by its Content-Type."""
+        httpx_mock.add_response(
+            content=FlextApiSerializers.Cbor.dumps([1, 2]),
+            headers={"Content-Type": "application/cbor"},
+        )
+        client = FlextApiClient(
+            FlextApiSettings(
+                base_url="https://api.example.com",
+                lazy_response_body=True,
+            ),
+        )
+
+        response = client.request(FlextApiModels.HttpRequest(url="/items")).value
+
+        assert isinstance(response.body, bytes)
+        assert response.json_body().value == [1, 2]
+
+
 __all__ = [
     "TestFlextApiClientBodySerialization",
+    "TestFlextApiClientConnectionPool",
+    "TestFlextApiClientContentNegotiation",
     "TestFlextApiClientErrorHandling",
     "TestFlextApiClientHeaderMerging",
     "TestFlextApiClientHttpMethods",
     "TestFlextApiClientHttpRequest",
     "TestFlextApiClientInitialization",
+    "TestFlextApiClientLazyBody",
     "TestFlextApiClientModelsIntegration",
     "TestFlextApiClientQueryParams",
     "TestFlextApiClientRailwayPattern",
+    "TestFlextApiClientRequestMany",
     "TestFlextApiClientSettingsuration",
     "TestFlextApiClientUrlBuilding",
     "TestFlextApiSettingsValidation",
@@ -0,0 +1,295 @@
+"""Tests for FlextApiRequestCoalescer single-flight request coalescing.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+import pytest_httpx
+from flext_core import FlextResult
+
+from flext_api import (
+    FlextApi,
+    FlextApiAsyncClient,
+    FlextApiClient,
+    FlextApiModels,
+    FlextApiRequestCoalescer,
+    FlextApiSettings,
+)
+
+BASE_URL = "https://api.example.com"
+CALLERS = 8
+
+
+class _SlowUpstream:
+    """httpx_mock callback counting upstream calls, slow enough to overlap."""
+
+    def __init__(self, delay: float = 0.2) -> None:
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        return httpx.Response(200, json={"path": request.url.path})
+
+    async def acall(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return httpx.Response(200, json={"path": request.url.path})
+
+
+def _concurrently(
+    client: FlextApiClient,
+    requests: list[FlextApiModels.HttpRequest],
+) -> list[FlextResult[FlextApiModels.HttpResponse]]:
+    barrier = threading.Barrier(len(requests))
+
+    def call(
+        request: FlextApiModels.HttpRequest,
+    ) -> FlextResult[FlextApiModels.HttpResponse]:
+        barrier.wait()
+        return client.request(request)
+
+    with ThreadPoolExecutor(max_workers=len(requests)) as executor:
+        return list(executor.map(call, requests))
+
+
+def _client() -> FlextApiClient:
+    return FlextApiClient(
+        FlextApiSettings(base_url=BASE_URL),
+        coalescer=FlextApiRequestCoalescer(),
+    )
+
+
+class TestFlextApiRequestCoalescerSync:
+    """Test coalescing for thread callers."""
+
+    def test_identical_gets_share_one_call(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test concurrent identical GETs hit the upstream once."""
+        upstream = _SlowUpstream()
+        httpx_mock.add_callback(upstream, is_reusable=True)
+        client = _client()
+
+        results = _concurrently(
+            client,
+            [FlextApiModels.HttpRequest(url="/items")] * CALLERS,
+        )
+
+        assert all(result.is_success for result in results)
+        assert {str(result.value.body) for result in results} == {"{'path': '/items'}"}
+        assert upstream.calls == 1
+        assert client.coalescer is not None
+        assert client.coalescer.metrics().value == {
+            "leaders": 1,
+            "coalesced": CALLERS - 1,
+        }
+
+    def test_different_params_and_headers_not_coalesced(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test query params and key headers are part of the identity."""
+        upstream = _SlowUpstream(delay=0.1)
+        httpx_mock.add_callback(upstream, is_reusable=True)
+        client = _client()
+
+        results = _concurrently(
+            client,
+            [
+                FlextApiModels.HttpRequest(url="/items", query_params={"page": "1"}),
+                FlextApiModels.HttpRequest(url="/items", query_params={"page": "2"}),
+                FlextApiModels.HttpRequest(
+                    url="/items",
+                    headers={"Authorization": "Bearer a"},
+                ),
+                FlextApiModels.HttpRequest(
+                    url="/items",
+                    headers={"Authorization": "Bearer b"},
+                ),
+            ],
+        )
+
+        assert all(result.is_success for result in results)
+        assert upstream.calls == 4
+
+    def test_unsafe_methods_not_coalesced(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test POST requests always reach the upstream."""
+        upstream = _SlowUpstream(delay=0.1)
+        httpx_mock.add_callback(upstream, is_reusable=True)
+        client = _client()
+
+        _concurrently(
+            client,
+            [FlextApiModels.HttpRequest(method="POST", url="/items")] * 3,
+        )
+
+        assert upstream.calls == 3
+
+    def test_leader_error_shared_with_followers(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test a transport error of the shared call fails every caller."""
+
+        def failing(request: httpx.Request) -> httpx.Response:
+            time.sleep(0.2)
+            raise httpx.ConnectError("upstream down", request=request)
+
+        httpx_mock.add_callback(failing)
+        client = _client()
+
+        results = _concurrently(
+            client,
+            [FlextApiModels.HttpRequest(url="/items")] * 4,
+        )
+
+        assert all(result.is_failure for result in results)
+        assert all("upstream down" in (result.error or "") for result in results)
+
+    def test_interrupted_leader_hands_off_to_followers(self) -> None:
+        """Test a leader KeyboardInterrupt does not fail its followers."""
+        coalescer = FlextApiRequestCoalescer()
+        followers = 2
+
+        def interrupted() -> httpx.Response:
+            while coalescer.metrics().value["coalesced"] < followers:
+                time.sleep(0.01)
+            raise KeyboardInterrupt
+
+        def lead() -> None:
+            with pytest.raises(KeyboardInterrupt):
+                coalescer.execute("GET", f"{BASE_URL}/items", {}, {}, interrupted)
+
+        leader = threading.Thread(target=lead)
+        leader.start()
+        while coalescer.metrics().value["leaders"] < 1:
+            time.sleep(0.01)
+        with ThreadPoolExecutor(max_workers=followers) as executor:
+            responses = list(
+                executor.map(
+                    lambda _: coalescer.execute(
+                        "GET",
+                        f"{BASE_URL}/items",
+                        {},
+                        {},
+                        lambda: httpx.Response(200),
+                    ),
+                    range(followers),
+                ),
+            )
+        leader.join()
+
+        assert [response.status_code for response in responses] == [200] * followers
+
+    def test_settings_enable_coalescing(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test FlextApiSettings.coalesce_requests enables it in the facade."""
+        httpx_mock.add_response(json={})
+        api = FlextApi(FlextApiSettings(base_url=BASE_URL, coalesce_requests=True))
+
+        assert api.get("/items").is_success
+        metrics = api.metrics().value
+        assert metrics["coalescing.leaders"] == 1
+        assert metrics["coalescing.coalesced"] == 0
+        assert FlextApi().metrics().value == {}
+
+
+class TestFlextApiRequestCoalescerAsync:
+    """Test coalescing for asyncio callers."""
+
+    @pytest.mark.asyncio
+    async def test_identical_gets_share_one_call(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test concurrent identical async GETs hit the upstream once."""
+        upstream = _SlowUpstream(delay=0.05)
+        httpx_mock.add_callback(upstream.acall, is_reusable=True)
+        coalescer = FlextApiRequestCoalescer()
+        async with FlextApiAsyncClient(
+            FlextApiSettings(base_url=BASE_URL),
+            coalescer=coalescer,
+        ) as client:
+            request = FlextApiModels.HttpRequest(url="/items")
+            results = await asyncio.gather(
+                *(client.arequest(request) for _ in range(CALLERS)),
+            )
+
+        assert all(result.is_success for result in results)
+        assert upstream.calls == 1
+        assert coalescer.metrics().value["coalesced"] == CALLERS - 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_follower_keeps_shared_call(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test cancelling a follower does not cancel the leader's call."""
+        upstream = _SlowUpstream(delay=0.05)
+        httpx_mock.add_callback(upstream.acall, is_reusable=True)
+        async with FlextApiAsyncClient(
+            FlextApiSettings(base_url=BASE_URL),
+            coalescer=FlextApiRequestCoalescer(),
+        ) as client:
+            request = FlextApiModels.HttpRequest(url="/items")
+            leader = asyncio.ensure_future(client.arequest(request))
+            await asyncio.sleep(0)
+            follower = asyncio.ensure_future(client.arequest(request))
+            await asyncio.sleep(0.01)
+            follower.cancel()
+            result = await leader
+
+        assert result.is_success
+        assert upstream.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_hands_off_to_followers(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test cancelling the leader still gives its followers a result."""
+        upstream = _SlowUpstream(delay=0.05)
+        httpx_mock.add_callback(upstream.acall, is_reusable=True)
+        async with FlextApiAsyncClient(
+            FlextApiSettings(base_url=BASE_URL),
+            coalescer=FlextApiRequestCoalescer(),
+        ) as client:
+            request = FlextApiModels.HttpRequest(url="/items")
+            leader = asyncio.ensure_future(client.arequest(request))
+            await asyncio.sleep(0)
+            followers = [
+                asyncio.ensure_future(client.arequest(request)) for _ in range(3)
+            ]
+            await asyncio.sleep(0.01)
+            leader.cancel()
+            results = await asyncio.gather(*followers)
+
+        assert leader.cancelled()
+        assert all(result.is_success for result in results)
+        assert upstream.calls == 2
+
+
+__all__ = [
+    "TestFlextApiRequestCoalescerAsync",
+    "TestFlextApiRequestCoalescerSync",
+]
@@ -0,0 +1,242 @@
+"""Tests for FlextApiCompression request/response compression.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+import pytest_httpx
+from pydantic import ValidationError
+
+from flext_api import (
+    FlextApiAsyncClient,
+    FlextApiClient,
+    FlextApiCompression,
+    FlextApiModels,
+    FlextApiSettings,
+)
+
+BASE_URL = "https://api.example.com"
+LARGE_BODY = {"items": [{"id": i, "name": f"item-{i}"} for i in range(200)]}
+
+
+def _settings(**overrides: object) -> FlextApiSettings:
+    return FlextApiSettings.model_validate(
+        {
+            "base_url": BASE_URL,
+            "compression_enabled": True,
+            **overrides,
+        }
+    )
+
+
+class _GzipEchoServer(ThreadingHTTPServer):
+    """Local HTTP server answering with the gzip-encoded request body.
+
+    pytest_httpx cannot serve Content-Encoded responses, so the client's
+    decoding path is exercised against a real socket.
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            self.server.requests.append((dict(self.headers), body))
+            payload = gzip.compress(gzip.decompress(body))
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+            """Silence request logging."""
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), self.Handler)
+        self.base_url = f"http://127.0.0.1:{self.server_address[1]}"
+        self.requests: list[tuple[dict[str, str], bytes]] = []
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+
+class TestFlextApiCompression:
+    """Test body compression decisions and counters."""
+
+    def test_compresses_above_threshold(self) -> None:
+        """Test large bodies are compressed, labelled and counted."""
+        compression = FlextApiCompression(min_size=100)
+        body = json.dumps(LARGE_BODY).encode()
+
+        sent, headers, report = compression.encode_request(
+            body,
+            {"Content-Type": "application/json"},
+        )
+
+        assert headers == {
+            "Content-Type": "application/json",
+            "Content-Encoding": "gzip",
+        }
+        assert gzip.decompress(sent) == body
+        assert report is not None
+        assert report.raw_size == len(body)
+        assert report.compressed_size == len(sent)
+        assert report.ratio < 0.5
+        assert report.cpu_seconds >= 0
+        metrics = compression.metrics().value
+        assert metrics["requests_compressed"] == 1
+        assert metrics["request_bytes_raw"] == len(body)
+        assert metrics["request_bytes_sent"] == len(sent)
+
+    @pytest.mark.parametrize(
+        ("body", "headers"),
+        [
+            (b"x" * 99, {}),
+            (b"x" * 1000, {"content-encoding": "br"}),
+            (os.urandom(1000), {}),
+        ],
+        ids=["below-threshold", "already-encoded", "incompressible"],
+    )
+    def test_sent_unchanged(self, body: bytes, headers: dict[str, str]) -> None:
+        """Test small, pre-encoded and incompressible bodies are not touched."""
+        compression = FlextApiCompression(min_size=100)
+
+        sent, sent_headers, report = compression.encode_request(body, headers)
+
+        assert sent is body
+        assert sent_headers == headers
+        assert report is None
+        assert compression.metrics().value["requests_uncompressed"] == 1
+
+    def test_accept_encoding_keeps_order_of_available(self) -> None:
+        """Test Accept-Encoding lists only decodable encodings, in order."""
+        available = FlextApiCompression.available_encodings()
+        compression = FlextApiCompression(
+            None,
+            accept_encodings=("zstd", "br", "gzip", "lzma"),
+        )
+
+        assert "gzip" in available
+        assert compression.accept_encoding == ", ".join(
+            name for name in ("zstd", "br", "gzip") if name in available
+        )
+
+    def test_round_trip_every_available_encoding(self) -> None:
+        """Test every available encoding decompresses what it compressed."""
+        compression = FlextApiCompression(None, level=None)
+        data = b"payload " * 512
+
+        for encoding in FlextApiCompression.available_encodings():
+            compressed = compression.compress(data, encoding).value
+            decompressed = FlextApiCompression.decompress(compressed, encoding)
+            assert decompressed.value == data
+
+    def test_invalid_configuration(self) -> None:
+        """Test unknown encodings are rejected by the component and settings."""
+        with pytest.raises(ValueError, match="not available"):
+            FlextApiCompression("lzma")
+        with pytest.raises(ValidationError, match="not available"):
+            FlextApiSettings(compression_encoding="lzma")
+        assert FlextApiCompression.decompress(b"not gzip", "gzip").is_failure
+
+
+class TestFlextApiClientCompression:
+    """Test compression in the client pipeline."""
+
+    def test_request_compressed_and_response_decoded(self) -> None:
+        """Test bodies are gzip-encoded and gzip responses counted."""
+        server = _GzipEchoServer()
+        client = FlextApiClient(
+            _settings(base_url=server.base_url, compression_min_size=100),
+        )
+        try:
+            result = client.request(
+                FlextApiModels.HttpRequest(
+                    method="POST",
+                    url="/items",
+                    body=LARGE_BODY,
+                ),
+            )
+        finally:
+            client.close()
+            server.shutdown()
+            server.server_close()
+
+        [(headers, body)] = server.requests
+        assert headers["Content-Encoding"] == "gzip"
+        assert client.compression is not None
+        assert headers["Accept-Encoding"] == client.compression.accept_encoding
+        assert json.loads(gzip.decompress(body)) == LARGE_BODY
+        assert result.value.body == LARGE_BODY
+        metrics = client.metrics().value
+        assert metrics["compression.requests_compressed"] == 1
+        assert metrics["compression.responses_compressed"] == 1
+        assert metrics["compression.response_bytes_decoded"] == len(
+            gzip.decompress(body),
+        )
+        assert (
+            metrics["compression.response_bytes_received"]
+            < metrics["compression.response_bytes_decoded"]
+        )
+
+    def test_disabled_by_default(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
+        """Test bodies are sent as-is without compression_enabled."""
+        httpx_mock.add_response(json={})
+        client = FlextApiClient(FlextApiSettings(base_url=BASE_URL))
+
+        client.request(
+            FlextApiModels.HttpRequest(method="POST", url="/items", body=LARGE_BODY),
+        )
+
+        sent = httpx_mock.get_request()
+        assert sent is not None
+        assert "Content-Encoding" not in sent.headers
+        assert client.compression is None
+
+    @pytest.mark.asyncio
+    async def test_async_request_compressed(self) -> None:
+        """Test the async client compresses bodies once across retries."""
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if len(requests) == 1:
+                return httpx.Response(503)
+            return httpx.Response(200, json={"ok": True})
+
+        async with FlextApiAsyncClient(
+            _settings(
+                compression_min_size=100,
+                retry_enabled=True,
+                max_retries=1,
+            ),
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            result = await client.arequest(
+                FlextApiModels.HttpRequest(
+                    method="PUT",
+                    url="/items",
+                    body=LARGE_BODY,
+                ),
+            )
+
+        assert result.is_success
+        assert len(requests) == 2
+        assert [request.headers["Content-Encoding"] for request in requests] == [
+            "gzip",
+            "gzip",
+        ]
+        assert requests[0].content == requests[1].content
+        assert client.metrics().value["compression.requests_compressed"] == 1
+
+
+__all__ = ["TestFlextApiClientCompression", "TestFlextApiCompression"]
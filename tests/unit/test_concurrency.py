@@ -0,0 +1,253 @@
+"""Tests for FlextApiConcurrencyLimiter admission, queueing and adaptation.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+
+from flext_api import (
+    FlextApiAsyncClient,
+    FlextApiConcurrencyLimiter,
+    FlextApiModels,
+    FlextApiSettings,
+    c,
+)
+
+if TYPE_CHECKING:
+    from tests.conftest import FakeClock
+
+URL = "https://api.example.com/items"
+
+
+def _limiter(
+    clock: FakeClock,
+    **options: float | str,
+) -> FlextApiConcurrencyLimiter:
+    return FlextApiConcurrencyLimiter(
+        algorithm=str(options.get("algorithm", "aimd")),
+        initial_limit=int(options.get("initial_limit", 2)),
+        max_limit=int(options.get("max_limit", 50)),
+        queue_timeout=float(options.get("queue_timeout", 0.0)),
+        clock=clock,
+    )
+
+
+class TestFlextApiConcurrencyLimiterAdmission:
+    """Test slots, queueing and rejection."""
+
+    def test_rejects_when_queue_disabled(self, fake_clock: FakeClock) -> None:
+        """Test requests above the limit fail fast without a queue."""
+        limiter = _limiter(fake_clock)
+        limiter.acquire(URL)
+        limiter.acquire(URL)
+
+        with pytest.raises(FlextApiConcurrencyLimiter.LimitExceededError) as raised:
+            limiter.acquire(URL)
+
+        assert raised.value.reason == "queue full"
+        assert raised.value.limit == 2
+        assert limiter.metrics().value["rejected"] == 1
+
+    def test_queued_request_times_out(self, fake_clock: FakeClock) -> None:
+        """Test a queued request gives up after its timeout."""
+        limiter = _limiter(fake_clock, queue_timeout=5.0, initial_limit=1)
+        limiter.acquire(URL)
+
+        with pytest.raises(
+            FlextApiConcurrencyLimiter.LimitExceededError,
+            match="queue timeout",
+        ):
+            limiter.acquire(URL, timeout=0.01)
+
+        metrics = limiter.metrics().value
+        assert metrics["timeouts"] == 1
+        assert metrics["queue_depth"] == 0
+
+    def test_release_hands_slot_to_queued_thread(self, fake_clock: FakeClock) -> None:
+        """Test a released slot goes to the first queued request."""
+        limiter = _limiter(fake_clock, queue_timeout=5.0, initial_limit=1)
+        held = limiter.acquire(URL)
+        permits: list[FlextApiConcurrencyLimiter.Permit] = []
+        waiter = threading.Thread(target=lambda: permits.append(limiter.acquire(URL)))
+        waiter.start()
+        while limiter.metrics().value["queue_depth"] == 0:
+            threading.Event().wait(0.001)
+
+        limiter.release(held, dropped=None)
+        waiter.join(5)
+
+        assert len(permits) == 1
+        assert limiter.metrics().value["in_flight"] == 1
+
+    def test_origins_have_separate_limits(self, fake_clock: FakeClock) -> None:
+        """Test one busy origin does not block another."""
+        limiter = _limiter(fake_clock, initial_limit=1)
+        limiter.acquire(URL)
+
+        permit = limiter.acquire("http://api.example.com/items")
+
+        assert permit.origin == "http://api.example.com:80"
+
+    def test_rejects_invalid_settings(self) -> None:
+        """Test limits and ratios are validated."""
+        with pytest.raises(ValueError, match="min <= initial <= max"):
+            FlextApiConcurrencyLimiter(initial_limit=500)
+        with pytest.raises(ValueError, match="backoff_ratio"):
+            FlextApiConcurrencyLimiter(backoff_ratio=1.0)
+
+
+class TestFlextApiConcurrencyLimiterAdaptation:
+    """Test AIMD and Vegas limit changes."""
+
+    def test_aimd_grows_additively_while_saturated(self, fake_clock: FakeClock) -> None:
+        """Test successes at the limit add about one slot per round trip."""
+        limiter = _limiter(fake_clock, initial_limit=4)
+
+        for _ in range(12):
+            permits = [limiter.acquire(URL) for _ in range(limiter.limit(URL))]
+            for permit in permits:
+                limiter.release(permit, dropped=False)
+
+        limit = limiter.limit(URL)
+        assert 4 < limit <= 4 + 12
+        assert limiter.metrics().value["increases"] == limit - 4
+
+    def test_aimd_idle_successes_do_not_grow(self, fake_clock: FakeClock) -> None:
+        """Test a mostly idle origin keeps its limit."""
+        limiter = _limiter(fake_clock, initial_limit=10)
+
+        for _ in range(50):
+            limiter.release(limiter.acquire(URL), dropped=False)
+
+        assert limiter.limit(URL) == 10
+
+    def test_burst_of_drops_backs_off_once(self, fake_clock: FakeClock) -> None:
+        """Test drops of requests sent before a cut do not cut again."""
+        limiter = _limiter(fake_clock, initial_limit=20)
+        permits = [limiter.acquire(URL) for _ in range(10)]
+
+        fake_clock.now = 1.0
+        for permit in permits:
+            limiter.release(permit, dropped=True)
+        assert limiter.limit(URL) == 18
+
+        limiter.release(limiter.acquire(URL), dropped=True)
+        assert limiter.limit(URL) == 16
+        assert limiter.metrics().value["dropped"] == 11
+
+    def test_vegas_follows_latency(self, fake_clock: FakeClock) -> None:
+        """Test Vegas grows at no-load latency and shrinks as queues build."""
+        limiter = _limiter(fake_clock, algorithm="vegas", initial_limit=10)
+
+        def round_trip(rtt: float) -> None:
+            permits = [limiter.acquire(URL) for _ in range(limiter.limit(URL))]
+            fake_clock.now += rtt
+            for permit in permits:
+                limiter.release(permit, dropped=False)
+
+        for _ in range(6):
+            round_trip(0.010)
+        assert limiter.limit(URL) == 12
+
+        for _ in range(6):
+            round_trip(0.040)
+        assert limiter.limit(URL) == 7
+        assert limiter.stats().value["https://api.example.com:443"][
+            "min_rtt_us"
+        ] == pytest.approx(10_000)
+
+    def test_call_counts_overload_statuses_as_drops(
+        self,
+        fake_clock: FakeClock,
+    ) -> None:
+        """Test 503 and transport errors back off, 500 does not."""
+        limiter = _limiter(fake_clock, initial_limit=10)
+
+        limiter.call(URL, lambda: httpx.Response(500))
+        assert limiter.limit(URL) == 10
+        limiter.call(URL, lambda: httpx.Response(503))
+
+        assert limiter.limit(URL) == 9
+
+
+class TestFlextApiConcurrencyLimiterAsync:
+    """Test the async path and client integration."""
+
+    @pytest.mark.asyncio
+    async def test_async_waiter_gets_released_slot(self, fake_clock: FakeClock) -> None:
+        """Test a queued coroutine resumes when a slot frees."""
+        limiter = _limiter(fake_clock, queue_timeout=5.0, initial_limit=1)
+        held = await limiter.aacquire(URL)
+        waiting = asyncio.ensure_future(limiter.aacquire(URL))
+        await asyncio.sleep(0)
+
+        assert limiter.metrics().value["queue_depth"] == 1
+        limiter.release(held, dropped=None)
+        permit = await asyncio.wait_for(waiting, 1)
+
+        assert permit.origin == held.origin
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self, fake_clock: FakeClock) -> None:
+        """Test cancelling a queued coroutine frees its queue entry."""
+        limiter = _limiter(fake_clock, queue_timeout=5.0, initial_limit=1)
+        held = await limiter.aacquire(URL)
+        waiting = asyncio.ensure_future(limiter.aacquire(URL))
+        await asyncio.sleep(0)
+
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        limiter.release(held, dropped=None)
+
+        metrics = limiter.metrics().value
+        assert metrics["queue_depth"] == 0
+        assert metrics["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_async_client_rejects_above_limit(self) -> None:
+        """Test settings build a limiter whose rejections carry an error code."""
+        release = asyncio.Event()
+
+        async def handler(_request: httpx.Request) -> httpx.Response:
+            await release.wait()
+            return httpx.Response(200, json={})
+
+        config = FlextApiSettings(
+            base_url="http://testserver",
+            adaptive_concurrency_enabled=True,
+            concurrency_initial_limit=1,
+            concurrency_queue_timeout=0,
+        )
+        async with FlextApiAsyncClient(
+            config,
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            request = FlextApiModels.HttpRequest(method="GET", url="/items")
+            first = asyncio.ensure_future(client.arequest(request))
+            await asyncio.sleep(0.01)
+            rejected = await client.arequest(request)
+            release.set()
+            served = await first
+            metrics = client.metrics().value
+
+        assert served.is_success
+        assert rejected.error_code == c.Api.Concurrency.LIMITED_ERROR_CODE
+        assert metrics["concurrency.rejected"] == 1
+        assert metrics["concurrency.in_flight"] == 0
+
+
+__all__ = [
+    "TestFlextApiConcurrencyLimiterAdaptation",
+    "TestFlextApiConcurrencyLimiterAdmission",
+    "TestFlextApiConcurrencyLimiterAsync",
+]
@@ -0,0 +1,428 @@
+"""Tests for FlextApiDnsCache resolution caching and happy-eyeballs connects.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING
+
+import httpcore
+import httpx
+import pytest
+
+from flext_api import (
+    FlextApiAsyncClient,
+    FlextApiClient,
+    FlextApiDnsCache,
+    FlextApiModels,
+    FlextApiSettings,
+    FlextWebProtocolPlugin,
+)
+from flext_api.transports import FlextApiTransports
+
+if TYPE_CHECKING:
+    from tests.conftest import FakeClock
+
+V4 = (socket.AF_INET, "127.0.0.1")
+V6 = (socket.AF_INET6, "::1")
+
+
+class _StubResolver:
+    """Resolver answering from a table and recording every lookup."""
+
+    def __init__(self, **answers: object) -> None:
+        self.answers: dict[str, object] = dict(answers)
+        self.calls: list[tuple[str, int]] = []
+
+    def __call__(self, host: str, port: int) -> FlextApiDnsCache.Resolution:
+        self.calls.append((host, port))
+        answer = self.answers[host]
+        if isinstance(answer, OSError):
+            raise answer
+        assert isinstance(answer, FlextApiDnsCache.Resolution)
+        return answer
+
+
+class _OkServer(ThreadingHTTPServer):
+    """Local HTTP server answering every GET with 200 on 127.0.0.1."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain")
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"ok")
+
+        def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+            """Silence request logging."""
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), self.Handler)
+        self.port = self.server_address[1]
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+def _wait_for(predicate: object, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.01)
+
+
+class TestFlextApiDnsCache:
+    """Test TTLs, negative caching, background refresh and metrics."""
+
+    def test_caches_answer_until_ttl_expires(self, fake_clock: FakeClock) -> None:
+        """Test lookups within the record TTL are served from the cache."""
+        resolver = _StubResolver(
+            **{"api.test": FlextApiDnsCache.Resolution([V4], ttl=10)},
+        )
+        dns = FlextApiDnsCache(resolver=resolver, clock=fake_clock, refresh_ahead=0)
+
+        assert dns.resolve("api.test", 443).value == (V4,)
+        fake_clock.now += 9
+        assert dns.resolve("API.test", 443).value == (V4,)
+        assert len(resolver.calls) == 1
+        fake_clock.now += 2
+        assert dns.resolve("api.test", 443).is_success
+
+        assert len(resolver.calls) == 2
+        metrics = dns.metrics().value
+        assert metrics["hits"] == 1
+        assert metrics["misses"] == 2
+        assert metrics["resolutions"] == 2
+        assert metrics["entries"] == 1
+
+    def test_default_and_max_ttl(self, fake_clock: FakeClock) -> None:
+        """Test answers without a TTL use ``ttl`` and long TTLs are capped."""
+        resolver = _StubResolver(
+            **{
+                "plain.test": FlextApiDnsCache.Resolution([V4]),
+                "long.test": FlextApiDnsCache.Resolution([V4], ttl=86400),
+            },
+        )
+        dns = FlextApiDnsCache(
+            ttl=5,
+            max_ttl=60,
+            refresh_ahead=0,
+            resolver=resolver,
+            clock=fake_clock,
+        )
+        dns.resolve("plain.test", 80)
+        dns.resolve("long.test", 80)
+
+        fake_clock.now += 6
+        dns.resolve("plain.test", 80)
+        dns.resolve("long.test", 80)
+        fake_clock.now += 60
+        dns.resolve("long.test", 80)
+
+        assert resolver.calls == [
+            ("plain.test", 80),
+            ("long.test", 80),
+            ("plain.test", 80),
+            ("long.test", 80),
+        ]
+
+    def test_negative_caching(self, fake_clock: FakeClock) -> None:
+        """Test failed lookups are cached for ``negative_ttl`` seconds."""
+        resolver = _StubResolver(
+            **{"missing.test": socket.gaierror(socket.EAI_NONAME, "not known")},
+        )
+        dns = FlextApiDnsCache(negative_ttl=2, resolver=resolver, clock=fake_clock)
+
+        first = dns.resolve("missing.test", 443)
+        second = dns.resolve("missing.test", 443)
+        fake_clock.now += 3
+        third = dns.resolve("missing.test", 443)
+
+        assert first.is_failure
+        assert first.error is not None
+        assert "missing.test" in first.error
+        assert second.error == first.error
+        assert third.is_failure
+        assert len(resolver.calls) == 2
+        metrics = dns.metrics().value
+        assert metrics["negative_hits"] == 1
+        assert metrics["failures"] == 2
+
+    def test_refreshes_in_background_before_expiry(self, fake_clock: FakeClock) -> None:
+        """Test a hit near expiry returns at once and refreshes behind it."""
+        old, new = (socket.AF_INET, "10.0.0.1"), (socket.AF_INET, "10.0.0.2")
+        resolver = _StubResolver(
+            **{"api.test": FlextApiDnsCache.Resolution([old], ttl=10)},
+        )
+        dns = FlextApiDnsCache(refresh_ahead=0.2, resolver=resolver, clock=fake_clock)
+        dns.resolve("api.test", 443)
+
+        resolver.answers["api.test"] = FlextApiDnsCache.Resolution([new], ttl=10)
+        fake_clock.now += 8.5
+        assert dns.resolve("api.test", 443).value == (old,)
+        _wait_for(lambda: dns.metrics().value["refreshes"] == 1)
+        fake_clock.now += 5
+
+        assert dns.resolve("api.test", 443).value == (new,)
+        assert len(resolver.calls) == 2
+        assert dns.metrics().value["misses"] == 1
+
+    def test_failed_refresh_keeps_current_answer(self, fake_clock: FakeClock) -> None:
+        """Test a failing background refresh does not evict a valid answer."""
+        resolver = _StubResolver(
+            **{"api.test": FlextApiDnsCache.Resolution([V4], ttl=10)},
+        )
+        dns = FlextApiDnsCache(resolver=resolver, clock=fake_clock)
+        dns.resolve("api.test", 443)
+
+        resolver.answers["api.test"] = OSError("resolver down")
+        fake_clock.now += 9
+        dns.resolve("api.test", 443)
+        _wait_for(lambda: dns.metrics().value["refreshes"] == 1)
+
+        assert dns.resolve("api.test", 443).value == (V4,)
+        assert dns.metrics().value["failures"] == 1
+
+    def test_ip_literals_and_invalidate(self) -> None:
+        """Test IP literals skip the resolver and invalidate drops entries."""
+        resolver = _StubResolver(**{"api.test": FlextApiDnsCache.Resolution([V4])})
+        dns = FlextApiDnsCache(resolver=resolver)
+
+        assert dns.resolve("127.0.0.1", 80).value == (V4,)
+        assert dns.resolve("[::1]", 80).value == (V6,)
+        dns.resolve("api.test", 80)
+        dns.invalidate("api.test")
+        dns.resolve("api.test", 80)
+
+        assert resolver.calls == [("api.test", 80), ("api.test", 80)]
+
+    def test_interleave_alternates_families(self) -> None:
+        """Test addresses alternate families, starting with the first one."""
+        a6 = (socket.AF_INET6, "2001:db8::1")
+        b6 = (socket.AF_INET6, "2001:db8::2")
+        a4 = (socket.AF_INET, "192.0.2.1")
+        b4 = (socket.AF_INET, "192.0.2.2")
+
+        assert FlextApiDnsCache.interleave([a6, b6, a4, b4]) == [a6, a4, b6, b4]
+        assert FlextApiDnsCache.interleave([a4, a6, b6]) == [a4, a6, b6]
+        assert FlextApiDnsCache.interleave([]) == []
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {"ttl": -1},
+            {"happy_eyeballs_delay": -0.1},
+            {"refresh_ahead": 1.0},
+            {"max_entries": 0},
+        ],
+    )
+    def test_rejects_invalid_settings(self, options: dict[str, float]) -> None:
+        """Test invalid TTLs, delays and sizes are rejected."""
+        with pytest.raises(ValueError, match="must be"):
+            FlextApiDnsCache(**options)
+
+    def test_drops_oldest_entry_beyond_max_entries(self) -> None:
+        """Test the cache never holds more than ``max_entries`` hosts."""
+        resolver = _StubResolver(
+            **{f"h{i}.test": FlextApiDnsCache.Resolution([V4]) for i in range(3)},
+        )
+        dns = FlextApiDnsCache(max_entries=2, resolver=resolver)
+        for i in range(3):
+            dns.resolve(f"h{i}.test", 80)
+        dns.resolve("h0.test", 80)
+
+        assert dns.metrics().value["entries"] == 2
+        assert resolver.calls.count(("h0.test", 80)) == 2
+
+
+class TestFlextApiDnsCacheConnect:
+    """Test happy-eyeballs connection racing against local sockets."""
+
+    def test_falls_back_to_next_address(self) -> None:
+        """Test a refused address is skipped for the next one."""
+        listener = socket.create_server(("127.0.0.1", 0))
+        port = listener.getsockname()[1]
+        refused = (socket.AF_INET, "127.0.0.2")
+        resolver = _StubResolver(
+            **{"api.test": FlextApiDnsCache.Resolution([refused, V4])},
+        )
+        dns = FlextApiDnsCache(resolver=resolver)
+        try:
+            sock = dns.connect("api.test", port, timeout=2)
+            assert sock.getpeername() == ("127.0.0.1", port)
+            assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+            sock.close()
+        finally:
+            listener.close()
+
+        metrics = dns.metrics().value
+        assert metrics["connects"] == 1
+        assert metrics["connect_attempts"] == 2
+
+    def test_races_next_address_while_first_hangs(self) -> None:
+        """Test a stalled attempt does not delay the connection."""
+        # A listener with a full backlog drops SYNs, so connects to it hang
+        stalled = socket.socket()
+        stalled.bind(("127.0.0.2", 0))
+        stalled.listen(0)
+        port = stalled.getsockname()[1]
+        fillers = []
+        for _ in range(4):
+            filler = socket.socket()
+            filler.setblocking(False)
+            filler.connect_ex(("127.0.0.2", port))
+            fillers.append(filler)
+        time.sleep(0.1)
+        listener = socket.create_server(("127.0.0.1", port))
+        resolver = _StubResolver(
+            **{
+                "api.test": FlextApiDnsCache.Resolution(
+                    [(socket.AF_INET, "127.0.0.2"), V4],
+                ),
+            },
+        )
+        dns = FlextApiDnsCache(happy_eyeballs_delay=0.05, resolver=resolver)
+        try:
+            started = time.monotonic()
+            sock = dns.connect("api.test", port, timeout=5)
+            elapsed = time.monotonic() - started
+            peer = sock.getpeername()
+            sock.close()
+        finally:
+            for open_socket in (*fillers, stalled, listener):
+                open_socket.close()
+
+        assert peer == ("127.0.0.1", port)
+        assert elapsed < 0.9
+        assert dns.metrics().value["connect_attempts"] == 2
+
+    def test_unresolvable_host_raises(self) -> None:
+        """Test lookup failures and empty answers raise OSError."""
+        resolver = _StubResolver(
+            **{
+                "missing.test": socket.gaierror(socket.EAI_NONAME, "not known"),
+                "none.test": FlextApiDnsCache.Resolution([]),
+            },
+        )
+        dns = FlextApiDnsCache(resolver=resolver)
+
+        with pytest.raises(OSError, match=r"missing\.test"):
+            dns.connect("missing.test", 80)
+        with pytest.raises(OSError, match="no addresses"):
+            dns.connect("none.test", 80)
+
+
+class TestFlextApiDnsCacheIntegration:
+    """Test FlextApiClient and FlextWebProtocolPlugin resolve through the cache."""
+
+    def test_client_resolves_through_cache(self) -> None:
+        """Test client connections use the stub resolver and report metrics."""
+        server = _OkServer()
+        resolver = _StubResolver(**{"service.test": FlextApiDnsCache.Resolution([V4])})
+        dns = FlextApiDnsCache(resolver=resolver)
+        client = FlextApiClient(
+            FlextApiSettings(base_url=f"http://service.test:{server.port}"),
+            dns_cache=dns,
+        )
+        try:
+            for _ in range(2):
+                result = client.request(
+                    FlextApiModels.HttpRequest(method="GET", url="/"),
+                )
+                assert result.is_success, result.error
+                assert result.value.status_code == 200
+            metrics = client.metrics().value
+        finally:
+            client.close()
+            server.stop()
+
+        assert client.dns_cache is dns
+        assert resolver.calls == [("service.test", server.port)]
+        assert metrics["dns.misses"] == 1
+        assert metrics["dns.connects"] >= 1
+
+    def test_settings_enable_cache(self) -> None:
+        """Test dns_* settings create a cache only when enabled."""
+        enabled = FlextApiClient(
+            FlextApiSettings(dns_cache_enabled=True, dns_cache_ttl=12),
+        )
+        disabled = FlextApiClient(FlextApiSettings())
+
+        assert isinstance(enabled.dns_cache, FlextApiDnsCache)
+        assert disabled.dns_cache is None
+        assert "dns.hits" in enabled.metrics().value
+
+    def test_async_client_has_no_cache(self) -> None:
+        """Test the async client neither creates nor reports a DNS cache."""
+        client = FlextApiAsyncClient(FlextApiSettings(dns_cache_enabled=True))
+
+        assert client.dns_cache is None
+        assert not any(name.startswith("dns.") for name in client.metrics().value)
+
+    def test_httpcore_internals_available(self) -> None:
+        """Fail loudly when an httpcore upgrade moves what install() patches."""
+        assert FlextApiDnsCache.supported(), (
+            f"httpcore {httpcore.__version__} is outside "
+            "c.Api.Dns.HTTPCORE_VERSIONS or moved SyncStream"
+        )
+        dns = FlextApiDnsCache()
+        transport = dns.install(httpx.HTTPTransport())
+        pool = transport._pool
+
+        assert isinstance(pool, httpcore.ConnectionPool)
+        assert pool._network_backend is dns.network_backend
+
+    def test_client_reports_unresolvable_host(self) -> None:
+        """Test a negative answer surfaces as a failed request."""
+        resolver = _StubResolver(
+            **{"missing.test": socket.gaierror(socket.EAI_NONAME, "not known")},
+        )
+        client = FlextApiClient(
+            FlextApiSettings(base_url="http://missing.test"),
+            dns_cache=FlextApiDnsCache(resolver=resolver),
+        )
+        try:
+            result = client.request(FlextApiModels.HttpRequest(method="GET", url="/"))
+        finally:
+            client.close()
+
+        assert result.is_failure
+
+    def test_plugin_resolves_through_cache(self) -> None:
+        """Test the protocol plugin's pooled clients use the cache."""
+        server = _OkServer()
+        resolver = _StubResolver(**{"service.test": FlextApiDnsCache.Resolution([V4])})
+        dns = FlextApiDnsCache(resolver=resolver)
+        plugin = FlextWebProtocolPlugin(max_retries=0, dns_cache=dns)
+        try:
+            result = plugin.send_request(
+                {
+                    "url": f"http://service.test:{server.port}/",
+                    "method": "GET",
+                }
+            )
+        finally:
+            plugin.close()
+            server.stop()
+            FlextApiTransports.PoolRegistry.reset_global()
+
+        assert result.is_success, result.error
+        assert dns.metrics().value["connects"] == 1
+        assert resolver.calls == [("service.test", server.port)]
+
+
+__all__ = [
+    "TestFlextApiDnsCache",
+    "TestFlextApiDnsCacheConnect",
+    "TestFlextApiDnsCacheIntegration",
+]
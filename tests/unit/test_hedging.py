@@ -0,0 +1,276 @@
+"""Tests for FlextApiHedging delays, races, budget and clients.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+import pytest_httpx
+
+from flext_api import (
+    FlextApiAsyncClient,
+    FlextApiClient,
+    FlextApiHedging,
+    FlextApiModels,
+    FlextApiRetryPolicy,
+    FlextApiSettings,
+)
+
+URL = "https://api.example.com/items"
+
+
+class _Replicas:
+    """Sync send() whose first call blocks until released."""
+
+    def __init__(self, *, slow_first: bool = True) -> None:
+        self.release = threading.Event()
+        self.responses: list[httpx.Response] = []
+        self._slow_first = slow_first
+        self._lock = threading.Lock()
+
+    def __call__(self) -> httpx.Response:
+        with self._lock:
+            call = len(self.responses)
+            response = httpx.Response(200, json={"copy": call})
+            self.responses.append(response)
+        if call == 0 and self._slow_first:
+            self.release.wait(5)
+        return response
+
+
+class TestFlextApiHedgingDelay:
+    """Test when requests are hedged and after how long."""
+
+    def test_fixed_delay_applies_to_idempotent_methods(self) -> None:
+        """Test a fixed delay hedges idempotent, replayable requests only."""
+        hedging = FlextApiHedging(delay=0.2)
+
+        assert hedging.delay_for("GET", URL) == 0.2
+        assert hedging.hedgeable("get")
+        assert not hedging.hedgeable("POST")
+        assert not hedging.hedgeable("PUT", replayable=False)
+
+    def test_derived_delay_uses_observed_percentile(self) -> None:
+        """Test the delay follows the endpoint's p95 once enough samples exist."""
+        hedging = FlextApiHedging(min_samples=20, min_delay=0.0)
+
+        for ms in range(1, 20):
+            hedging.observe("GET", URL, ms / 1000)
+        assert hedging.delay_for("GET", URL) is None
+
+        for ms in range(20, 101):
+            hedging.observe("GET", f"{URL}?page={ms}", ms / 1000)
+
+        assert hedging.delay_for("GET", URL) == pytest.approx(0.096)
+        assert hedging.delay_for("HEAD", URL) is None
+
+    def test_derived_delay_is_clamped(self) -> None:
+        """Test derived delays stay within min_delay and max_delay."""
+        hedging = FlextApiHedging(min_samples=1, min_delay=0.05, max_delay=1.0)
+        hedging.observe("GET", URL, 0.001)
+        hedging.observe("GET", "https://api.example.com/slow", 30.0)
+
+        assert hedging.delay_for("GET", URL) == 0.05
+        assert hedging.delay_for("GET", "https://api.example.com/slow") == 1.0
+
+    def test_endpoint_history_is_bounded(self) -> None:
+        """Test the oldest endpoint is forgotten beyond max_endpoints."""
+        hedging = FlextApiHedging(min_samples=1, max_endpoints=2)
+
+        for path in ("a", "b", "c"):
+            hedging.observe("GET", f"https://api.example.com/{path}", 0.1)
+
+        assert hedging.metrics().value["endpoints"] == 2
+        assert hedging.delay_for("GET", "https://api.example.com/a") is None
+
+    def test_rejects_invalid_settings(self) -> None:
+        """Test percentile and counts are validated."""
+        with pytest.raises(ValueError, match="percentile"):
+            FlextApiHedging(percentile=1.0)
+        with pytest.raises(ValueError, match="positive"):
+            FlextApiHedging(max_workers=0)
+
+
+class TestFlextApiHedgingExecute:
+    """Test racing copies on the sync and async paths."""
+
+    def test_fast_primary_is_not_hedged(self) -> None:
+        """Test a request completing within the delay is sent once."""
+        hedging = FlextApiHedging(delay=5.0)
+        replicas = _Replicas(slow_first=False)
+
+        response = hedging.execute("GET", URL, replicas)
+
+        assert response.json() == {"copy": 0}
+        assert len(replicas.responses) == 1
+        assert hedging.metrics().value["hedges_sent"] == 0
+
+    def test_hedge_wins_over_slow_primary(self) -> None:
+        """Test the duplicate answers and the slow copy's response is closed."""
+        hedging = FlextApiHedging(delay=0.01)
+        replicas = _Replicas()
+        try:
+            response = hedging.execute("GET", URL, replicas)
+        finally:
+            replicas.release.set()
+            hedging.close()
+
+        metrics = hedging.metrics().value
+        assert response.json() == {"copy": 1}
+        assert metrics["hedges_sent"] == 1
+        assert metrics["hedges_won"] == 1
+        assert metrics["losers_cancelled"] == 1
+        for _ in range(100):
+            if replicas.responses[0].is_closed:
+                break
+            time.sleep(0.01)
+        assert replicas.responses[0].is_closed
+
+    def test_failed_copy_waits_for_the_other(self) -> None:
+        """Test an error only loses once the other copy answers."""
+        hedging = FlextApiHedging(delay=0.01)
+        calls = 0
+
+        def send() -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                time.sleep(0.05)
+                msg = "reset"
+                raise httpx.ReadError(msg)
+            return httpx.Response(200)
+
+        try:
+            response = hedging.execute("GET", URL, send)
+        finally:
+            hedging.close()
+
+        assert response.status_code == 200
+
+    def test_non_idempotent_requests_run_inline(self) -> None:
+        """Test POST is sent once on the calling thread."""
+        hedging = FlextApiHedging(delay=0.0)
+        threads: list[threading.Thread] = []
+
+        def send() -> httpx.Response:
+            threads.append(threading.current_thread())
+            return httpx.Response(201)
+
+        hedging.execute("POST", URL, send)
+
+        assert threads == [threading.current_thread()]
+        assert hedging.metrics().value["requests"] == 0
+
+    def test_budget_caps_hedges(self) -> None:
+        """Test an exhausted budget waits for the primary instead of hedging."""
+        hedging = FlextApiHedging(delay=0.0)
+        hedging.budget = FlextApiRetryPolicy.Budget(0, min_per_second=0, capacity=1)
+        try:
+            for _ in range(3):
+                replicas = _Replicas()
+                threading.Timer(0.05, replicas.release.set).start()
+                hedging.execute("GET", URL, replicas)
+        finally:
+            hedging.close()
+
+        metrics = hedging.metrics().value
+        assert metrics["hedges_sent"] == 1
+        assert metrics["budget_exhausted"] == 2
+
+    @pytest.mark.asyncio
+    async def test_async_loser_is_cancelled(self) -> None:
+        """Test the async path cancels the slower copy."""
+        hedging = FlextApiHedging(delay=0.01)
+        cancelled = asyncio.Event()
+        calls = 0
+
+        async def send() -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+            return httpx.Response(200, json={"copy": calls})
+
+        response = await hedging.aexecute("GET", URL, send)
+        await asyncio.wait_for(cancelled.wait(), 1)
+
+        assert response.json() == {"copy": 2}
+        assert hedging.metrics().value["hedges_won"] == 1
+
+
+class TestFlextApiHedgingClients:
+    """Test clients hedge requests through their pipeline."""
+
+    def test_sync_client_hedges_slow_get(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test FlextApiClient returns the hedged copy's response."""
+        replicas = _Replicas()
+        httpx_mock.add_callback(lambda _request: replicas(), is_reusable=True)
+        client = FlextApiClient(
+            FlextApiSettings(base_url="https://api.example.com"),
+            hedging=FlextApiHedging(delay=0.01),
+        )
+        try:
+            result = client.request(
+                FlextApiModels.HttpRequest(method="GET", url="/items"),
+            )
+        finally:
+            replicas.release.set()
+            client.close()
+
+        assert result.is_success
+        assert result.value.body == {"copy": 1}
+        assert client.metrics().value["hedging.hedges_won"] == 1
+
+    @pytest.mark.asyncio
+    async def test_async_client_builds_hedging_from_settings(self) -> None:
+        """Test hedging settings enable hedging for async requests."""
+        calls = 0
+
+        async def handler(_request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                await asyncio.sleep(5)
+            return httpx.Response(200, json={"copy": calls})
+
+        config = FlextApiSettings(
+            base_url="http://testserver",
+            hedging_enabled=True,
+            hedge_delay=0.01,
+        )
+        async with FlextApiAsyncClient(
+            config,
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            started = time.monotonic()
+            result = await client.arequest(
+                FlextApiModels.HttpRequest(method="GET", url="/items"),
+            )
+
+        assert result.is_success
+        assert result.value.body == {"copy": 2}
+        assert time.monotonic() - started < 1
+        assert client.hedging is not None
+        assert client.hedging.metrics().value["hedges_sent"] == 1
+
+
+__all__ = [
+    "TestFlextApiHedgingClients",
+    "TestFlextApiHedgingDelay",
+    "TestFlextApiHedgingExecute",
+]
@@ -0,0 +1,334 @@
+"""Tests for FlextApiPagination strategies, prefetch and client paginate().
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+import pytest_httpx
+
+from flext_api import (
+    FlextApiAsyncClient,
+    FlextApiClient,
+    FlextApiModels,
+    FlextApiPagination,
+    FlextApiSettings,
+)
+
+BASE_URL = "http://testserver"
+TOTAL = 7
+
+
+def _collection(request: httpx.Request, page_size: int = 3) -> list[int]:
+    """Items 0..TOTAL-1 at the page or offset ``request`` asks for."""
+    params = request.url.params
+    if "offset" in params:
+        start = int(params["offset"])
+        size = int(params["limit"])
+    else:
+        size = int(params.get("page_size", page_size))
+        start = (int(params.get("page", "1")) - 1) * size
+    return list(range(TOTAL))[start : start + size]
+
+
+def _client() -> FlextApiClient:
+    return FlextApiClient(FlextApiSettings(base_url=BASE_URL))
+
+
+class TestFlextApiPaginationStrategies:
+    """Test each strategy walks the whole collection in order."""
+
+    def test_page_numbers_stop_at_short_page(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test page pagination requests pages until one comes back short."""
+        seen: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.url.params["page"])
+            return httpx.Response(200, json={"data": _collection(request)})
+
+        httpx_mock.add_callback(handler, is_reusable=True)
+        request = FlextApiModels.HttpRequest(url="/items")
+        pagination = FlextApiPagination(page_size=3, prefetch=0)
+
+        with _client() as client:
+            items = list(client.paginate(request, pagination))
+
+        assert items == list(range(TOTAL))
+        assert seen == ["1", "2", "3"]
+
+    def test_offset_limit(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
+        """Test offset pagination advances by the page size."""
+        httpx_mock.add_callback(
+            lambda request: httpx.Response(200, json=_collection(request)),
+            is_reusable=True,
+        )
+        request = FlextApiModels.HttpRequest(url="/items", query_params={"q": "x"})
+        pagination = FlextApiPagination("offset", page_size=2)
+
+        with _client() as client:
+            items = list(client.paginate(request, pagination))
+
+        assert items == list(range(TOTAL))
+        offsets = sorted(
+            int(sent.url.params["offset"]) for sent in httpx_mock.get_requests()
+        )
+        assert offsets[:4] == [0, 2, 4, 6]
+        assert all(sent.url.params["q"] == "x" for sent in httpx_mock.get_requests())
+
+    def test_cursor_from_nested_body_path(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test the cursor is read from the body and sent back."""
+        pages = {
+            None: ([1, 2], "c2"),
+            "c2": ([3, 4], "c3"),
+            "c3": ([5], None),
+        }
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            items, cursor = pages[request.url.params.get("cursor")]
+            return httpx.Response(
+                200,
+                json={"results": items, "meta": {"next": cursor}},
+            )
+
+        httpx_mock.add_callback(handler, is_reusable=True)
+        pagination = FlextApiPagination("cursor", cursor_path="meta.next")
+
+        with _client() as client:
+            items = list(
+                client.paginate(FlextApiModels.HttpRequest(url="/items"), pagination),
+            )
+
+        assert items == [1, 2, 3, 4, 5]
+        assert len(httpx_mock.get_requests()) == 3
+
+    def test_link_header(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
+        """Test Link rel="next" targets are followed, absolute or relative."""
+        links = {
+            "1": f'<{BASE_URL}/items?page=2>; rel="next", <{BASE_URL}/items>; '
+            'rel="first"',
+            "2": '</items?page=3>; rel="prev next"',
+            "3": '</items?page=2>; rel="prev"',
+        }
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            page = request.url.params.get("page", "1")
+            return httpx.Response(
+                200,
+                json={"items": [f"item-{page}"]},
+                headers={"Link": links[page]},
+            )
+
+        httpx_mock.add_callback(handler, is_reusable=True)
+
+        with _client() as client:
+            items = list(
+                client.paginate(
+                    FlextApiModels.HttpRequest(url="/items"),
+                    FlextApiPagination("link"),
+                ),
+            )
+
+        assert items == ["item-1", "item-2", "item-3"]
+
+    def test_envelope_total_pages_and_max_pages(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test PaginationBuilder envelopes and max_pages end the walk."""
+        httpx_mock.add_callback(
+            lambda request: httpx.Response(
+                200,
+                json={
+                    "data": [request.url.params["page"]] * 2,
+                    "pagination": {"total_pages": 3},
+                },
+            ),
+            is_reusable=True,
+        )
+        request = FlextApiModels.HttpRequest(url="/items")
+
+        with _client() as client:
+            full = list(
+                client.paginate(request, FlextApiPagination(page_size=2, prefetch=0)),
+            )
+            capped = list(
+                client.paginate(
+                    request,
+                    FlextApiPagination(page_size=2, prefetch=0, max_pages=2),
+                ),
+            )
+
+        assert full == ["1", "1", "2", "2", "3", "3"]
+        assert capped == ["1", "1", "2", "2"]
+
+    def test_failed_page_raises_after_earlier_items(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test a failing page raises PageError once earlier items are out."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.params["page"] == "2":
+                return httpx.Response(500)
+            return httpx.Response(200, json={"data": [1, 2]})
+
+        httpx_mock.add_callback(handler, is_reusable=True)
+        items: list[object] = []
+
+        with (
+            _client() as client,
+            pytest.raises(FlextApiPagination.PageError) as raised,
+        ):
+            items.extend(
+                client.paginate(
+                    FlextApiModels.HttpRequest(url="/items"),
+                    FlextApiPagination(page_size=2),
+                ),
+            )
+
+        assert items == [1, 2]
+        assert raised.value.index == 1
+
+    def test_rejects_invalid_settings(self) -> None:
+        """Test sizes and prefetch depth are validated."""
+        with pytest.raises(ValueError, match="page_size"):
+            FlextApiPagination(page_size=0)
+        with pytest.raises(ValueError, match="prefetch"):
+            FlextApiPagination(prefetch=-1)
+
+
+class TestFlextApiPaginationPrefetch:
+    """Test pages are fetched ahead and memory stays bounded."""
+
+    def test_prefetch_overlaps_page_fetches(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test up to prefetch + 1 pages are in flight at once."""
+        lock = threading.Lock()
+        active = [0, 0]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            with lock:
+                active[0] += 1
+                active[1] = max(active)
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            page = int(request.url.params["page"])
+            return httpx.Response(200, json={"data": [page] * 2 if page <= 8 else []})
+
+        httpx_mock.add_callback(handler, is_reusable=True)
+        config = FlextApiSettings(base_url=BASE_URL, max_connections=8)
+
+        with FlextApiClient(config) as client:
+            items = list(
+                client.paginate(
+                    FlextApiModels.HttpRequest(url="/items"),
+                    FlextApiPagination(page_size=2, prefetch=3),
+                ),
+            )
+
+        assert items == [page for page in range(1, 9) for _ in range(2)]
+        assert 2 <= active[1] <= 4
+
+    def test_early_stop_bounds_pages_fetched(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test closing the iterator stops fetching beyond the prefetch window."""
+        httpx_mock.add_callback(
+            lambda _request: httpx.Response(200, json={"data": [0, 1]}),
+            is_reusable=True,
+        )
+
+        with _client() as client:
+            items = client.paginate(
+                FlextApiModels.HttpRequest(url="/items"),
+                FlextApiPagination(page_size=2, prefetch=2),
+            )
+            first = next(items)
+            items.close()
+
+        assert first == 0
+        assert len(httpx_mock.get_requests()) <= 3
+
+
+class TestFlextApiPaginationAsync:
+    """Test apaginate on the async client."""
+
+    @pytest.mark.asyncio
+    async def test_async_pages_prefetched_concurrently(self) -> None:
+        """Test async page pagination overlaps page fetches."""
+        active = [0, 0]
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            active[0] += 1
+            active[1] = max(active)
+            await asyncio.sleep(0.02)
+            active[0] -= 1
+            return httpx.Response(200, json={"data": _collection(request)})
+
+        async with FlextApiAsyncClient(
+            FlextApiSettings(base_url=BASE_URL),
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            items = [
+                item
+                async for item in client.apaginate(
+                    FlextApiModels.HttpRequest(url="/items"),
+                    FlextApiPagination(page_size=3, prefetch=2),
+                )
+            ]
+
+        assert items == list(range(TOTAL))
+        assert active[1] == 3
+
+    @pytest.mark.asyncio
+    async def test_async_cursor(self) -> None:
+        """Test async cursor pagination follows the default cursor keys."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            cursor = int(request.url.params.get("cursor", "0"))
+            return httpx.Response(
+                200,
+                json={
+                    "items": [cursor],
+                    "next_cursor": str(cursor + 1) if cursor < 3 else None,
+                },
+            )
+
+        async with FlextApiAsyncClient(
+            FlextApiSettings(base_url=BASE_URL),
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            items = [
+                item
+                async for item in client.apaginate(
+                    FlextApiModels.HttpRequest(url="/items"),
+                    FlextApiPagination("cursor"),
+                )
+            ]
+
+        assert items == [0, 1, 2, 3]
+
+
+__all__ = [
+    "TestFlextApiPaginationAsync",
+    "TestFlextApiPaginationPrefetch",
+    "TestFlextApiPaginationStrategies",
+]
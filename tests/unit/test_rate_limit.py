@@ -0,0 +1,368 @@
+"""Tests for FlextApiRateLimiter token buckets and header adaptation.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import threading
+import time
+import uuid
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+import pytest_httpx
+
+from flext_api import (
+    FlextApi,
+    FlextApiAsyncClient,
+    FlextApiClient,
+    FlextApiModels,
+    FlextApiRateLimiter,
+    FlextApiSettings,
+    c,
+)
+
+if TYPE_CHECKING:
+    from tests.conftest import FakeClock
+
+URL = "https://api.example.com/items"
+ORIGIN = "https://api.example.com:443"
+
+
+def _limiter(
+    clock: FakeClock,
+    *,
+    rate: float | None = 2.0,
+    burst: float | None = None,
+    scope: str = "origin",
+    max_wait: float = 30.0,
+) -> FlextApiRateLimiter:
+    return FlextApiRateLimiter(
+        rate=rate,
+        burst=burst,
+        scope=scope,
+        max_wait=max_wait,
+        clock=clock,
+        sleep=clock.sleep,
+    )
+
+
+@pytest.fixture
+def shared_name() -> Iterator[str]:
+    """Unique shared-memory segment name, unlinked after the test."""
+    name = f"flext_api_rl_{os.getpid()}_{uuid.uuid4().hex[:8]}"
+    yield name
+    buckets = FlextApiRateLimiter.SharedBuckets(name, slots=8)
+    buckets.unlink()
+    buckets.close()
+
+
+class TestFlextApiRateLimiterBuckets:
+    """Test token spending, waiting and bucket scopes."""
+
+    def test_burst_then_paced_wait(self, fake_clock: FakeClock) -> None:
+        """Test a full bucket serves a burst, then requests wait for refill."""
+        limiter = _limiter(fake_clock, rate=2.0, burst=2.0)
+
+        assert limiter.acquire(URL) == 0
+        assert limiter.acquire(URL) == 0
+        assert limiter.acquire(URL) == pytest.approx(0.5)
+
+        metrics = limiter.metrics().value
+        assert metrics["acquired"] == 3
+        assert metrics["waited"] == 1
+        assert metrics["wait_ms_total"] == 500
+
+    def test_rejects_wait_above_max_wait(self, fake_clock: FakeClock) -> None:
+        """Test a token further away than max_wait fails without sleeping."""
+        limiter = _limiter(fake_clock, rate=1.0, max_wait=0.1)
+        limiter.acquire(URL)
+
+        with pytest.raises(FlextApiRateLimiter.RateLimitedError) as raised:
+            limiter.acquire(URL)
+
+        assert raised.value.key == ORIGIN
+        assert raised.value.wait == pytest.approx(1.0)
+        assert fake_clock.sleeps == []
+        assert limiter.metrics().value["rejected"] == 1
+
+    def test_route_scope_keeps_separate_buckets(self, fake_clock: FakeClock) -> None:
+        """Test route scope gives each path its own bucket."""
+        per_route = _limiter(fake_clock, rate=1.0, scope="route", max_wait=0)
+        per_origin = _limiter(fake_clock, rate=1.0, max_wait=0)
+
+        per_route.acquire(URL)
+        per_route.acquire("https://api.example.com/other?page=2")
+        per_origin.acquire(URL)
+
+        assert per_route.key_of(URL) == f"{ORIGIN}/items"
+        with pytest.raises(FlextApiRateLimiter.RateLimitedError):
+            per_origin.acquire("https://api.example.com/other")
+
+    def test_per_key_limits_override_default(self, fake_clock: FakeClock) -> None:
+        """Test limits configure one bucket without touching the others."""
+        limiter = FlextApiRateLimiter(
+            rate=1.0,
+            limits={ORIGIN: (10.0, 5.0)},
+            max_wait=0,
+            clock=fake_clock,
+            sleep=fake_clock.sleep,
+        )
+
+        for _ in range(5):
+            limiter.acquire(URL)
+        limiter.acquire("https://other.example.com/")
+
+        with pytest.raises(FlextApiRateLimiter.RateLimitedError):
+            limiter.acquire("https://other.example.com/")
+
+    def test_concurrent_threads_never_overspend(self) -> None:
+        """Test threads racing for tokens take exactly the burst."""
+        limiter = FlextApiRateLimiter(rate=0.001, burst=200, max_wait=0)
+        taken: list[int] = []
+
+        def worker() -> None:
+            count = 0
+            for _ in range(50):
+                try:
+                    limiter.acquire(URL)
+                    count += 1
+                except FlextApiRateLimiter.RateLimitedError:
+                    pass
+            taken.append(count)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sum(taken) == 200
+
+    def test_rejects_invalid_settings(self) -> None:
+        """Test rates, bursts and max_wait are validated."""
+        with pytest.raises(ValueError, match="must be > 0"):
+            FlextApiRateLimiter(rate=0)
+        with pytest.raises(ValueError, match="burst >= 1"):
+            FlextApiRateLimiter(rate=1, burst=0.5)
+        with pytest.raises(ValueError, match="max_wait"):
+            FlextApiRateLimiter(max_wait=-1)
+
+
+class TestFlextApiRateLimiterHeaders:
+    """Test parsing and following rate-limit headers."""
+
+    @pytest.mark.parametrize(
+        ("headers", "expected"),
+        [
+            ({"RateLimit": '"default";r=5;t=10'}, (5.0, 10.0)),
+            ({"RateLimit": "limit=100, remaining=3, reset=7"}, (3.0, 7.0)),
+            ({"RateLimit-Remaining": "4", "RateLimit-Reset": "20"}, (4.0, 20.0)),
+            ({"X-RateLimit-Remaining": "9", "X-RateLimit-Reset": "30"}, (9.0, 30.0)),
+            ({"X-RateLimit-Remaining": "9"}, (None, None)),
+            ({}, (None, None)),
+        ],
+    )
+    def test_parse_headers(
+        self,
+        headers: dict[str, str],
+        expected: tuple[float | None, float | None],
+    ) -> None:
+        """Test each header family yields (remaining, reset seconds)."""
+        assert FlextApiRateLimiter.parse_headers(httpx.Headers(headers)) == expected
+
+    def test_epoch_reset_becomes_seconds(self) -> None:
+        """Test a Unix-time reset (GitHub style) is turned into a delay."""
+        headers = httpx.Headers(
+            {
+                "X-RateLimit-Remaining": "1",
+                "X-RateLimit-Reset": str(int(time.time()) + 60),
+            }
+        )
+
+        _, reset = FlextApiRateLimiter.parse_headers(headers)
+
+        assert reset == pytest.approx(60, abs=2)
+
+    def test_remaining_is_spread_over_window(self, fake_clock: FakeClock) -> None:
+        """Test an unlimited bucket paces itself to the reported remainder."""
+        limiter = _limiter(fake_clock, rate=None)
+        limiter.observe(
+            URL,
+            httpx.Response(
+                200,
+                headers={"RateLimit-Remaining": "11", "RateLimit-Reset": "10"},
+            ),
+        )
+
+        assert limiter.acquire(URL) == 0
+        assert limiter.acquire(URL) == pytest.approx(1.0)
+        assert limiter.metrics().value["header_updates"] == 1
+
+    def test_exhausted_window_blocks_until_reset(self, fake_clock: FakeClock) -> None:
+        """Test remaining=0 blocks the bucket until the window resets."""
+        limiter = _limiter(fake_clock, rate=100.0)
+        limiter.observe(
+            URL,
+            httpx.Response(
+                200,
+                headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "4"},
+            ),
+        )
+
+        assert limiter.acquire(URL) == pytest.approx(4.0)
+        assert limiter.metrics().value["blocked"] == 1
+
+    def test_too_many_requests_honours_retry_after(self, fake_clock: FakeClock) -> None:
+        """Test a 429 Retry-After blocks later requests to that origin."""
+        limiter = _limiter(fake_clock, rate=None, max_wait=5.0)
+
+        limiter.call(URL, lambda: httpx.Response(429, headers={"Retry-After": "3"}))
+
+        assert limiter.acquire(URL) == pytest.approx(3.0)
+        limiter.call(URL, lambda: httpx.Response(429, headers={"Retry-After": "60"}))
+        with pytest.raises(FlextApiRateLimiter.RateLimitedError):
+            limiter.acquire(URL)
+
+
+class TestFlextApiRateLimiterShared:
+    """Test buckets shared through shared memory."""
+
+    def test_limiters_share_one_bucket(self, shared_name: str) -> None:
+        """Test two limiters on one segment spend the same tokens."""
+        stores = [
+            FlextApiRateLimiter.SharedBuckets(shared_name, slots=8) for _ in range(2)
+        ]
+        first, second = (
+            FlextApiRateLimiter(rate=0.001, burst=3, max_wait=0, store=store)
+            for store in stores
+        )
+
+        first.acquire(URL)
+        second.acquire(URL)
+        first.acquire(URL)
+
+        with pytest.raises(FlextApiRateLimiter.RateLimitedError):
+            second.acquire(URL)
+        for store in stores:
+            store.close()
+
+    def test_processes_share_one_bucket(self, shared_name: str) -> None:
+        """Test another process spends tokens from the same bucket."""
+        store = FlextApiRateLimiter.SharedBuckets(shared_name, slots=8)
+        limiter = FlextApiRateLimiter(rate=0.001, burst=5, max_wait=0, store=store)
+        script = (
+            "from flext_api import FlextApiRateLimiter as L\n"
+            f"s = L.SharedBuckets({shared_name!r}, slots=8)\n"
+            f"l = L(rate=0.001, burst=5, max_wait=0, store=s)\n"
+            "for _ in range(4):\n"
+            f"    l.acquire({URL!r})\n"
+            "s.close()\n"
+        )
+
+        subprocess.run(  # noqa: S603 - runs this interpreter
+            [sys.executable, "-c", script],
+            check=True,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        )
+
+        limiter.acquire(URL)
+        with pytest.raises(FlextApiRateLimiter.RateLimitedError):
+            limiter.acquire(URL)
+        store.close()
+
+
+class TestFlextApiRateLimiterClients:
+    """Test the async path and client integration."""
+
+    @pytest.mark.asyncio
+    async def test_aacquire_waits_without_blocking(self) -> None:
+        """Test async acquire awaits the next token."""
+        limiter = FlextApiRateLimiter(rate=50.0, burst=1)
+
+        await limiter.aacquire(URL)
+        waited = await limiter.aacquire(URL)
+
+        assert waited == pytest.approx(0.02, abs=0.01)
+
+    @pytest.mark.asyncio
+    async def test_facade_shares_limiter_between_sync_and_async(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test a window exhausted through get() also limits aget()."""
+        httpx_mock.add_response(
+            url="http://testserver/items",
+            headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "120"},
+            json={},
+        )
+        config = FlextApiSettings(
+            base_url="http://testserver",
+            rate_limit_enabled=True,
+        )
+        async with FlextApi(config) as api:
+            served = api.get("/items")
+            rejected = await api.aget("/items")
+
+        assert served.is_success
+        assert rejected.error_code == c.Api.RateLimit.LIMITED_ERROR_CODE
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_client_fails_fast_when_headers_exhaust_window(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test settings build a limiter whose rejections carry an error code."""
+        httpx_mock.add_response(
+            url="http://testserver/items",
+            headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "120"},
+            json={},
+        )
+        config = FlextApiSettings(
+            base_url="http://testserver",
+            rate_limit_enabled=True,
+        )
+        with FlextApiClient(config) as client:
+            request = FlextApiModels.HttpRequest(method="GET", url="/items")
+            served = client.request(request)
+            rejected = client.request(request)
+            metrics = client.metrics().value
+
+        assert served.is_success
+        assert rejected.error_code == c.Api.RateLimit.LIMITED_ERROR_CODE
+        assert metrics["rate_limit.blocked"] == 1
+        assert metrics["rate_limit.rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_async_client_paces_requests(self) -> None:
+        """Test the async client takes a token per request."""
+        config = FlextApiSettings(base_url="http://testserver")
+        limiter = FlextApiRateLimiter(rate=100.0, burst=1)
+        async with FlextApiAsyncClient(
+            config,
+            transport=httpx.MockTransport(lambda _: httpx.Response(200, json={})),
+            rate_limiter=limiter,
+        ) as client:
+            request = FlextApiModels.HttpRequest(method="GET", url="/items")
+            results = [await client.arequest(request) for _ in range(3)]
+
+        assert all(result.is_success for result in results)
+        metrics = limiter.metrics().value
+        assert metrics["acquired"] == 3
+        assert metrics["waited"] == 2
+
+
+__all__ = [
+    "TestFlextApiRateLimiterBuckets",
+    "TestFlextApiRateLimiterClients",
+    "TestFlextApiRateLimiterHeaders",
+    "TestFlextApiRateLimiterShared",
+]
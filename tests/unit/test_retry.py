@@ -0,0 +1,380 @@
+"""Tests for FlextApiRetryPolicy backoff, Retry-After, deadline and budget.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+import pytest_httpx
+
+from flext_api import (
+    FlextApiAsyncClient,
+    FlextApiClient,
+    FlextApiModels,
+    FlextApiRetryPolicy,
+    FlextApiSettings,
+    FlextWebProtocolPlugin,
+    c,
+)
+
+if TYPE_CHECKING:
+    from tests.conftest import FakeClock
+
+URL = "https://api.example.com/items"
+
+
+def _response(status: int, **headers: str) -> httpx.Response:
+    return httpx.Response(status, headers=headers)
+
+
+def _no_jitter(**options: object) -> FlextApiRetryPolicy:
+    return FlextApiRetryPolicy(jitter="none", **options)
+
+
+class TestFlextApiRetryPolicyBackoff:
+    """Test backoff delays and jitter strategies."""
+
+    def test_exponential_backoff_is_capped(self) -> None:
+        """Test un-jittered delays double per retry up to max_delay."""
+        policy = _no_jitter(backoff_factor=0.5, max_delay=3.0)
+
+        assert [policy.backoff(n, 0.5) for n in range(5)] == [
+            0.5,
+            1.0,
+            2.0,
+            3.0,
+            3.0,
+        ]
+
+    def test_full_jitter_spreads_below_ceiling(self) -> None:
+        """Test full jitter draws uniformly between zero and the ceiling."""
+        policy = FlextApiRetryPolicy(backoff_factor=1.0, rng=random.Random(7))
+        delays = [policy.backoff(3, 1.0) for _ in range(200)]
+
+        assert all(0 <= delay <= 8.0 for delay in delays)
+        assert len(set(delays)) == 200
+        assert min(delays) < 2.0
+        assert max(delays) > 6.0
+
+    def test_decorrelated_jitter_grows_from_previous_delay(self) -> None:
+        """Test decorrelated jitter stays within [base, 3 * previous]."""
+        policy = FlextApiRetryPolicy(
+            backoff_factor=0.1,
+            max_delay=5.0,
+            jitter=c.Api.Retry.Jitter.DECORRELATED,
+            rng=random.Random(3),
+        )
+        previous = 0.1
+        for retry in range(20):
+            delay = policy.backoff(retry, previous)
+            assert 0.1 <= delay <= min(5.0, max(0.1, previous * 3))
+            previous = delay
+
+    def test_rejects_invalid_settings(self) -> None:
+        """Test negative counts, bad deadlines and unknown jitter fail."""
+        with pytest.raises(ValueError, match="must be"):
+            FlextApiRetryPolicy(max_retries=-1)
+        with pytest.raises(ValueError, match="deadline"):
+            FlextApiRetryPolicy(deadline=0)
+        with pytest.raises(ValueError, match="jitter"):
+            FlextApiRetryPolicy(jitter="jitter")
+
+
+class TestFlextApiRetryPolicyDecisions:
+    """Test which failures are retried and how long to wait."""
+
+    def test_retry_after_seconds_and_http_date(self) -> None:
+        """Test Retry-After is read as delta-seconds or an HTTP date."""
+        policy = FlextApiRetryPolicy()
+        future = format_datetime(datetime.now(UTC) + timedelta(seconds=30), usegmt=True)
+
+        assert policy.retry_after(_response(503, **{"Retry-After": "7"})) == 7.0
+        from_date = policy.retry_after(_response(429, **{"Retry-After": future}))
+        assert from_date is not None
+        assert 25 < from_date <= 30
+        assert policy.retry_after(_response(503, **{"Retry-After": "soon"})) is None
+        assert policy.retry_after(_response(503)) is None
+
+    def test_retry_after_sets_delay_for_429_and_503(self) -> None:
+        """Test 429/503 wait for Retry-After instead of backing off."""
+        policy = _no_jitter(backoff_factor=0.5)
+        attempts = policy.start("GET", URL)
+
+        assert attempts.next_delay(_response(503, **{"Retry-After": "4"})) == 4.0
+        assert attempts.next_delay(_response(500, **{"Retry-After": "4"})) == 1.0
+        assert policy.metrics().value["retry_after_honored"] == 1
+
+    def test_gives_up_on_long_retry_after(self) -> None:
+        """Test a Retry-After beyond max_retry_after is not waited for."""
+        policy = FlextApiRetryPolicy(max_retry_after=10)
+        attempts = policy.start("GET", URL)
+
+        assert attempts.next_delay(_response(429, **{"Retry-After": "60"})) is None
+        metrics = policy.metrics().value
+        assert metrics["retry_after_too_long"] == 1
+        assert metrics["gave_up"] == 1
+
+    def test_only_idempotent_methods_retry_after_sending(self) -> None:
+        """Test POST retries only when the server cannot have acted on it."""
+        policy = FlextApiRetryPolicy(backoff_factor=0)
+        request = httpx.Request("POST", URL)
+
+        assert policy.start("POST", URL).next_delay(_response(503)) is None
+        assert policy.start("POST", URL).next_delay(_response(429)) == 0
+        connect_error = httpx.ConnectError("refused", request=request)
+        assert policy.start("POST", URL).next_delay(error=connect_error) == 0
+        read_error = httpx.ReadTimeout("slow", request=request)
+        assert policy.start("POST", URL).next_delay(error=read_error) is None
+        assert policy.start("PUT", URL).next_delay(error=read_error) == 0
+        assert policy.metrics().value["not_idempotent"] == 2
+
+    def test_success_and_foreign_errors_are_not_retried(self) -> None:
+        """Test non-retryable outcomes stop without counting a give-up."""
+        policy = FlextApiRetryPolicy()
+        attempts = policy.start("GET", URL)
+
+        assert attempts.next_delay(_response(200)) is None
+        assert attempts.next_delay(_response(404)) is None
+        assert attempts.next_delay(error=ValueError("bug")) is None
+        assert policy.metrics().value["gave_up"] == 0
+
+    def test_stops_after_max_retries(self) -> None:
+        """Test retries stop once max_retries is reached."""
+        policy = FlextApiRetryPolicy(max_retries=2, backoff_factor=0)
+        attempts = policy.start("GET", URL)
+
+        delays = [attempts.next_delay(_response(502)) for _ in range(3)]
+
+        assert delays == [0, 0, None]
+        assert attempts.retries == 2
+        assert policy.metrics().value["retries_exhausted"] == 1
+
+    def test_deadline_stops_retries_and_caps_timeouts(
+        self,
+        fake_clock: FakeClock,
+    ) -> None:
+        """Test no retry starts that would overrun the deadline."""
+        policy = _no_jitter(backoff_factor=1.0, deadline=5.0, clock=fake_clock)
+        attempts = policy.start("GET", URL)
+
+        assert attempts.begin(30.0) == 5.0
+        fake_clock.now = 2.0
+        assert attempts.next_delay(_response(503)) == 1.0
+        fake_clock.now = 3.5
+        assert attempts.begin(30.0) == 1.5
+        assert attempts.next_delay(_response(503)) is None
+        assert policy.metrics().value["deadline_exceeded"] == 1
+
+    def test_one_shot_bodies_are_not_retried(self) -> None:
+        """Test requests whose body cannot be replayed are sent once."""
+        policy = FlextApiRetryPolicy()
+        attempts = policy.start("PUT", URL, replayable=False)
+
+        assert attempts.next_delay(_response(503)) is None
+        assert policy.metrics().value["not_replayable"] == 1
+
+
+class TestFlextApiRetryPolicyBudget:
+    """Test the per-host token bucket retry budget."""
+
+    def test_retries_limited_to_share_of_requests(self, fake_clock: FakeClock) -> None:
+        """Test retries spend tokens that only requests replenish."""
+        budget = FlextApiRetryPolicy.Budget(
+            0.5,
+            min_per_second=0,
+            capacity=2,
+            clock=fake_clock,
+        )
+
+        assert budget.withdraw("a")
+        assert budget.withdraw("a")
+        assert not budget.withdraw("a")
+        assert budget.withdraw("b")
+        budget.deposit("a")
+        assert not budget.withdraw("a")
+        budget.deposit("a")
+        assert budget.withdraw("a")
+
+    def test_minimum_rate_refills_over_time(self, fake_clock: FakeClock) -> None:
+        """Test idle hosts regain tokens at min_per_second up to capacity."""
+        budget = FlextApiRetryPolicy.Budget(
+            0,
+            min_per_second=2,
+            capacity=3,
+            clock=fake_clock,
+        )
+        for _ in range(3):
+            assert budget.withdraw("a")
+        fake_clock.now = 0.5
+        assert budget.tokens("a") == 1.0
+        fake_clock.now = 60
+        assert budget.tokens("a") == 3.0
+
+    def test_exhausted_budget_stops_retries(self) -> None:
+        """Test a host out of tokens gives up and counts it."""
+        budget = FlextApiRetryPolicy.Budget(0, min_per_second=0, capacity=1)
+        policy = FlextApiRetryPolicy(backoff_factor=0, budget=budget)
+
+        assert policy.start("GET", URL).next_delay(_response(503)) == 0
+        assert policy.start("GET", URL).next_delay(_response(503)) is None
+        assert policy.metrics().value["budget_exhausted"] == 1
+
+
+class TestFlextApiRetryPolicyExecute:
+    """Test execute/aexecute drive attempts end to end."""
+
+    def test_execute_retries_until_success(self) -> None:
+        """Test failed attempts are closed and retried."""
+        statuses = [503, 502, 200]
+        timeouts: list[float | None] = []
+
+        def send(timeout: float | None) -> httpx.Response:
+            timeouts.append(timeout)
+            return _response(statuses.pop(0))
+
+        policy = FlextApiRetryPolicy(backoff_factor=0, deadline=30)
+        response = policy.execute("GET", URL, send, timeout=10.0)
+
+        assert response.status_code == 200
+        assert len(timeouts) == 3
+        assert all(t is not None and t <= 10.0 for t in timeouts)
+        metrics = policy.metrics().value
+        assert metrics["requests"] == 1
+        assert metrics["attempts"] == 3
+        assert metrics["retries"] == 2
+
+    def test_execute_reraises_last_transport_error(self) -> None:
+        """Test transport errors propagate once retries are exhausted."""
+        calls = 0
+
+        def send(_timeout: float | None) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            msg = "refused"
+            raise httpx.ConnectError(msg)
+
+        policy = FlextApiRetryPolicy(max_retries=2, backoff_factor=0)
+
+        with pytest.raises(httpx.ConnectError):
+            policy.execute("GET", URL, send)
+        assert calls == 3
+
+    @pytest.mark.asyncio
+    async def test_aexecute_waits_retry_after(self) -> None:
+        """Test the async path honours Retry-After without blocking."""
+        statuses = [429, 200]
+
+        async def send(_timeout: float | None) -> httpx.Response:
+            return _response(statuses.pop(0), **{"Retry-After": "0"})
+
+        policy = FlextApiRetryPolicy()
+        response = await policy.aexecute("POST", URL, send)
+
+        assert response.status_code == 200
+        assert policy.metrics().value["retry_after_honored"] == 1
+
+
+class TestFlextApiRetryPolicyClients:
+    """Test clients and the protocol plugin use the retry policy."""
+
+    def test_plugin_does_not_retry_post_on_503(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test the plugin sends a failing POST once."""
+        httpx_mock.add_response(url=URL, method="POST", status_code=503)
+        plugin = FlextWebProtocolPlugin(max_retries=3, retry_backoff_factor=0)
+        try:
+            result = plugin.send_request({"url": URL, "method": "POST"})
+            metrics = plugin.metrics().value
+        finally:
+            plugin.close()
+
+        assert result.is_failure
+        assert len(httpx_mock.get_requests()) == 1
+        assert metrics["retry.not_idempotent"] == 1
+
+    def test_sync_client_retries_with_policy(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test FlextApiClient retries only when given a policy."""
+        httpx_mock.add_response(url=URL, status_code=503)
+        httpx_mock.add_response(url=URL, json={"ok": True})
+        client = FlextApiClient(
+            FlextApiSettings(base_url="https://api.example.com"),
+            retry_policy=FlextApiRetryPolicy(backoff_factor=0),
+        )
+
+        result = client.request(FlextApiModels.HttpRequest(method="GET", url="/items"))
+
+        assert result.is_success
+        assert client.metrics().value["retry.retries"] == 1
+
+    def test_clients_share_default_retry_rule(self) -> None:
+        """Test both clients retry only when retry_enabled is set."""
+        disabled = FlextApiSettings(max_retries=3)
+        enabled = FlextApiSettings(retry_enabled=True, max_retries=3)
+
+        assert FlextApiClient(disabled).retry_policy is None
+        assert FlextApiAsyncClient(disabled).retry_policy is None
+        for client in (FlextApiClient(enabled), FlextApiAsyncClient(enabled)):
+            policy = client.retry_policy
+            assert policy is not None
+            assert policy.max_retries == 3
+
+    @pytest.mark.asyncio
+    async def test_async_client_builds_policy_from_settings(self) -> None:
+        """Test retry settings configure the async client's policy."""
+        calls = 0
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(503 if calls == 1 else 200, json={})
+
+        config = FlextApiSettings(
+            base_url="http://testserver",
+            retry_enabled=True,
+            max_retries=2,
+            retry_backoff_factor=0,
+            retry_jitter="decorrelated",
+            retry_deadline=5,
+            retry_budget_ratio=None,
+        )
+        async with FlextApiAsyncClient(
+            config,
+            transport=httpx.MockTransport(handler),
+        ) as client:
+            started = time.monotonic()
+            result = await client.arequest(
+                FlextApiModels.HttpRequest(method="GET", url="/items"),
+            )
+            policy = client.retry_policy
+
+        assert result.is_success
+        assert calls == 2
+        assert time.monotonic() - started < 1
+        assert policy is not None
+        assert policy.jitter is c.Api.Retry.Jitter.DECORRELATED
+        assert policy.deadline == 5
+        assert policy.budget is None
+
+
+__all__ = [
+    "TestFlextApiRetryPolicyBackoff",
+    "TestFlextApiRetryPolicyBudget",
+    "TestFlextApiRetryPolicyClients",
+    "TestFlextApiRetryPolicyDecisions",
+    "TestFlextApiRetryPolicyExecute",
+]
@@ -10,7 +10,14 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
+import datetime
+import json
+from collections.abc import Iterator
+
+import pytest
+
 from flext_api.serializers import FlextApiSerializers
+from flext_api.typings import t
 
 # Test comment for workflow validation
 
@@ -33,3 +40,211 @@ class TestFlextApiSerializers:
         unpacked = FlextApiSerializers.MessagePack.unpackb(packed)
         assert isinstance(unpacked, dict)
         assert unpacked == data
+
+
+class TestFlextApiSerializersBodyDecoder:
+    """Test content-type dispatched response body decoding."""
+
+    @pytest.mark.parametrize(
+        ("content_type", "content", "expected"),
+        [
+            ("application/json", b'{"a": 1}', {"a": 1}),
+            ("application/problem+json; charset=utf-8", b"[1]", {"value": [1]}),
+            ("text/plain", b"plain", "plain"),
+            ("text/html; charset=latin-1", "\u00e9".encode("latin-1"), "\u00e9"),
+            ("application/xml", b"<a/>", "<a/>"),
+            ("application/octet-stream", b"\x00\x01", b"\x00\x01"),
+            ("image/png", b"\x89PNG", b"\x89PNG"),
+            ("", b' {"x": 1}', {"x": 1}),
+            ("", b"hello", "hello"),
+            ("", b"\xff\xfe\x00", b"\xff\xfe\x00"),
+            ("application/x-unknown", b"hello", "hello"),
+            ("application/msgpack", b"\x81\xa1a\x01", {"a": 1}),
+            ("application/x-msgpack", b"\x92\x01\x02", {"value": [1, 2]}),
+            ("application/cbor", b"\xa1\x61a\x01", {"a": 1}),
+            ("application/vnd.api+cbor", b"\x82\x01\x02", {"value": [1, 2]}),
+        ],
+    )
+    def test_dispatch_on_media_type(
+        self,
+        content_type: str,
+        content: bytes,
+        expected: t.Api.ResponseBody,
+    ) -> None:
+        """Test each media type selects exactly one decoder."""
+        result = FlextApiSerializers.BodyDecoder.decode(content, content_type)
+
+        assert result.is_success
+        assert result.value == expected
+
+    def test_top_level_cbor_datetime_becomes_text(self) -> None:
+        """Test a tagged CBOR datetime, which has no JSON form, is wrapped as text."""
+        moment = datetime.datetime(2025, 1, 2, 3, 4, 5, tzinfo=datetime.UTC)
+        content = FlextApiSerializers.Cbor.dumps(moment)
+
+        result = FlextApiSerializers.BodyDecoder.decode(content, "application/cbor")
+
+        assert result.value == {"value": str(moment)}
+
+    def test_text_is_not_parsed_as_json(self) -> None:
+        """Test a text/plain body that looks like JSON stays text."""
+        result = FlextApiSerializers.BodyDecoder.decode(b'{"a": 1}', "text/plain")
+
+        assert result.value == '{"a": 1}'
+
+    def test_mislabelled_json_falls_back_to_text(self) -> None:
+        """Test an invalid application/json body is returned as text."""
+        result = FlextApiSerializers.BodyDecoder.decode(b"oops", "application/json")
+
+        assert result.value == "oops"
+
+    def test_empty_bodies(self) -> None:
+        """Test empty bodies decode to empty text, or empty bytes for binary."""
+        decode = FlextApiSerializers.BodyDecoder.decode
+
+        assert decode(b"", "application/json").value == ""
+        assert decode(b"", "application/octet-stream").value == b""
+
+    def test_register_custom_decoder(self) -> None:
+        """Test registered decoders are dispatched by media type."""
+        FlextApiSerializers.BodyDecoder.register(
+            "upper",
+            lambda content, _charset: content.decode().upper(),
+            ["application/x-upper-test"],
+        )
+
+        result = FlextApiSerializers.BodyDecoder.decode(
+            b"shout",
+            "application/x-upper-test",
+        )
+
+        assert result.value == "SHOUT"
+
+
+class TestFlextApiSerializersJson:
+    """Test the pluggable JSON codec."""
+
+    @pytest.fixture(params=FlextApiSerializers.Json.available_backends())
+    def backend(self, request: pytest.FixtureRequest) -> Iterator[str]:
+        """Run a test once per installed backend, restoring the default."""
+        previous = FlextApiSerializers.Json.backend
+        assert FlextApiSerializers.Json.use(request.param).is_success
+        yield request.param
+        FlextApiSerializers.Json.use(previous)
+
+    def test_fastest_backend_selected(self) -> None:
+        """Test the default backend is the first importable one."""
+        backends = FlextApiSerializers.Json.available_backends()
+        assert backends[-1] == "json"
+        assert FlextApiSerializers.Json.backend == backends[0]
+
+    def test_round_trip(self, backend: str) -> None:
+        """Test every backend emits compact UTF-8 and parses it back."""
+        data = {"name": "café", "items": [1, 2.5, None, True], "nested": {}}
+
+        encoded = FlextApiSerializers.Json.dumps(data)
+
+        assert (
+            encoded
+            == json.dumps(
+                data,
+                ensure_ascii=False,
+                separators=(",", ":"),
+            ).encode()
+        )
+        assert FlextApiSerializers.Json.loads(encoded) == data
+        assert FlextApiSerializers.Json.loads(encoded.decode()) == data
+        assert FlextApiSerializers.Json.loads(memoryview(encoded)) == data
+
+    def test_indent_and_default(self, backend: str) -> None:
+        """Test indent output and the default hook for unsupported objects."""
+        encoded = FlextApiSerializers.Json.dumps_str(
+            {"when": datetime.date(2025, 1, 2)},
+            default=str,
+            indent=True,
+        )
+
+        assert encoded == '{\n  "when": "2025-01-02"\n}'
+
+    def test_big_int_falls_back_to_stdlib(self, backend: str) -> None:
+        """Test values outside a fast backend's range still encode."""
+        assert FlextApiSerializers.Json.dumps([2**70]) == b"[1180591620717411303424]"
+
+    def test_errors(self, backend: str) -> None:
+        """Test invalid input raises ValueError, unsupported types TypeError."""
+        with pytest.raises(ValueError):
+            FlextApiSerializers.Json.loads(b"{")
+        with pytest.raises(TypeError):
+            FlextApiSerializers.Json.dumps({"x": object()})
+
+    def test_use_unknown_backend_fails(self) -> None:
+        """Test selecting a backend that is not installed fails."""
+        result = FlextApiSerializers.Json.use("simdjson")
+
+        assert result.is_failure
+        assert "simdjson" in (result.error or "")
+
+
+class TestFlextApiSerializersContentNegotiation:
+    """Test JSON/MessagePack/CBOR negotiation."""
+
+    @pytest.mark.parametrize(
+        ("accept", "expected"),
+        [
+            (None, "application/json"),
+            ("*/*", "application/json"),
+            ("text/html", "application/json"),
+            ("application/msgpack", "application/msgpack"),
+            ("application/x-msgpack", "application/msgpack"),
+            ("application/json;q=0.5, application/cbor;q=0.8", "application/cbor"),
+            ("application/cbor, application/msgpack", "application/cbor"),
+            ("text/html, application/msgpack;q=0.1", "application/msgpack"),
+        ],
+    )
+    def test_negotiate(self, accept: str | None, expected: str) -> None:
+        """Test the highest ranked supported type wins, JSON otherwise."""
+        assert FlextApiSerializers.ContentNegotiation.negotiate(accept) == expected
+
+    @pytest.mark.parametrize(
+        "content_type",
+        ["application/json", "application/msgpack", "application/cbor"],
+    )
+    def test_round_trip(self, content_type: str) -> None:
+        """Test every supported format encodes and decodes the same data."""
+        negotiation = FlextApiSerializers.ContentNegotiation
+        data = {"id": 1, "name": "café", "scores": [0.5, None, True]}
+
+        encoded = negotiation.encode(data, f"{content_type}; charset=utf-8")
+
+        assert negotiation.decode(encoded, content_type) == data
+
+    def test_unsupported_and_malformed(self) -> None:
+        """Test unsupported media types and malformed bodies raise ValueError."""
+        negotiation = FlextApiSerializers.ContentNegotiation
+
+        assert not negotiation.supports("text/plain")
+        with pytest.raises(ValueError, match="Unsupported content type"):
+            negotiation.encode({}, "text/plain")
+        with pytest.raises(ValueError, match="MessagePack"):
+            negotiation.decode(b"\xc1", "application/msgpack")
+        with pytest.raises(ValueError, match="incomplete"):
+            negotiation.decode(b"\x92\x01", "application/msgpack")
+
+    def test_accept_header(self) -> None:
+        """Test binary formats advertise JSON as a lower-quality fallback."""
+        negotiation = FlextApiSerializers.ContentNegotiation
+
+        assert negotiation.accept_header("application/json") == "application/json"
+        assert negotiation.accept_header("application/cbor") == (
+            "application/cbor, application/json;q=0.9"
+        )
+        assert negotiation.media_type_for("msgpack").value == "application/msgpack"
+        assert negotiation.media_type_for("custom").is_failure
+
+
+__all__ = [
+    "TestFlextApiSerializers",
+    "TestFlextApiSerializersBodyDecoder",
+    "TestFlextApiSerializersContentNegotiation",
+    "TestFlextApiSerializersJson",
+]
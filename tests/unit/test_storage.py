@@ -7,7 +7,20 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
-from flext_api import FlextApiStorage
+from typing import TYPE_CHECKING
+
+import pytest
+
+from flext_api import FlextApiEviction, FlextApiStorage, c
+
+if TYPE_CHECKING:
+    from tests.conftest import FakeClock
+
+
+def _clocked_storage(clock: FakeClock, **kwargs: int | str) -> FlextApiStorage:
+    storage = FlextApiStorage(**kwargs)
+    storage._clock = clock
+    return storage
 
 
 def test_keys_pattern_and_unknown_operation_commit() -> None:
@@ -115,11 +128,10 @@ def test_size_and_clear_operations() -> None:
     storage.set("size_test2", "value2")
     storage.set("size_test3", "value3")
 
-    # Check size (includes both direct and namespaced keys)
+    # Check size (one entry per key)
     size_result = storage.size()
     assert size_result.is_success
-    # Each set stores 2 keys (direct + namespaced) = 6
-    assert size_result.value == 6
+    assert size_result.value == 3
 
     # Clear storage
     clear_result = storage.clear()
@@ -159,11 +171,10 @@ def test_performance_scenario() -> None:
         result = storage.set(f"perf_key_{i}", f"perf_value_{i}")
         assert result.is_success
 
-    # Verify all stored (includes both direct and namespaced keys)
+    # Verify all stored (one entry per key)
     perf_size_result = storage.size()
     assert perf_size_result.is_success
-    # Each set stores 2 keys = 200
-    assert perf_size_result.value == 200
+    assert perf_size_result.value == 100
 
     # Retrieve all items
     for i in range(100):
@@ -354,3 +365,201 @@ def test_batch_get_empty_list() -> None:
     batch_result = storage.batch_get([])
     assert batch_result.is_success
     assert batch_result.value == {}
+
+
+def test_max_size_evicts_least_recently_used() -> None:
+    """Test the default LRU policy keeps max_size keys, dropping the coldest."""
+    storage = FlextApiStorage(max_size=3)
+
+    for key in ("a", "b", "c"):
+        storage.set(key, key)
+    storage.get("a")
+    storage.set("d", "d")
+
+    assert storage.exists("b").value is False
+    assert storage.get("a").value == "a"
+    assert sorted(storage.keys().value) == ["a", "c", "d"]
+    assert storage.metrics().value["evictions"] == 1
+    assert storage.info().value["eviction_policy"] == "lru"
+
+
+def test_lfu_eviction_keeps_frequent_keys() -> None:
+    """Test LFU drops the least used key, the oldest of them on a tie."""
+    storage = FlextApiStorage({"eviction_policy": "lfu"}, max_size=3)
+    for key in ("a", "b", "c"):
+        storage.set(key, key)
+    for _ in range(3):
+        storage.get("a")
+    storage.get("c")
+
+    storage.set("d", "d")
+    storage.set("e", "e")
+
+    assert sorted(storage.keys().value) == ["a", "c", "e"]
+    assert storage.get_storage_metrics().value["evictions"] == 2
+
+
+def test_tinylfu_scan_does_not_flush_hot_keys() -> None:
+    """Test W-TinyLFU rejects one-time keys in favour of popular ones."""
+    storage = FlextApiStorage(max_size=100, eviction_policy="tinylfu")
+    hot = [f"hot_{i}" for i in range(50)]
+    for key in hot:
+        storage.set(key, key)
+    for _ in range(3):
+        for key in hot:
+            storage.get(key)
+
+    # Each hot key is read again only after 150 one-time keys: LRU loses it
+    for i in range(3000):
+        storage.set(f"scan_{i}", i)
+        if i % 3 == 0:
+            storage.get(hot[i // 3 % len(hot)])
+
+    assert all(storage.exists(key).value for key in hot)
+    assert len(storage.keys().value) == 100
+    assert storage.metrics().value["evictions"] == 2950
+
+
+def test_eviction_policy_validation() -> None:
+    """Test unknown policies are rejected and unbounded stores never evict."""
+    with pytest.raises(ValueError, match="eviction_policy"):
+        FlextApiStorage(max_size=10, eviction_policy="random")
+
+    storage = FlextApiStorage()
+    for i in range(500):
+        storage.set(f"key_{i}", i)
+    assert len(storage.keys().value) == 500
+    assert storage.metrics().value["evictions"] == 0
+
+
+def test_eviction_policies_track_deletes() -> None:
+    """Test deleted keys free their slot in every policy."""
+    for name in FlextApiEviction.Name:
+        policy = FlextApiEviction.create(name, max_size=2)
+        assert policy.insert("a") == []
+        assert policy.insert("b") == []
+        policy.remove("a")
+        assert policy.insert("c") == []
+        assert len(policy) == 2
+        assert policy.pop() in {"b", "c"}
+        assert len(policy) == 1
+        policy.clear()
+        assert len(policy) == 0
+        assert policy.pop() is None
+
+
+def test_expired_key_is_dropped_on_read(fake_clock: FakeClock) -> None:
+    """Test a read of an expired key misses and removes both copies."""
+    storage = _clocked_storage(fake_clock)
+    storage.set("short", "value", ttl=10)
+    storage.set("forever", "value")
+
+    fake_clock.now += 11
+
+    assert storage.exists("short").value is False
+    assert storage.get("short").is_failure
+    assert storage.get("forever").value == "value"
+    assert storage.keys().value == ["forever"]
+
+
+def test_expiry_sweeps_are_incremental(fake_clock: FakeClock) -> None:
+    """Test each operation removes a bounded batch of expired entries."""
+    storage = _clocked_storage(fake_clock)
+    for i in range(100):
+        storage.set(f"key_{i}", i, ttl=5)
+    storage.set("late", "value", ttl=60)
+
+    fake_clock.now += 10
+    storage.get("late")
+
+    batch = c.Api.Storage.EXPIRY_SWEEP_BATCH
+    assert len(storage._storage) == 101 - batch
+    assert storage.cleanup_expired().value == 100 - batch
+    assert storage.get("late").value == "value"
+
+
+def test_overwrite_replaces_expiry(fake_clock: FakeClock) -> None:
+    """Test re-setting a key moves or clears its TTL and keeps the index small."""
+    storage = _clocked_storage(fake_clock)
+    for ttl in range(1, 200):
+        storage.set("key", ttl, ttl=ttl)
+    storage.set("plain", "value", ttl=1)
+    storage.set("plain", "value")
+
+    fake_clock.now += 100
+
+    assert storage.get("key").value == 199
+    assert storage.get("plain").value == "value"
+    assert len(storage._expiry_heap) <= 2 + 2 * c.Api.Storage.EXPIRY_SWEEP_BATCH
+
+
+def test_metrics_snapshot_counters() -> None:
+    """Test hits, misses and operations are counted and reported by metrics()."""
+    storage = FlextApiStorage()
+    storage.set("a", 1)
+    storage.get("a")
+    storage.get("a")
+    storage.get("missing")
+
+    metrics = storage.metrics().value
+    assert metrics["total_operations"] == 4
+    assert metrics["cache_hits"] == 2
+    assert metrics["cache_misses"] == 1
+    assert metrics["hit_ratio"] == 2 / 3
+    assert storage.get_cache_stats().value["hits"] == 2
+    assert storage.get_storage_statistics().value["cache_misses"] == 1.0
+
+
+def test_one_entry_per_key() -> None:
+    """Test each key is stored once and namespaces do not leak into keys."""
+    storage = FlextApiStorage({"namespace": "orders"})
+    storage.set("a", 1)
+    storage.set("b", [2], ttl=60)
+
+    assert storage.items().value == [("a", 1), ("b", [2])]
+    assert storage.values().value == [1, [2]]
+    assert storage.exists("orders:a").value is False
+    assert storage.size().value == 2
+
+
+def test_memory_usage_is_tracked_incrementally() -> None:
+    """Test set, overwrite and delete keep the byte total and histogram exact."""
+    storage = FlextApiStorage()
+    storage.set("small", "x")
+    storage.set("big", "x" * 5000)
+    total = storage.metrics().value["memory_usage"]
+
+    storage.set("big", "x")
+    storage.delete("small")
+
+    metrics = storage.metrics().value
+    assert isinstance(total, int)
+    assert total > 5000
+    assert metrics["memory_usage"] == storage._storage["big"].size
+    assert metrics["size_histogram"] == {"<=256": 1}
+    assert storage.get_storage_statistics().value["memory_usage"] < 256
+
+    storage.clear()
+    assert storage.metrics().value["memory_usage"] == 0
+    assert storage.size_histogram() == {}
+
+
+def test_max_memory_bytes_evicts_to_fit() -> None:
+    """Test the memory limit evicts in policy order until the store fits."""
+    storage = FlextApiStorage(max_memory_bytes=20_000)
+    for i in range(10):
+        storage.set(f"blob_{i}", "x" * 3000)
+    storage.get("blob_4")
+    storage.set("blob_10", "x" * 3000)
+
+    metrics = storage.metrics().value
+    memory_usage = metrics["memory_usage"]
+    assert isinstance(memory_usage, int)
+    assert memory_usage <= 20_000
+    assert storage.exists("blob_4").value is True
+    assert storage.exists("blob_0").value is False
+    assert metrics["evictions"] == 11 - storage.size().value
+    assert storage.info().value["max_memory_bytes"] == 20_000
+
+    with pytest.raises(ValueError, match="max_memory_bytes"):
+        FlextApiStorage(max_memory_bytes=0)
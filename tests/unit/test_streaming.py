@@ -0,0 +1,446 @@
+"""Tests for streamed HTTP request and response bodies.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import mmap
+import os
+import tempfile
+import threading
+import tracemalloc
+from collections.abc import AsyncIterator, Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import httpx
+import pytest
+import pytest_httpx
+from flext_core import FlextResult
+
+from flext_api import (
+    FlextApiAsyncClient,
+    FlextApiClient,
+    FlextApiModels,
+    FlextApiSettings,
+    FlextApiStreamingBody,
+    FlextApiStreamingResponse,
+    FlextWebProtocolPlugin,
+    c,
+)
+from flext_api.transports import FlextApiTransports
+
+BASE_URL = "https://api.example.com"
+URL = f"{BASE_URL}/export"
+MIB = 1024 * 1024
+
+
+def _body(total: int, piece: int = 64 * 1024) -> Iterator[bytes]:
+    """Generate ``total`` bytes lazily so the server side never holds them."""
+    sent = 0
+    while sent < total:
+        size = min(piece, total - sent)
+        yield b"x" * size
+        sent += size
+
+
+def _stream(
+    plugin: FlextWebProtocolPlugin | None = None,
+    chunk_size: int = 1024,
+) -> FlextApiStreamingResponse:
+    result = (plugin or FlextWebProtocolPlugin(max_retries=0)).stream_request(
+        FlextApiModels.HttpRequest(url=URL),
+        chunk_size=chunk_size,
+    )
+    assert result.is_success, result.error
+    return result.value
+
+
+class _UploadSink:
+    """httpx_mock callback that consumes a request body without keeping it."""
+
+    def __init__(self) -> None:
+        self.received = 0
+        self.digest = hashlib.sha256()
+        self.headers: httpx.Headers | None = None
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.headers = request.headers
+        for chunk in request.stream:
+            self.received += len(chunk)
+            self.digest.update(chunk)
+        return httpx.Response(201, json={"received": self.received})
+
+    async def acall(self, request: httpx.Request) -> httpx.Response:
+        self.headers = request.headers
+        async for chunk in request.stream:
+            self.received += len(chunk)
+            self.digest.update(chunk)
+        return httpx.Response(201, json={"received": self.received})
+
+
+def _upload(
+    body: FlextApiStreamingBody | FlextApiStreamingBody.Source,
+) -> FlextResult[FlextApiModels.HttpResponse]:
+    return FlextApiClient(FlextApiSettings(base_url=BASE_URL)).request(
+        FlextApiModels.HttpRequest(method="PUT", url="/export", body=body),
+    )
+
+
+class _DrainServer(ThreadingHTTPServer):
+    """Local HTTP server that reads upload bodies in chunks and discards them."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_PUT(self) -> None:
+            remaining = int(self.headers["Content-Length"])
+            while remaining:
+                remaining -= len(self.rfile.read(min(remaining, 64 * 1024)))
+            payload = b'{"ok": true}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+            """Silence request logging."""
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), self.Handler)
+        self.base_url = f"http://127.0.0.1:{self.server_address[1]}"
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+
+class TestFlextWebProtocolPluginStreaming:
+    """Test streamed iteration of response bodies."""
+
+    def test_iter_bytes_respects_chunk_size(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test chunks have the configured size, except possibly the last."""
+        httpx_mock.add_response(url=URL, content=b"a" * 2500)
+
+        with _stream(chunk_size=1000) as response:
+            chunks = list(response.iter_bytes())
+
+        assert [len(chunk) for chunk in chunks] == [1000, 1000, 500]
+        assert response.is_closed
+
+    def test_closing_stream_returns_pool_lease(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test the pooled client is leased until the stream is closed."""
+        httpx_mock.add_response(url=URL, content=b"data")
+        registry = FlextApiTransports.PoolRegistry.get_global()
+        before = registry.metrics().value
+
+        response = _stream()
+        while_open = registry.metrics().value
+        response.close()
+        after = registry.metrics().value
+
+        assert while_open["leases"] - before["leases"] == 1
+        assert while_open["releases"] == before["releases"]
+        assert after["releases"] - before["releases"] == 1
+
+    def test_iter_lines_and_ndjson(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test line and NDJSON record iteration, skipping blank lines."""
+        payload = b'{"id": 1}\n\n{"id": 2}\r\n{"id": 3}'
+        httpx_mock.add_response(url=URL, content=payload, is_reusable=True)
+
+        with _stream() as response:
+            lines = list(response.iter_lines())
+        with _stream(chunk_size=3) as response:
+            records = list(response.iter_ndjson())
+
+        assert lines == ['{"id": 1}', "", '{"id": 2}', '{"id": 3}']
+        assert records == [{"id": 1}, {"id": 2}, {"id": 3}]
+
+    def test_write_to_file_descriptor_and_file_object(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test the body is copied to an fd or a binary file object."""
+        httpx_mock.add_callback(
+            lambda _: httpx.Response(200, content=_body(MIB)),
+            is_reusable=True,
+        )
+        buffer = io.BytesIO()
+
+        with tempfile.TemporaryFile() as target:
+            written = _stream().write_to(target.fileno())
+            target.seek(0)
+            on_disk = len(target.read())
+        copied = _stream().write_to(buffer)
+
+        assert written.value == on_disk == MIB
+        assert copied.value == len(buffer.getvalue()) == MIB
+
+    def test_error_status_fails_without_stream(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test a non-retryable error status returns a failure result."""
+        httpx_mock.add_response(url=URL, status_code=404, text="missing")
+
+        result = FlextWebProtocolPlugin(max_retries=0).stream_request(
+            FlextApiModels.HttpRequest(url=URL),
+        )
+
+        assert result.is_failure
+        assert result.error == "HTTP 404: missing"
+
+    def test_retryable_status_retried_before_streaming(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test retryable statuses are retried before handing out the stream."""
+        httpx_mock.add_response(url=URL, status_code=503)
+        httpx_mock.add_response(url=URL, content=b"ok")
+        plugin = FlextWebProtocolPlugin(max_retries=1, retry_backoff_factor=0.0)
+
+        with _stream(plugin) as response:
+            assert b"".join(response.iter_bytes()) == b"ok"
+
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_invalid_chunk_size(self) -> None:
+        """Test chunk_size below one is rejected."""
+        result = FlextWebProtocolPlugin().stream_request(
+            FlextApiModels.HttpRequest(url=URL),
+            chunk_size=0,
+        )
+
+        assert result.is_failure
+
+    def test_memory_flat_regardless_of_body_size(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test peak traced memory does not grow with the streamed body size."""
+        httpx_mock.add_callback(
+            lambda request: httpx.Response(
+                200,
+                content=_body(int(request.url.params["size"])),
+            ),
+            is_reusable=True,
+        )
+        plugin = FlextWebProtocolPlugin(max_retries=0)
+
+        def peak_for(size: int) -> int:
+            tracemalloc.start()
+            try:
+                result = plugin.stream_request(
+                    FlextApiModels.HttpRequest(url=f"{URL}?size={size}"),
+                    chunk_size=64 * 1024,
+                )
+                with open(os.devnull, "wb") as sink, result.value as response:
+                    assert response.write_to(sink).value == size
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        small = peak_for(MIB)
+        large = peak_for(64 * MIB)
+
+        assert large < 4 * MIB
+        assert large < small + MIB
+
+
+class TestFlextApiStreamingBody:
+    """Test streamed request bodies through the HTTP clients."""
+
+    def test_path_upload_with_content_length_and_progress(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+        tmp_path: Path,
+    ) -> None:
+        """Test a file path is sent with Content-Length and reports progress."""
+        sink = _UploadSink()
+        httpx_mock.add_callback(sink)
+        path = tmp_path / "upload.bin"
+        data = os.urandom(300_000)
+        path.write_bytes(data)
+        progress: list[tuple[int, int | None]] = []
+
+        result = _upload(
+            FlextApiStreamingBody(
+                path,
+                chunk_size=100_000,
+                on_progress=lambda sent, total: progress.append((sent, total)),
+            ),
+        )
+
+        assert result.is_success, result.error
+        assert sink.headers is not None
+        assert sink.headers["content-length"] == str(len(data))
+        assert "transfer-encoding" not in sink.headers
+        assert sink.digest.digest() == hashlib.sha256(data).digest()
+        assert progress == [(100_000, 300_000), (200_000, 300_000), (300_000, 300_000)]
+
+    def test_generator_upload_is_chunked(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test an iterator of unknown size uses chunked transfer encoding."""
+        sink = _UploadSink()
+        httpx_mock.add_callback(sink)
+
+        result = _upload(b"part-%d;" % i for i in range(3))
+
+        assert result.is_success, result.error
+        assert sink.headers is not None
+        assert sink.headers["transfer-encoding"] == "chunked"
+        assert sink.digest.digest() == hashlib.sha256(b"part-0;part-1;part-2;").digest()
+
+    def test_iterator_with_declared_length(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test a declared length turns an iterator into a sized upload."""
+        sink = _UploadSink()
+        httpx_mock.add_callback(sink)
+
+        result = _upload(FlextApiStreamingBody(iter([b"ab", b"cd"]), length=4))
+
+        assert result.is_success, result.error
+        assert sink.headers is not None
+        assert sink.headers["content-length"] == "4"
+
+    def test_file_object_and_mmap_sources(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+        tmp_path: Path,
+    ) -> None:
+        """Test file objects upload from their position and mmaps in full."""
+        sinks = [_UploadSink(), _UploadSink()]
+        for sink in sinks:
+            httpx_mock.add_callback(sink)
+        path = tmp_path / "upload.bin"
+        path.write_bytes(b"header|" + b"z" * 50_000)
+
+        with path.open("rb") as file:
+            file.seek(len(b"header|"))
+            assert _upload(file).is_success
+        with (
+            path.open("rb") as file,
+            mmap.mmap(
+                file.fileno(),
+                0,
+                access=mmap.ACCESS_READ,
+            ) as mapped,
+        ):
+            assert _upload(mapped).is_success
+
+        assert sinks[0].received == 50_000
+        assert sinks[1].received == 50_007
+        assert sinks[1].headers is not None
+        assert sinks[1].headers["content-length"] == "50007"
+
+    def test_one_shot_iterator_cannot_be_resent(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+        tmp_path: Path,
+    ) -> None:
+        """Test iterators are single-use while path bodies replay."""
+        httpx_mock.add_callback(_UploadSink(), is_reusable=True)
+        path = tmp_path / "upload.bin"
+        path.write_bytes(b"data")
+        one_shot = FlextApiStreamingBody(iter([b"data"]))
+        replayable = FlextApiStreamingBody(path)
+
+        assert _upload(one_shot).is_success
+        second = _upload(one_shot)
+
+        assert second.is_failure
+        assert second.error == c.Api.Streaming.BODY_CONSUMED_ERROR
+        assert replayable.is_replayable
+        assert not one_shot.is_replayable
+        assert _upload(replayable).is_success
+        assert _upload(replayable).is_success
+
+    def test_async_iterable_requires_async_client(self) -> None:
+        """Test the sync client rejects async-only bodies with a failure."""
+
+        async def chunks() -> AsyncIterator[bytes]:
+            yield b"data"
+
+        result = _upload(chunks())
+
+        assert result.is_failure
+        assert "FlextApiAsyncClient" in (result.error or "")
+
+    @pytest.mark.asyncio
+    async def test_async_client_streams_async_and_file_sources(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+        tmp_path: Path,
+    ) -> None:
+        """Test the async client uploads async iterators and paths."""
+        sink = _UploadSink()
+        httpx_mock.add_callback(sink.acall, is_reusable=True)
+        path = tmp_path / "upload.bin"
+        path.write_bytes(b"f" * 200_000)
+
+        async def chunks() -> AsyncIterator[bytes]:
+            for _ in range(4):
+                yield b"a" * 1000
+
+        async with FlextApiAsyncClient(FlextApiSettings(base_url=BASE_URL)) as client:
+            first = await client.arequest(
+                FlextApiModels.HttpRequest(method="POST", url="/export", body=chunks()),
+            )
+            second = await client.arequest(
+                FlextApiModels.HttpRequest(method="POST", url="/export", body=path),
+            )
+
+        assert first.is_success, first.error
+        assert second.is_success, second.error
+        assert sink.received == 204_000
+
+    def test_upload_memory_flat_regardless_of_body_size(self) -> None:
+        """Test peak traced memory of an upload does not grow with its size."""
+        server = _DrainServer()
+        client = FlextApiClient(FlextApiSettings(base_url=server.base_url))
+
+        def peak_for(size: int) -> int:
+            tracemalloc.start()
+            try:
+                result = client.request(
+                    FlextApiModels.HttpRequest(
+                        method="PUT",
+                        url="/upload",
+                        body=FlextApiStreamingBody(_body(size), length=size),
+                    ),
+                )
+                assert result.is_success, result.error
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        try:
+            small = peak_for(MIB)
+            large = peak_for(64 * MIB)
+        finally:
+            client.close()
+            server.shutdown()
+            server.server_close()
+
+        assert large < 4 * MIB
+        assert large < small + MIB
+
+
+__all__ = [
+    "TestFlextApiStreamingBody",
+    "TestFlextWebProtocolPluginStreaming",
+]
@@ -12,12 +12,73 @@ from __future__ import annotations
 from unittest.mock import MagicMock, patch  # TEST-INFRA
 # All error checks below are safe with null checks, patch
 
+import asyncio
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
 import pytest
+import pytest_httpx
 from flext_core import FlextTypes as t
 
+from flext_api import FlextWebProtocolPlugin
 from flext_api.transports import FlextApiTransports
 
 
+class _ConcurrencyServer(ThreadingHTTPServer):
+    """Keep-alive server recording connections and peak concurrent requests."""
+
+    daemon_threads = True
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:
+            server = self.server
+            assert isinstance(server, _ConcurrencyServer)
+            with server.lock:
+                server.active += 1
+                server.peak = max(server.peak, server.active)
+            time.sleep(0.05)
+            with server.lock:
+                server.active -= 1
+            self.send_response(200)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"ok")
+
+        def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+            """Silence request logging."""
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), self.Handler)
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.connections = 0
+        self.base_url = f"http://127.0.0.1:{self.server_address[1]}"
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    def process_request(self, request: object, client_address: object) -> None:
+        self.connections += 1
+        super().process_request(request, client_address)
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+@pytest.fixture(autouse=True)
+def fresh_pool_registry() -> Iterator[None]:
+    """Isolate tests from pools leased by earlier tests."""
+    FlextApiTransports.PoolRegistry.reset_global()
+    yield
+    FlextApiTransports.PoolRegistry.reset_global()
+
+
 class TestFlextWebTransport:
     """Unit tests for HTTP transport implementation."""
 
@@ -52,8 +113,22 @@ class TestFlextWebTransport:
         result = transport.connect("https://api.example.com", timeout=30.0, verify=False)
 
         assert result.is_success
-        # Current implementation doesn't use options, just creates basic client
-        mock_client_class.assert_called_once_with()
+        # Client options configure the pool; redirect policy comes from init
+        kwargs = mock_client_class.call_args.kwargs
+        assert kwargs["timeout"] == 30.0
+        assert kwargs["follow_redirects"] is True
+        assert kwargs["max_redirects"] == 20
+        assert isinstance(kwargs["transport"], httpx.HTTPTransport)
+
+    def test_connect_rejects_invalid_option_types(
+        self,
+        transport: FlextApiTransports.FlextWebTransport,
+    ) -> None:
+        """Test options httpx cannot take fail the connect with their name."""
+        result = transport.connect("https://api.example.com", timeout="soon")
+
+        assert result.is_failure
+        assert "timeout" in (result.error or "")
 
     @patch("httpx.Client")
     def test_connect_failure(self, mock_client_class: MagicMock, transport: FlextApiTransports.FlextWebTransport) -> None:
@@ -68,7 +143,6 @@ class TestFlextWebTransport:
 
     def test_disconnect_when_connected(self, transport: FlextApiTransports.FlextWebTransport) -> None:
         """Test disconnect when client is connected."""
-        import httpx  # CONDITIONAL  # CONDITIONAL
         mock_client = MagicMock(spec=httpx.Client)
         transport._client = mock_client
 
@@ -82,7 +156,6 @@ class TestFlextWebTransport:
     def test_disconnect_when_not_connected(self, transport: FlextApiTransports.FlextWebTransport) -> None:
         """Test disconnect when no client is connected."""
         # Create a mock that behaves like httpx.Client
-        import httpx  # CONDITIONAL  # CONDITIONAL
         mock_client = MagicMock(spec=httpx.Client)
         result = transport.disconnect(mock_client)
 
@@ -92,7 +165,6 @@ class TestFlextWebTransport:
 
     def test_disconnect_wrong_connection(self, transport: FlextApiTransports.FlextWebTransport) -> None:
         """Test disconnect with wrong connection object."""
-        import httpx  # CONDITIONAL  # CONDITIONAL
         mock_client = MagicMock(spec=httpx.Client)
         transport._client = mock_client
 
@@ -105,7 +177,6 @@ class TestFlextWebTransport:
 
     def test_send_with_connection(self, transport: FlextApiTransports.FlextWebTransport) -> None:
         """Test sending data through connection."""
-        import httpx  # CONDITIONAL  # CONDITIONAL
         mock_client = MagicMock(spec=httpx.Client)
         mock_response = MagicMock()
         mock_client.request.return_value = mock_response
@@ -167,6 +238,295 @@ class TestFlextWebTransport:
         assert "URL is required" in result.error
 
 
+class TestFlextWebTransportPool:
+    """Test the pooled client, limits and redirect policy."""
+
+    def test_connect_leases_shared_pool_per_origin(self) -> None:
+        """Test transports with equal settings share one client per origin."""
+        transport = FlextApiTransports.FlextWebTransport()
+        other = FlextApiTransports.FlextWebTransport()
+
+        first = transport.connect("https://api.example.com/a").value
+        same_origin = other.connect("https://api.example.com:443/b").value
+        other_origin = transport.connect("https://other.example.com").value
+        other_tls = transport.connect("https://api.example.com", verify=False).value
+        assert transport.close().is_success
+        assert other.close().is_success
+
+        assert isinstance(first, httpx.Client)
+        assert same_origin is first
+        assert other_origin is not first
+        assert other_tls is not first
+        assert not first.is_closed
+        registry = FlextApiTransports.PoolRegistry.get_global()
+        assert registry.metrics().value == {
+            "pools_created": 3,
+            "pools_evicted": 0,
+            "leases": 4,
+            "releases": 4,
+            "pools": 3,
+            "pools_leased": 0,
+        }
+
+    def test_http2_requires_h2_package(self) -> None:
+        """Test HTTP/2 is used only when the h2 package is installed."""
+        transport = FlextApiTransports.FlextWebTransport(http2=True)
+
+        assert transport.http2 is transport.http2_available()
+        assert FlextApiTransports.FlextWebTransport().http2 is False
+
+    def test_sync_pool_speaks_http11(self) -> None:
+        """Test sync clients stay on HTTP/1.1 even with HTTP/2 enabled."""
+        server = _ConcurrencyServer()
+        transport = FlextApiTransports.FlextWebTransport(http2_prior_knowledge=True)
+        client = transport.connect(server.base_url).value
+        assert isinstance(client, httpx.Client)
+        try:
+            response = client.get(f"{server.base_url}/")
+            metrics = transport.metrics().value
+        finally:
+            transport.close()
+            server.stop()
+
+        assert response.http_version == "HTTP/1.1"
+        assert metrics["connections"] == 1
+        assert metrics["connections_http2"] == 0
+
+    def test_connection_counts_without_httpcore_pool(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test transports without an httpcore pool count as empty."""
+        transport = httpx.HTTPTransport()
+        monkeypatch.setattr(transport, "_pool", None)
+
+        assert FlextApiTransports.PoolRegistry.connection_counts([transport]) == {
+            "connections": 0,
+            "connections_idle": 0,
+            "connections_http2": 0,
+        }
+
+    def test_invalid_limits_rejected(self) -> None:
+        """Test non-positive per-origin limits and negative redirects fail."""
+        with pytest.raises(ValueError, match="max_connections_per_origin"):
+            FlextApiTransports.FlextWebTransport(max_connections_per_origin=0)
+        with pytest.raises(ValueError, match="max_redirects"):
+            FlextApiTransports.FlextWebTransport(max_redirects=-1)
+
+    def test_redirect_policy(self, httpx_mock: pytest_httpx.HTTPXMock) -> None:
+        """Test max_redirects bounds redirect chains and can be disabled."""
+        httpx_mock.add_response(
+            status_code=302,
+            headers={"Location": "https://api.example.com/loop"},
+            is_reusable=True,
+        )
+        limited = FlextApiTransports.FlextWebTransport(max_redirects=2)
+        manual = FlextApiTransports.FlextWebTransport(follow_redirects=False)
+
+        client = limited.connect("https://api.example.com").value
+        assert isinstance(client, httpx.Client)
+        with pytest.raises(httpx.TooManyRedirects):
+            client.get("https://api.example.com/loop")
+        no_follow = manual.connect("https://api.example.com").value
+        assert isinstance(no_follow, httpx.Client)
+        assert no_follow.get("https://api.example.com/loop").status_code == 302
+        assert len(httpx_mock.get_requests()) == 4
+
+    def test_per_origin_limit_caps_concurrency(self) -> None:
+        """Test no more requests than the per-origin limit run at once."""
+        server = _ConcurrencyServer()
+        transport = FlextApiTransports.FlextWebTransport(max_connections_per_origin=2)
+        client = transport.connect(server.base_url).value
+        assert isinstance(client, httpx.Client)
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                statuses = list(
+                    executor.map(
+                        lambda _: client.get(f"{server.base_url}/").status_code,
+                        range(8),
+                    ),
+                )
+            metrics = transport.metrics().value
+        finally:
+            transport.close()
+            server.stop()
+
+        assert statuses == [200] * 8
+        assert server.peak == 2
+        assert server.connections == 2
+        assert metrics["connections"] == 2
+        assert metrics["connections_idle"] == 2
+        assert metrics["in_flight"] == 0
+        assert metrics["origin_waits"] >= 1
+
+    def test_per_origin_slot_held_until_stream_closed(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test an open streamed response keeps its slot; waiting times out."""
+        httpx_mock.add_response(content=b"ok", is_reusable=True)
+        transport = FlextApiTransports.FlextWebTransport(max_connections_per_origin=1)
+        client = transport.connect("https://api.example.com").value
+        assert isinstance(client, httpx.Client)
+        quick = httpx.Timeout(5.0, pool=0.05)
+
+        with client.stream("GET", "https://api.example.com/a"):
+            with pytest.raises(httpx.PoolTimeout):
+                client.get("https://api.example.com/b", timeout=quick)
+            assert client.get("https://other.example.com/", timeout=quick).is_success
+        assert client.get("https://api.example.com/b", timeout=quick).is_success
+        transport.close()
+
+    @pytest.mark.asyncio
+    async def test_async_pool_shares_limits(
+        self,
+        httpx_mock: pytest_httpx.HTTPXMock,
+    ) -> None:
+        """Test connect_async reuses one AsyncClient with the per-origin cap."""
+        active = peak = 0
+
+        async def slow(_: httpx.Request) -> httpx.Response:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+            return httpx.Response(200, text="ok")
+
+        httpx_mock.add_callback(slow, is_reusable=True)
+        transport = FlextApiTransports.FlextWebTransport(max_connections_per_origin=2)
+        client = transport.connect_async("https://api.example.com").value
+        assert isinstance(client, httpx.AsyncClient)
+        assert transport.connect_async("https://api.example.com").value is client
+
+        responses = await asyncio.gather(
+            *(client.get("https://api.example.com/") for _ in range(6)),
+        )
+        metrics = transport.metrics().value
+        assert (await transport.aclose()).is_success
+
+        assert [response.status_code for response in responses] == [200] * 6
+        assert peak == 2
+        assert metrics["in_flight"] == 0
+        assert metrics["origin_waits"] >= 1
+        assert client.is_closed
+
+
+
+class TestFlextApiPoolRegistry:
+    """Test lease counting, idle eviction and per-origin stats."""
+
+    @staticmethod
+    def _pool() -> tuple[
+        httpx.Client,
+        httpx.HTTPTransport,
+        FlextApiTransports.OriginLimitedTransport | None,
+    ]:
+        pool = httpx.HTTPTransport()
+        return httpx.Client(transport=pool), pool, None
+
+    def test_idle_pool_evicted_after_timeout(self) -> None:
+        """Test only unleased pools idle past the timeout are closed."""
+        now = [0.0]
+        registry = FlextApiTransports.PoolRegistry(
+            idle_timeout=10.0,
+            clock=lambda: now[0],
+        )
+        origin = "https://api.example.com:443"
+        client = registry.acquire(("a",), origin, self._pool)
+        assert registry.acquire(("a",), origin, self._pool) is client
+        busy = registry.acquire(("b",), origin, self._pool)
+
+        assert registry.release(client)
+        now[0] = 60.0
+        assert registry.evict_idle() == 0
+        assert registry.release(client)
+        now[0] = 65.0
+        assert registry.evict_idle() == 0
+        now[0] = 70.0
+        assert registry.evict_idle() == 1
+
+        assert client.is_closed
+        assert not busy.is_closed
+        assert not registry.owns(client)
+        assert not registry.release(client)
+        assert registry.acquire(("a",), origin, self._pool) is not client
+        registry.close_all()
+        assert busy.is_closed
+
+    def test_global_registry_closed_by_reset(self) -> None:
+        """Test the global registry is a singleton whose pools close on reset."""
+        registry = FlextApiTransports.PoolRegistry.get_global()
+        client = registry.acquire(("a",), "http://localhost:80", self._pool)
+
+        assert FlextApiTransports.PoolRegistry.get_global() is registry
+        FlextApiTransports.PoolRegistry.reset_global()
+
+        assert client.is_closed
+        assert FlextApiTransports.PoolRegistry.get_global() is not registry
+
+    def test_per_origin_open_idle_in_use_counts(self) -> None:
+        """Test stats() reports connections per origin while requests run."""
+        server = _ConcurrencyServer()
+        transport = FlextApiTransports.FlextWebTransport()
+        registry = transport.registry
+        client = transport.connect(server.base_url).value
+        assert isinstance(client, httpx.Client)
+        origin = server.base_url
+        try:
+            with client.stream("GET", f"{server.base_url}/"):
+                during = registry.stats().value[origin]
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                list(executor.map(lambda _: client.get(f"{server.base_url}/"), range(3)))
+            transport.disconnect(client)
+            after = registry.stats().value[origin]
+        finally:
+            registry.close_all()
+            server.stop()
+
+        assert during == {"pools": 1, "leases": 1, "open": 1, "idle": 0, "in_use": 1}
+        assert after == {"pools": 1, "leases": 0, "open": 3, "idle": 3, "in_use": 0}
+
+
+class TestFlextWebProtocolPluginPool:
+    """Test FlextWebProtocolPlugin wires its options into the transport."""
+
+    def test_requests_share_one_connection(self) -> None:
+        """Test sequential requests reuse one keep-alive connection."""
+        server = _ConcurrencyServer()
+        plugin = FlextWebProtocolPlugin(
+            max_retries=0,
+            max_connections=10,
+            max_connections_per_origin=4,
+            max_redirects=3,
+        )
+        try:
+            for _ in range(3):
+                result = plugin.send_request({"url": f"{server.base_url}/", "method": "GET"})
+                assert result.is_success, result.error
+            metrics = plugin.metrics().value
+            leased = FlextApiTransports.PoolRegistry.get_global().metrics().value
+        finally:
+            plugin.close()
+            server.stop()
+
+        info = plugin.get_protocol_info()
+        assert leased["pools_leased"] == 0
+        assert leased["leases"] == leased["releases"] == 3
+        assert server.connections == 1
+        assert metrics["connections"] == 1
+        assert info["max_connections_per_origin"] == 4
+        assert info["max_redirects"] == 3
+        assert info["http2_enabled"] is False
+
+    def test_http2_option_is_not_reported_as_enabled(self) -> None:
+        """Test the sync-only plugin does not claim HTTP/2 when asked for it."""
+        plugin = FlextWebProtocolPlugin(http2=True, http2_prior_knowledge=True)
+
+        assert plugin.get_protocol_info()["http2_enabled"] is False
+        assert plugin._transport.http2 is False
+
+
 class TestWebSocketTransport:
     """Unit tests for WebSocket transport (Phase 3 - not implemented)."""
 